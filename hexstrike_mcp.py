@@ -21,7 +21,7 @@ import sys
 import os
 import argparse
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import requests
 import time
 from datetime import datetime
@@ -113,13 +113,17 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '🔥'
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Precompute per-level prefixes once instead of rebuilding them for every record
+        self._prefix = {level: f"{color}{self.EMOJIS.get(level, '📝')} " for level, color in self.COLORS.items()}
+        self._default_prefix = f"{HexStrikeColors.BRIGHT_WHITE}📝 "
+        self._suffix = HexStrikeColors.RESET
+    
     def format(self, record):
-        emoji = self.EMOJIS.get(record.levelname, '📝')
-        color = self.COLORS.get(record.levelname, HexStrikeColors.BRIGHT_WHITE)
-        
-        # Add color and emoji to the message
-        record.msg = f"{color}{emoji} {record.msg}{HexStrikeColors.RESET}"
-        return super().format(record)
+        # Format the untouched record so other handlers sharing it are unaffected
+        prefix = self._prefix.get(record.levelname, self._default_prefix)
+        return f"{prefix}{super().format(record)}{self._suffix}"
 
 # Setup logging
 logging.basicConfig(
@@ -276,6 +280,65 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
     """
     mcp = FastMCP("hexstrike-ai-mcp")
     
+    # ============================================================================
+    # BATCH EXECUTION
+    # ============================================================================
+    
+    @mcp.tool()
+    def batch_tools(requests: List[Dict[str, Any]], max_concurrent: int = 3) -> Dict[str, Any]:
+        """
+        Run several security tools concurrently in a single server call.
+        
+        Args:
+            requests: List of {"tool": "<endpoint name, e.g. nmap>", "params": {...}} entries; parameters may
+                      also be given inline (e.g. {"tool": "checksec", "binary": "/bin/ls"}) and an optional
+                      "id" is echoed back
+            max_concurrent: Maximum number of tools running at the same time
+            
+        Returns:
+            Per-tool results in request order (plus results_by_id when ids are given) and the total wall time
+        """
+        data = {
+            "requests": requests,
+            "max_concurrent": max_concurrent
+        }
+        logger.info(f"📦 Starting batch of {len(requests)} tools (concurrency {max_concurrent})")
+        result = hexstrike_client.safe_post("api/tools/batch", data)
+        if result.get("success"):
+            logger.info(f"✅ Batch completed in {result.get('total_time', 0):.1f}s")
+        else:
+            logger.warning("⚠️  Batch completed with failures")
+        return result
+    
+    @mcp.tool()
+    def start_background_tool(tool: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a long-running security tool on the server and return immediately with a token.
+        
+        Args:
+            tool: Endpoint name, e.g. "autorecon" or "zap"
+            params: The parameters the tool endpoint normally takes
+            
+        Returns:
+            Token to pass to get_background_tool_result
+        """
+        logger.info(f"📋 Queueing background {tool} run")
+        return hexstrike_client.safe_post(f"api/tools/{tool}?async=1", params)
+    
+    @mcp.tool()
+    def get_background_tool_result(token: str) -> Dict[str, Any]:
+        """
+        Check on a tool started with start_background_tool.
+        
+        Args:
+            token: Token returned when the run was queued
+            
+        Returns:
+            Status (queued, running, done or failed) and, once finished, the tool's status code and result
+        """
+        logger.info(f"📋 Checking background job {token}")
+        return hexstrike_client.safe_get(f"api/tools/result/{token}")
+    
     # ============================================================================
     # CORE NETWORK SCANNING TOOLS
     # ============================================================================
@@ -973,7 +1036,7 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
         Args:
             script: Python script content to execute
             env_name: Name of the virtual environment
-            filename: Custom script filename (auto-generated if empty)
+            filename: Label for the run in logs and the result (auto-generated if empty)
             
         Returns:
             Script execution results
@@ -1530,7 +1593,7 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
         Execute AutoRecon for comprehensive automated reconnaissance.
         
         Args:
-            target: The target IP address or hostname
+            target: The target IP address or hostname (comma-separated for several)
             output_dir: Output directory for results
             port_scans: Port scan configuration
             service_scans: Service scan configuration
@@ -3589,7 +3652,7 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
         Execute fierce for DNS reconnaissance with enhanced logging.
         
         Args:
-            domain: Target domain
+            domain: Target domain (comma-separated, or a file with one per line, to sweep several concurrently)
             dns_server: DNS server to use
             additional_args: Additional fierce arguments
             
@@ -3610,15 +3673,17 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
         return result
 
     @mcp.tool()
-    def dnsenum_scan(domain: str, dns_server: str = "", wordlist: str = "", additional_args: str = "") -> Dict[str, Any]:
+    def dnsenum_scan(domain: str, dns_server: str = "", wordlist: str = "", additional_args: str = "",
+                     use_native: bool = False) -> Dict[str, Any]:
         """
         Execute dnsenum for DNS enumeration with enhanced logging.
         
         Args:
-            domain: Target domain
+            domain: Target domain (comma-separated, or a file with one per line, to sweep several concurrently)
             dns_server: DNS server to use
             wordlist: Wordlist for brute forcing
             additional_args: Additional dnsenum arguments
+            use_native: Resolve records, zone transfers and wordlist names in-process (faster; no reverse sweeps)
             
         Returns:
             DNS enumeration results
@@ -3627,7 +3692,8 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
             "domain": domain,
             "dns_server": dns_server,
             "wordlist": wordlist,
-            "additional_args": additional_args
+            "additional_args": additional_args,
+            "use_native": use_native
         }
         logger.info(f"🔍 Starting DNSenum: {domain}")
         result = hexstrike_client.safe_post("api/tools/dnsenum", data)
@@ -3637,6 +3703,34 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
             logger.error(f"❌ DNSenum failed for {domain}")
         return result
 
+    @mcp.tool()
+    def dns_enumeration(domain: str, enums: str = "a,ns,mx", dns_server: str = "", wordlist: str = "") -> Dict[str, Any]:
+        """
+        Run DNS enumerations through one endpoint, resolving in-process when the server has dnspython.
+        
+        Args:
+            domain: Target domain (comma-separated, or a file with one per line, to sweep several concurrently)
+            enums: Comma-separated enumerations: a, ns, mx, axfr (zone transfer), brt (wordlist brute force)
+            dns_server: DNS server to use
+            wordlist: Wordlist for brt (dnsenum's dns.txt when empty)
+            
+        Returns:
+            Structured DNS records per enumeration
+        """
+        data = {
+            "domain": domain,
+            "enums": enums,
+            "dns_server": dns_server,
+            "wordlist": wordlist
+        }
+        logger.info(f"🔍 Starting DNS enumeration ({enums}): {domain}")
+        result = hexstrike_client.safe_post("api/tools/dns", data)
+        if result.get("success"):
+            logger.info(f"✅ DNS enumeration completed for {domain}")
+        else:
+            logger.error(f"❌ DNS enumeration failed for {domain}")
+        return result
+
     @mcp.tool()
     def autorecon_scan(
         target: str = "",
@@ -3825,6 +3919,31 @@ def setup_mcp_server(hexstrike_client: HexStrikeClient) -> FastMCP:
             logger.error(f"❌ Failed to clear cache")
         return result
 
+    @mcp.tool()
+    def invalidate_cache(match: str) -> Dict[str, Any]:
+        """
+        Drop cached results for commands that mention a path or other text on the HexStrike AI server.
+        
+        Args:
+            match: Text to look for in cached commands (e.g. a binary path)
+            
+        Returns:
+            Number of cache entries removed
+        """
+        logger.info(f"🧹 Invalidating cached results matching {match}")
+        return hexstrike_client.safe_post("api/cache/invalidate", {"match": match})
+
+    @mcp.tool()
+    def get_throttle_status() -> Dict[str, Any]:
+        """
+        Get per-family concurrency limits and queue depths for throttled tools (hashcat, john, hydra, ...).
+        
+        Returns:
+            Limit, running and queued counts for each tool family
+        """
+        logger.info("⏳ Getting tool throttle status")
+        return hexstrike_client.safe_get("api/throttle/status")
+
     @mcp.tool()
     def get_telemetry() -> Dict[str, Any]:
         """
@@ -19,39 +19,54 @@ Framework: FastMCP integration for AI agent communication
 """
 
 import argparse
+import codecs
+import functools
+import itertools
 import json
 import logging
 import os
 import subprocess
 import sys
+import tempfile
 import traceback
 import threading
 import time
 import hashlib
+import mmap
 import pickle
 import base64
 import queue
-from concurrent.futures import ThreadPoolExecutor
+import select
+import struct
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_futures
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import shutil
+import stat
 import venv
 import zipfile
 from pathlib import Path
-from flask import Flask, request, jsonify
+from flask import Flask, Response, current_app, request, jsonify, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 import psutil
 import signal
+import secrets
+import shlex
+from string import ascii_letters, digits
 import requests
 import re
 import socket
+import ipaddress
 import urllib.parse
-from dataclasses import dataclass, field
+import http.cookiejar
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import List, Set, Tuple
+from typing import List, NamedTuple, Set, Tuple
 import asyncio
 import aiohttp
-from urllib.parse import urljoin, urlparse, parse_qs
+from urllib.parse import urljoin, urlparse, parse_qs, parse_qsl, urlencode, urlunparse
 from bs4 import BeautifulSoup
 import selenium
 from selenium import webdriver
@@ -65,14 +80,54 @@ from mitmproxy import http as mitmhttp
 from mitmproxy.tools.dump import DumpMaster
 from mitmproxy.options import Options as MitmOptions
 
+try:
+    import orjson  # Optional: faster JSON serialization for cached responses
+except ImportError:
+    orjson = None
+
+try:
+    from pymetasploit3.msfrpc import MsfRpcClient  # Optional: persistent msfrpcd instead of msfconsole per request
+except ImportError:
+    MsfRpcClient = None
+
+try:
+    import fcntl  # POSIX only; used to enlarge command output pipes
+except ImportError:
+    fcntl = None
+
+try:
+    import uvloop  # Optional: libuv event loop for the async command runner
+except ImportError:
+    uvloop = None
+
+try:
+    import binwalk as binwalk_api  # Optional: binwalk v2 module for in-process signature scans
+except ImportError:
+    binwalk_api = None
+
+try:
+    import dns.resolver  # Optional: dnspython for in-process DNS enumeration
+    import dns.query
+    import dns.zone
+except ImportError:
+    dns = None
+
+try:
+    import ijson  # Optional: stream large OpenAPI documents instead of parsing them whole
+except ImportError:
+    ijson = None
+
 # ============================================================================
 # LOGGING CONFIGURATION (MUST BE FIRST)
 # ============================================================================
 
+# Records below this level are dropped before their message is formatted
+LOG_LEVEL = getattr(logging, os.environ.get('HEXSTRIKE_LOG_LEVEL', 'INFO').upper(), logging.INFO)
+
 # Configure logging with fallback for permission issues
 try:
     logging.basicConfig(
-        level=logging.INFO,
+        level=LOG_LEVEL,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(sys.stdout),
@@ -82,7 +137,7 @@ try:
 except PermissionError:
     # Fallback to console-only logging if file creation fails
     logging.basicConfig(
-        level=logging.INFO,
+        level=LOG_LEVEL,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(sys.stdout)
@@ -97,6 +152,164 @@ app.config['JSON_SORT_KEYS'] = False
 # API Configuration
 API_PORT = int(os.environ.get('HEXSTRIKE_PORT', 8888))
 API_HOST = os.environ.get('HEXSTRIKE_HOST', '127.0.0.1')
+MAX_CONCURRENT_AGENTS = int(os.environ.get('HEXSTRIKE_MAX_CONCURRENT_AGENTS', 3))  # Default fan-out for /api/tools/batch
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """Serialize data to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+
+def json_response(body: bytes, status: int = 200) -> Response:
+    """Wrap pre-serialized JSON bytes in a Flask response without re-encoding"""
+    return Response(body, status=status, mimetype="application/json")
+
+# Precomputed bodies for common validation failures (skips jsonify on the error path)
+ERR_NO_TARGET = json_dumps_bytes({"error": "Target parameter is required"})
+ERR_NO_URL = json_dumps_bytes({"error": "URL parameter is required"})
+ERR_NO_BINARY = json_dumps_bytes({"error": "Binary parameter is required"})
+ERR_NO_FILE_PATH = json_dumps_bytes({"error": "File path parameter is required"})
+ERR_NO_DOMAIN = json_dumps_bytes({"error": "Domain parameter is required"})
+ERR_NO_FILENAME = json_dumps_bytes({"error": "Filename is required"})
+ERR_NO_COMMAND = json_dumps_bytes({"error": "Command parameter is required"})
+ERR_PAYLOAD_TOO_LARGE = json_dumps_bytes({"error": "Payload size too large (max 100MB)"})
+ERR_INVALID_PAYLOAD_TYPE = json_dumps_bytes({"error": "Invalid payload type"})
+ERR_INVALID_PAYLOAD_SIZE = json_dumps_bytes({"error": "size must be a non-negative integer (max 100MB)"})
+ERR_INVALID_PAYLOAD_PATTERN = json_dumps_bytes({"error": "pattern must be a non-empty string"})
+ERR_NO_BATCH_REQUESTS = json_dumps_bytes({"error": "requests must be a non-empty list of {tool, params} entries"})
+ERR_MALFORMED_URL = json_dumps_bytes({"error": "Malformed URL (expected http(s)://host[:port][/path])"})
+ERR_MALFORMED_DOMAIN = json_dumps_bytes({"error": "Malformed domain name"})
+ERR_MALFORMED_TARGET = json_dumps_bytes({"error": "Malformed target (expected a host, IP address or URL)"})
+ERR_MALFORMED_DNS_SERVER = json_dumps_bytes({"error": "dns_server must be a comma-separated list of IP addresses"})
+ERR_MALFORMED_JSON = json_dumps_bytes({"error": "Request body must be a JSON object"})
+ERR_NO_BASE_URL = json_dumps_bytes({"error": "Base URL parameter is required"})
+ERR_NO_GRAPHQL_ENDPOINT = json_dumps_bytes({"error": "GraphQL endpoint parameter is required"})
+ERR_NO_JWT_TOKEN = json_dumps_bytes({"error": "JWT token parameter is required"})
+ERR_NO_SCHEMA_URL = json_dumps_bytes({"error": "Schema URL parameter is required"})
+ERR_SCHEMA_FETCH_FAILED = json_dumps_bytes({"error": "Failed to fetch API schema"})
+
+# Shape checks run before a tool is spawned, so bad input fails in microseconds rather than mid-scan.
+# Anchored via fullmatch and built from plain character classes, so matching is linear in the input.
+URL_PATTERN = re.compile(r"https?://(?:[^\s/@]+@)?(?:[\w.-]+|\[[0-9a-fA-F:.]+\])(?::\d{1,5})?(?:[/?#]\S*)?", re.IGNORECASE)
+DOMAIN_PATTERN = re.compile(r"(?:\*\.)?(?:[a-z0-9_-]{1,63}\.)+[a-z][a-z0-9-]{1,62}\.?", re.IGNORECASE)
+HOST_PATTERN = re.compile(r"(?:[\w.-]+|\[?[0-9a-fA-F:.]+\]?)(?::\d{1,5})?(?:/\d{1,3})?")
+
+def error_response(body: bytes, status: int = 400) -> Response:
+    """Return a precomputed JSON error body"""
+    return json_response(body, status)
+
+def read_json_body(empty_error: bytes) -> Tuple[Optional[Dict[str, Any]], Optional[Response]]:
+    """
+    Decode the JSON body of a view that cannot do anything with an empty one
+    
+    An empty body is answered with empty_error without reading or parsing anything, and a
+    malformed one with a 400 instead of silently becoming {}. Decoding goes through app.json,
+    i.e. orjson when it is installed.
+    
+    Returns:
+        (params, None) on success, (None, error response) otherwise
+    """
+    if request.content_length == 0:
+        return None, error_response(empty_error)
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None, error_response(empty_error)
+    try:
+        params = app.json.loads(raw)
+    except ValueError:
+        return None, error_response(ERR_MALFORMED_JSON)
+    if not isinstance(params, dict):
+        return None, error_response(ERR_MALFORMED_JSON)
+    return params, None
+
+def stream_json_response(head: Dict[str, Any], key: str, items, keyed: bool = False) -> Response:
+    """Stream a JSON object whose `key` member is serialized one item at a time
+    
+    Args:
+        head: Leading members of the object
+        key: Name of the streamed member
+        items: Iterable of values, or of (key, value) pairs when keyed=True
+        keyed: Stream an object instead of an array
+    
+    A "total_count" member is appended once all items have been written.
+    """
+    def generate():
+        yield json_dumps_bytes(head)[:-1] + (b"," if head else b"") + json_dumps_bytes(key) + (b":{" if keyed else b":[")
+        count = 0
+        try:
+            for item in items:
+                separator = b"," if count else b""
+                if keyed:
+                    item_key, value = item
+                    yield separator + json_dumps_bytes(str(item_key)) + b":" + json_dumps_bytes(value)
+                else:
+                    yield separator + json_dumps_bytes(item)
+                count += 1
+        except Exception as e:
+            # Headers are already sent; report the failure inside the (still valid) document
+            logger.error("💥 Error while streaming %s: %s", key, e)
+            yield (b"}" if keyed else b"]") + b',"error":' + json_dumps_bytes(str(e)) + b',"total_count":' + str(count).encode() + b"}"
+            return
+        yield (b"}" if keyed else b"]") + b',"total_count":' + str(count).encode() + b"}"
+    
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+def ttl_cached_response(ms: int = 250):
+    """Cache an endpoint's serialized JSON body for a short TTL
+    
+    The wrapped view returns plain data; within the TTL repeated polls get the
+    stored bytes back without recomputing or re-encoding them.
+    """
+    ttl = ms / 1000.0
+    
+    def decorator(func):
+        state = {"expires_at": 0.0, "body": None}
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            body = state["body"]
+            if body is None or now >= state["expires_at"]:
+                body = json_dumps_bytes(func(*args, **kwargs))
+                state["body"], state["expires_at"] = body, now + ttl
+            return json_response(body)
+        
+        return wrapper
+    
+    return decorator
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for request parsing and jsonify()"""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs.get("indent") is not None:
+            # Pretty-printing (debug mode) stays on the stdlib encoder
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+        except orjson.JSONEncodeError:
+            return super().dumps(obj)
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """jsonify() without the str round-trip: orjson's bytes go straight into the response body"""
+        if (self.compact is None and current_app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        # Same argument rules as jsonify(): one value as-is, several as a list, or keywords as a dict
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            return super().response(*args, **kwargs)
+        return current_app.response_class(body, mimetype=self.mimetype)
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+    app.json.sort_keys = False
 
 # ============================================================================
 # MODERN VISUAL ENGINE (v2.0 ENHANCEMENT)
@@ -220,15 +433,9 @@ class ModernVisualEngine:
 └─{'─' * (width + 10)}┘{ModernVisualEngine.COLORS['RESET']}"""
 
     @staticmethod
-    def render_progress_bar(progress: float, width: int = 40, style: str = 'cyber', 
-                          label: str = "", eta: float = 0, speed: str = "") -> str:
-        """Render a beautiful progress bar with multiple styles"""
-        
-        # Clamp progress between 0 and 1
-        progress = max(0.0, min(1.0, progress))
-        
-        # Calculate filled and empty portions
-        filled_width = int(width * progress)
+    @functools.lru_cache(maxsize=512)
+    def _progress_bar_segments(width: int, style: str, filled_width: int) -> Tuple[str, str, str]:
+        """Build (filled_part, empty_part, progress_color) for a progress bar"""
         empty_width = width - filled_width
         
         # Style-specific rendering
@@ -253,9 +460,22 @@ class ModernVisualEngine:
             bar_color = ModernVisualEngine.COLORS['ACCENT_LINE']
             progress_color = ModernVisualEngine.COLORS['PRIMARY_BORDER']
         
-        # Build the progress bar
         filled_part = bar_color + filled_char * filled_width
         empty_part = ModernVisualEngine.COLORS['TERMINAL_GRAY'] + empty_char * empty_width
+        return filled_part, empty_part, progress_color
+    
+    @staticmethod
+    def render_progress_bar(progress: float, width: int = 40, style: str = 'cyber', 
+                          label: str = "", eta: float = 0, speed: str = "") -> str:
+        """Render a beautiful progress bar with multiple styles"""
+        
+        # Clamp progress between 0 and 1
+        progress = max(0.0, min(1.0, progress))
+        
+        # Bar segments are cached per (width, style, filled) so ticks only format the numbers
+        filled_part, empty_part, progress_color = ModernVisualEngine._progress_bar_segments(
+            width, style, int(width * progress)
+        )
         percentage = f"{progress * 100:.1f}%"
         
         # Add ETA and speed if provided
@@ -2008,7 +2228,7 @@ class IntelligentErrorHandler:
         best_strategy = self._select_best_strategy(strategies, error_context)
         
         error_message = f'{error_type.value} - Applying {best_strategy.action.value}'
-        logger.warning(f"{ModernVisualEngine.format_error_card('RECOVERY', tool, error_message)}")
+        logger.warning("%s", ModernVisualEngine.format_error_card('RECOVERY', tool, error_message))
         
         return best_strategy
     
@@ -2060,7 +2280,7 @@ class IntelligentErrorHandler:
         adjusted_params.update(adjustments)
         
         adjustment_info = f'Parameters adjusted: {adjustments}'
-        logger.info(f"{ModernVisualEngine.format_tool_status(tool, 'RECOVERY', adjustment_info)}")
+        logger.info("%s", ModernVisualEngine.format_tool_status(tool, 'RECOVERY', adjustment_info))
         
         return adjusted_params
     
@@ -2105,9 +2325,9 @@ class IntelligentErrorHandler:
         }
         
         # Log escalation with enhanced formatting
-        logger.error(f"{ModernVisualEngine.format_error_card('CRITICAL', context.tool_name, context.error_message, 'HUMAN ESCALATION REQUIRED')}")
-        logger.error(f"{ModernVisualEngine.format_highlighted_text('ESCALATION DETAILS', 'RED')}")
-        logger.error(f"{json.dumps(escalation_data, indent=2)}")
+        logger.error("%s", ModernVisualEngine.format_error_card('CRITICAL', context.tool_name, context.error_message, 'HUMAN ESCALATION REQUIRED'))
+        logger.error("%s", ModernVisualEngine.format_highlighted_text('ESCALATION DETAILS', 'RED'))
+        logger.error("%s", json.dumps(escalation_data, indent=2))
         
         return escalation_data
     
@@ -2255,7 +2475,7 @@ class GracefulDegradation:
         for chain in chains:
             viable_chain = [tool for tool in chain if tool not in failed_tools]
             if viable_chain:
-                logger.info(f"🔄 Fallback chain for {operation}: {viable_chain}")
+                logger.info("🔄 Fallback chain for %s: %s", operation, viable_chain)
                 return viable_chain
         
         # If no viable chain found, return basic fallback
@@ -2267,7 +2487,7 @@ class GracefulDegradation:
         }
         
         fallback = basic_fallbacks.get(operation, ["manual_testing"])
-        logger.warning(f"⚠️  Using basic fallback for {operation}: {fallback}")
+        logger.warning("⚠️  Using basic fallback for %s: %s", operation, fallback)
         return fallback
     
     def handle_partial_failure(self, operation: str, partial_results: Dict[str, Any], 
@@ -2301,7 +2521,7 @@ class GracefulDegradation:
             operation, failed_components
         )
         
-        logger.info(f"🛡️  Graceful degradation applied for {operation}")
+        logger.info("🛡️  Graceful degradation applied for %s", operation)
         return enhanced_results
     
     def _basic_port_check(self, target: str) -> List[int]:
@@ -3912,7 +4132,7 @@ class CTFChallengeAutomator:
         except Exception as e:
             result["status"] = "error"
             result["error"] = str(e)
-            logger.error(f"Error in auto-solve for {challenge.name}: {str(e)}")
+            logger.error("Error in auto-solve for %s: %s", challenge.name, e)
         
         return result
     
@@ -4593,7 +4813,7 @@ class PerformanceMonitor:
                 "timestamp": time.time()
             }
         except Exception as e:
-            logger.error(f"Error monitoring system resources: {str(e)}")
+            logger.error("Error monitoring system resources: %s", e)
             return {}
     
     def optimize_based_on_resources(self, current_params: Dict[str, Any], resource_usage: Dict[str, float]) -> Dict[str, Any]:
@@ -4916,7 +5136,7 @@ class ProcessPool:
             self.active_tasks[task_id] = task
             self.task_queue.put(task)
         
-        logger.info(f"📋 Task submitted to pool: {task_id}")
+        logger.info("📋 Task submitted to pool: %s", task_id)
         return task_id
     
     def get_task_result(self, task_id: str) -> Dict[str, Any]:
@@ -4931,7 +5151,7 @@ class ProcessPool:
     
     def _worker_thread(self, worker_id: int):
         """Worker thread that processes tasks"""
-        logger.info(f"🔧 Process pool worker {worker_id} started")
+        logger.info("🔧 Process pool worker %s started", worker_id)
         
         while True:
             try:
@@ -4976,7 +5196,7 @@ class ProcessPool:
                         if task_id in self.active_tasks:
                             del self.active_tasks[task_id]
                     
-                    logger.info(f"✅ Task completed: {task_id} in {execution_time:.2f}s")
+                    logger.info("✅ Task completed: %s in %.2fs", task_id, execution_time)
                     
                 except Exception as e:
                     # Handle task failure
@@ -4994,7 +5214,7 @@ class ProcessPool:
                         if task_id in self.active_tasks:
                             del self.active_tasks[task_id]
                     
-                    logger.error(f"❌ Task failed: {task_id} - {str(e)}")
+                    logger.error("❌ Task failed: %s - %s", task_id, e)
                 
                 self.task_queue.task_done()
                 
@@ -5002,7 +5222,7 @@ class ProcessPool:
                 # No tasks available, continue waiting
                 continue
             except Exception as e:
-                logger.error(f"💥 Worker {worker_id} error: {str(e)}")
+                logger.error("💥 Worker %s error: %s", worker_id, e)
     
     def _monitor_performance(self):
         """Monitor pool performance and auto-scale"""
@@ -5026,13 +5246,13 @@ class ProcessPool:
                     # Scale up
                     new_workers = min(2, self.max_workers - active_workers)
                     self._scale_up(new_workers)
-                    logger.info(f"📈 Scaled up process pool: +{new_workers} workers (total: {active_workers + new_workers})")
+                    logger.info("📈 Scaled up process pool: +%s workers (total: %s)", new_workers, active_workers + new_workers)
                 
                 elif load_ratio < 0.3 and active_workers > self.min_workers:
                     # Scale down
                     workers_to_remove = min(1, active_workers - self.min_workers)
                     self._scale_down(workers_to_remove)
-                    logger.info(f"📉 Scaled down process pool: -{workers_to_remove} workers (total: {active_workers - workers_to_remove})")
+                    logger.info("📉 Scaled down process pool: -%s workers (total: %s)", workers_to_remove, active_workers - workers_to_remove)
                 
                 # Update performance metrics
                 try:
@@ -5047,7 +5267,7 @@ class ProcessPool:
                     pass  # Ignore psutil errors
                 
             except Exception as e:
-                logger.error(f"💥 Pool monitor error: {str(e)}")
+                logger.error("💥 Pool monitor error: %s", e)
     
     def _scale_up(self, count: int):
         """Add workers to the pool"""
@@ -5166,7 +5386,7 @@ class AdvancedCache:
         # Find least recently used key
         lru_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
         self._remove_key(lru_key)
-        logger.debug(f"🗑️ Evicted LRU cache entry: {lru_key}")
+        logger.debug("🗑️ Evicted LRU cache entry: %s", lru_key)
     
     def _cleanup_expired(self) -> None:
         """Cleanup expired entries periodically"""
@@ -5185,10 +5405,10 @@ class AdvancedCache:
                         self._remove_key(key)
                 
                 if expired_keys:
-                    logger.debug(f"🧹 Cleaned up {len(expired_keys)} expired cache entries")
+                    logger.debug("🧹 Cleaned up %s expired cache entries", len(expired_keys))
                 
             except Exception as e:
-                logger.error(f"💥 Cache cleanup error: {str(e)}")
+                logger.error("💥 Cache cleanup error: %s", e)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -5241,7 +5461,7 @@ class EnhancedProcessManager:
         cache_key = f"cmd_result_{hash(command)}"
         cached_result = self.cache.get(cache_key)
         if cached_result and context and context.get("use_cache", True):
-            logger.info(f"📋 Using cached result for command: {command[:50]}...")
+            logger.info("📋 Using cached result for command: %s...", command[:50])
             return cached_result
         
         # Submit to process pool
@@ -5354,17 +5574,17 @@ class EnhancedProcessManager:
                 try:
                     process.wait(timeout=timeout)
                     process_info["status"] = "terminated_gracefully"
-                    logger.info(f"✅ Process {pid} terminated gracefully")
+                    logger.info("✅ Process %s terminated gracefully", pid)
                     return True
                 except subprocess.TimeoutExpired:
                     # Force kill if graceful termination fails
                     process.kill()
                     process_info["status"] = "force_killed"
-                    logger.warning(f"⚠️ Process {pid} force killed after timeout")
+                    logger.warning("⚠️ Process %s force killed after timeout", pid)
                     return True
                     
         except Exception as e:
-            logger.error(f"💥 Error terminating process {pid}: {str(e)}")
+            logger.error("💥 Error terminating process %s: %s", pid, e)
             return False
     
     def _monitor_system(self):
@@ -5384,7 +5604,7 @@ class EnhancedProcessManager:
                 self.performance_dashboard.update_system_metrics(resource_usage)
                 
             except Exception as e:
-                logger.error(f"💥 System monitoring error: {str(e)}")
+                logger.error("💥 System monitoring error: %s", e)
     
     def _auto_scale_based_on_resources(self, resource_usage: Dict[str, float]):
         """Auto-scale process pool based on resource usage"""
@@ -5397,7 +5617,7 @@ class EnhancedProcessManager:
             
             if current_workers > self.process_pool.min_workers:
                 self.process_pool._scale_down(1)
-                logger.info(f"📉 Auto-scaled down due to high resource usage: CPU {resource_usage['cpu_percent']:.1f}%, Memory {resource_usage['memory_percent']:.1f}%")
+                logger.info("📉 Auto-scaled down due to high resource usage: CPU %.1f%%, Memory %.1f%%", resource_usage['cpu_percent'], resource_usage['memory_percent'])
         
         # Scale up if resources are available and there's demand
         elif (resource_usage["cpu_percent"] < 60 and 
@@ -5406,7 +5626,7 @@ class EnhancedProcessManager:
             
             if current_workers < self.process_pool.max_workers:
                 self.process_pool._scale_up(1)
-                logger.info(f"📈 Auto-scaled up due to available resources and demand")
+                logger.info("📈 Auto-scaled up due to available resources and demand")
     
     def get_comprehensive_stats(self) -> Dict[str, Any]:
         """Get comprehensive system and process statistics"""
@@ -5456,7 +5676,7 @@ class ResourceMonitor:
             return usage
             
         except Exception as e:
-            logger.error(f"💥 Error getting resource usage: {str(e)}")
+            logger.error("💥 Error getting resource usage: %s", e)
             return {
                 "cpu_percent": 0,
                 "memory_percent": 0,
@@ -5570,45 +5790,156 @@ ctf_coordinator = CTFTeamCoordinator()
 # ============================================================================
 
 # Process management for command termination
-active_processes = {}  # pid -> process info
+@dataclass
+class ProcessInfo:
+    """Slotted registry entry for an active process"""
+    __slots__ = ("pid", "command", "process", "start_time", "status", "progress",
+                 "last_output", "bytes_processed", "runtime", "eta", "cgroup")
+    pid: int
+    command: str
+    process: Any
+    start_time: float
+    status: str
+    progress: float
+    last_output: str
+    bytes_processed: int
+    runtime: float
+    eta: float
+    cgroup: Optional[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert ProcessInfo to a JSON-serializable snapshot (without the Popen handle)"""
+        return {
+            "pid": self.pid,
+            "command": self.command,
+            "start_time": self.start_time,
+            "status": self.status,
+            "progress": self.progress,
+            "last_output": self.last_output,
+            "bytes_processed": self.bytes_processed,
+            "runtime": self.runtime,
+            "eta": self.eta
+        }
+    
+    def to_view(self, now: float) -> Dict[str, Any]:
+        """Snapshot plus the formatted runtime/ETA/progress fields served by the API"""
+        view = self.to_dict()
+        runtime = now - self.start_time
+        view["runtime_formatted"] = f"{runtime:.1f}s"
+        if self.progress > 0:
+            view["eta_formatted"] = f"{(runtime / self.progress) * (1.0 - self.progress):.1f}s"
+        else:
+            view["eta_formatted"] = "Unknown"
+        view["progress_bar"] = PROCESS_PROGRESS_BARS[int(max(0.0, min(1.0, self.progress)) * 20)]
+        return view
+
+# Plain 20-cell progress bars for every fill level, built once
+PROCESS_PROGRESS_BARS = tuple('█' * i + '░' * (20 - i) for i in range(21))
+
+# pid -> process info, published copy-on-write: writers build a new dict under
+# process_lock and swap the reference, readers use whatever table is current
+active_processes: Dict[int, ProcessInfo] = {}
 process_lock = threading.Lock()
 
+# cgroup v2 hierarchy used to freeze whole process trees on pause/resume
+CGROUP_ROOT = Path("/sys/fs/cgroup/hexstrike")
+
 class ProcessManager:
     """Enhanced process manager for command termination and monitoring"""
     
+    _cgroup_available = None
+    
+    @staticmethod
+    def _cgroup_freezer_available() -> bool:
+        """Check (once) whether a writable cgroup v2 hierarchy with freezer support exists"""
+        if ProcessManager._cgroup_available is None:
+            try:
+                if (CGROUP_ROOT.parent / "cgroup.controllers").exists():
+                    CGROUP_ROOT.mkdir(exist_ok=True)
+                    ProcessManager._cgroup_available = os.access(CGROUP_ROOT, os.W_OK)
+                else:
+                    ProcessManager._cgroup_available = False
+            except OSError:
+                ProcessManager._cgroup_available = False
+        return ProcessManager._cgroup_available
+    
+    @staticmethod
+    def _attach_cgroup(pid) -> Optional[str]:
+        """Move a process into its own cgroup so children it forks are frozen with it"""
+        if not ProcessManager._cgroup_freezer_available():
+            return None
+        cgroup_dir = CGROUP_ROOT / str(pid)
+        try:
+            cgroup_dir.mkdir(exist_ok=True)
+            (cgroup_dir / "cgroup.procs").write_text(str(pid))
+            return str(cgroup_dir)
+        except OSError as e:
+            logger.debug("cgroup attach failed for %s: %s", pid, e)
+            try:
+                cgroup_dir.rmdir()
+            except OSError:
+                pass
+            return None
+    
+    @staticmethod
+    def _signal_process_tree(process_info: ProcessInfo, freeze: bool):
+        """Freeze/thaw via cgroup v2, falling back to signalling the whole process group"""
+        if process_info.cgroup:
+            try:
+                Path(process_info.cgroup, "cgroup.freeze").write_text("1" if freeze else "0")
+                return
+            except OSError as e:
+                logger.debug("cgroup freeze failed for %s: %s", process_info.pid, e)
+        sig = signal.SIGSTOP if freeze else signal.SIGCONT
+        try:
+            os.killpg(os.getpgid(process_info.pid), sig)
+        except (ProcessLookupError, PermissionError):
+            os.kill(process_info.pid, sig)
+    
+    @staticmethod
+    def _publish(table: Dict[int, ProcessInfo]):
+        """Swap in a new process table (callers hold process_lock)"""
+        global active_processes
+        active_processes = table
+    
     @staticmethod
     def register_process(pid, command, process_obj):
         """Register a new active process"""
         with process_lock:
-            active_processes[pid] = {
-                "pid": pid,
-                "command": command,
-                "process": process_obj,
-                "start_time": time.time(),
-                "status": "running",
-                "progress": 0.0,
-                "last_output": "",
-                "bytes_processed": 0
-            }
-            logger.info(f"🆔 REGISTERED: Process {pid} - {command[:50]}...")
+            table = dict(active_processes)
+            table[pid] = ProcessInfo(
+                pid=pid,
+                command=command,
+                process=process_obj,
+                start_time=time.time(),
+                status="running",
+                progress=0.0,
+                last_output="",
+                bytes_processed=0,
+                runtime=0.0,
+                eta=0.0,
+                cgroup=ProcessManager._attach_cgroup(pid)
+            )
+            ProcessManager._publish(table)
+            logger.info("🆔 REGISTERED: Process %s - %s...", pid, command[:50])
     
     @staticmethod
     def update_process_progress(pid, progress, last_output="", bytes_processed=0):
-        """Update process progress and stats"""
-        with process_lock:
-            if pid in active_processes:
-                active_processes[pid]["progress"] = progress
-                active_processes[pid]["last_output"] = last_output
-                active_processes[pid]["bytes_processed"] = bytes_processed
-                runtime = time.time() - active_processes[pid]["start_time"]
-                
-                # Calculate ETA if progress > 0
-                eta = 0
-                if progress > 0:
-                    eta = (runtime / progress) * (1.0 - progress)
-                
-                active_processes[pid]["runtime"] = runtime
-                active_processes[pid]["eta"] = eta
+        """Update process progress and stats (only the process's own monitor writes these)"""
+        info = active_processes.get(pid)
+        if info is not None:
+            info.progress = progress
+            info.last_output = last_output
+            info.bytes_processed = bytes_processed
+            runtime = time.time() - info.start_time
+            
+            # Calculate ETA if progress > 0
+            eta = 0
+            if progress > 0:
+                eta = (runtime / progress) * (1.0 - progress)
+            
+            info.runtime = runtime
+            info.eta = eta
     
     @staticmethod
     def terminate_process(pid):
@@ -5617,73 +5948,110 @@ class ProcessManager:
             if pid in active_processes:
                 process_info = active_processes[pid]
                 try:
-                    process_obj = process_info["process"]
+                    process_obj = process_info.process
                     if process_obj and process_obj.poll() is None:
                         process_obj.terminate()
-                        time.sleep(1)  # Give it a chance to terminate gracefully
-                        if process_obj.poll() is None:
+                        try:
+                            # Returns as soon as the process exits, at most 1s for a graceful exit
+                            process_obj.wait(timeout=1.0)
+                        except subprocess.TimeoutExpired:
                             process_obj.kill()  # Force kill if still running
+                            try:
+                                process_obj.wait(timeout=1.0)
+                            except subprocess.TimeoutExpired:
+                                logger.warning("⚠️  Process %s still alive after SIGKILL", pid)
                         
-                        active_processes[pid]["status"] = "terminated"
-                        logger.warning(f"🛑 TERMINATED: Process {pid} - {process_info['command'][:50]}...")
+                        process_info.status = "terminated"
+                        logger.warning("🛑 TERMINATED: Process %s - %s...", pid, process_info.command[:50])
                         return True
                 except Exception as e:
-                    logger.error(f"💥 Error terminating process {pid}: {str(e)}")
+                    logger.error("💥 Error terminating process %s: %s", pid, e)
                     return False
             return False
     
+    @staticmethod
+    def terminate_all():
+        """Terminate every tracked process (used on server shutdown)"""
+        for info in ProcessManager.snapshot():
+            ProcessManager.terminate_process(info.pid)
+    
     @staticmethod
     def cleanup_process(pid):
         """Remove process from active registry"""
         with process_lock:
             if pid in active_processes:
-                process_info = active_processes.pop(pid)
-                logger.info(f"🧹 CLEANUP: Process {pid} removed from registry")
+                table = dict(active_processes)
+                process_info = table.pop(pid)
+                ProcessManager._publish(table)
+                if process_info.cgroup:
+                    try:
+                        os.rmdir(process_info.cgroup)
+                    except OSError:
+                        pass  # Still populated by lingering children; kernel keeps it until empty
+                logger.info("🧹 CLEANUP: Process %s removed from registry", pid)
                 return process_info
             return None
     
     @staticmethod
     def get_process_status(pid):
         """Get status of a specific process"""
-        with process_lock:
-            return active_processes.get(pid, None)
+        info = active_processes.get(pid)
+        return info.to_dict() if info is not None else None
+    
+    @staticmethod
+    def snapshot() -> Tuple[ProcessInfo, ...]:
+        """Lock-free view of the currently published process table"""
+        return tuple(active_processes.values())
     
     @staticmethod
     def list_active_processes():
         """List all active processes"""
-        with process_lock:
-            return dict(active_processes)
+        return {pid: info.to_dict() for pid, info in active_processes.items()}
+    
+    @staticmethod
+    def get_process_view(pid):
+        """Get the formatted API view of a specific process"""
+        info = active_processes.get(pid)
+        return info.to_view(time.time()) if info is not None else None
+    
+    @staticmethod
+    def list_process_views():
+        """Project all active processes into formatted API views in a single pass"""
+        now = time.time()
+        return {pid: info.to_view(now) for pid, info in active_processes.items()}
     
     @staticmethod
     def pause_process(pid):
-        """Pause a specific process (SIGSTOP)"""
+        """Pause a process and its children (cgroup freezer or process-group SIGSTOP)"""
         with process_lock:
             if pid in active_processes:
                 try:
-                    process_obj = active_processes[pid]["process"]
+                    process_info = active_processes[pid]
+                    process_obj = process_info.process
                     if process_obj and process_obj.poll() is None:
-                        os.kill(pid, signal.SIGSTOP)
-                        active_processes[pid]["status"] = "paused"
-                        logger.info(f"⏸️  PAUSED: Process {pid}")
+                        ProcessManager._signal_process_tree(process_info, freeze=True)
+                        process_info.status = "paused"
+                        logger.info("⏸️  PAUSED: Process %s", pid)
                         return True
                 except Exception as e:
-                    logger.error(f"💥 Error pausing process {pid}: {str(e)}")
+                    logger.error("💥 Error pausing process %s: %s", pid, e)
             return False
     
     @staticmethod
     def resume_process(pid):
-        """Resume a paused process (SIGCONT)"""
+        """Resume a paused process tree (cgroup thaw or process-group SIGCONT)"""
         with process_lock:
             if pid in active_processes:
                 try:
-                    process_obj = active_processes[pid]["process"]
+                    process_info = active_processes[pid]
+                    process_obj = process_info.process
                     if process_obj and process_obj.poll() is None:
-                        os.kill(pid, signal.SIGCONT)
-                        active_processes[pid]["status"] = "running"
-                        logger.info(f"▶️  RESUMED: Process {pid}")
+                        ProcessManager._signal_process_tree(process_info, freeze=False)
+                        process_info.status = "running"
+                        logger.info("▶️  RESUMED: Process %s", pid)
                         return True
                 except Exception as e:
-                    logger.error(f"💥 Error resuming process {pid}: {str(e)}")
+                    logger.error("💥 Error resuming process %s: %s", pid, e)
             return False
 
 # Enhanced color codes and visual elements for modern terminal output
@@ -5713,7 +6081,7 @@ class PythonEnvironmentManager:
         """Create a new virtual environment"""
         env_path = self.base_dir / env_name
         if not env_path.exists():
-            logger.info(f"🐍 Creating virtual environment: {env_name}")
+            logger.info("🐍 Creating virtual environment: %s", env_name)
             venv.create(env_path, with_pip=True)
         return env_path
     
@@ -5726,13 +6094,13 @@ class PythonEnvironmentManager:
             result = subprocess.run([str(pip_path), "install", package], 
                                   capture_output=True, text=True, timeout=300)
             if result.returncode == 0:
-                logger.info(f"📦 Installed package {package} in {env_name}")
+                logger.info("📦 Installed package %s in %s", package, env_name)
                 return True
             else:
-                logger.error(f"❌ Failed to install {package}: {result.stderr}")
+                logger.error("❌ Failed to install %s: %s", package, result.stderr)
                 return False
         except Exception as e:
-            logger.error(f"💥 Error installing package {package}: {e}")
+            logger.error("💥 Error installing package %s: %s", package, e)
             return False
     
     def get_python_path(self, env_name: str) -> str:
@@ -5972,13 +6340,17 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': '🔥'
     }
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Precompute per-level prefixes once instead of rebuilding them for every record
+        self._prefix = {level: f"{color}{self.EMOJIS.get(level, '📝')} " for level, color in self.COLORS.items()}
+        self._default_prefix = f"{ModernVisualEngine.COLORS['BRIGHT_WHITE']}📝 "
+        self._suffix = ModernVisualEngine.COLORS['RESET']
+    
     def format(self, record):
-        emoji = self.EMOJIS.get(record.levelname, '📝')
-        color = self.COLORS.get(record.levelname, ModernVisualEngine.COLORS['BRIGHT_WHITE'])
-        
-        # Add color and emoji to the message
-        record.msg = f"{color}{emoji} {record.msg}{ModernVisualEngine.COLORS['RESET']}"
-        return super().format(record)
+        # Format the untouched record so other handlers sharing it are unaffected
+        prefix = self._prefix.get(record.levelname, self._default_prefix)
+        return f"{prefix}{super().format(record)}{self._suffix}"
 
 # Enhanced logging setup
 def setup_logging():
@@ -6003,8 +6375,11 @@ def setup_logging():
 # Configuration (using existing API_PORT from top of file)
 DEBUG_MODE = os.environ.get("DEBUG_MODE", "0").lower() in ("1", "true", "yes", "y")
 COMMAND_TIMEOUT = 300  # 5 minutes default timeout
+SHORT_COMMAND_TIMEOUT = 5  # Timeout for the short-command fast path
+SHORT_INPUT_SIZE = 1 << 20  # Inputs below this size make xxd/strings short enough for the fast path
 CACHE_SIZE = 1000
 CACHE_TTL = 3600  # 1 hour
+CACHE_SUMMARY_INTERVAL = 1000  # Lookups between aggregated cache log lines
 
 class HexStrikeCache:
     """Advanced caching system for command results"""
@@ -6014,38 +6389,61 @@ class HexStrikeCache:
         self.max_size = max_size
         self.ttl = ttl
         self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.ops_since_summary = 0
         
-    def _generate_key(self, command: str, params: Dict[str, Any]) -> str:
+    @staticmethod
+    def _canonical(value: Any) -> Any:
+        """Convert parameters into a hashable, order-independent form"""
+        if isinstance(value, dict):
+            return tuple(sorted((k, HexStrikeCache._canonical(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(HexStrikeCache._canonical(v) for v in value)
+        if isinstance(value, set):
+            return frozenset(HexStrikeCache._canonical(v) for v in value)
+        return value
+    
+    def _generate_key(self, command: str, params: Dict[str, Any]) -> Tuple[Any, ...]:
         """Generate cache key from command and parameters"""
-        key_data = f"{command}:{json.dumps(params, sort_keys=True)}"
-        return hashlib.md5(key_data.encode()).hexdigest()
+        if not params:
+            return (command,)
+        key = (command, self._canonical(params))
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameter values fall back to a serialized digest
+            key_data = f"{command}:{json.dumps(params, sort_keys=True, default=str)}"
+            key = (command, hashlib.md5(key_data.encode()).hexdigest())
+        return key
     
-    def _is_expired(self, timestamp: float) -> bool:
+    @staticmethod
+    def _is_expired(expires_at: float) -> bool:
         """Check if cache entry is expired"""
-        return time.time() - timestamp > self.ttl
+        return time.time() > expires_at
     
     def get(self, command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Get cached result if available and not expired"""
         key = self._generate_key(command, params)
         
         if key in self.cache:
-            timestamp, data = self.cache[key]
-            if not self._is_expired(timestamp):
+            expires_at, data, _ = self.cache[key]
+            if not self._is_expired(expires_at):
                 # Move to end (most recently used)
                 self.cache.move_to_end(key)
                 self.stats["hits"] += 1
-                logger.info(f"💾 Cache HIT for command: {command}")
+                logger.debug("💾 Cache HIT for command: %s", command)
+                self._record_op()
                 return data
             else:
                 # Remove expired entry
                 del self.cache[key]
         
         self.stats["misses"] += 1
-        logger.info(f"🔍 Cache MISS for command: {command}")
+        logger.debug("🔍 Cache MISS for command: %s", command)
+        self._record_op()
         return None
     
-    def set(self, command: str, params: Dict[str, Any], result: Dict[str, Any]):
-        """Store result in cache"""
+    def set(self, command: str, params: Dict[str, Any], result: Dict[str, Any], ttl: Optional[int] = None):
+        """Store result in cache for ttl seconds (the cache-wide TTL by default)"""
         key = self._generate_key(command, params)
         
         # Remove oldest entries if cache is full
@@ -6054,8 +6452,53 @@ class HexStrikeCache:
             del self.cache[oldest_key]
             self.stats["evictions"] += 1
         
-        self.cache[key] = (time.time(), result)
-        logger.info(f"💾 Cached result for command: {command}")
+        # The serialized form is filled in lazily by get_serialized()
+        self.cache[key] = (time.time() + (self.ttl if ttl is None else ttl), result, None)
+        logger.debug("💾 Cached result for command: %s", command)
+    
+    def get_serialized(self, command: str, params: Dict[str, Any]) -> Optional[bytes]:
+        """Get a cached result as JSON bytes, serializing it at most once per entry
+        
+        Misses are not counted here; callers fall through to execute_command(),
+        whose own lookup records the miss.
+        """
+        key = self._generate_key(command, params)
+        entry = self.cache.get(key)
+        if entry is None or self._is_expired(entry[0]):
+            return None
+        
+        expires_at, data, blob = entry
+        if blob is None:
+            blob = json_dumps_bytes(data)
+            self.cache[key] = (expires_at, data, blob)
+        self.cache.move_to_end(key)
+        self.stats["hits"] += 1
+        logger.debug("💾 Cache HIT for command: %s", command)
+        self._record_op()
+        return blob
+    
+    def _record_op(self):
+        """Emit an aggregated stats line every CACHE_SUMMARY_INTERVAL lookups"""
+        self.ops_since_summary += 1
+        if self.ops_since_summary >= CACHE_SUMMARY_INTERVAL:
+            self.ops_since_summary = 0
+            logger.info("💾 Cache summary: %d hits | %d misses | %d evictions | %d entries",
+                        self.stats["hits"], self.stats["misses"], self.stats["evictions"], len(self.cache))
+    
+    def invalidate(self, match: str) -> int:
+        """Drop entries whose command contains match (e.g. a binary path); returns how many were removed"""
+        # Same swap as clear(): readers keep iterating the old dict while the filtered copy is built
+        kept = OrderedDict((key, entry) for key, entry in tuple(self.cache.items()) if match not in key[0])
+        removed = len(self.cache) - len(kept)
+        self.cache = kept
+        return removed
+    
+    def clear(self):
+        """Drop all entries by swapping in fresh containers instead of clearing in place"""
+        # Readers see either the old or the new dict, never a half-cleared one; the old
+        # entries are released when the last reference to the old dict goes away.
+        self.cache, self.stats = OrderedDict(), {"hits": 0, "misses": 0, "evictions": 0}
+        self.ops_since_summary = 0
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -6121,17 +6564,352 @@ class TelemetryCollector:
 # Global telemetry collector
 telemetry = TelemetryCollector()
 
+class SystemLoadCache:
+    """Short-TTL cache of psutil load samples shared by concurrent dashboard requests"""
+    
+    def __init__(self, ttl: float = 1.0, connections_ttl: float = 2.0):
+        self.ttl = ttl
+        self.connections_ttl = connections_ttl
+        self._lock = threading.Lock()
+        self._value = None
+        self._expires_at = 0.0
+        self._connections = 0
+        self._connections_expires_at = 0.0
+        self._warmer = None
+        # Prime the CPU baseline so later non-blocking samples measure a real interval
+        psutil.cpu_percent(interval=None)
+    
+    def _active_connections(self, now: float) -> int:
+        """Count inet sockets, refreshing at most every connections_ttl seconds"""
+        if now >= self._connections_expires_at:
+            try:
+                self._connections = len(psutil.net_connections(kind="inet"))
+            except (psutil.AccessDenied, OSError) as e:
+                logger.debug("net_connections unavailable: %s", e)
+            self._connections_expires_at = now + self.connections_ttl
+        return self._connections
+    
+    def get(self) -> Dict[str, Any]:
+        """Get the current system load, sampling only when the cached value has expired"""
+        with self._lock:
+            now = time.monotonic()
+            if self._value is None or now >= self._expires_at:
+                self._value = {
+                    "cpu_percent": psutil.cpu_percent(interval=None),
+                    "memory_percent": psutil.virtual_memory().percent,
+                    "active_connections": self._active_connections(now)
+                }
+                self._expires_at = now + self.ttl
+            return dict(self._value)
+    
+    def start_warmer(self, interval: float = 1.0):
+        """Refresh the cache in a background thread so requests never pay for sampling"""
+        if self._warmer is not None:
+            return
+        
+        def warm():
+            while True:
+                try:
+                    self.get()
+                except Exception as e:
+                    logger.debug("System load warmer error: %s", e)
+                time.sleep(interval)
+        
+        self._warmer = threading.Thread(target=warm, name="system-load-warmer", daemon=True)
+        self._warmer.start()
+
+# Global system load cache
+system_load_cache = SystemLoadCache()
+
+# Shared worker pool for command output readers and progress monitors
+COMMAND_POOL_WORKERS = max(32, (os.cpu_count() or 1) * 4)
+command_pool = ThreadPoolExecutor(max_workers=COMMAND_POOL_WORKERS, thread_name_prefix="hexstrike-cmd")
+command_pool_slots = threading.BoundedSemaphore(COMMAND_POOL_WORKERS)
+
+def submit_command_task(fn, *args) -> Future:
+    """Run fn on the shared command pool
+    
+    Pipe readers must never sit in the pool queue (the child would block on a full
+    pipe), so when every worker is busy the task gets a dedicated daemon thread instead.
+    """
+    if command_pool_slots.acquire(blocking=False):
+        future = command_pool.submit(fn, *args)
+        future.add_done_callback(lambda _: command_pool_slots.release())
+        return future
+    
+    future = Future()
+    
+    def run():
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+@functools.lru_cache(maxsize=None)
+def resolve_tool(name: str) -> Optional[str]:
+    """Absolute path of a tool binary, looked up on PATH once per process (None if missing)"""
+    return shutil.which(name)
+
+# Characters that need /bin/sh to interpret (quotes are handled by shlex)
+SHELL_METACHARS = frozenset('|&;<>()$`\\*?[]{}~#!\n')
+
+def split_simple_command(command: str) -> Optional[List[str]]:
+    """Return an argv list if the command needs no shell features, otherwise None"""
+    if any(ch in SHELL_METACHARS for ch in command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0]:
+        return None  # Empty command or leading VAR=value assignment
+    executable = resolve_tool(argv[0])
+    if executable is None:
+        return None  # Let the shell report "command not found" as before
+    return [executable, *argv[1:]]
+
+class RateLimitedLogger:
+    """Token-bucket log wrapper that folds chatty per-line output into periodic summaries"""
+    
+    def __init__(self, log_func, label: str, rate: int = 200, tail_size: int = 20, flush_interval: float = 1.0):
+        self.log_func = log_func
+        self.label = label
+        self.rate = rate
+        self.flush_interval = flush_interval
+        self.tokens = float(rate)
+        self.last_refill = time.monotonic()
+        self.last_flush = self.last_refill
+        self.suppressed = 0
+        self.tail = deque(maxlen=tail_size)
+    
+    def log(self, line: str):
+        """Log a line if the bucket has tokens, otherwise keep it in the tail buffer"""
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        
+        if self.suppressed and now - self.last_flush >= self.flush_interval:
+            self.flush()
+        
+        if self.tokens >= 1:
+            self.tokens -= 1
+            self.log_func("%s: %s", self.label, line)
+        else:
+            self.suppressed += 1
+            self.tail.append(line)
+    
+    def flush(self):
+        """Emit a single consolidated entry for suppressed lines"""
+        if self.suppressed:
+            self.log_func("%s: %d lines suppressed; tail: %s", self.label, self.suppressed, " | ".join(self.tail))
+            self.suppressed = 0
+            self.tail.clear()
+        self.last_flush = time.monotonic()
+
+# Output beyond OUTPUT_INLINE_LIMIT characters is spooled to disk and only its tail is returned inline
+OUTPUT_SPOOL_DIR = Path(tempfile.gettempdir()) / "hexstrike_output"
+OUTPUT_INLINE_LIMIT = 1 << 20
+OUTPUT_TAIL_SIZE = 4096
+# Spill files are pruned once they are older than OUTPUT_SPOOL_MAX_AGE seconds or, oldest first,
+# while the directory holds more than OUTPUT_SPOOL_MAX_BYTES; files written to within the last
+# OUTPUT_SPOOL_ACTIVE seconds are never removed
+OUTPUT_SPOOL_MAX_AGE = int(os.environ.get("HEXSTRIKE_OUTPUT_MAX_AGE", 24 * 3600))
+OUTPUT_SPOOL_MAX_BYTES = int(os.environ.get("HEXSTRIKE_OUTPUT_MAX_BYTES", 2 << 30))
+OUTPUT_SPOOL_ACTIVE = 60
+OUTPUT_SPOOL_PRUNE_INTERVAL = 60
+
+_spool_prune_lock = threading.Lock()
+_spool_pruned_at = 0.0
+
+def prune_output_spool(force: bool = False) -> int:
+    """Delete expired spill files and trim OUTPUT_SPOOL_DIR to its size budget; returns the number removed"""
+    global _spool_pruned_at
+    now = time.time()
+    with _spool_prune_lock:
+        if not force and now - _spool_pruned_at < OUTPUT_SPOOL_PRUNE_INTERVAL:
+            return 0
+        _spool_pruned_at = now
+        try:
+            entries = []
+            for entry in os.scandir(OUTPUT_SPOOL_DIR):
+                if entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return 0
+        
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for mtime, size, path in entries:
+            if now - mtime < OUTPUT_SPOOL_ACTIVE:
+                break
+            if now - mtime < OUTPUT_SPOOL_MAX_AGE and total <= OUTPUT_SPOOL_MAX_BYTES:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            logger.info("🧹 Pruned %d spooled output files", removed)
+        return removed
+
+class OutputSpool:
+    """Collect a command's output in memory, spilling to a file once it outgrows OUTPUT_INLINE_LIMIT"""
+    
+    def __init__(self, stream: str):
+        self.stream = stream
+        self.chunks = []
+        self.size = 0
+        self.file = None
+        self.path = None
+        self.tail = ""
+    
+    def write(self, text: str):
+        self.size += len(text)
+        if self.file is not None:
+            self.file.write(text)
+            self.tail = (self.tail + text)[-OUTPUT_TAIL_SIZE:]
+            return
+        
+        self.chunks.append(text)
+        if self.size > OUTPUT_INLINE_LIMIT:
+            data = "".join(self.chunks)
+            self.chunks = []
+            OUTPUT_SPOOL_DIR.mkdir(exist_ok=True)
+            prune_output_spool()
+            self.file = tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", errors="replace", dir=OUTPUT_SPOOL_DIR,
+                prefix=f"{self.stream}_", suffix=".log", delete=False
+            )
+            self.path = self.file.name
+            self.file.write(data)
+            self.tail = data[-OUTPUT_TAIL_SIZE:]
+    
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+    
+    def on_disk(self, incoming: int = 0) -> bool:
+        """True when writing `incoming` more characters touches the spill file (so may block)"""
+        return self.file is not None or self.size + incoming > OUTPUT_INLINE_LIMIT
+    
+    def getvalue(self) -> str:
+        """Full output when it stayed in memory, otherwise the last OUTPUT_TAIL_SIZE characters"""
+        if self.file is None:
+            if len(self.chunks) > 1:
+                self.chunks = ["".join(self.chunks)]
+            return self.chunks[0] if self.chunks else ""
+        return self.tail
+    
+    def annotate(self, result: Dict[str, Any]):
+        """Point the result at the spooled file when the inline output is only a tail"""
+        if self.path is not None:
+            name = os.path.basename(self.path)
+            result[f"{self.stream}_file"] = self.path
+            result[f"{self.stream}_url"] = f"/api/files/output/{name}"
+            result[f"{self.stream}_size"] = self.size
+            result[f"{self.stream}_truncated"] = True
+    
+    def __len__(self):
+        return self.size
+
+# Command output is read in large binary chunks from enlarged pipes: fewer read() syscalls and
+# wake-ups per megabyte than line-by-line text reads from the default 64 KiB pipe
+OUTPUT_READ_CHUNK = 64 * 1024
+OUTPUT_PIPE_SIZE = 1 << 20
+F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)  # Linux value; exposed by fcntl from Python 3.10
+
+def enlarge_pipe(pipe) -> None:
+    """Grow a pipe's kernel buffer (Linux only, capped by /proc/sys/fs/pipe-max-size); best effort"""
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), F_SETPIPE_SZ, OUTPUT_PIPE_SIZE)
+    except (OSError, ValueError):
+        pass
+
+# Read buffers shared by every OutputPump.drain; each read lands in one of these instead of a fresh bytes
+output_read_buffers: "queue.LifoQueue[bytearray]" = queue.LifoQueue()
+
+# Longest single output line handed to the logger; the rest of an overlong line is dropped from the log
+OUTPUT_LOG_LINE_MAX = 4096
+
+class OutputPump:
+    """Decode raw output chunks into a spool and feed complete lines to a rate-limited logger"""
+    
+    def __init__(self, spool: OutputSpool, log: RateLimitedLogger):
+        self.spool = spool
+        self.log = log
+        self.decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # Fragments of the unfinished last line, joined only once its newline arrives
+        self.pending = []
+        self.pending_size = 0
+    
+    def _hold(self, fragment: str):
+        room = OUTPUT_LOG_LINE_MAX - self.pending_size
+        if room > 0 and fragment:
+            self.pending.append(fragment[:room])
+            self.pending_size += min(len(fragment), room)
+    
+    def _emit(self):
+        line = "".join(self.pending).strip()
+        self.pending = []
+        self.pending_size = 0
+        if line:
+            self.log.log(line)
+    
+    def feed(self, data: Union[bytes, memoryview]):
+        text = self.decoder.decode(data, final=not data)
+        if text:
+            self.spool.write(text)
+            *lines, rest = text.split("\n")
+            for line in lines:
+                self._hold(line)
+                self._emit()
+            self._hold(rest)
+    
+    def close(self):
+        self.feed(b"")
+        self._emit()
+        self.log.flush()
+    
+    def drain(self, pipe):
+        """Read an unbuffered binary pipe to EOF in OUTPUT_READ_CHUNK reads (blocking; run on a worker thread)"""
+        try:
+            buffer = output_read_buffers.get_nowait()
+        except queue.Empty:
+            buffer = bytearray(OUTPUT_READ_CHUNK)
+        view = memoryview(buffer)
+        try:
+            while True:
+                count = pipe.readinto(view)
+                if not count:
+                    break
+                # The decoder copies what it needs, so the buffer is free for the next read
+                self.feed(view[:count])
+        finally:
+            view.release()
+            output_read_buffers.put(buffer)
+            self.close()
+
 class EnhancedCommandExecutor:
     """Enhanced command executor with caching, progress tracking, and better output handling"""
     
-    def __init__(self, command: str, timeout: int = COMMAND_TIMEOUT):
+    def __init__(self, command: str, timeout: int = COMMAND_TIMEOUT, argv: Optional[List[str]] = None):
         self.command = command
+        self.argv = argv
         self.timeout = timeout
         self.process = None
-        self.stdout_data = ""
-        self.stderr_data = ""
-        self.stdout_thread = None
-        self.stderr_thread = None
+        self.stdout_data = OutputSpool("stdout")
+        self.stderr_data = OutputSpool("stderr")
+        self.stdout_future = None
+        self.stderr_future = None
         self.return_code = None
         self.timed_out = False
         self.start_time = None
@@ -6140,43 +6918,34 @@ class EnhancedCommandExecutor:
     def _read_stdout(self):
         """Thread function to continuously read and display stdout"""
         try:
-            for line in iter(self.process.stdout.readline, ''):
-                if line:
-                    self.stdout_data += line
-                    # Real-time output display
-                    logger.info(f"📤 STDOUT: {line.strip()}")
+            # Real-time output display (rate-limited for chatty tools)
+            OutputPump(self.stdout_data, RateLimitedLogger(logger.info, "📤 STDOUT")).drain(self.process.stdout)
         except Exception as e:
-            logger.error(f"Error reading stdout: {e}")
+            logger.error("Error reading stdout: %s", e)
     
     def _read_stderr(self):
         """Thread function to continuously read and display stderr"""
         try:
-            for line in iter(self.process.stderr.readline, ''):
-                if line:
-                    self.stderr_data += line
-                    # Real-time error output display
-                    logger.warning(f"📥 STDERR: {line.strip()}")
+            # Real-time error output display (rate-limited for chatty tools)
+            OutputPump(self.stderr_data, RateLimitedLogger(logger.warning, "📥 STDERR")).drain(self.process.stderr)
         except Exception as e:
-            logger.error(f"Error reading stderr: {e}")
+            logger.error("Error reading stderr: %s", e)
     
     def _show_progress(self, duration: float):
         """Show enhanced progress indication for long-running commands"""
         if duration > 2:  # Show progress for commands taking more than 2 seconds
-            progress_chars = ModernVisualEngine.PROGRESS_STYLES['dots']
+            spinner = itertools.cycle(ModernVisualEngine.PROGRESS_STYLES['dots'])
+            inv_timeout = 1.0 / self.timeout
             start = time.time()
-            i = 0
             while self.process and self.process.poll() is None:
                 elapsed = time.time() - start
-                char = progress_chars[i % len(progress_chars)]
+                char = next(spinner)
                 
-                # Calculate progress percentage (rough estimate)
-                progress_percent = min((elapsed / self.timeout) * 100, 99.9)
-                progress_fraction = progress_percent / 100
+                # Calculate progress (rough estimate against the timeout)
+                progress_fraction = min(elapsed * inv_timeout, 0.999)
                 
-                # Calculate ETA
-                eta = 0
-                if progress_percent > 5:  # Only show ETA after 5% progress
-                    eta = ((elapsed / progress_percent) * 100) - elapsed
+                # ETA reduces to the remaining timeout once past 5% progress
+                eta = self.timeout - elapsed if progress_fraction > 0.05 else 0
                 
                 # Calculate speed
                 bytes_processed = len(self.stdout_data) + len(self.stderr_data)
@@ -6200,9 +6969,8 @@ class EnhancedCommandExecutor:
                     speed=speed
                 )
                 
-                logger.info(f"{progress_bar} | {elapsed:.1f}s | PID: {self.process.pid}")
+                logger.info("%s | %.1fs | PID: %s", progress_bar, elapsed, self.process.pid)
                 time.sleep(0.8)
-                i += 1
                 if elapsed > self.timeout:
                     break
     
@@ -6210,46 +6978,43 @@ class EnhancedCommandExecutor:
         """Execute the command with enhanced monitoring and output"""
         self.start_time = time.time()
         
-        logger.info(f"🚀 EXECUTING: {self.command}")
-        logger.info(f"⏱️  TIMEOUT: {self.timeout}s | PID: Starting...")
+        logger.info("🚀 EXECUTING: %s", self.command)
+        logger.info("⏱️  TIMEOUT: %ss | PID: Starting...", self.timeout)
         
         try:
+            # Simple argv commands are exec'd directly, skipping the intermediate /bin/sh
+            argv = self.argv if self.argv is not None else split_simple_command(self.command)
             self.process = subprocess.Popen(
-                self.command,
-                shell=True,
+                argv if argv is not None else self.command,
+                shell=argv is None,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
+                bufsize=0,
+                start_new_session=True  # Own process group so pause/resume reach the whole tree
             )
+            enlarge_pipe(self.process.stdout)
+            enlarge_pipe(self.process.stderr)
             
             pid = self.process.pid
-            logger.info(f"🆔 PROCESS: PID {pid} started")
+            logger.info("🆔 PROCESS: PID %s started", pid)
             
             # Register process with ProcessManager (v5.0 enhancement)
             ProcessManager.register_process(pid, self.command, self.process)
             
-            # Start threads to read output continuously
-            self.stdout_thread = threading.Thread(target=self._read_stdout)
-            self.stderr_thread = threading.Thread(target=self._read_stderr)
-            self.stdout_thread.daemon = True
-            self.stderr_thread.daemon = True
-            self.stdout_thread.start()
-            self.stderr_thread.start()
+            # Read output continuously on the shared command pool
+            self.stdout_future = submit_command_task(self._read_stdout)
+            self.stderr_future = submit_command_task(self._read_stderr)
             
-            # Start progress tracking in a separate thread
-            progress_thread = threading.Thread(target=self._show_progress, args=(self.timeout,))
-            progress_thread.daemon = True
-            progress_thread.start()
+            # Track progress on the shared command pool
+            submit_command_task(self._show_progress, self.timeout)
             
             # Wait for the process to complete or timeout
             try:
                 self.return_code = self.process.wait(timeout=self.timeout)
                 self.end_time = time.time()
                 
-                # Process completed, join the threads
-                self.stdout_thread.join(timeout=1)
-                self.stderr_thread.join(timeout=1)
+                # Process completed, wait for the readers to drain the pipes
+                wait_futures([self.stdout_future, self.stderr_future], timeout=1)
                 
                 execution_time = self.end_time - self.start_time
                 
@@ -6257,10 +7022,10 @@ class EnhancedCommandExecutor:
                 ProcessManager.cleanup_process(pid)
                 
                 if self.return_code == 0:
-                    logger.info(f"✅ SUCCESS: Command completed | Exit Code: {self.return_code} | Duration: {execution_time:.2f}s")
+                    logger.info("✅ SUCCESS: Command completed | Exit Code: %s | Duration: %.2fs", self.return_code, execution_time)
                     telemetry.record_execution(True, execution_time)
                 else:
-                    logger.warning(f"⚠️  WARNING: Command completed with errors | Exit Code: {self.return_code} | Duration: {execution_time:.2f}s")
+                    logger.warning("⚠️  WARNING: Command completed with errors | Exit Code: %s | Duration: %.2fs", self.return_code, execution_time)
                     telemetry.record_execution(False, execution_time)
                     
             except subprocess.TimeoutExpired:
@@ -6269,7 +7034,7 @@ class EnhancedCommandExecutor:
                 
                 # Process timed out but we might have partial results
                 self.timed_out = True
-                logger.warning(f"⏰ TIMEOUT: Command timed out after {self.timeout}s | Terminating PID {self.process.pid}")
+                logger.warning("⏰ TIMEOUT: Command timed out after %ss | Terminating PID %s", self.timeout, self.process.pid)
                 
                 # Try to terminate gracefully first
                 self.process.terminate()
@@ -6277,13 +7042,16 @@ class EnhancedCommandExecutor:
                     self.process.wait(timeout=5)
                 except subprocess.TimeoutExpired:
                     # Force kill if it doesn't terminate
-                    logger.error(f"🔪 FORCE KILL: Process {self.process.pid} not responding to termination")
+                    logger.error("🔪 FORCE KILL: Process %s not responding to termination", self.process.pid)
                     self.process.kill()
                 
                 self.return_code = -1
                 telemetry.record_execution(False, execution_time)
             
             # Always consider it a success if we have output, even with timeout
+            wait_futures([self.stdout_future, self.stderr_future], timeout=1)
+            self.stdout_data.close()
+            self.stderr_data.close()
             success = True if self.timed_out and (self.stdout_data or self.stderr_data) else (self.return_code == 0)
             
             # Log enhanced final results with summary using ModernVisualEngine
@@ -6313,28 +7081,33 @@ class EnhancedCommandExecutor:
                 if line.strip():
                     logger.info(line)
             
-            return {
-                "stdout": self.stdout_data,
-                "stderr": self.stderr_data,
+            result = {
+                "stdout": self.stdout_data.getvalue(),
+                "stderr": self.stderr_data.getvalue(),
                 "return_code": self.return_code,
                 "success": success,
                 "timed_out": self.timed_out,
-                "partial_results": self.timed_out and (self.stdout_data or self.stderr_data),
+                "partial_results": self.timed_out and bool(self.stdout_data or self.stderr_data),
                 "execution_time": self.end_time - self.start_time if self.end_time else 0,
                 "timestamp": datetime.now().isoformat()
             }
+            self.stdout_data.annotate(result)
+            self.stderr_data.annotate(result)
+            return result
         
         except Exception as e:
             self.end_time = time.time()
             execution_time = self.end_time - self.start_time if self.start_time else 0
             
-            logger.error(f"💥 ERROR: Command execution failed: {str(e)}")
-            logger.error(f"🔍 TRACEBACK: {traceback.format_exc()}")
+            logger.error("💥 ERROR: Command execution failed: %s", e)
+            logger.error("🔍 TRACEBACK: %s", traceback.format_exc())
             telemetry.record_execution(False, execution_time)
             
+            self.stdout_data.close()
+            self.stderr_data.close()
             return {
-                "stdout": self.stdout_data,
-                "stderr": f"Error executing command: {str(e)}\n{self.stderr_data}",
+                "stdout": self.stdout_data.getvalue(),
+                "stderr": f"Error executing command: {str(e)}\n{self.stderr_data.getvalue()}",
                 "return_code": -1,
                 "success": False,
                 "timed_out": False,
@@ -6343,6 +7116,366 @@ class EnhancedCommandExecutor:
                 "timestamp": datetime.now().isoformat()
             }
 
+class AsyncProcessHandle:
+    """Popen-compatible view of an asyncio subprocess so ProcessManager can control it"""
+    
+    def __init__(self, process, loop):
+        self._process = process
+        self._loop = loop
+        self.pid = process.pid
+        self.exited = threading.Event()
+    
+    @property
+    def returncode(self):
+        return self._process.returncode
+    
+    def poll(self):
+        return self._process.returncode
+    
+    def _signal(self, kill: bool):
+        if self._process.returncode is None:
+            try:
+                self._process.kill() if kill else self._process.terminate()
+            except ProcessLookupError:
+                pass
+    
+    def terminate(self):
+        self._loop.call_soon_threadsafe(self._signal, False)
+    
+    def kill(self):
+        self._loop.call_soon_threadsafe(self._signal, True)
+    
+    def wait(self, timeout=None):
+        if not self.exited.wait(timeout):
+            raise subprocess.TimeoutExpired(self.pid, timeout)
+        return self._process.returncode
+
+# Concurrent runs allowed per tool family on the async runner: family -> (limit, binaries)
+# Each limit can be overridden with HEXSTRIKE_MAX_CONCURRENT_<FAMILY>, e.g. HEXSTRIKE_MAX_CONCURRENT_GPU_CRACKING=2
+TOOL_CONCURRENCY_LIMITS = {
+    family: (int(os.environ.get(f"HEXSTRIKE_MAX_CONCURRENT_{family.upper()}", limit)), binaries)
+    for family, (limit, binaries) in {
+        "gpu_cracking": (1, ("hashcat",)),
+        "cpu_cracking": (2, ("john",)),
+        "online_bruteforce": (4, ("hydra", "nxc", "netexec")),
+        "network_scanning": (8, ("nmap", "nikto", "ffuf", "gobuster", "dirb", "nuclei", "wpscan",
+                                 "sqlmap", "smbmap", "enum4linux")),
+        "recon": (8, ("amass", "subfinder")),
+    }.items()
+}
+TOOL_FAMILIES = {binary: family for family, (_, binaries) in TOOL_CONCURRENCY_LIMITS.items() for binary in binaries}
+
+# Unthrottled scanners that routinely run for minutes; supervising them on the async runner's
+# loop costs a coroutine per run instead of two pipe readers and a progress monitor thread
+LONG_RUNNING_TOOLS = frozenset({
+    "feroxbuster", "wfuzz", "dirsearch", "dotdotpwn", "xsser", "x8", "katana", "arjun", "dalfox", "jaeles",
+    "hakrawler", "paramspider", "httpx", "masscan", "rustscan", "autorecon", "kube-hunter", "scout", "zaproxy",
+    "fierce", "dnsenum",
+})
+
+def command_binary(command: str, argv: Optional[List[str]] = None) -> str:
+    """Basename of the executable a command starts"""
+    binary = argv[0] if argv else (command.split(None, 1) or [""])[0]
+    return os.path.basename(binary)
+
+def tool_family(command: str, argv: Optional[List[str]] = None) -> Optional[str]:
+    """Concurrency family of the binary a command runs, if it is throttled"""
+    return TOOL_FAMILIES.get(command_binary(command, argv))
+
+# Event loop behind AsyncCommandRunner: "auto" prefers uvloop, "asyncio" pins the stdlib epoll/selector
+# loop (e.g. on hosts whose seccomp profile trips libuv); "auto" also falls back when uvloop fails to start
+EVENT_LOOP_BACKEND = os.environ.get("HEXSTRIKE_EVENT_LOOP", "auto").lower()
+
+# How often a blocked request checks whether its client has gone away (see client_disconnect_probe)
+DISCONNECT_POLL_INTERVAL = 1.0
+
+def new_event_loop() -> Tuple[asyncio.AbstractEventLoop, str]:
+    """A fresh event loop for the configured backend, and the backend's name"""
+    if uvloop is not None and EVENT_LOOP_BACKEND in ("auto", "uvloop"):
+        try:
+            return uvloop.new_event_loop(), "uvloop"
+        except (OSError, RuntimeError) as e:
+            logger.warning("⚠️  uvloop unavailable (%s), falling back to the asyncio event loop", e)
+    return asyncio.new_event_loop(), "asyncio"
+
+class AsyncCommandRunner:
+    """
+    Supervise tool subprocesses from a single asyncio event loop
+    
+    EnhancedCommandExecutor ties up two pipe readers and a progress monitor per
+    command; here every running scan is a coroutine on one background loop, so
+    request handlers only block on a future while the loop multiplexes the pipes.
+    Runs are admitted through per-family semaphores (TOOL_CONCURRENCY_LIMITS).
+    """
+    
+    def __init__(self):
+        self.loop = None
+        self.backend = None
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._family_stats = {family: {"running": 0, "queued": 0} for family in TOOL_CONCURRENCY_LIMITS}
+    
+    def _ensure_loop(self):
+        with self._lock:
+            if self.loop is None:
+                self.loop, self.backend = new_event_loop()
+                logger.info("🔁 Async command runner started on the %s event loop", self.backend)
+                threading.Thread(target=self.loop.run_forever, name="hexstrike-async-exec", daemon=True).start()
+        return self.loop
+    
+    def run(self, command: str, timeout: int = COMMAND_TIMEOUT, argv: Optional[List[str]] = None,
+            input_data: Optional[bytes] = None, cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """
+        Execute a command on the event loop and block until its result is ready
+        
+        cancelled is polled every DISCONNECT_POLL_INTERVAL seconds while the command is queued
+        or running; once it returns True the run is cancelled, which terminates the process.
+        """
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self._execute_limited(command, timeout, argv, input_data), loop)
+        if cancelled is None:
+            return future.result()
+        
+        while not wait_futures([future], timeout=DISCONNECT_POLL_INTERVAL).done:
+            if cancelled():
+                future.cancel()
+                logger.warning("🛑 CANCELLED: Client disconnected, terminating | %s", command[:60])
+                return {
+                    "stdout": "",
+                    "stderr": "Cancelled: the client disconnected",
+                    "return_code": -1,
+                    "success": False,
+                    "timed_out": False,
+                    "cancelled": True,
+                    "partial_results": False,
+                    "execution_time": 0,
+                    "timestamp": datetime.now().isoformat()
+                }
+        return future.result()
+    
+    def run_many(self, argvs: List[List[str]], timeout: int = COMMAND_TIMEOUT) -> List[Dict[str, Any]]:
+        """
+        Execute several argv commands in one submission to the event loop and block until all finish
+        
+        The whole batch costs one cross-thread handoff and one waiting thread instead of a
+        thread per command each scheduling its own coroutine. Family limits still apply per run.
+        """
+        loop = self._ensure_loop()
+        runs = [(shlex.join(argv), [resolve_tool(argv[0]) or argv[0], *argv[1:]]) for argv in argvs]
+        
+        async def run_all():
+            return await asyncio.gather(*(self._execute_limited(command, timeout, argv) for command, argv in runs))
+        
+        return asyncio.run_coroutine_threadsafe(run_all(), loop).result()
+    
+    async def _execute_limited(self, command: str, timeout: int, argv: Optional[List[str]],
+                               input_data: Optional[bytes] = None) -> Dict[str, Any]:
+        family = tool_family(command, argv)
+        if family is None:
+            return await self._execute(command, timeout, argv, input_data)
+        
+        await self._acquire(family, command)
+        try:
+            return await self._execute(command, timeout, argv, input_data)
+        finally:
+            self._release(family)
+    
+    async def _acquire(self, family: str, command: str):
+        semaphore = self._semaphores.get(family)
+        if semaphore is None:
+            semaphore = self._semaphores[family] = asyncio.Semaphore(TOOL_CONCURRENCY_LIMITS[family][0])
+        if semaphore.locked():
+            logger.info("⏳ QUEUED: %s limit reached, waiting for a slot | %s", family, command[:60])
+        
+        stats = self._family_stats[family]
+        stats["queued"] += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            stats["queued"] -= 1
+        stats["running"] += 1
+    
+    def _release(self, family: str):
+        self._family_stats[family]["running"] -= 1
+        self._semaphores[family].release()
+    
+    def acquire_slot(self, command: str, argv: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Block until the command's family has a free slot and take it for a process run outside the loop
+        
+        Returns the family to hand back to release_slot, or None for unthrottled tools.
+        """
+        family = tool_family(command, argv)
+        if family is not None:
+            asyncio.run_coroutine_threadsafe(self._acquire(family, command), self._ensure_loop()).result()
+        return family
+    
+    def release_slot(self, family: Optional[str]):
+        """Give back a slot taken with acquire_slot"""
+        if family is not None:
+            self.loop.call_soon_threadsafe(self._release, family)
+    
+    def throttle_status(self) -> Dict[str, Any]:
+        """Limit, running and queued counts for every throttled tool family"""
+        return {
+            family: {
+                "limit": limit,
+                "running": self._family_stats[family]["running"],
+                "queued": self._family_stats[family]["queued"],
+                "tools": list(binaries)
+            }
+            for family, (limit, binaries) in TOOL_CONCURRENCY_LIMITS.items()
+        }
+    
+    @staticmethod
+    async def _pump(stream, spool: OutputSpool, log: RateLimitedLogger):
+        # In-memory appends stay on the loop; once the spool spills, its file writes go to a worker thread
+        loop = asyncio.get_running_loop()
+        pump = OutputPump(spool, log)
+        try:
+            while True:
+                data = await stream.read(OUTPUT_READ_CHUNK)
+                if not data:
+                    break
+                if spool.on_disk(len(data)):
+                    await loop.run_in_executor(None, pump.feed, data)
+                else:
+                    pump.feed(data)
+        finally:
+            pump.close()
+    
+    @staticmethod
+    async def _feed(stream, data: bytes):
+        try:
+            stream.write(data)
+            await stream.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The process exited without reading all of its input
+        finally:
+            stream.close()
+    
+    async def _track_progress(self, pid: int, start: float, timeout: int, stdout_spool, stderr_spool):
+        loop = asyncio.get_running_loop()
+        inv_timeout = 1.0 / timeout
+        while True:
+            await asyncio.sleep(1.0)
+            elapsed = time.time() - start
+            bytes_processed = len(stdout_spool) + len(stderr_spool)
+            # ProcessManager takes a threading lock, keep it off the loop thread
+            await loop.run_in_executor(
+                None, ProcessManager.update_process_progress,
+                pid, min(elapsed * inv_timeout, 0.999), f"Running for {elapsed:.1f}s", bytes_processed
+            )
+    
+    async def _execute(self, command: str, timeout: int, argv: Optional[List[str]] = None,
+                       input_data: Optional[bytes] = None) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        stdin = asyncio.subprocess.PIPE if input_data is not None else None
+        start_time = time.time()
+        stdout_spool, stderr_spool = OutputSpool("stdout"), OutputSpool("stderr")
+        timed_out = False
+        
+        logger.info("🚀 EXECUTING (async): %s", command)
+        
+        try:
+            if argv is None:
+                argv = split_simple_command(command)
+            if argv is not None:
+                process = await asyncio.create_subprocess_exec(
+                    *argv, stdin=stdin, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                    start_new_session=True
+                )
+            else:
+                process = await asyncio.create_subprocess_shell(
+                    command, stdin=stdin, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                    start_new_session=True
+                )
+        except Exception as e:
+            execution_time = time.time() - start_time
+            logger.error("💥 ERROR: Command execution failed: %s", e)
+            telemetry.record_execution(False, execution_time)
+            return {
+                "stdout": "",
+                "stderr": f"Error executing command: {str(e)}",
+                "return_code": -1,
+                "success": False,
+                "timed_out": False,
+                "partial_results": False,
+                "execution_time": execution_time,
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        pid = process.pid
+        handle = AsyncProcessHandle(process, loop)
+        logger.info("🆔 PROCESS: PID %s started", pid)
+        await loop.run_in_executor(None, ProcessManager.register_process, pid, command, handle)
+        
+        progress = loop.create_task(self._track_progress(pid, start_time, timeout, stdout_spool, stderr_spool))
+        feed = (self._feed(process.stdin, input_data),) if input_data is not None else ()
+        work = asyncio.gather(
+            *feed,
+            self._pump(process.stdout, stdout_spool, RateLimitedLogger(logger.info, "📤 STDOUT")),
+            self._pump(process.stderr, stderr_spool, RateLimitedLogger(logger.warning, "📥 STDERR")),
+            process.wait()
+        )
+        try:
+            await asyncio.wait_for(work, timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            logger.warning("⏰ TIMEOUT: Command timed out after %ss | Terminating PID %s", timeout, pid)
+            handle._signal(kill=False)
+            try:
+                await asyncio.wait_for(process.wait(), 5)
+            except asyncio.TimeoutError:
+                logger.error("🔪 FORCE KILL: Process %s not responding to termination", pid)
+                handle._signal(kill=True)
+                await process.wait()
+        except asyncio.CancelledError:
+            # Nobody is waiting for the result any more; free the slot and the scan's CPU
+            if work.done() and not work.cancelled():
+                work.exception()  # Retrieve the children's CancelledError so asyncio does not log it
+            handle._signal(kill=False)
+            try:
+                await asyncio.wait_for(process.wait(), 5)
+            except asyncio.TimeoutError:
+                handle._signal(kill=True)
+            raise
+        finally:
+            progress.cancel()
+            for spool in (stdout_spool, stderr_spool):
+                if spool.on_disk():
+                    await loop.run_in_executor(None, spool.close)
+            handle.exited.set()
+            await loop.run_in_executor(None, ProcessManager.cleanup_process, pid)
+        
+        execution_time = time.time() - start_time
+        stdout, stderr = stdout_spool.getvalue(), stderr_spool.getvalue()
+        return_code = -1 if timed_out else process.returncode
+        success = bool(stdout or stderr) if timed_out else return_code == 0
+        telemetry.record_execution(return_code == 0, execution_time)
+        
+        if success:
+            logger.info("✅ SUCCESS: Command completed | Exit Code: %s | Duration: %.2fs", return_code, execution_time)
+        else:
+            logger.warning("⚠️  WARNING: Command completed with errors | Exit Code: %s | Duration: %.2fs", return_code, execution_time)
+        
+        result = {
+            "stdout": stdout,
+            "stderr": stderr,
+            "return_code": return_code,
+            "success": success,
+            "timed_out": timed_out,
+            "partial_results": timed_out and bool(stdout or stderr),
+            "execution_time": execution_time,
+            "timestamp": datetime.now().isoformat()
+        }
+        stdout_spool.annotate(result)
+        stderr_spool.annotate(result)
+        return result
+
+# Global asyncio command runner
+async_runner = AsyncCommandRunner()
+
 # ============================================================================
 # DUPLICATE CLASSES REMOVED - Using the first definitions above
 # ============================================================================
@@ -6530,7 +7663,7 @@ def send_exploit(target_url, command):
             }
             
         except Exception as e:
-            logger.error(f"Error generating exploit: {str(e)}")
+            logger.error("Error generating exploit: %s", e)
             return {"success": False, "error": str(e)}
     
     def _classify_vulnerability(self, description):
@@ -6721,7 +7854,7 @@ class VulnerabilityCorrelator:
             }
             
         except Exception as e:
-            logger.error(f"Error finding attack chains: {str(e)}")
+            logger.error("Error finding attack chains: %s", e)
             return {"success": False, "error": str(e)}
     
     def _find_vulnerabilities_by_pattern(self, software, pattern_type):
@@ -6765,36 +7898,466 @@ cve_intelligence = CVEIntelligenceManager()
 exploit_generator = AIExploitGenerator()
 vulnerability_correlator = VulnerabilityCorrelator()
 
-def execute_command(command: str, use_cache: bool = True) -> Dict[str, Any]:
+def is_small_file(path: str) -> bool:
+    """True if path is a regular file below SHORT_INPUT_SIZE bytes"""
+    try:
+        return os.path.isfile(path) and os.path.getsize(path) < SHORT_INPUT_SIZE
+    except (OSError, TypeError, ValueError):
+        return False
+
+def execute_command_fast(command: str, timeout: int = SHORT_COMMAND_TIMEOUT,
+                         argv: Optional[List[str]] = None) -> Dict[str, Any]:
     """
-    Execute a shell command with enhanced features
+    Execute a short-lived command synchronously
+    
+    Skips the reader/progress threads and ProcessManager registration used by
+    EnhancedCommandExecutor, which cost more than commands finishing in milliseconds.
     
     Args:
         command: The command to execute
+        timeout: Timeout in seconds
+        argv: Pre-split arguments to exec directly instead of running command via the shell
+        
+    Returns:
+        A dictionary with the same shape as EnhancedCommandExecutor.execute()
+    """
+    start_time = time.time()
+    timed_out = False
+    
+    # An absolute executable with close_fds=False lets subprocess use posix_spawn() (vfork-style)
+    # instead of fork()ing the whole server; Python-created descriptors are non-inheritable anyway
+    spawn_argv = None
+    if argv is not None:
+        executable = resolve_tool(argv[0])
+        if executable is not None:
+            spawn_argv = [executable, *argv[1:]]
+    
+    try:
+        completed = subprocess.run(
+            (spawn_argv or argv) if argv is not None else command,
+            shell=argv is None,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            close_fds=spawn_argv is None
+        )
+        stdout, stderr, return_code = completed.stdout, completed.stderr, completed.returncode
+    except subprocess.TimeoutExpired as e:
+        timed_out = True
+        stdout = e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+        stderr = e.stderr.decode(errors="replace") if isinstance(e.stderr, bytes) else (e.stderr or "")
+        return_code = -1
+    except Exception as e:
+        stdout, stderr, return_code = "", f"Error executing command: {str(e)}", -1
+    
+    execution_time = time.time() - start_time
+    success = return_code == 0
+    telemetry.record_execution(success, execution_time)
+    
+    return {
+        "stdout": stdout,
+        "stderr": stderr,
+        "return_code": return_code,
+        "success": success,
+        "timed_out": timed_out,
+        "partial_results": timed_out and bool(stdout or stderr),
+        "execution_time": execution_time,
+        "timestamp": datetime.now().isoformat()
+    }
+
+@functools.lru_cache(maxsize=64)
+def _printable_run_pattern(min_len: int) -> "re.Pattern[bytes]":
+    # Same character class as GNU strings: printable ASCII plus tab
+    return re.compile(rb"[\t\x20-\x7e]{%d,}" % min_len)
+
+def scan_strings(path: str, min_len: int = 4) -> Dict[str, Any]:
+    """
+    Extract printable runs from a file over a read-only mmap, like `strings -a -n min_len`
+    
+    The regex engine walks the mapping in C, so small files skip the fork/exec and
+    pipe copy of strings(1). Returns the same shape as execute_command_fast().
+    """
+    start_time = time.time()
+    stdout, stderr, return_code = "", "", 0
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    runs = _printable_run_pattern(max(1, min_len)).findall(mapped)
+                stdout = b"".join(run + b"\n" for run in runs).decode("ascii")
+    except OSError as e:
+        stderr, return_code = f"strings: '{path}': {e.strerror}\n", 1
+    
+    execution_time = time.time() - start_time
+    telemetry.record_execution(return_code == 0, execution_time)
+    return {
+        "stdout": stdout,
+        "stderr": stderr,
+        "return_code": return_code,
+        "success": return_code == 0,
+        "timed_out": False,
+        "partial_results": False,
+        "execution_time": execution_time,
+        "timestamp": datetime.now().isoformat()
+    }
+
+# Byte -> xxd ASCII column character (printable ASCII kept, everything else '.')
+XXD_ASCII_TABLE = bytes(b if 0x20 <= b < 0x7f else 0x2e for b in range(256))
+
+def hex_dump(path: str, offset: int = 0, length: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Render a file region in xxd's default layout (16 bytes per row, 2-byte groups)
+    
+    Reads the region in one call and formats rows with bytes.hex(); returns the
+    same shape as execute_command_fast().
+    """
+    start_time = time.time()
+    stdout, stderr, return_code = "", "", 0
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            data = f.read(-1 if length is None else length)
+        view = memoryview(data)
+        rows = []
+        for pos in range(0, len(data), 16):
+            row = bytes(view[pos:pos + 16])
+            rows.append(f"{offset + pos:08x}: {row.hex(' ', -2):<39}  {row.translate(XXD_ASCII_TABLE).decode('ascii')}\n")
+        stdout = "".join(rows)
+    except OSError as e:
+        stderr, return_code = f"xxd: {path}: {e.strerror}\n", 2
+    
+    execution_time = time.time() - start_time
+    telemetry.record_execution(return_code == 0, execution_time)
+    return {
+        "stdout": stdout,
+        "stderr": stderr,
+        "return_code": return_code,
+        "success": return_code == 0,
+        "timed_out": False,
+        "partial_results": False,
+        "execution_time": execution_time,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def parse_dump_bound(value: str) -> Optional[int]:
+    """Non-negative int from an xxd -s/-l value in decimal or 0x hex, else None"""
+    try:
+        number = int(value, 16) if value.lower().startswith("0x") else int(value, 10)
+    except (AttributeError, ValueError):
+        return None
+    return number if number >= 0 else None
+
+def binwalk_signature_scan(path: str) -> Dict[str, Any]:
+    """
+    Run binwalk's signature scan through its Python API instead of the CLI
+    
+    Results come back as structured offsets/descriptions; stdout is rendered in the
+    CLI's table layout so existing callers see the same text.
+    """
+    start_time = time.time()
+    signatures = []
+    stderr, return_code = "", 0
+    try:
+        for module in binwalk_api.scan(path, signature=True, quiet=True):
+            signatures += [{"offset": r.offset, "description": r.description} for r in module.results]
+    except Exception as e:
+        stderr, return_code = f"binwalk: {e}\n", 1
+    
+    lines = ["", "DECIMAL       HEXADECIMAL     DESCRIPTION", "-" * 80]
+    lines += ["%-14d0x%-14X%s" % (sig["offset"], sig["offset"], sig["description"]) for sig in signatures]
+    execution_time = time.time() - start_time
+    telemetry.record_execution(return_code == 0, execution_time)
+    return {
+        "stdout": "\n".join(lines) + "\n" if return_code == 0 else "",
+        "stderr": stderr,
+        "return_code": return_code,
+        "success": return_code == 0,
+        "timed_out": False,
+        "partial_results": False,
+        "execution_time": execution_time,
+        "timestamp": datetime.now().isoformat(),
+        "signatures": signatures,
+        "backend": "binwalk-api"
+    }
+
+def execute_inprocess(argv: List[str], scan: Callable[[], Dict[str, Any]], cache_deps: Tuple[Any, ...] = (),
+                      force: bool = False, cache_ttl: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Run an in-process stand-in for argv under the cache entry and single-flight key
+    execute_command would use, so concurrent identical requests scan the file once
+    """
+    cache_key = shlex.join(argv)
+    cache_params = {"deps": file_fingerprints(cache_deps)} if cache_deps else {}
+    if not force:
+        cached_result = cache.get(cache_key, cache_params)
+        if cached_result:
+            return cached_result
+    
+    def scan_and_cache():
+        result = scan()
+        if result["success"]:
+            cache.set(cache_key, cache_params, result, cache_ttl)
+        return result
+    
+    return run_single_flight((cache_key, cache_params.get("deps", ())), cache_key, scan_and_cache)
+
+# Wordlist content digests keyed by path, re-hashed only when (mtime_ns, size) changes
+_wl_meta: Dict[str, Tuple[int, int, str]] = {}
+_wl_lock = threading.Lock()
+
+def wordlist_fingerprint(path: str) -> Optional[Tuple[str, int, str]]:
+    """(path, size, blake2b) for a wordlist, or None if it is missing. One stat per call for hot lists."""
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    with _wl_lock:
+        cached = _wl_meta.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return (path, st.st_size, cached[2])
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        with open(path, "rb") as f:
+            if st.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    digest.update(mapped)
+    except (OSError, ValueError):
+        return None
+    with _wl_lock:
+        _wl_meta[path] = (st.st_mtime_ns, st.st_size, digest.hexdigest())
+    return (path, st.st_size, digest.hexdigest())
+
+def file_fingerprints(paths: Tuple[Any, ...]) -> Tuple[Tuple[str, int, int], ...]:
+    """(path, size, mtime_ns) for each existing input file, so cached scans expire when inputs change.
+    Entries that are already fingerprints (e.g. from wordlist_fingerprint) pass through untouched."""
+    fingerprints = []
+    for path in paths:
+        if not path:
+            continue
+        if isinstance(path, tuple):
+            fingerprints.append(path)
+            continue
+        try:
+            st = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            continue
+        fingerprints.append((str(path), st.st_size, st.st_mtime_ns))
+    return tuple(fingerprints)
+
+# Single-flight registry: identical cacheable commands (and uncached long-running scans) already
+# running are joined, not re-run
+inflight_commands: Dict[Tuple[Any, ...], Future] = {}
+inflight_lock = threading.Lock()
+
+def run_single_flight(key: Tuple[Any, ...], label: str, run: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Call run() once per key; callers arriving while it is in flight share the leader's result"""
+    with inflight_lock:
+        future = inflight_commands.get(key)
+        leader = future is None
+        if leader:
+            future = inflight_commands[key] = Future()
+            future.waiters = 0
+        else:
+            future.waiters += 1
+    
+    if not leader:
+        logger.info("🔗 Joining in-flight run: %s", label[:60])
+        return dict(future.result())
+    
+    try:
+        result = run()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with inflight_lock:
+            inflight_commands.pop(key, None)
+
+def flight_waiters(key: Tuple[Any, ...]) -> int:
+    """Number of callers joined to the in-flight run for key, besides its leader"""
+    with inflight_lock:
+        future = inflight_commands.get(key)
+        return future.waiters if future is not None else 0
+
+def execute_command(command: Union[str, List[str]], use_cache: bool = True, short: bool = False,
+                    use_async: bool = False, cache_deps: Tuple[Any, ...] = (),
+                    force: bool = False, cache_ttl: Optional[int] = None,
+                    input_data: Optional[bytes] = None,
+                    cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """
+    Execute a shell command with enhanced features
+    
+    Args:
+        command: The command to execute, either a shell string or an argv list (run without a shell)
         use_cache: Whether to use caching for this command
+        short: Hint that the command completes quickly; runs it via execute_command_fast
+        use_async: Supervise the command on the shared asyncio loop (AsyncCommandRunner)
+        cache_deps: Input files (wordlists, hash files, ...) whose size/mtime are part of the cache key
+        force: Skip the cache lookup and re-run, still caching the fresh result
+        cache_ttl: Seconds to keep this result cached (defaults to CACHE_TTL)
+        input_data: Bytes written to the command's stdin; such commands always run on the async runner
+        cancelled: Polled while an async run is in progress (e.g. client_disconnect_probe()); the
+            process is terminated once it returns True and no other caller shares the run
+        
+    Cacheable commands identical to one already running wait for and share its result, and
+    so do uncached runs of LONG_RUNNING_TOOLS.
         
     Returns:
         A dictionary containing the stdout, stderr, return code, and metadata
     """
+    argv = None
+    if isinstance(command, list):
+        argv, command = command, shlex.join(command)
+        executable = resolve_tool(argv[0])
+        # Exec the pre-resolved binary; the cache key and logs keep the plain command
+        argv = [executable, *argv[1:]] if executable is not None else None
+    
+    # Throttled tools always queue on the async runner so limits hold across every caller,
+    # and long-running scanners are supervised there rather than by per-command threads
+    if not short and (tool_family(command, argv) is not None or command_binary(command, argv) in LONG_RUNNING_TOOLS):
+        use_async = True
+    if input_data is not None:
+        short, use_async = False, True
+    
+    cache_params = {"deps": file_fingerprints(cache_deps)} if cache_deps else {}
+    if input_data is not None:
+        cache_params["stdin"] = hashlib.sha256(input_data).hexdigest()
     
     # Check cache first
-    if use_cache:
-        cached_result = cache.get(command, {})
+    if use_cache and not force:
+        cached_result = cache.get(command, cache_params)
         if cached_result:
             return cached_result
     
-    # Execute command
-    executor = EnhancedCommandExecutor(command)
-    result = executor.execute()
+    flight_key = (command, cache_params.get("deps", ()), cache_params.get("stdin"))
+    if cancelled is not None:
+        caller_gone = cancelled
+        # Callers joined to this run still want it, whatever happened to the leader's client
+        cancelled = lambda: caller_gone() and not flight_waiters(flight_key)
+    
+    if not use_cache:
+        # An identical multi-minute scan already in flight is as fresh as a new one would be
+        if command_binary(command, argv) in LONG_RUNNING_TOOLS:
+            return run_single_flight(flight_key, command,
+                                     lambda: _run_command(command, argv, short, use_async, input_data, cancelled))
+        return _run_command(command, argv, short, use_async, input_data, cancelled)
+    
+    def run_and_cache():
+        result = _run_command(command, argv, short, use_async, input_data, cancelled)
+        
+        # Cache successful results
+        if result.get("success", False):
+            cache.set(command, cache_params, result, cache_ttl)
+        return result
+    
+    return run_single_flight(flight_key, command, run_and_cache)
+
+def _run_command(command: str, argv: Optional[List[str]], short: bool, use_async: bool,
+                 input_data: Optional[bytes] = None, cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """Dispatch a command to the fast, async or threaded executor"""
+    if short:
+        return execute_command_fast(command, argv=argv)
+    if use_async:
+        return async_runner.run(command, argv=argv, input_data=input_data, cancelled=cancelled)
+    return EnhancedCommandExecutor(command, argv=argv).execute()
+
+def cached_command_response(command: Union[str, List[str]], cache_deps: Tuple[Any, ...] = ()) -> Optional[Response]:
+    """
+    Serve a cached execute_command result straight from its stored JSON bytes, or None on a miss
+    
+    Large reports (autorecon, ZAP) are then encoded once per cache entry instead of on every hit.
+    """
+    key = shlex.join(command) if isinstance(command, list) else command
+    blob = cache.get_serialized(key, {"deps": file_fingerprints(cache_deps)} if cache_deps else {})
+    return json_response(blob) if blob is not None else None
+
+def client_disconnect_probe() -> Optional[Callable[[], bool]]:
+    """
+    A callable reporting whether the current request's client has closed its connection,
+    or None when the WSGI server does not expose the socket
+    
+    The request body has been read by the time a scan runs, so a readable socket that
+    peeks zero bytes (or a reset) means the peer hung up. poll() is used rather than
+    select() so descriptors above FD_SETSIZE work; a probe that fails for any other
+    reason reports the client as still connected.
+    """
+    sock = request.environ.get("werkzeug.socket")
+    if sock is None or not hasattr(select, "poll"):
+        return None
+    poller = select.poll()
+    poller.register(sock, select.POLLIN)
+    
+    def disconnected() -> bool:
+        try:
+            if not poller.poll(0):
+                return False
+            return sock.recv(1, socket.MSG_PEEK) == b""
+        except (ConnectionResetError, BrokenPipeError):
+            return True
+        except (OSError, ValueError):
+            return False
+    
+    return disconnected
+
+def wants_stream() -> bool:
+    """True when the client asked for raw streamed output with ?stream=1"""
+    return request.args.get("stream", "").lower() in ("1", "true", "yes")
+
+def stream_command_response(argv: List[str], timeout: int = COMMAND_TIMEOUT) -> Response:
+    """
+    Run a command and stream its combined stdout/stderr as text/plain while it is produced,
+    so large outputs (objdump -d, strings) are never held in memory as a whole
     
-    # Cache successful results
-    if use_cache and result.get("success", False):
-        cache.set(command, {}, result)
+    The process is started before the response is returned, so a missing binary still
+    raises in the endpoint; it is killed on timeout or when the client disconnects. Throttled
+    tools wait for a TOOL_CONCURRENCY_LIMITS slot first and hold it until the stream ends.
+    """
+    family = async_runner.acquire_slot(shlex.join(argv), argv)
+    try:
+        process = subprocess.Popen(argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0,
+                                   start_new_session=True)
+    except BaseException:
+        async_runner.release_slot(family)
+        raise
+    enlarge_pipe(process.stdout)
+    ProcessManager.register_process(process.pid, shlex.join(argv), process)
+    watchdog = threading.Timer(timeout, process.kill)
+    watchdog.daemon = True
+    watchdog.start()
+    finished = []
+    
+    def finish():
+        # Runs from the generator's finally and from the response's close, whichever comes first;
+        # the latter also covers a response closed before its body was ever iterated
+        if finished:
+            return
+        finished.append(True)
+        watchdog.cancel()
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        ProcessManager.cleanup_process(process.pid)
+        async_runner.release_slot(family)
+    
+    def generate():
+        try:
+            yield from iter(lambda: process.stdout.read(OUTPUT_READ_CHUNK), b"")
+            process.wait()
+        finally:
+            finish()
     
-    return result
+    response = Response(stream_with_context(generate()), mimetype="text/plain")
+    response.call_on_close(finish)
+    return response
 
 def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict[str, Any] = None, 
-                                 use_cache: bool = True, max_attempts: int = 3) -> Dict[str, Any]:
+                                 use_cache: bool = True, max_attempts: int = 3,
+                                 use_async: bool = False) -> Dict[str, Any]:
     """
     Execute a command with intelligent error handling and recovery
     
@@ -6804,6 +8367,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
         parameters: Tool parameters for context
         use_cache: Whether to use caching
         max_attempts: Maximum number of recovery attempts
+        use_async: Run attempts on the shared asyncio loop
         
     Returns:
         A dictionary containing execution results with recovery information
@@ -6820,7 +8384,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
         
         try:
             # Execute the command
-            result = execute_command(command, use_cache)
+            result = execute_command(command, use_cache, use_async=use_async)
             
             # Check if execution was successful
             if result.get("success", False):
@@ -6860,7 +8424,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
                 actual_delay = min(delay * (recovery_strategy.backoff_multiplier ** (attempt_count - 1)), backoff)
                 
                 retry_info = f'Retrying in {actual_delay}s (attempt {attempt_count}/{max_attempts})'
-                logger.info(f"{ModernVisualEngine.format_tool_status(tool_name, 'RECOVERY', retry_info)}")
+                logger.info("%s", ModernVisualEngine.format_tool_status(tool_name, 'RECOVERY', retry_info))
                 time.sleep(actual_delay)
                 continue
                 
@@ -6874,7 +8438,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
                 
                 # Rebuild command with adjusted parameters
                 command = _rebuild_command_with_params(tool_name, command, adjusted_params)
-                logger.info(f"🔧 Retrying {tool_name} with reduced scope")
+                logger.info("🔧 Retrying %s with reduced scope", tool_name)
                 continue
                 
             elif recovery_strategy.action == RecoveryAction.SWITCH_TO_ALTERNATIVE_TOOL:
@@ -6883,7 +8447,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
                 
                 if alternative_tool:
                     switch_info = f'Switching to alternative: {alternative_tool}'
-                    logger.info(f"{ModernVisualEngine.format_tool_status(tool_name, 'RECOVERY', switch_info)}")
+                    logger.info("%s", ModernVisualEngine.format_tool_status(tool_name, 'RECOVERY', switch_info))
                     # This would require the calling function to handle tool switching
                     result["alternative_tool_suggested"] = alternative_tool
                     result["recovery_info"] = {
@@ -6894,7 +8458,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
                     }
                     return result
                 else:
-                    logger.warning(f"⚠️  No alternative tool found for {tool_name}")
+                    logger.warning("⚠️  No alternative tool found for %s", tool_name)
                     
             elif recovery_strategy.action == RecoveryAction.ADJUST_PARAMETERS:
                 # Adjust parameters based on error type
@@ -6903,7 +8467,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
                 
                 # Rebuild command with adjusted parameters
                 command = _rebuild_command_with_params(tool_name, command, adjusted_params)
-                logger.info(f"🔧 Retrying {tool_name} with adjusted parameters")
+                logger.info("🔧 Retrying %s with adjusted parameters", tool_name)
                 continue
                 
             elif recovery_strategy.action == RecoveryAction.ESCALATE_TO_HUMAN:
@@ -6952,7 +8516,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
                 return degraded_result
                 
             elif recovery_strategy.action == RecoveryAction.ABORT_OPERATION:
-                logger.error(f"🛑 Aborting {tool_name} operation after {attempt_count} attempts")
+                logger.error("🛑 Aborting %s operation after %s attempts", tool_name, attempt_count)
                 result["recovery_info"] = {
                     "attempts_made": attempt_count,
                     "recovery_applied": True,
@@ -6965,7 +8529,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
             
         except Exception as e:
             last_error = e
-            logger.error(f"💥 Unexpected error in recovery attempt {attempt_count}: {str(e)}")
+            logger.error("💥 Unexpected error in recovery attempt %s: %s", attempt_count, e)
             
             # If this is the last attempt, escalate to human
             if attempt_count >= max_attempts:
@@ -6996,7 +8560,7 @@ def execute_command_with_recovery(tool_name: str, command: str, parameters: Dict
                 }
     
     # All attempts exhausted
-    logger.error(f"🚫 All recovery attempts exhausted for {tool_name}")
+    logger.error("🚫 All recovery attempts exhausted for %s", tool_name)
     return {
         "success": False,
         "error": f"All recovery attempts exhausted: {str(last_error)}",
@@ -7071,7 +8635,8 @@ class FileOperationsManager:
             file_path = self.base_dir / filename
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            if len(content.encode()) > self.max_file_size:
+            content_size = len(content) if isinstance(content, bytes) else len(content.encode())
+            if content_size > self.max_file_size:
                 return {"success": False, "error": f"File size exceeds {self.max_file_size} bytes"}
             
             mode = "wb" if binary else "w"
@@ -7081,11 +8646,48 @@ class FileOperationsManager:
                 else:
                     f.write(content)
             
-            logger.info(f"📄 Created file: {filename} ({len(content)} bytes)")
+            logger.info("📄 Created file: %s (%s bytes)", filename, len(content))
             return {"success": True, "path": str(file_path), "size": len(content)}
             
         except Exception as e:
-            logger.error(f"❌ Error creating file {filename}: {e}")
+            logger.error("❌ Error creating file %s: %s", filename, e)
+            return {"success": False, "error": str(e)}
+    
+    def create_file_streamed(self, filename: str, chunks) -> Dict[str, Any]:
+        """
+        Create a binary file from an iterable of byte chunks without holding it all in memory
+        
+        Chunks go to a temp file beside the target that replaces it only once every chunk
+        is written, so an oversized or interrupted upload leaves no partial file behind.
+        """
+        try:
+            file_path = self.base_dir / filename
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            size = 0
+            # Opened like a plain open() would, so the final file keeps the usual umask permissions
+            temp_path = file_path.parent / f".{file_path.name}.{secrets.token_hex(8)}.part"
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            try:
+                with os.fdopen(fd, "wb", buffering=PAYLOAD_CHUNK_SIZE) as f:
+                    for chunk in chunks:
+                        size += len(chunk)
+                        if size > self.max_file_size:
+                            raise ValueError(f"File size exceeds {self.max_file_size} bytes")
+                        f.write(chunk)
+                os.replace(temp_path, file_path)
+            except BaseException:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+            
+            logger.info("📄 Created file: %s (%s bytes)", filename, size)
+            return {"success": True, "path": str(file_path), "size": size}
+            
+        except Exception as e:
+            logger.error("❌ Error creating file %s: %s", filename, e)
             return {"success": False, "error": str(e)}
     
     def modify_file(self, filename: str, content: str, append: bool = False) -> Dict[str, Any]:
@@ -7099,11 +8701,11 @@ class FileOperationsManager:
             with open(file_path, mode) as f:
                 f.write(content)
             
-            logger.info(f"✏️  Modified file: {filename}")
+            logger.info("✏️  Modified file: %s", filename)
             return {"success": True, "path": str(file_path)}
             
         except Exception as e:
-            logger.error(f"❌ Error modifying file {filename}: {e}")
+            logger.error("❌ Error modifying file %s: %s", filename, e)
             return {"success": False, "error": str(e)}
     
     def delete_file(self, filename: str) -> Dict[str, Any]:
@@ -7118,13 +8720,26 @@ class FileOperationsManager:
             else:
                 file_path.unlink()
             
-            logger.info(f"🗑️  Deleted: {filename}")
+            logger.info("🗑️  Deleted: %s", filename)
             return {"success": True}
             
         except Exception as e:
-            logger.error(f"❌ Error deleting {filename}: {e}")
+            logger.error("❌ Error deleting %s: %s", filename, e)
             return {"success": False, "error": str(e)}
     
+    def iter_files(self, directory: str = "."):
+        """Yield file entries of a directory one at a time (one stat per entry)"""
+        with os.scandir(self.base_dir / directory) as entries:
+            for entry in entries:
+                st = entry.stat()
+                is_dir = entry.is_dir()
+                yield {
+                    "name": entry.name,
+                    "type": "directory" if is_dir else "file",
+                    "size": st.st_size if entry.is_file() else 0,
+                    "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
+                }
+    
     def list_files(self, directory: str = ".") -> Dict[str, Any]:
         """List files in a directory"""
         try:
@@ -7132,27 +8747,23 @@ class FileOperationsManager:
             if not dir_path.exists():
                 return {"success": False, "error": "Directory does not exist"}
             
-            files = []
-            for item in dir_path.iterdir():
-                files.append({
-                    "name": item.name,
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else 0,
-                    "modified": datetime.fromtimestamp(item.stat().st_mtime).isoformat()
-                })
-            
-            return {"success": True, "files": files}
+            return {"success": True, "files": list(self.iter_files(directory))}
             
         except Exception as e:
-            logger.error(f"❌ Error listing files in {directory}: {e}")
+            logger.error("❌ Error listing files in %s: %s", directory, e)
             return {"success": False, "error": str(e)}
 
 # Global file operations manager
 file_manager = FileOperationsManager()
 
+def is_tool_available(tool: str) -> bool:
+    """Check whether a tool binary is on PATH (memoized for the process lifetime)"""
+    return resolve_tool(tool) is not None
+
 # API Routes
 
 @app.route("/health", methods=["GET"])
+@ttl_cached_response(ms=250)
 def health_check():
     """Enhanced health check endpoint with telemetry"""
     essential_tools = ["nmap", "gobuster", "dirb", "nikto", "sqlmap", "hydra", "john"]
@@ -7164,18 +8775,11 @@ def health_check():
     ]
     
     all_tools = essential_tools + cloud_tools + advanced_tools
-    tools_status = {}
-    
-    for tool in all_tools:
-        try:
-            result = execute_command(f"which {tool}", use_cache=True)
-            tools_status[tool] = result["success"]
-        except:
-            tools_status[tool] = False
+    tools_status = {tool: is_tool_available(tool) for tool in all_tools}
     
     all_essential_tools_available = all(tools_status[tool] for tool in essential_tools)
     
-    return jsonify({
+    return {
         "status": "healthy",
         "message": "HexStrike AI Tools API Server is operational",
         "version": "5.0.0",
@@ -7186,26 +8790,30 @@ def health_check():
         "cache_stats": cache.get_stats(),
         "telemetry": telemetry.get_stats(),
         "uptime": time.time() - telemetry.stats["start_time"]
-    })
+    }
 
 @app.route("/api/command", methods=["POST"])
 def generic_command():
     """Execute any command provided in the request with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         command = params.get("command", "")
         use_cache = params.get("use_cache", True)
         
         if not command:
             logger.warning("⚠️  Command endpoint called without command parameter")
-            return jsonify({
-                "error": "Command parameter is required"
-            }), 400
+            return error_response(ERR_NO_COMMAND)
+        
+        # Serve cache hits from the stored JSON bytes instead of re-encoding
+        if use_cache:
+            cached = cached_command_response(command)
+            if cached is not None:
+                return cached
         
-        result = execute_command(command, use_cache=use_cache)
+        result = execute_command(command, use_cache=use_cache, use_async=True)
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in command endpoint: {str(e)}")
+        logger.error("💥 Error in command endpoint: %s", e)
         logger.error(traceback.format_exc())
         return jsonify({
             "error": f"Server error: {str(e)}"
@@ -7217,126 +8825,191 @@ def generic_command():
 def create_file():
     """Create a new file"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         filename = params.get("filename", "")
         content = params.get("content", "")
         binary = params.get("binary", False)
         
         if not filename:
-            return jsonify({"error": "Filename is required"}), 400
+            return error_response(ERR_NO_FILENAME)
         
         result = file_manager.create_file(filename, content, binary)
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error creating file: {str(e)}")
+        logger.error("💥 Error creating file: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/files/modify", methods=["POST"])
 def modify_file():
     """Modify an existing file"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         filename = params.get("filename", "")
         content = params.get("content", "")
         append = params.get("append", False)
         
         if not filename:
-            return jsonify({"error": "Filename is required"}), 400
+            return error_response(ERR_NO_FILENAME)
         
         result = file_manager.modify_file(filename, content, append)
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error modifying file: {str(e)}")
+        logger.error("💥 Error modifying file: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/files/delete", methods=["DELETE"])
 def delete_file():
     """Delete a file or directory"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         filename = params.get("filename", "")
         
         if not filename:
-            return jsonify({"error": "Filename is required"}), 400
+            return error_response(ERR_NO_FILENAME)
         
         result = file_manager.delete_file(filename)
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error deleting file: {str(e)}")
+        logger.error("💥 Error deleting file: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
+@app.route("/api/files/output/<name>", methods=["GET"])
+def get_command_output(name):
+    """Download the full output of a command whose result only carried the tail"""
+    return send_from_directory(OUTPUT_SPOOL_DIR, name, mimetype="text/plain")
+
 @app.route("/api/files/list", methods=["GET"])
 def list_files():
     """List files in a directory"""
     try:
         directory = request.args.get("directory", ".")
-        result = file_manager.list_files(directory)
-        return jsonify(result)
+        if not (file_manager.base_dir / directory).is_dir():
+            return jsonify({"success": False, "error": "Directory does not exist"})
+        
+        # Stream entries as they are read instead of buffering the whole listing
+        return stream_json_response({"success": True}, "files", file_manager.iter_files(directory))
     except Exception as e:
-        logger.error(f"💥 Error listing files: {str(e)}")
+        logger.error("💥 Error listing files: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
+# Payload generation helpers: stream payloads in fixed-size chunks built with bytes operations
+PAYLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+PAYLOAD_MAX_SIZE = 100 * 1024 * 1024  # 100MB limit
+CYCLIC_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ALPHANUMERIC = (ascii_letters + digits).encode()
+ALPHANUMERIC_TABLE = bytes(ALPHANUMERIC[i % 62] for i in range(256))
+# Bytes >= 248 (62 * 4) are dropped so every character is equally likely
+ALPHANUMERIC_REJECT = bytes(range(248, 256))
+
+def _repeat_chunks(unit: bytes, size: int):
+    """Yield unit repeated up to exactly size bytes, one ~1 MiB block at a time"""
+    # Keep blocks a whole multiple of the unit so the pattern stays continuous across chunks
+    block = unit * max(1, PAYLOAD_CHUNK_SIZE // len(unit))
+    remaining = size
+    while remaining >= len(block):
+        yield block
+        remaining -= len(block)
+    if remaining > 0:
+        yield memoryview(block)[:remaining]
+
+def _cyclic_payload(size: int):
+    """Repeat A-Z up to size bytes"""
+    return _repeat_chunks(CYCLIC_ALPHABET, size)
+
+def _buffer_payload(pattern: str, size: int):
+    """Repeat pattern up to exactly size bytes"""
+    return _repeat_chunks(pattern.encode(), size)
+
+def _random_payload(size: int):
+    """Uniform random alphanumeric bytes from the OS CSPRNG mapped through a lookup table"""
+    remaining = size
+    while remaining > 0:
+        chunk_size = min(PAYLOAD_CHUNK_SIZE, remaining)
+        # Over-draw slightly to cover rejected bytes; short chunks are topped up next round
+        chunk = secrets.token_bytes(chunk_size + chunk_size // 16 + 16).translate(
+            ALPHANUMERIC_TABLE, ALPHANUMERIC_REJECT
+        )[:chunk_size]
+        yield chunk
+        remaining -= len(chunk)
+
+# payload type -> generator(size, pattern)
+_PAYLOAD_GENS = {
+    "buffer": lambda size, pattern: _buffer_payload(pattern, size),
+    "cyclic": lambda size, pattern: _cyclic_payload(size),
+    "random": lambda size, pattern: _random_payload(size),
+}
+
 # Payload Generation Endpoint
 @app.route("/api/payloads/generate", methods=["POST"])
 def generate_payload():
     """Generate large payloads for testing"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         payload_type = params.get("type", "buffer")
         size = params.get("size", 1024)
         pattern = params.get("pattern", "A")
         filename = params.get("filename", f"payload_{int(time.time())}")
         
-        if size > 100 * 1024 * 1024:  # 100MB limit
-            return jsonify({"error": "Payload size too large (max 100MB)"}), 400
-        
-        if payload_type == "buffer":
-            content = pattern * (size // len(pattern))
-        elif payload_type == "cyclic":
-            # Generate cyclic pattern
-            alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            content = ""
-            for i in range(size):
-                content += alphabet[i % len(alphabet)]
-        elif payload_type == "random":
-            import random
-            import string
-            content = ''.join(random.choices(string.ascii_letters + string.digits, k=size))
-        else:
-            return jsonify({"error": "Invalid payload type"}), 400
+        if not isinstance(size, int) or isinstance(size, bool) or size < 0:
+            return error_response(ERR_INVALID_PAYLOAD_SIZE)
+        if size > PAYLOAD_MAX_SIZE:
+            return error_response(ERR_PAYLOAD_TOO_LARGE)
+        
+        gen = _PAYLOAD_GENS.get(payload_type) if isinstance(payload_type, str) else None
+        if gen is None:
+            return error_response(ERR_INVALID_PAYLOAD_TYPE)
+        if payload_type == "buffer" and (not isinstance(pattern, str) or not pattern):
+            return error_response(ERR_INVALID_PAYLOAD_PATTERN)
         
-        result = file_manager.create_file(filename, content)
+        result = file_manager.create_file_streamed(filename, gen(size, pattern))
         result["payload_info"] = {
             "type": payload_type,
             "size": size,
             "pattern": pattern
         }
         
-        logger.info(f"🎯 Generated {payload_type} payload: {filename} ({size} bytes)")
+        logger.info("🎯 Generated %s payload: %s (%s bytes)", payload_type, filename, size)
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error generating payload: {str(e)}")
+        logger.error("💥 Error generating payload: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # Cache Management Endpoint
 @app.route("/api/cache/stats", methods=["GET"])
+@ttl_cached_response(ms=250)
 def cache_stats():
     """Get cache statistics"""
-    return jsonify(cache.get_stats())
+    return cache.get_stats()
 
 @app.route("/api/cache/clear", methods=["POST"])
 def clear_cache():
     """Clear the cache"""
-    cache.cache.clear()
-    cache.stats = {"hits": 0, "misses": 0, "evictions": 0}
+    cache.clear()
     logger.info("🧹 Cache cleared")
     return jsonify({"success": True, "message": "Cache cleared"})
 
+@app.route("/api/cache/invalidate", methods=["POST"])
+def invalidate_cache():
+    """Drop cached results for commands mentioning a path or other text"""
+    params = request.get_json(silent=True) or {}
+    match = params.get("match", "")
+    if not match or not isinstance(match, str):
+        return jsonify({"error": "match parameter is required"}), 400
+    removed = cache.invalidate(match)
+    logger.info("🧹 Cache invalidated %d entries matching %s", removed, match)
+    return jsonify({"success": True, "removed": removed})
+
+@app.route("/api/throttle/status", methods=["GET"])
+def throttle_status():
+    """Get per-family concurrency limits and queue depths for throttled tools"""
+    return jsonify({"success": True, "families": async_runner.throttle_status(), "event_loop": async_runner.backend})
+
 # Telemetry Endpoint
 @app.route("/api/telemetry", methods=["GET"])
+@ttl_cached_response(ms=250)
 def get_telemetry():
     """Get system telemetry"""
-    return jsonify(telemetry.get_stats())
+    return telemetry.get_stats()
 
 # ============================================================================
 # PROCESS MANAGEMENT API ENDPOINTS (v5.0 ENHANCEMENT)
@@ -7346,45 +9019,20 @@ def get_telemetry():
 def list_processes():
     """List all active processes"""
     try:
-        processes = ProcessManager.list_active_processes()
-        
-        # Add calculated fields for each process
-        for pid, info in processes.items():
-            runtime = time.time() - info["start_time"]
-            info["runtime_formatted"] = f"{runtime:.1f}s"
-            
-            if info["progress"] > 0:
-                eta = (runtime / info["progress"]) * (1.0 - info["progress"])
-                info["eta_formatted"] = f"{eta:.1f}s"
-            else:
-                info["eta_formatted"] = "Unknown"
+        processes = ProcessManager.list_process_views()
         
-        return jsonify({
-            "success": True,
-            "active_processes": processes,
-            "total_count": len(processes)
-        })
+        return stream_json_response({"success": True}, "active_processes", processes.items(), keyed=True)
     except Exception as e:
-        logger.error(f"💥 Error listing processes: {str(e)}")
+        logger.error("💥 Error listing processes: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/processes/status/<int:pid>", methods=["GET"])
 def get_process_status(pid):
     """Get status of a specific process"""
     try:
-        process_info = ProcessManager.get_process_status(pid)
+        process_info = ProcessManager.get_process_view(pid)
         
         if process_info:
-            # Add calculated fields
-            runtime = time.time() - process_info["start_time"]
-            process_info["runtime_formatted"] = f"{runtime:.1f}s"
-            
-            if process_info["progress"] > 0:
-                eta = (runtime / process_info["progress"]) * (1.0 - process_info["progress"])
-                process_info["eta_formatted"] = f"{eta:.1f}s"
-            else:
-                process_info["eta_formatted"] = "Unknown"
-            
             return jsonify({
                 "success": True,
                 "process": process_info
@@ -7396,7 +9044,7 @@ def get_process_status(pid):
             }), 404
             
     except Exception as e:
-        logger.error(f"💥 Error getting process status: {str(e)}")
+        logger.error("💥 Error getting process status: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/processes/terminate/<int:pid>", methods=["POST"])
@@ -7406,7 +9054,7 @@ def terminate_process(pid):
         success = ProcessManager.terminate_process(pid)
         
         if success:
-            logger.info(f"🛑 Process {pid} terminated successfully")
+            logger.info("🛑 Process %s terminated successfully", pid)
             return jsonify({
                 "success": True,
                 "message": f"Process {pid} terminated successfully"
@@ -7418,7 +9066,7 @@ def terminate_process(pid):
             }), 404
             
     except Exception as e:
-        logger.error(f"💥 Error terminating process {pid}: {str(e)}")
+        logger.error("💥 Error terminating process %s: %s", pid, e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/processes/pause/<int:pid>", methods=["POST"])
@@ -7428,7 +9076,7 @@ def pause_process(pid):
         success = ProcessManager.pause_process(pid)
         
         if success:
-            logger.info(f"⏸️ Process {pid} paused successfully")
+            logger.info("⏸️ Process %s paused successfully", pid)
             return jsonify({
                 "success": True,
                 "message": f"Process {pid} paused successfully"
@@ -7440,7 +9088,7 @@ def pause_process(pid):
             }), 404
             
     except Exception as e:
-        logger.error(f"💥 Error pausing process {pid}: {str(e)}")
+        logger.error("💥 Error pausing process %s: %s", pid, e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/processes/resume/<int:pid>", methods=["POST"])
@@ -7450,7 +9098,7 @@ def resume_process(pid):
         success = ProcessManager.resume_process(pid)
         
         if success:
-            logger.info(f"▶️ Process {pid} resumed successfully")
+            logger.info("▶️ Process %s resumed successfully", pid)
             return jsonify({
                 "success": True,
                 "message": f"Process {pid} resumed successfully"
@@ -7462,7 +9110,7 @@ def resume_process(pid):
             }), 404
             
     except Exception as e:
-        logger.error(f"💥 Error resuming process {pid}: {str(e)}")
+        logger.error("💥 Error resuming process %s: %s", pid, e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/processes/dashboard", methods=["GET"])
@@ -7480,11 +9128,7 @@ def process_dashboard():
             "total_processes": len(processes),
             "visual_dashboard": dashboard_visual,
             "processes": [],
-            "system_load": {
-                "cpu_percent": psutil.cpu_percent(interval=1),
-                "memory_percent": psutil.virtual_memory().percent,
-                "active_connections": len(psutil.net_connections())
-            }
+            "system_load": system_load_cache.get()
         }
         
         for pid, info in processes.items():
@@ -7515,14 +9159,14 @@ def process_dashboard():
         return jsonify(dashboard)
         
     except Exception as e:
-        logger.error(f"💥 Error getting process dashboard: {str(e)}")
+        logger.error("💥 Error getting process dashboard: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/visual/vulnerability-card", methods=["POST"])
 def create_vulnerability_card():
     """Create a beautiful vulnerability card using ModernVisualEngine"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data:
             return jsonify({"error": "No data provided"}), 400
         
@@ -7536,14 +9180,14 @@ def create_vulnerability_card():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating vulnerability card: {str(e)}")
+        logger.error("💥 Error creating vulnerability card: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/visual/summary-report", methods=["POST"])
 def create_summary_report():
     """Create a beautiful summary report using ModernVisualEngine"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data:
             return jsonify({"error": "No data provided"}), 400
         
@@ -7557,14 +9201,14 @@ def create_summary_report():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating summary report: {str(e)}")
+        logger.error("💥 Error creating summary report: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/visual/tool-output", methods=["POST"])
 def format_tool_output():
     """Format tool output using ModernVisualEngine"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'tool' not in data or 'output' not in data:
             return jsonify({"error": "Tool and output data required"}), 400
         
@@ -7582,7 +9226,7 @@ def format_tool_output():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error formatting tool output: {str(e)}")
+        logger.error("💥 Error formatting tool output: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # ============================================================================
@@ -7593,18 +9237,18 @@ def format_tool_output():
 def analyze_target():
     """Analyze target and create comprehensive profile using Intelligent Decision Engine"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'target' not in data:
             return jsonify({"error": "Target is required"}), 400
         
         target = data['target']
-        logger.info(f"🧠 Analyzing target: {target}")
+        logger.info("🧠 Analyzing target: %s", target)
         
         # Use the decision engine to analyze the target
         profile = decision_engine.analyze_target(target)
         
-        logger.info(f"✅ Target analysis completed for {target}")
-        logger.info(f"📊 Target type: {profile.target_type.value}, Risk level: {profile.risk_level}")
+        logger.info("✅ Target analysis completed for %s", target)
+        logger.info("📊 Target type: %s, Risk level: %s", profile.target_type.value, profile.risk_level)
         
         return jsonify({
             "success": True,
@@ -7613,21 +9257,21 @@ def analyze_target():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error analyzing target: {str(e)}")
+        logger.error("💥 Error analyzing target: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/intelligence/select-tools", methods=["POST"])
 def select_optimal_tools():
     """Select optimal tools based on target profile and objective"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'target' not in data:
             return jsonify({"error": "Target is required"}), 400
         
         target = data['target']
         objective = data.get('objective', 'comprehensive')  # comprehensive, quick, stealth
         
-        logger.info(f"🎯 Selecting optimal tools for {target} with objective: {objective}")
+        logger.info("🎯 Selecting optimal tools for %s with objective: %s", target, objective)
         
         # Analyze target first
         profile = decision_engine.analyze_target(target)
@@ -7635,7 +9279,7 @@ def select_optimal_tools():
         # Select optimal tools
         selected_tools = decision_engine.select_optimal_tools(profile, objective)
         
-        logger.info(f"✅ Selected {len(selected_tools)} tools for {target}")
+        logger.info("✅ Selected %s tools for %s", len(selected_tools), target)
         
         return jsonify({
             "success": True,
@@ -7648,14 +9292,14 @@ def select_optimal_tools():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error selecting tools: {str(e)}")
+        logger.error("💥 Error selecting tools: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/intelligence/optimize-parameters", methods=["POST"])
 def optimize_tool_parameters():
     """Optimize tool parameters based on target profile and context"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'target' not in data or 'tool' not in data:
             return jsonify({"error": "Target and tool are required"}), 400
         
@@ -7663,7 +9307,7 @@ def optimize_tool_parameters():
         tool = data['tool']
         context = data.get('context', {})
         
-        logger.info(f"⚙️  Optimizing parameters for {tool} against {target}")
+        logger.info("⚙️  Optimizing parameters for %s against %s", tool, target)
         
         # Analyze target first
         profile = decision_engine.analyze_target(target)
@@ -7671,7 +9315,7 @@ def optimize_tool_parameters():
         # Optimize parameters
         optimized_params = decision_engine.optimize_parameters(tool, profile, context)
         
-        logger.info(f"✅ Parameters optimized for {tool}")
+        logger.info("✅ Parameters optimized for %s", tool)
         
         return jsonify({
             "success": True,
@@ -7684,21 +9328,21 @@ def optimize_tool_parameters():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error optimizing parameters: {str(e)}")
+        logger.error("💥 Error optimizing parameters: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/intelligence/create-attack-chain", methods=["POST"])
 def create_attack_chain():
     """Create an intelligent attack chain based on target profile"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'target' not in data:
             return jsonify({"error": "Target is required"}), 400
         
         target = data['target']
         objective = data.get('objective', 'comprehensive')
         
-        logger.info(f"⚔️  Creating attack chain for {target} with objective: {objective}")
+        logger.info("⚔️  Creating attack chain for %s with objective: %s", target, objective)
         
         # Analyze target first
         profile = decision_engine.analyze_target(target)
@@ -7706,8 +9350,8 @@ def create_attack_chain():
         # Create attack chain
         attack_chain = decision_engine.create_attack_chain(profile, objective)
         
-        logger.info(f"✅ Attack chain created with {len(attack_chain.steps)} steps")
-        logger.info(f"📊 Success probability: {attack_chain.success_probability:.2f}, Estimated time: {attack_chain.estimated_time}s")
+        logger.info("✅ Attack chain created with %s steps", len(attack_chain.steps))
+        logger.info("📊 Success probability: %.2f, Estimated time: %ss", attack_chain.success_probability, attack_chain.estimated_time)
         
         return jsonify({
             "success": True,
@@ -7719,14 +9363,14 @@ def create_attack_chain():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating attack chain: {str(e)}")
+        logger.error("💥 Error creating attack chain: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/intelligence/smart-scan", methods=["POST"])
 def intelligent_smart_scan():
     """Execute an intelligent scan using AI-driven tool selection and parameter optimization"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'target' not in data:
             return jsonify({"error": "Target is required"}), 400
         
@@ -7734,7 +9378,7 @@ def intelligent_smart_scan():
         objective = data.get('objective', 'comprehensive')
         max_tools = data.get('max_tools', 5)
         
-        logger.info(f"🚀 Starting intelligent smart scan for {target}")
+        logger.info("🚀 Starting intelligent smart scan for %s", target)
         
         # Analyze target
         profile = decision_engine.analyze_target(target)
@@ -7752,7 +9396,7 @@ def intelligent_smart_scan():
         }
         
         for tool in selected_tools:
-            logger.info(f"🔧 Executing {tool} with optimized parameters")
+            logger.info("🔧 Executing %s with optimized parameters", tool)
             
             # Get optimized parameters
             optimized_params = decision_engine.optimize_parameters(tool, profile)
@@ -7767,7 +9411,7 @@ def intelligent_smart_scan():
             
             scan_results["tools_executed"].append(tool_result)
         
-        logger.info(f"✅ Intelligent smart scan completed for {target}")
+        logger.info("✅ Intelligent smart scan completed for %s", target)
         
         return jsonify({
             "success": True,
@@ -7776,20 +9420,20 @@ def intelligent_smart_scan():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in intelligent smart scan: {str(e)}")
+        logger.error("💥 Error in intelligent smart scan: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/intelligence/technology-detection", methods=["POST"])
 def detect_technologies():
     """Detect technologies and create technology-specific testing recommendations"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'target' not in data:
             return jsonify({"error": "Target is required"}), 400
         
         target = data['target']
         
-        logger.info(f"🔍 Detecting technologies for {target}")
+        logger.info("🔍 Detecting technologies for %s", target)
         
         # Analyze target
         profile = decision_engine.analyze_target(target)
@@ -7816,7 +9460,7 @@ def detect_technologies():
                     "priority": "medium"
                 }
         
-        logger.info(f"✅ Technology detection completed for {target}")
+        logger.info("✅ Technology detection completed for %s", target)
         
         return jsonify({
             "success": True,
@@ -7829,7 +9473,7 @@ def detect_technologies():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in technology detection: {str(e)}")
+        logger.error("💥 Error in technology detection: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # ============================================================================
@@ -7840,7 +9484,7 @@ def detect_technologies():
 def create_reconnaissance_workflow():
     """Create comprehensive reconnaissance workflow for bug bounty hunting"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'domain' not in data:
             return jsonify({"error": "Domain is required"}), 400
         
@@ -7849,7 +9493,7 @@ def create_reconnaissance_workflow():
         out_of_scope = data.get('out_of_scope', [])
         program_type = data.get('program_type', 'web')
         
-        logger.info(f"🎯 Creating reconnaissance workflow for {domain}")
+        logger.info("🎯 Creating reconnaissance workflow for %s", domain)
         
         # Create bug bounty target
         target = BugBountyTarget(
@@ -7862,7 +9506,7 @@ def create_reconnaissance_workflow():
         # Generate reconnaissance workflow
         workflow = bugbounty_manager.create_reconnaissance_workflow(target)
         
-        logger.info(f"✅ Reconnaissance workflow created for {domain}")
+        logger.info("✅ Reconnaissance workflow created for %s", domain)
         
         return jsonify({
             "success": True,
@@ -7871,14 +9515,14 @@ def create_reconnaissance_workflow():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating reconnaissance workflow: {str(e)}")
+        logger.error("💥 Error creating reconnaissance workflow: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/bugbounty/vulnerability-hunting-workflow", methods=["POST"])
 def create_vulnerability_hunting_workflow():
     """Create vulnerability hunting workflow prioritized by impact"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'domain' not in data:
             return jsonify({"error": "Domain is required"}), 400
         
@@ -7886,7 +9530,7 @@ def create_vulnerability_hunting_workflow():
         priority_vulns = data.get('priority_vulns', ["rce", "sqli", "xss", "idor", "ssrf"])
         bounty_range = data.get('bounty_range', 'unknown')
         
-        logger.info(f"🎯 Creating vulnerability hunting workflow for {domain}")
+        logger.info("🎯 Creating vulnerability hunting workflow for %s", domain)
         
         # Create bug bounty target
         target = BugBountyTarget(
@@ -7898,7 +9542,7 @@ def create_vulnerability_hunting_workflow():
         # Generate vulnerability hunting workflow
         workflow = bugbounty_manager.create_vulnerability_hunting_workflow(target)
         
-        logger.info(f"✅ Vulnerability hunting workflow created for {domain}")
+        logger.info("✅ Vulnerability hunting workflow created for %s", domain)
         
         return jsonify({
             "success": True,
@@ -7907,21 +9551,21 @@ def create_vulnerability_hunting_workflow():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating vulnerability hunting workflow: {str(e)}")
+        logger.error("💥 Error creating vulnerability hunting workflow: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/bugbounty/business-logic-workflow", methods=["POST"])
 def create_business_logic_workflow():
     """Create business logic testing workflow"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'domain' not in data:
             return jsonify({"error": "Domain is required"}), 400
         
         domain = data['domain']
         program_type = data.get('program_type', 'web')
         
-        logger.info(f"🎯 Creating business logic testing workflow for {domain}")
+        logger.info("🎯 Creating business logic testing workflow for %s", domain)
         
         # Create bug bounty target
         target = BugBountyTarget(domain=domain, program_type=program_type)
@@ -7929,7 +9573,7 @@ def create_business_logic_workflow():
         # Generate business logic testing workflow
         workflow = bugbounty_manager.create_business_logic_testing_workflow(target)
         
-        logger.info(f"✅ Business logic testing workflow created for {domain}")
+        logger.info("✅ Business logic testing workflow created for %s", domain)
         
         return jsonify({
             "success": True,
@@ -7938,20 +9582,20 @@ def create_business_logic_workflow():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating business logic workflow: {str(e)}")
+        logger.error("💥 Error creating business logic workflow: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/bugbounty/osint-workflow", methods=["POST"])
 def create_osint_workflow():
     """Create OSINT gathering workflow"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'domain' not in data:
             return jsonify({"error": "Domain is required"}), 400
         
         domain = data['domain']
         
-        logger.info(f"🎯 Creating OSINT workflow for {domain}")
+        logger.info("🎯 Creating OSINT workflow for %s", domain)
         
         # Create bug bounty target
         target = BugBountyTarget(domain=domain)
@@ -7959,7 +9603,7 @@ def create_osint_workflow():
         # Generate OSINT workflow
         workflow = bugbounty_manager.create_osint_workflow(target)
         
-        logger.info(f"✅ OSINT workflow created for {domain}")
+        logger.info("✅ OSINT workflow created for %s", domain)
         
         return jsonify({
             "success": True,
@@ -7968,20 +9612,20 @@ def create_osint_workflow():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating OSINT workflow: {str(e)}")
+        logger.error("💥 Error creating OSINT workflow: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/bugbounty/file-upload-testing", methods=["POST"])
 def create_file_upload_testing():
     """Create file upload vulnerability testing workflow"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'target_url' not in data:
             return jsonify({"error": "Target URL is required"}), 400
         
         target_url = data['target_url']
         
-        logger.info(f"🎯 Creating file upload testing workflow for {target_url}")
+        logger.info("🎯 Creating file upload testing workflow for %s", target_url)
         
         # Generate file upload testing workflow
         workflow = fileupload_framework.create_upload_testing_workflow(target_url)
@@ -7990,7 +9634,7 @@ def create_file_upload_testing():
         test_files = fileupload_framework.generate_test_files()
         workflow["test_files"] = test_files
         
-        logger.info(f"✅ File upload testing workflow created for {target_url}")
+        logger.info("✅ File upload testing workflow created for %s", target_url)
         
         return jsonify({
             "success": True,
@@ -7999,14 +9643,14 @@ def create_file_upload_testing():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating file upload testing workflow: {str(e)}")
+        logger.error("💥 Error creating file upload testing workflow: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/bugbounty/comprehensive-assessment", methods=["POST"])
 def create_comprehensive_bugbounty_assessment():
     """Create comprehensive bug bounty assessment combining all workflows"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data or 'domain' not in data:
             return jsonify({"error": "Domain is required"}), 400
         
@@ -8016,7 +9660,7 @@ def create_comprehensive_bugbounty_assessment():
         include_osint = data.get('include_osint', True)
         include_business_logic = data.get('include_business_logic', True)
         
-        logger.info(f"🎯 Creating comprehensive bug bounty assessment for {domain}")
+        logger.info("🎯 Creating comprehensive bug bounty assessment for %s", domain)
         
         # Create bug bounty target
         target = BugBountyTarget(
@@ -8049,7 +9693,7 @@ def create_comprehensive_bugbounty_assessment():
             "priority_score": assessment["vulnerability_hunting"].get("priority_score", 0)
         }
         
-        logger.info(f"✅ Comprehensive bug bounty assessment created for {domain}")
+        logger.info("✅ Comprehensive bug bounty assessment created for %s", domain)
         
         return jsonify({
             "success": True,
@@ -8058,148 +9702,972 @@ def create_comprehensive_bugbounty_assessment():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating comprehensive assessment: {str(e)}")
+        logger.error("💥 Error creating comprehensive assessment: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # ============================================================================
 # SECURITY TOOLS API ENDPOINTS
 # ============================================================================
 
-@app.route("/api/tools/nmap", methods=["POST"])
-def nmap():
-    """Execute nmap scan with enhanced logging, caching, and intelligent error handling"""
-    try:
-        params = request.json
-        target = params.get("target", "")
-        scan_type = params.get("scan_type", "-sCV")
-        ports = params.get("ports", "")
-        additional_args = params.get("additional_args", "-T4 -Pn")
-        use_recovery = params.get("use_recovery", True)
-        
-        if not target:
-            logger.warning("🎯 Nmap called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
-        
-        command = f"nmap {scan_type}"
-        
-        if ports:
-            command += f" -p {ports}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        command += f" {target}"
-        
-        logger.info(f"🔍 Starting Nmap scan: {target}")
-        
-        # Use intelligent error handling if enabled
-        if use_recovery:
-            tool_params = {
-                "target": target,
-                "scan_type": scan_type,
-                "ports": ports,
-                "additional_args": additional_args
-            }
-            result = execute_command_with_recovery("nmap", command, tool_params)
-        else:
-            result = execute_command(command)
-        
-        logger.info(f"📊 Nmap scan completed for {target}")
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"💥 Error in nmap endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+# Command builders: one join per command, memoized so repeated scans reuse the string.
+# User-supplied values are shell-quoted; additional_args is passed through as raw flags.
 
-@app.route("/api/tools/gobuster", methods=["POST"])
-def gobuster():
-    """Execute gobuster with enhanced logging and intelligent error handling"""
-    try:
-        params = request.json
-        url = params.get("url", "")
-        mode = params.get("mode", "dir")
-        wordlist = params.get("wordlist", "/usr/share/wordlists/dirb/common.txt")
-        additional_args = params.get("additional_args", "")
-        use_recovery = params.get("use_recovery", True)
-        
-        if not url:
-            logger.warning("🌐 Gobuster called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
-        
-        # Validate mode
-        if mode not in ["dir", "dns", "fuzz", "vhost"]:
-            logger.warning(f"❌ Invalid gobuster mode: {mode}")
-            return jsonify({
-                "error": f"Invalid mode: {mode}. Must be one of: dir, dns, fuzz, vhost"
-            }), 400
-        
-        command = f"gobuster {mode} -u {url} -w {wordlist}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"📁 Starting Gobuster {mode} scan: {url}")
-        
-        # Use intelligent error handling if enabled
-        if use_recovery:
-            tool_params = {
-                "target": url,
-                "mode": mode,
-                "wordlist": wordlist,
-                "additional_args": additional_args
-            }
-            result = execute_command_with_recovery("gobuster", command, tool_params)
+@functools.lru_cache(maxsize=1024)
+def build_nmap_command(target: str, scan_type: str, ports: str, additional_args: str) -> str:
+    """Build an nmap command line"""
+    parts = ["nmap", scan_type]
+    if ports:
+        parts += ("-p", shlex.quote(ports))
+    if additional_args:
+        parts.append(additional_args)
+    parts.append(shlex.quote(target))
+    return " ".join(parts)
+
+_VALID_GOBUSTER_MODES = frozenset({"dir", "dns", "fuzz", "vhost"})
+
+@functools.lru_cache(maxsize=1024)
+def build_gobuster_command(url: str, mode: str, wordlist: str, additional_args: str) -> str:
+    """Build a gobuster command line"""
+    parts = ["gobuster", mode, "-u", shlex.quote(url), "-w", shlex.quote(wordlist)]
+    if additional_args:
+        parts.append(additional_args)
+    return " ".join(parts)
+
+@functools.lru_cache(maxsize=1024)
+def build_nuclei_command(target: str, severity: str, tags: str, template: str, additional_args: str) -> str:
+    """Build a nuclei command line"""
+    parts = ["nuclei", "-u", shlex.quote(target)]
+    if severity:
+        parts += ("-severity", shlex.quote(severity))
+    if tags:
+        parts += ("-tags", shlex.quote(tags))
+    if template:
+        parts += ("-t", shlex.quote(template))
+    if additional_args:
+        parts.append(additional_args)
+    return " ".join(parts)
+
+def build_argv(base: List[Any], flag_map: Optional[Dict[str, Any]] = None,
+               positional: Tuple[Any, ...] = (), extra: str = "") -> List[str]:
+    """
+    Build an argv list for execute_command without going through a shell
+    
+    Args:
+        base: Leading arguments (binary, subcommand, fixed positionals)
+        flag_map: flag -> value; falsy values are skipped, True emits the bare flag,
+                  and flags ending in "=" are joined with their value
+        positional: Positional arguments appended after the flags (falsy ones skipped)
+        extra: Raw additional_args string, split with shlex
+    """
+    argv = [str(arg) for arg in base]
+    for flag, value in (flag_map or {}).items():
+        if not value:
+            continue
+        if value is True:
+            argv.append(flag)
+        elif flag.endswith("="):
+            argv.append(f"{flag}{value}")
         else:
-            result = execute_command(command)
-        
-        logger.info(f"📊 Gobuster scan completed for {url}")
-        return jsonify(result)
-        
-    except Exception as e:
-        logger.error(f"💥 Error in gobuster endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+            argv += (flag, str(value))
+    argv += (str(arg) for arg in positional if arg)
+    if extra:
+        argv += shlex.split(extra)
+    return argv
+
+@dataclass(frozen=True)
+class ToolArg:
+    """One element of a tool's argv layout in TOOL_SPECS"""
+    kind: str                       # const, pos, flag, switch, count or extra
+    key: str = ""                   # Value name passed to build_tool_argv (a list pos value emits each item)
+    flag: str = ""                  # Flag emitted before the value ("=" suffix joins them)
+    values: Tuple[str, ...] = ()    # Literal arguments for const entries
+    unless: str = ""                # Skip this entry when that value is set
+    
+    @classmethod
+    def const(cls, *values: str) -> "ToolArg":
+        return cls("const", values=values)
+    
+    @classmethod
+    def pos(cls, key: str) -> "ToolArg":
+        return cls("pos", key=key)
+    
+    @classmethod
+    def opt(cls, flag: str, key: str, unless: str = "") -> "ToolArg":
+        return cls("flag", key=key, flag=flag, unless=unless)
+    
+    @classmethod
+    def switch(cls, flag: str, key: str) -> "ToolArg":
+        return cls("switch", key=key, flag=flag)
+    
+    @classmethod
+    def count(cls, flag: str, key: str) -> "ToolArg":
+        return cls("count", key=key, flag=flag)
+    
+    @classmethod
+    def extra(cls, key: str = "additional_args") -> "ToolArg":
+        return cls("extra", key=key)
+
+# Argv layouts built once at import: tool -> (binary, args). Empty values are skipped.
+TOOL_SPECS = {
+    "prowler": ("prowler", (
+        ToolArg.pos("provider"), ToolArg.opt("--profile", "profile"), ToolArg.opt("--region", "region"),
+        ToolArg.opt("--checks", "checks"), ToolArg.opt("--output-directory", "output_dir"),
+        ToolArg.opt("--output-format", "output_format"), ToolArg.extra())),
+    "trivy": ("trivy", (
+        ToolArg.pos("scan_type"), ToolArg.pos("target"), ToolArg.opt("--format", "output_format"),
+        ToolArg.opt("--severity", "severity"), ToolArg.opt("--output", "output_file"), ToolArg.extra())),
+    "dirb": ("dirb", (ToolArg.pos("url"), ToolArg.pos("wordlist"), ToolArg.extra())),
+    "nikto": ("nikto", (ToolArg.opt("-h", "target"), ToolArg.extra())),
+    "sqlmap": ("sqlmap", (
+        ToolArg.opt("-u", "url"), ToolArg.const("--batch"), ToolArg.opt("--data=", "data"), ToolArg.extra())),
+    "xsser": ("xsser", (ToolArg.opt("--url", "url"), ToolArg.opt("--param=", "params"), ToolArg.extra())),
+    "wfuzz": ("wfuzz", (ToolArg.opt("-w", "wordlist"), ToolArg.pos("url"), ToolArg.extra())),
+    "x8": ("x8", (
+        ToolArg.opt("-u", "url"), ToolArg.opt("-w", "wordlist"), ToolArg.opt("-X", "method"),
+        ToolArg.opt("-b", "body"), ToolArg.opt("-H", "headers"), ToolArg.extra())),
+    "hydra": ("hydra", (
+        ToolArg.const("-t", "4"), ToolArg.opt("-l", "username"), ToolArg.opt("-L", "username_file", unless="username"),
+        ToolArg.opt("-p", "password"), ToolArg.opt("-P", "password_file", unless="password"),
+        ToolArg.extra(), ToolArg.pos("target"), ToolArg.pos("service"))),
+    "john": ("john", (
+        ToolArg.opt("--format=", "format_type"), ToolArg.opt("--wordlist=", "wordlist"),
+        ToolArg.extra(), ToolArg.pos("hash_file"))),
+    "wpscan": ("wpscan", (ToolArg.opt("--url", "url"), ToolArg.extra())),
+    "enum4linux": ("enum4linux", (ToolArg.extra(), ToolArg.pos("target"))),
+    "netexec": ("nxc", (
+        ToolArg.pos("protocol"), ToolArg.pos("target"), ToolArg.opt("-u", "username"), ToolArg.opt("-p", "password"),
+        ToolArg.opt("-H", "hash_value"), ToolArg.opt("-M", "module"), ToolArg.extra())),
+    "amass": ("amass", (ToolArg.pos("mode"), ToolArg.opt("-d", "domain"), ToolArg.extra())),
+    "amass_shard": ("amass", (ToolArg.pos("mode"), ToolArg.opt("-df", "domain_file"), ToolArg.extra())),
+    "subfinder": ("subfinder", (
+        ToolArg.opt("-d", "domain"), ToolArg.switch("-silent", "silent"), ToolArg.switch("-all", "all_sources"),
+        ToolArg.extra())),
+    "subfinder_shard": ("subfinder", (
+        ToolArg.opt("-dL", "domain_file"), ToolArg.switch("-silent", "silent"), ToolArg.switch("-all", "all_sources"),
+        ToolArg.extra())),
+    "smbmap": ("smbmap", (
+        ToolArg.opt("-H", "target"), ToolArg.opt("-u", "username"), ToolArg.opt("-p", "password"),
+        ToolArg.opt("-d", "domain"), ToolArg.extra())),
+    "volatility": ("volatility", (
+        ToolArg.opt("-f", "memory_file"), ToolArg.opt("--profile=", "profile"), ToolArg.pos("plugin"),
+        ToolArg.extra())),
+    "msfvenom": ("msfvenom", (
+        ToolArg.opt("-p", "payload"), ToolArg.opt("-f", "format_type"), ToolArg.opt("-o", "output_file"),
+        ToolArg.opt("-e", "encoder"), ToolArg.opt("-i", "iterations"), ToolArg.extra())),
+    "feroxbuster": ("feroxbuster", (
+        ToolArg.opt("-u", "url"), ToolArg.opt("-w", "wordlist"), ToolArg.opt("-t", "threads"), ToolArg.extra())),
+    "dotdotpwn": ("dotdotpwn", (
+        ToolArg.opt("-m", "module"), ToolArg.opt("-h", "target"), ToolArg.extra(), ToolArg.const("-b"))),
+    "binwalk": ("binwalk", (ToolArg.switch("-e", "extract"), ToolArg.extra(), ToolArg.pos("file_path"))),
+    "ropgadget": ("ROPgadget", (ToolArg.opt("--binary", "binary"), ToolArg.opt("--only", "gadget_type"), ToolArg.extra())),
+    "checksec": ("checksec", (ToolArg.opt("--file=", "binary"),)),
+    "xxd": ("xxd", (ToolArg.opt("-s", "offset"), ToolArg.opt("-l", "length"), ToolArg.extra(), ToolArg.pos("file_path"))),
+    "strings": ("strings", (ToolArg.opt("-n", "min_len"), ToolArg.extra(), ToolArg.pos("file_path"))),
+    "objdump": ("objdump", (ToolArg.pos("mode"), ToolArg.extra(), ToolArg.pos("binary"))),
+    "autorecon": ("autorecon", (
+        ToolArg.pos("targets"), ToolArg.opt("-t", "target_file"), ToolArg.opt("-p", "ports"),
+        ToolArg.opt("-o", "output_dir"), ToolArg.opt("-m", "max_scans"), ToolArg.opt("-mp", "max_port_scans"),
+        ToolArg.opt("--heartbeat", "heartbeat"), ToolArg.opt("--timeout", "timeout"),
+        ToolArg.opt("--target-timeout", "target_timeout"), ToolArg.opt("-c", "config_file"),
+        ToolArg.opt("-g", "global_file"), ToolArg.opt("--plugins-dir", "plugins_dir"),
+        ToolArg.opt("--add-plugins-dir", "add_plugins_dir"), ToolArg.opt("--tags", "tags"),
+        ToolArg.opt("--exclude-tags", "exclude_tags"), ToolArg.opt("--port-scans", "port_scans"),
+        ToolArg.opt("--service-scans", "service_scans"), ToolArg.opt("--reports", "reports"),
+        ToolArg.switch("--single-target", "single_target"), ToolArg.switch("--only-scans-dir", "only_scans_dir"),
+        ToolArg.switch("--no-port-dirs", "no_port_dirs"), ToolArg.opt("--nmap=", "nmap"),
+        ToolArg.opt("--nmap-append=", "nmap_append"), ToolArg.switch("--proxychains", "proxychains"),
+        ToolArg.switch("--disable-sanity-checks", "disable_sanity_checks"),
+        ToolArg.switch("--disable-keyboard-control", "disable_keyboard_control"),
+        ToolArg.opt("--force-services", "force_services"), ToolArg.switch("--accessible", "accessible"),
+        ToolArg.count("-v", "verbose"), ToolArg.opt("--curl.path", "curl_path"),
+        ToolArg.opt("--dirbuster.tool", "dirbuster_tool"), ToolArg.opt("--dirbuster.wordlist", "dirbuster_wordlist"),
+        ToolArg.opt("--dirbuster.threads", "dirbuster_threads"), ToolArg.opt("--dirbuster.ext", "dirbuster_ext"),
+        ToolArg.opt("--onesixtyone.community-strings", "onesixtyone_community_strings"),
+        ToolArg.opt("--global.username-wordlist", "global_username_wordlist"),
+        ToolArg.opt("--global.password-wordlist", "global_password_wordlist"),
+        ToolArg.opt("--global.domain", "global_domain"), ToolArg.opt("--concurrent-targets", "max_concurrent"),
+        ToolArg.extra())),
+}
+
+# Binaries resolved up front so requests never walk PATH; r2 and gdb are run outside TOOL_SPECS
+TOOL_PATHS = {binary: resolve_tool(binary)
+              for binary in sorted({binary for binary, _ in TOOL_SPECS.values()} | {"gdb", "r2"})}
+
+def build_tool_argv(tool: str, **values: Any) -> List[str]:
+    """Assemble a tool's argv by walking its TOOL_SPECS layout"""
+    binary, spec = TOOL_SPECS[tool]
+    argv = [binary]
+    for arg in spec:
+        if arg.kind == "const":
+            argv += arg.values
+            continue
+        value = values.get(arg.key)
+        if not value or (arg.unless and values.get(arg.unless)):
+            continue
+        if arg.kind == "pos":
+            argv += map(str, value) if isinstance(value, list) else (str(value),)
+        elif arg.kind == "switch":
+            argv.append(arg.flag)
+        elif arg.kind == "count":
+            argv.append(arg.flag + arg.flag[-1] * (int(value) - 1))
+        elif arg.kind == "extra":
+            argv += shlex.split(value)
+        elif arg.flag.endswith("="):
+            argv.append(f"{arg.flag}{value}")
+        else:
+            argv += (arg.flag, str(value))
+    return argv
 
-@app.route("/api/tools/nuclei", methods=["POST"])
-def nuclei():
-    """Execute Nuclei vulnerability scanner with enhanced logging and intelligent error handling"""
-    try:
-        params = request.json
-        target = params.get("target", "")
-        severity = params.get("severity", "")
-        tags = params.get("tags", "")
-        template = params.get("template", "")
-        additional_args = params.get("additional_args", "")
-        use_recovery = params.get("use_recovery", True)
-        
-        if not target:
-            logger.warning("🎯 Nuclei called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
-        
-        command = f"nuclei -u {target}"
-        
-        if severity:
-            command += f" -severity {severity}"
-            
-        if tags:
-            command += f" -tags {tags}"
-            
-        if template:
-            command += f" -t {template}"
-            
-        if additional_args:
-            command += f" {additional_args}"
+class ParamsValidationError(ValueError):
+    """Raised when a request body does not match its params dataclass"""
+
+def param_flag(params: Dict[str, Any], name: str, default: bool = False) -> bool:
+    """
+    A boolean field of a raw JSON body, for views that do not go through parse_params
+    
+    JSON booleans, 0/1 and the strings wants_stream() accepts (plus "0"/"false"/"no")
+    are understood, so "false" no longer counts as set; anything else raises
+    ParamsValidationError.
+    """
+    value = params.get(name)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("1", "true", "yes"):
+            return True
+        if lowered in ("", "0", "false", "no"):
+            return False
+    raise ParamsValidationError(f"{name} must be a boolean")
+
+@functools.lru_cache(maxsize=None)
+def _param_fields(params_cls) -> Tuple[Tuple[str, type], ...]:
+    return tuple((f.name, f.type) for f in fields(params_cls))
+
+def parse_params(params_cls):
+    """
+    Decode the JSON request body into a params dataclass in one pass
+    
+    Missing or null fields (and "" for integers) take the dataclass default and unknown keys are ignored.
+    Numbers are accepted for string fields and list fields hold strings; anything else
+    of the wrong type raises ParamsValidationError, which endpoints turn into a 400.
+    """
+    data = request.get_json(cache=False, silent=True)
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise ParamsValidationError("Request body must be a JSON object")
+    
+    values = {}
+    for name, expected in _param_fields(params_cls):
+        value = data.get(name)
+        if value is None:
+            continue
+        if expected is str:
+            if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+                raise ParamsValidationError(f"{name} must be a string")
+            value = str(value)
+        elif expected is bool:
+            if not isinstance(value, bool):
+                raise ParamsValidationError(f"{name} must be a boolean")
+        elif expected is int:
+            if value == "":
+                continue
+            if isinstance(value, bool):
+                raise ParamsValidationError(f"{name} must be an integer")
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ParamsValidationError(f"{name} must be an integer")
+        elif expected is list:
+            if not isinstance(value, list) or any(isinstance(item, (bool, list, dict)) for item in value):
+                raise ParamsValidationError(f"{name} must be a list of strings")
+            value = [str(item) for item in value if item is not None]
+        values[name] = value
+    return params_cls(**values)
+
+def tool_endpoint(params_cls, required: Optional[Dict[str, bytes]] = None):
+    """
+    Decorate a tool view that takes a parsed params dataclass instead of reading the request itself
+    
+    Args:
+        params_cls: Dataclass the JSON body is parsed into (see parse_params)
+        required: Field name -> precomputed 400 body returned when that field is empty
+    
+    Validation errors become 400s and unexpected exceptions the usual JSON 500. Start and
+    completion are logged here, with the tool and its first required field as the target,
+    so the views themselves carry no logging boilerplate.
+    """
+    target_field = next(iter(required), None) if required else None
+    
+    def decorator(fn):
+        tool = fn.__name__
+        
+        @functools.wraps(fn)
+        def wrapper():
+            try:
+                params = parse_params(params_cls)
+                for name, error_body in (required or {}).items():
+                    if not getattr(params, name):
+                        logger.warning("🔧 %s called without %s parameter", tool, name)
+                        return error_response(error_body)
+                target = getattr(params, target_field) if target_field else ""
+                log_fields = {"tool": tool, "target": target}
+                logger.info("🔧 Starting %s: %s", tool, target, extra=log_fields)
+                response = fn(params)
+                if getattr(response, "is_streamed", False):
+                    logger.info("📡 Streaming %s output: %s", tool, target, extra=log_fields)
+                else:
+                    logger.info("📊 %s completed for %s", tool, target, extra=log_fields)
+                return response
+            except ParamsValidationError as e:
+                return jsonify({"error": str(e)}), 400
+            except Exception as e:
+                logger.error("💥 Error in %s endpoint: %s", fn.__name__, e)
+                return jsonify({"error": f"Server error: {str(e)}"}), 500
+        return wrapper
+    return decorator
+
+DEFAULT_SHARDS = min(8, os.cpu_count() or 1)
+
+@dataclass
+class ProwlerParams:
+    """Request body of /api/tools/prowler"""
+    provider: str = "aws"
+    profile: str = "default"
+    region: str = ""
+    checks: str = ""
+    output_dir: str = "/tmp/prowler_output"
+    output_format: str = "json"
+    additional_args: str = ""
+
+@dataclass
+class TrivyParams:
+    """Request body of /api/tools/trivy"""
+    scan_type: str = "image"
+    target: str = ""
+    output_format: str = "json"
+    severity: str = ""
+    output_file: str = ""
+    additional_args: str = ""
+
+@dataclass
+class DirbParams:
+    """Request body of /api/tools/dirb"""
+    url: str = ""
+    wordlist: str = "/usr/share/wordlists/dirb/common.txt"
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class NiktoParams:
+    """Request body of /api/tools/nikto"""
+    target: str = ""
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class SqlmapParams:
+    """Request body of /api/tools/sqlmap"""
+    url: str = ""
+    data: str = ""
+    additional_args: str = ""
+
+@dataclass
+class HydraParams:
+    """Request body of /api/tools/hydra"""
+    target: str = ""
+    service: str = ""
+    username: str = ""
+    username_file: str = ""
+    password: str = ""
+    password_file: str = ""
+    additional_args: str = ""
+
+@dataclass
+class JohnParams:
+    """Request body of /api/tools/john"""
+    hash_file: str = ""
+    wordlist: str = "/usr/share/wordlists/rockyou.txt"
+    format: str = ""
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class WpscanParams:
+    """Request body of /api/tools/wpscan"""
+    url: str = ""
+    additional_args: str = ""
+
+@dataclass
+class Enum4linuxParams:
+    """Request body of /api/tools/enum4linux"""
+    target: str = ""
+    additional_args: str = "-a"
+
+@dataclass
+class FfufParams:
+    """Request body of /api/tools/ffuf"""
+    url: str = ""
+    wordlist: str = "/usr/share/wordlists/dirb/common.txt"
+    mode: str = "directory"
+    match_codes: str = "200,204,301,302,307,401,403"
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class NetexecParams:
+    """Request body of /api/tools/netexec"""
+    target: str = ""
+    protocol: str = "smb"
+    username: str = ""
+    password: str = ""
+    hash: str = ""
+    module: str = ""
+    additional_args: str = ""
+
+@dataclass
+class AmassParams:
+    """Request body of /api/tools/amass"""
+    domain: str = ""
+    mode: str = "enum"
+    additional_args: str = ""
+    shards: int = DEFAULT_SHARDS
+    
+    def __post_init__(self):
+        if self.shards < 1:
+            raise ParamsValidationError("shards must be at least 1")
+
+@dataclass
+class HashcatParams:
+    """Request body of /api/tools/hashcat"""
+    hash_file: str = ""
+    hash_type: str = ""
+    attack_mode: str = "0"
+    wordlist: str = "/usr/share/wordlists/rockyou.txt"
+    mask: str = ""
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class SubfinderParams:
+    """Request body of /api/tools/subfinder"""
+    domain: str = ""
+    silent: bool = True
+    all_sources: bool = False
+    additional_args: str = ""
+    shards: int = DEFAULT_SHARDS
+    
+    def __post_init__(self):
+        if self.shards < 1:
+            raise ParamsValidationError("shards must be at least 1")
+
+@dataclass
+class SmbmapParams:
+    """Request body of /api/tools/smbmap"""
+    target: str = ""
+    username: str = ""
+    password: str = ""
+    domain: str = ""
+    additional_args: str = ""
+
+@dataclass
+class VolatilityParams:
+    """Request body of /api/tools/volatility"""
+    memory_file: str = ""
+    plugin: str = ""
+    profile: str = ""
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class MsfvenomParams:
+    """Request body of /api/tools/msfvenom"""
+    payload: str = ""
+    format: str = ""
+    output_file: str = ""
+    encoder: str = ""
+    iterations: str = ""
+    additional_args: str = ""
+
+@dataclass
+class GdbParams:
+    """Request body of /api/tools/gdb"""
+    binary: str = ""
+    commands: str = ""
+    script_file: str = ""
+    additional_args: str = ""
+
+@dataclass
+class Radare2Params:
+    """Request body of /api/tools/radare2"""
+    binary: str = ""
+    commands: str = ""
+    additional_args: str = ""
+
+@dataclass
+class BinwalkParams:
+    """Request body of /api/tools/binwalk"""
+    file_path: str = ""
+    extract: bool = False
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class RopgadgetParams:
+    """Request body of /api/tools/ropgadget"""
+    binary: str = ""
+    gadget_type: str = ""
+    additional_args: str = ""
+
+@dataclass
+class ChecksecParams:
+    """Request body of /api/tools/checksec"""
+    binary: str = ""
+    force: bool = False
+
+@dataclass
+class XxdParams:
+    """Request body of /api/tools/xxd"""
+    file_path: str = ""
+    offset: str = "0"
+    length: str = ""
+    additional_args: str = ""
+
+@dataclass
+class StringsParams:
+    """Request body of /api/tools/strings"""
+    file_path: str = ""
+    min_len: int = 4
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class ObjdumpParams:
+    """Request body of /api/tools/objdump"""
+    binary: str = ""
+    disassemble: bool = True
+    additional_args: str = ""
+    force: bool = False
+
+@dataclass
+class FeroxbusterParams:
+    """Request body of /api/tools/feroxbuster"""
+    url: str = ""
+    wordlist: str = "/usr/share/wordlists/dirb/common.txt"
+    threads: int = 10
+    additional_args: str = ""
+
+@dataclass
+class DotdotpwnParams:
+    """Request body of /api/tools/dotdotpwn"""
+    target: str = ""
+    module: str = "http"
+    additional_args: str = ""
+
+@dataclass
+class XsserParams:
+    """Request body of /api/tools/xsser"""
+    url: str = ""
+    params: str = ""
+    additional_args: str = ""
+
+@dataclass
+class WfuzzParams:
+    """Request body of /api/tools/wfuzz"""
+    url: str = ""
+    wordlist: str = "/usr/share/wordlists/dirb/common.txt"
+    additional_args: str = ""
+
+@dataclass
+class AutoReconParams:
+    """Request body of /api/tools/autorecon"""
+    target: str = ""
+    targets: list = field(default_factory=list)
+    target_file: str = ""
+    ports: str = ""
+    output_dir: str = "/tmp/autorecon"
+    max_scans: int = 0
+    max_port_scans: int = 0
+    port_scans: str = "top-100-ports"
+    service_scans: str = "default"
+    reports: str = ""
+    heartbeat: int = 60
+    timeout: int = 300
+    target_timeout: int = 0
+    config_file: str = ""
+    global_file: str = ""
+    plugins_dir: str = ""
+    add_plugins_dir: str = ""
+    tags: str = ""
+    exclude_tags: str = ""
+    single_target: bool = False
+    only_scans_dir: bool = False
+    no_port_dirs: bool = False
+    nmap: str = ""
+    nmap_append: str = ""
+    proxychains: bool = False
+    disable_sanity_checks: bool = False
+    disable_keyboard_control: bool = False
+    force_services: str = ""
+    accessible: bool = False
+    verbose: int = 0
+    curl_path: str = ""
+    dirbuster_tool: str = ""
+    dirbuster_wordlist: str = ""
+    dirbuster_threads: int = 0
+    dirbuster_ext: str = ""
+    onesixtyone_community_strings: str = ""
+    global_username_wordlist: str = ""
+    global_password_wordlist: str = ""
+    global_domain: str = ""
+    max_concurrent: int = 0
+    additional_args: str = ""
+    
+    def __post_init__(self):
+        # A "targets" list folds into the comma-separated form split_targets() reads
+        if self.targets:
+            self.target = ",".join(self.targets)
+
+TOOL_NAME_PATTERN = re.compile(r"[\w-]+(?:/[\w-]+)*")
+TOOL_ROUTE_PREFIX = "/api/tools/"
+
+@functools.lru_cache(maxsize=None)
+def tool_views() -> Dict[str, Callable[[], Any]]:
+    """Tool name -> view function for every static POST /api/tools/<tool> route, built once on first use"""
+    views = {}
+    for rule in app.url_map.iter_rules():
+        if rule.rule.startswith(TOOL_ROUTE_PREFIX) and not rule.arguments and "POST" in rule.methods:
+            views[rule.rule[len(TOOL_ROUTE_PREFIX):]] = app.view_functions[rule.endpoint]
+    views.pop("batch", None)
+    return views
+
+def dispatch_tool(tool: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+    """Invoke the /api/tools/<tool> endpoint in-process and return (status code, JSON body)"""
+    if not isinstance(tool, str) or not TOOL_NAME_PATTERN.fullmatch(tool) or tool == "batch":
+        return 400, {"error": f"Invalid tool name: {tool}"}
+    
+    view = tool_views().get(tool)
+    if view is None:
+        return 404, {"error": f"Unknown tool: {tool}"}
+    
+    with app.test_request_context(TOOL_ROUTE_PREFIX + tool, method="POST", json=params):
+        response = app.make_response(view())
+        return response.status_code, response.get_json(silent=True)
+
+# Shared by all batch requests; each request keeps at most max_concurrent of its entries in flight
+BATCH_POOL_WORKERS = (os.cpu_count() or 1) * 2
+batch_pool = ThreadPoolExecutor(max_workers=BATCH_POOL_WORKERS, thread_name_prefix="hexstrike-batch")
+
+def batch_entry_params(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool parameters of a batch entry: its "params" member, or its other keys when given inline"""
+    if "params" in entry:
+        return entry["params"] or {}
+    return {key: value for key, value in entry.items() if key not in ("tool", "id")}
+
+@app.route("/api/tools/batch", methods=["POST"])
+def batch_tools():
+    """Run several tool endpoints concurrently and aggregate their results"""
+    try:
+        params = request.get_json(cache=False, silent=True) or {}
+        entries = params.get("requests", [])
         
-        logger.info(f"🔬 Starting Nuclei vulnerability scan: {target}")
+        if not isinstance(entries, list) or not entries or not all(isinstance(e, dict) for e in entries):
+            return error_response(ERR_NO_BATCH_REQUESTS)
+        
+        try:
+            max_concurrent = int(params.get("max_concurrent", MAX_CONCURRENT_AGENTS))
+            timeout = float(params.get("timeout", COMMAND_TIMEOUT))
+        except (TypeError, ValueError):
+            return jsonify({"error": "max_concurrent and timeout must be numbers"}), 400
+        if not 0 < timeout < float("inf"):
+            return jsonify({"error": "timeout must be a positive number of seconds"}), 400
+        # More in-flight entries than there are entries (or pool workers) would only queue
+        max_concurrent = max(1, min(max_concurrent, len(entries), BATCH_POOL_WORKERS))
+        
+        logger.info("📦 Batch: running %s tools with concurrency %s", len(entries), max_concurrent)
+        start_time = time.time()
+        deadline = start_time + timeout
+        results = []
+        for entry in entries:
+            result = {"tool": entry.get("tool"), "success": False, "status_code": 504, "error": f"Timed out after {timeout}s"}
+            if "id" in entry:
+                result["id"] = entry["id"]
+            results.append(result)
+        
+        # Sliding window over the shared pool: a new entry is submitted whenever one finishes
+        backlog = iter(enumerate(entries))
+        pending: Dict[Future, int] = {}
+        
+        def submit_next():
+            for index, entry in backlog:
+                pending[batch_pool.submit(dispatch_tool, entry.get("tool"), batch_entry_params(entry))] = index
+                return
+        
+        for _ in range(max_concurrent):
+            submit_next()
+        
+        while pending:
+            done, _ = wait_futures(pending, timeout=max(0, deadline - time.time()), return_when=FIRST_COMPLETED)
+            if not done:
+                logger.warning("⏰ Batch timed out after %ss; unfinished tools keep running under the process manager", timeout)
+                break
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    status_code, body = future.result()
+                    results[index].update({
+                        "success": status_code < 400 and bool(isinstance(body, dict) and body.get("success", True)),
+                        "status_code": status_code,
+                        "result": body
+                    })
+                    results[index].pop("error")
+                except Exception as e:
+                    results[index]["status_code"] = 500
+                    results[index]["error"] = f"Server error: {str(e)}"
+                submit_next()
+        
+        response = {
+            "success": all(result["success"] for result in results),
+            "results": results,
+            "total_time": time.time() - start_time
+        }
+        if any("id" in result for result in results):
+            response["results_by_id"] = {str(result["id"]): result for result in results if "id" in result}
+        return jsonify(response)
+    except Exception as e:
+        logger.error("💥 Error in batch endpoint: %s", e)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+# Tool runs started with ?async=1 share this cap; further submissions wait in the executor's FIFO
+SCAN_MAX_PARALLEL = int(os.environ.get("HEXSTRIKE_MAX_PARALLEL_SCANS", 4))
+SCAN_RESULT_TTL = 3600  # Seconds a finished job's result stays retrievable
+# Queued plus running jobs accepted at once (further submissions get a 429) and finished results kept
+SCAN_MAX_PENDING = int(os.environ.get("HEXSTRIKE_MAX_PENDING_SCANS", 64))
+SCAN_MAX_FINISHED = 1000
+
+class ScanJobs:
+    """Background tool runs addressed by token, so long scans do not hold the HTTP request open"""
+    
+    def __init__(self, max_parallel: int = SCAN_MAX_PARALLEL):
+        self.executor = ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="hexstrike-scan")
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.pending = 0
+        self._lock = threading.Lock()
+    
+    def submit(self, tool: str, params: Dict[str, Any]) -> Optional[str]:
+        """Queue a tool run and return its token, or None when SCAN_MAX_PENDING jobs are already waiting"""
+        token = secrets.token_hex(16)
+        job = {"tool": tool, "submitted_at": time.time(), "started_at": None, "finished_at": None}
+        
+        def run():
+            job["started_at"] = time.time()
+            try:
+                return dispatch_tool(tool, params)
+            finally:
+                with self._lock:
+                    job["finished_at"] = time.time()
+                    self.pending -= 1
+        
+        with self._lock:
+            self._prune()
+            if self.pending >= SCAN_MAX_PENDING:
+                return None
+            self.pending += 1
+            job["future"] = self.executor.submit(run)
+            self.jobs[token] = job
+        return token
+    
+    def status(self, token: str) -> Optional[Dict[str, Any]]:
+        """Job state, plus the tool's status code and JSON body once it has finished"""
+        with self._lock:
+            self._prune()
+            job = self.jobs.get(token)
+        if job is None:
+            return None
+        state = {"token": token, "tool": job["tool"], "submitted_at": job["submitted_at"]}
+        future = job["future"]
+        if not future.done():
+            state["status"] = "running" if job["started_at"] else "queued"
+            return state
+        state["finished_at"] = job["finished_at"]
+        try:
+            state["status_code"], state["result"] = future.result()
+            state["status"] = "done"
+        except Exception as e:
+            state.update(status="failed", status_code=500, error=f"Server error: {str(e)}")
+        return state
+    
+    def _prune(self):
+        """Forget finished jobs older than SCAN_RESULT_TTL, then the oldest beyond SCAN_MAX_FINISHED (caller holds the lock)"""
+        cutoff = time.time() - SCAN_RESULT_TTL
+        finished = sorted((job["finished_at"], t) for t, job in self.jobs.items() if job["finished_at"])
+        excess = len(finished) - SCAN_MAX_FINISHED
+        for index, (finished_at, token) in enumerate(finished):
+            if finished_at >= cutoff and index >= excess:
+                break
+            del self.jobs[token]
+    
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+scan_jobs = ScanJobs()
+
+def wants_background() -> bool:
+    """True when the client asked for a token instead of waiting, with ?async=1"""
+    return request.args.get("async", "").lower() in ("1", "true", "yes")
+
+@app.before_request
+def submit_background_tool():
+    """Turn POST /api/tools/<tool>?async=1 into a queued job and answer 202 with its token"""
+    if request.method != "POST" or not request.path.startswith(TOOL_ROUTE_PREFIX) or not wants_background():
+        return None
+    tool = request.path[len(TOOL_ROUTE_PREFIX):]
+    if tool not in tool_views():
+        return None
+    token = scan_jobs.submit(tool, request.get_json(cache=False, silent=True) or {})
+    if token is None:
+        logger.warning("📋 Background queue full, rejecting %s", tool)
+        response = jsonify({"error": f"Too many background jobs pending (max {SCAN_MAX_PENDING}); retry later"})
+        response.headers["Retry-After"] = "30"
+        return response, 429
+    logger.info("📋 Queued %s as background job %s", tool, token)
+    return jsonify({"success": True, "token": token, "tool": tool, "status": "queued",
+                    "result_url": f"{TOOL_ROUTE_PREFIX}result/{token}"}), 202
+
+@app.route("/api/tools/result/<token>", methods=["GET"])
+def get_tool_result(token):
+    """Poll a background tool run: 202 while queued/running, 200 with the tool's response when finished"""
+    state = scan_jobs.status(token)
+    if state is None:
+        return jsonify({"error": f"Unknown or expired token: {token}"}), 404
+    return jsonify(state), 200 if "status_code" in state else 202
+
+@app.route("/api/tools/nmap", methods=["POST"])
+def nmap():
+    """Execute nmap scan with enhanced logging, caching, and intelligent error handling"""
+    try:
+        params = request.get_json(cache=False, silent=True) or {}
+        target = params.get("target", "")
+        scan_type = params.get("scan_type", "-sCV")
+        ports = params.get("ports", "")
+        additional_args = params.get("additional_args", "-T4 -Pn")
+        use_recovery = params.get("use_recovery", True)
+        
+        if not target:
+            logger.warning("🎯 Nmap called without target parameter")
+            return error_response(ERR_NO_TARGET)
+        
+        command = build_nmap_command(str(target), str(scan_type), str(ports), str(additional_args))
+        
+        logger.info("🔍 Starting Nmap scan: %s", target)
+        
+        # Streamed runs exec without a shell; the built line splits back into its argv
+        if wants_stream():
+            return stream_command_response(shlex.split(command))
+        
+        # Use intelligent error handling if enabled
+        if use_recovery:
+            tool_params = {
+                "target": target,
+                "scan_type": scan_type,
+                "ports": ports,
+                "additional_args": additional_args
+            }
+            result = execute_command_with_recovery("nmap", command, tool_params, use_async=True)
+        else:
+            result = execute_command(command, use_async=True)
+        
+        logger.info("📊 Nmap scan completed for %s", target)
+        return jsonify(result)
+        
+    except Exception as e:
+        logger.error("💥 Error in nmap endpoint: %s", e)
+        return jsonify({
+            "error": f"Server error: {str(e)}"
+        }), 500
+
+@app.route("/api/tools/gobuster", methods=["POST"])
+def gobuster():
+    """Execute gobuster with enhanced logging and intelligent error handling"""
+    try:
+        params = request.get_json(cache=False, silent=True) or {}
+        url = params.get("url", "")
+        mode = params.get("mode", "dir")
+        wordlist = params.get("wordlist", "/usr/share/wordlists/dirb/common.txt")
+        additional_args = params.get("additional_args", "")
+        use_recovery = params.get("use_recovery", True)
+        
+        if not url:
+            logger.warning("🌐 Gobuster called without URL parameter")
+            return error_response(ERR_NO_URL)
+        
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
+        
+        # Validate mode
+        if not isinstance(mode, str) or mode not in _VALID_GOBUSTER_MODES:
+            logger.warning("❌ Invalid gobuster mode: %s", mode)
+            return jsonify({
+                "error": f"Invalid mode: {mode}. Must be one of: dir, dns, fuzz, vhost"
+            }), 400
+        
+        command = build_gobuster_command(str(url), mode, str(wordlist), str(additional_args))
+        
+        logger.info("📁 Starting Gobuster %s scan: %s", mode, url)
+        
+        # Streamed runs exec without a shell; the built line splits back into its argv
+        if wants_stream():
+            return stream_command_response(shlex.split(command))
+        
+        # Use intelligent error handling if enabled
+        if use_recovery:
+            tool_params = {
+                "target": url,
+                "mode": mode,
+                "wordlist": wordlist,
+                "additional_args": additional_args
+            }
+            result = execute_command_with_recovery("gobuster", command, tool_params, use_async=True)
+        else:
+            result = execute_command(command, use_async=True)
+        
+        logger.info("📊 Gobuster scan completed for %s", url)
+        return jsonify(result)
+        
+    except Exception as e:
+        logger.error("💥 Error in gobuster endpoint: %s", e)
+        return jsonify({
+            "error": f"Server error: {str(e)}"
+        }), 500
+
+@app.route("/api/tools/nuclei", methods=["POST"])
+def nuclei():
+    """Execute Nuclei vulnerability scanner with enhanced logging and intelligent error handling"""
+    try:
+        params = request.get_json(cache=False, silent=True) or {}
+        target = params.get("target", "")
+        severity = params.get("severity", "")
+        tags = params.get("tags", "")
+        template = params.get("template", "")
+        additional_args = params.get("additional_args", "")
+        use_recovery = params.get("use_recovery", True)
+        
+        if not target:
+            logger.warning("🎯 Nuclei called without target parameter")
+            return error_response(ERR_NO_TARGET)
+        
+        command = build_nuclei_command(str(target), str(severity), str(tags), str(template), str(additional_args))
+        
+        logger.info("🔬 Starting Nuclei vulnerability scan: %s", target)
+        
+        # Streamed runs exec without a shell; the built line splits back into its argv
+        if wants_stream():
+            return stream_command_response(shlex.split(command))
         
         # Use intelligent error handling if enabled
         if use_recovery:
@@ -8210,15 +10678,15 @@ def nuclei():
                 "template": template,
                 "additional_args": additional_args
             }
-            result = execute_command_with_recovery("nuclei", command, tool_params)
+            result = execute_command_with_recovery("nuclei", command, tool_params, use_async=True)
         else:
-            result = execute_command(command)
+            result = execute_command(command, use_async=True)
         
-        logger.info(f"📊 Nuclei scan completed for {target}")
+        logger.info("📊 Nuclei scan completed for %s", target)
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"💥 Error in nuclei endpoint: {str(e)}")
+        logger.error("💥 Error in nuclei endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8231,42 +10699,28 @@ def nuclei():
 def prowler():
     """Execute Prowler for AWS security assessment"""
     try:
-        params = request.json
-        provider = params.get("provider", "aws")
-        profile = params.get("profile", "default")
-        region = params.get("region", "")
-        checks = params.get("checks", "")
-        output_dir = params.get("output_dir", "/tmp/prowler_output")
-        output_format = params.get("output_format", "json")
-        additional_args = params.get("additional_args", "")
-        
-        # Ensure output directory exists
+        params = parse_params(ProwlerParams)
+        provider = params.provider
+        profile = params.profile
+        region = params.region
+        checks = params.checks
+        output_dir = params.output_dir
+        output_format = params.output_format
+        additional_args = params.additional_args
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
-        command = f"prowler {provider}"
-        
-        if profile:
-            command += f" --profile {profile}"
-            
-        if region:
-            command += f" --region {region}"
-            
-        if checks:
-            command += f" --checks {checks}"
-            
-        command += f" --output-directory {output_dir}"
-        command += f" --output-format {output_format}"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_tool_argv("prowler", provider=provider, profile=profile, region=region, checks=checks,
+                                  output_dir=output_dir, output_format=output_format, additional_args=additional_args)
         
-        logger.info(f"☁️  Starting Prowler {provider} security assessment")
-        result = execute_command(command)
+        logger.info("☁️  Starting Prowler %s security assessment", provider)
+        result = execute_command(command, use_async=True)
         result["output_directory"] = output_dir
-        logger.info(f"📊 Prowler assessment completed")
+        logger.info("📊 Prowler assessment completed")
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in prowler endpoint: {str(e)}")
+        logger.error("💥 Error in prowler endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8275,42 +10729,31 @@ def prowler():
 def trivy():
     """Execute Trivy for container/filesystem vulnerability scanning"""
     try:
-        params = request.json
-        scan_type = params.get("scan_type", "image")  # image, fs, repo
-        target = params.get("target", "")
-        output_format = params.get("output_format", "json")
-        severity = params.get("severity", "")
-        output_file = params.get("output_file", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(TrivyParams)
+        scan_type = params.scan_type
+        target = params.target
+        output_format = params.output_format
+        severity = params.severity
+        output_file = params.output_file
+        additional_args = params.additional_args
         
         if not target:
             logger.warning("🎯 Trivy called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
+            return error_response(ERR_NO_TARGET)
         
-        command = f"trivy {scan_type} {target}"
+        command = build_tool_argv("trivy", scan_type=scan_type, target=target, output_format=output_format,
+                                  severity=severity, output_file=output_file, additional_args=additional_args)
         
-        if output_format:
-            command += f" --format {output_format}"
-            
-        if severity:
-            command += f" --severity {severity}"
-            
-        if output_file:
-            command += f" --output {output_file}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting Trivy {scan_type} scan: {target}")
-        result = execute_command(command)
+        logger.info("🔍 Starting Trivy %s scan: %s", scan_type, target)
+        result = execute_command(command, use_async=True)
         if output_file:
             result["output_file"] = output_file
-        logger.info(f"📊 Trivy scan completed for {target}")
+        logger.info("📊 Trivy scan completed for %s", target)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in trivy endpoint: {str(e)}")
+        logger.error("💥 Error in trivy endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8323,7 +10766,7 @@ def trivy():
 def scout_suite():
     """Execute Scout Suite for multi-cloud security assessment"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         provider = params.get("provider", "aws")  # aws, azure, gcp, aliyun, oci
         profile = params.get("profile", "default")
         report_dir = params.get("report_dir", "/tmp/scout-suite")
@@ -8334,36 +10777,24 @@ def scout_suite():
         # Ensure report directory exists
         Path(report_dir).mkdir(parents=True, exist_ok=True)
         
-        command = f"scout {provider}"
+        command = build_argv(["scout", provider],
+                             {"--profile": profile if provider == "aws" else None, "--services": services,
+                              "--exceptions": exceptions, "--report-dir": report_dir}, extra=additional_args)
         
-        if profile and provider == "aws":
-            command += f" --profile {profile}"
-        
-        if services:
-            command += f" --services {services}"
-        
-        if exceptions:
-            command += f" --exceptions {exceptions}"
-        
-        command += f" --report-dir {report_dir}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"☁️  Starting Scout Suite {provider} assessment")
+        logger.info("☁️  Starting Scout Suite %s assessment", provider)
         result = execute_command(command)
         result["report_directory"] = report_dir
-        logger.info(f"📊 Scout Suite assessment completed")
+        logger.info("📊 Scout Suite assessment completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in scout-suite endpoint: {str(e)}")
+        logger.error("💥 Error in scout-suite endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/cloudmapper", methods=["POST"])
 def cloudmapper():
     """Execute CloudMapper for AWS network visualization and security analysis"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         action = params.get("action", "collect")  # collect, prepare, webserver, find_admins, etc.
         account = params.get("account", "")
         config = params.get("config", "config.json")
@@ -8373,30 +10804,20 @@ def cloudmapper():
             logger.warning("☁️  CloudMapper called without account parameter")
             return jsonify({"error": "Account parameter is required for most actions"}), 400
         
-        command = f"cloudmapper {action}"
-        
-        if account:
-            command += f" --account {account}"
+        command = build_argv(["cloudmapper", action], {"--account": account, "--config": config}, extra=additional_args)
         
-        if config:
-            command += f" --config {config}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"☁️  Starting CloudMapper {action}")
+        logger.info("☁️  Starting CloudMapper %s", action)
         result = execute_command(command)
-        logger.info(f"📊 CloudMapper {action} completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in cloudmapper endpoint: {str(e)}")
+        logger.error("💥 Error in cloudmapper endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/pacu", methods=["POST"])
 def pacu():
     """Execute Pacu for AWS exploitation framework"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         session_name = params.get("session_name", "hexstrike_session")
         modules = params.get("modules", "")
         data_services = params.get("data_services", "")
@@ -8429,7 +10850,7 @@ def pacu():
         if additional_args:
             command += f" {additional_args}"
         
-        logger.info(f"☁️  Starting Pacu AWS exploitation")
+        logger.info("☁️  Starting Pacu AWS exploitation")
         result = execute_command(command)
         
         # Cleanup
@@ -8438,17 +10859,17 @@ def pacu():
         except:
             pass
         
-        logger.info(f"📊 Pacu exploitation completed")
+        logger.info("📊 Pacu exploitation completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in pacu endpoint: {str(e)}")
+        logger.error("💥 Error in pacu endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/kube-hunter", methods=["POST"])
 def kube_hunter():
     """Execute kube-hunter for Kubernetes penetration testing"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         remote = params.get("remote", "")
         cidr = params.get("cidr", "")
@@ -8457,111 +10878,77 @@ def kube_hunter():
         report = params.get("report", "json")
         additional_args = params.get("additional_args", "")
         
-        command = "kube-hunter"
-        
-        if target:
-            command += f" --remote {target}"
-        elif remote:
-            command += f" --remote {remote}"
+        # One scan scope, in order of precedence; pod scanning when none is given
+        if target or remote:
+            scope = ("--remote", target or remote)
         elif cidr:
-            command += f" --cidr {cidr}"
+            scope = ("--cidr", cidr)
         elif interface:
-            command += f" --interface {interface}"
+            scope = ("--interface", interface)
         else:
-            # Default to pod scanning
-            command += " --pod"
-        
-        if active:
-            command += " --active"
+            scope = ("--pod",)
+        command = build_argv(["kube-hunter", *scope], {"--active": bool(active), "--report": report},
+                             extra=additional_args)
         
-        if report:
-            command += f" --report {report}"
+        logger.info("☁️  Starting kube-hunter Kubernetes scan")
+        if wants_stream():
+            return stream_command_response(command)
         
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"☁️  Starting kube-hunter Kubernetes scan")
         result = execute_command(command)
-        logger.info(f"📊 kube-hunter scan completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in kube-hunter endpoint: {str(e)}")
+        logger.error("💥 Error in kube-hunter endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/kube-bench", methods=["POST"])
 def kube_bench():
     """Execute kube-bench for CIS Kubernetes benchmark checks"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         targets = params.get("targets", "")  # master, node, etcd, policies
         version = params.get("version", "")
         config_dir = params.get("config_dir", "")
         output_format = params.get("output_format", "json")
         additional_args = params.get("additional_args", "")
         
-        command = "kube-bench"
-        
-        if targets:
-            command += f" --targets {targets}"
-        
-        if version:
-            command += f" --version {version}"
-        
-        if config_dir:
-            command += f" --config-dir {config_dir}"
-        
-        if output_format:
-            command += f" --outputfile /tmp/kube-bench-results.{output_format} --json"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        output_args = ("--outputfile", f"/tmp/kube-bench-results.{output_format}", "--json") if output_format else ()
+        command = build_argv(["kube-bench"], {"--targets": targets, "--version": version, "--config-dir": config_dir},
+                             positional=output_args, extra=additional_args)
         
-        logger.info(f"☁️  Starting kube-bench CIS benchmark")
+        logger.info("☁️  Starting kube-bench CIS benchmark")
         result = execute_command(command)
-        logger.info(f"📊 kube-bench benchmark completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in kube-bench endpoint: {str(e)}")
+        logger.error("💥 Error in kube-bench endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/docker-bench-security", methods=["POST"])
 def docker_bench_security():
     """Execute Docker Bench for Security for Docker security assessment"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         checks = params.get("checks", "")  # Specific checks to run
         exclude = params.get("exclude", "")  # Checks to exclude
         output_file = params.get("output_file", "/tmp/docker-bench-results.json")
         additional_args = params.get("additional_args", "")
         
-        command = "docker-bench-security"
-        
-        if checks:
-            command += f" -c {checks}"
-        
-        if exclude:
-            command += f" -e {exclude}"
-        
-        if output_file:
-            command += f" -l {output_file}"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_argv(["docker-bench-security"], {"-c": checks, "-e": exclude, "-l": output_file},
+                             extra=additional_args)
         
-        logger.info(f"🐳 Starting Docker Bench Security assessment")
+        logger.info("🐳 Starting Docker Bench Security assessment")
         result = execute_command(command)
         result["output_file"] = output_file
-        logger.info(f"📊 Docker Bench Security completed")
+        logger.info("📊 Docker Bench Security completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in docker-bench-security endpoint: {str(e)}")
+        logger.error("💥 Error in docker-bench-security endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/clair", methods=["POST"])
 def clair():
     """Execute Clair for container vulnerability analysis"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         image = params.get("image", "")
         config = params.get("config", "/etc/clair/config.yaml")
         output_format = params.get("output_format", "json")
@@ -8572,63 +10959,43 @@ def clair():
             return jsonify({"error": "Image parameter is required"}), 400
         
         # Use clairctl for scanning
-        command = f"clairctl analyze {image}"
+        command = build_argv(["clairctl", "analyze", image], {"--config": config, "--format": output_format},
+                             extra=additional_args)
         
-        if config:
-            command += f" --config {config}"
-        
-        if output_format:
-            command += f" --format {output_format}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🐳 Starting Clair vulnerability scan: {image}")
+        logger.info("🐳 Starting Clair vulnerability scan: %s", image)
         result = execute_command(command)
-        logger.info(f"📊 Clair scan completed for {image}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in clair endpoint: {str(e)}")
+        logger.error("💥 Error in clair endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/falco", methods=["POST"])
 def falco():
     """Execute Falco for runtime security monitoring"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         config_file = params.get("config_file", "/etc/falco/falco.yaml")
         rules_file = params.get("rules_file", "")
         output_format = params.get("output_format", "json")
         duration = params.get("duration", 60)  # seconds
         additional_args = params.get("additional_args", "")
         
-        command = f"timeout {duration} falco"
-        
-        if config_file:
-            command += f" --config {config_file}"
-        
-        if rules_file:
-            command += f" --rules {rules_file}"
-        
-        if output_format == "json":
-            command += " --json"
+        command = build_argv(["timeout", duration, "falco"],
+                             {"--config": config_file, "--rules": rules_file, "--json": output_format == "json"},
+                             extra=additional_args)
         
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🛡️  Starting Falco runtime monitoring for {duration}s")
+        logger.info("🛡️  Starting Falco runtime monitoring for %ss", duration)
         result = execute_command(command)
-        logger.info(f"📊 Falco monitoring completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in falco endpoint: {str(e)}")
+        logger.error("💥 Error in falco endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/checkov", methods=["POST"])
 def checkov():
     """Execute Checkov for infrastructure as code security scanning"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         directory = params.get("directory", ".")
         framework = params.get("framework", "")  # terraform, cloudformation, kubernetes, etc.
         check = params.get("check", "")
@@ -8636,36 +11003,22 @@ def checkov():
         output_format = params.get("output_format", "json")
         additional_args = params.get("additional_args", "")
         
-        command = f"checkov -d {directory}"
-        
-        if framework:
-            command += f" --framework {framework}"
+        command = build_argv(["checkov", "-d", directory],
+                             {"--framework": framework, "--check": check, "--skip-check": skip_check, "--output": output_format},
+                             extra=additional_args)
         
-        if check:
-            command += f" --check {check}"
-        
-        if skip_check:
-            command += f" --skip-check {skip_check}"
-        
-        if output_format:
-            command += f" --output {output_format}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting Checkov IaC scan: {directory}")
+        logger.info("🔍 Starting Checkov IaC scan: %s", directory)
         result = execute_command(command)
-        logger.info(f"📊 Checkov scan completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in checkov endpoint: {str(e)}")
+        logger.error("💥 Error in checkov endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/terrascan", methods=["POST"])
 def terrascan():
     """Execute Terrascan for infrastructure as code security scanning"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         scan_type = params.get("scan_type", "all")  # all, terraform, k8s, etc.
         iac_dir = params.get("iac_dir", ".")
         policy_type = params.get("policy_type", "")
@@ -8673,54 +11026,47 @@ def terrascan():
         severity = params.get("severity", "")
         additional_args = params.get("additional_args", "")
         
-        command = f"terrascan scan -t {scan_type} -d {iac_dir}"
-        
-        if policy_type:
-            command += f" -p {policy_type}"
-        
-        if output_format:
-            command += f" -o {output_format}"
-        
-        if severity:
-            command += f" --severity {severity}"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_argv(["terrascan", "scan", "-t", scan_type, "-d", iac_dir],
+                             {"-p": policy_type, "-o": output_format, "--severity": severity}, extra=additional_args)
         
-        logger.info(f"🔍 Starting Terrascan IaC scan: {iac_dir}")
+        logger.info("🔍 Starting Terrascan IaC scan: %s", iac_dir)
         result = execute_command(command)
-        logger.info(f"📊 Terrascan scan completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in terrascan endpoint: {str(e)}")
+        logger.error("💥 Error in terrascan endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/dirb", methods=["POST"])
 def dirb():
     """Execute dirb with enhanced logging"""
     try:
-        params = request.json
-        url = params.get("url", "")
-        wordlist = params.get("wordlist", "/usr/share/wordlists/dirb/common.txt")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(DirbParams)
+        url = params.url
+        wordlist = params.wordlist
+        additional_args = params.additional_args
+        force = params.force
         
         if not url:
             logger.warning("🌐 Dirb called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"dirb {url} {wordlist}"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if additional_args:
-            command += f" {additional_args}"
+        wordlist_fp = wordlist_fingerprint(wordlist)
+        if wordlist_fp is None:
+            logger.warning("📁 Dirb wordlist not found: %s", wordlist)
+            return jsonify({"error": f"Wordlist not found: {wordlist}"}), 400
         
-        logger.info(f"📁 Starting Dirb scan: {url}")
-        result = execute_command(command)
-        logger.info(f"📊 Dirb scan completed for {url}")
+        command = build_tool_argv("dirb", url=url, wordlist=wordlist, additional_args=additional_args)
+        
+        logger.info("📁 Starting Dirb scan: %s", url)
+        result = execute_command(command, use_async=True, cache_deps=(wordlist_fp,), force=force)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in dirb endpoint: {str(e)}")
+        logger.error("💥 Error in dirb endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8729,27 +11075,27 @@ def dirb():
 def nikto():
     """Execute nikto with enhanced logging"""
     try:
-        params = request.json
-        target = params.get("target", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(NiktoParams)
+        target = params.target
+        additional_args = params.additional_args
+        force = params.force
         
         if not target:
             logger.warning("🎯 Nikto called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
+            return error_response(ERR_NO_TARGET)
         
-        command = f"nikto -h {target}"
+        if not (URL_PATTERN.fullmatch(target) or HOST_PATTERN.fullmatch(target)):
+            return error_response(ERR_MALFORMED_TARGET)
         
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_tool_argv("nikto", target=target, additional_args=additional_args)
         
-        logger.info(f"🔬 Starting Nikto scan: {target}")
-        result = execute_command(command)
-        logger.info(f"📊 Nikto scan completed for {target}")
+        logger.info("🔬 Starting Nikto scan: %s", target)
+        result = execute_command(command, use_async=True, force=force)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in nikto endpoint: {str(e)}")
+        logger.error("💥 Error in nikto endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8758,40 +11104,159 @@ def nikto():
 def sqlmap():
     """Execute sqlmap with enhanced logging"""
     try:
-        params = request.json
-        url = params.get("url", "")
-        data = params.get("data", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(SqlmapParams)
+        url = params.url
+        data = params.data
+        additional_args = params.additional_args
         
         if not url:
             logger.warning("🎯 SQLMap called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"sqlmap -u {url} --batch"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if data:
-            command += f" --data=\"{data}\""
+        command = build_tool_argv("sqlmap", url=url, data=data, additional_args=additional_args)
         
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"💉 Starting SQLMap scan: {url}")
-        result = execute_command(command)
-        logger.info(f"📊 SQLMap scan completed for {url}")
+        logger.info("💉 Starting SQLMap scan: %s", url)
+        result = execute_command(command, use_async=True)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in sqlmap endpoint: {str(e)}")
+        logger.error("💥 Error in sqlmap endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
 
+# msfrpcd connection settings; the RPC backend is only used when a password is configured
+MSFRPC_PASSWORD = os.environ.get("HEXSTRIKE_MSFRPC_PASSWORD", "")
+MSFRPC_HOST = os.environ.get("HEXSTRIKE_MSFRPC_HOST", "127.0.0.1")
+MSFRPC_PORT = int(os.environ.get("HEXSTRIKE_MSFRPC_PORT", 55553))
+MSFRPC_STARTUP_TIMEOUT = 60  # msfrpcd needs several seconds to load the framework once
+MSFRPC_RETRY_INTERVAL = 30  # seconds a failed connection is remembered before msfrpcd is tried again
+
+# Console lines msfconsole prints when a module did not run to completion
+MSF_FAILURE_PATTERN = re.compile(
+    r"^\[-\] .*(?:failed|error|invalid|unknown|not set|could not)|Msf::\w*Error",
+    re.IGNORECASE | re.MULTILINE
+)
+
+class MetasploitRPC:
+    """Run modules through one long-lived msfrpcd instead of cold-starting msfconsole per request"""
+    
+    def __init__(self):
+        self.client = None
+        self.daemon = None
+        self.failed_until = 0.0
+        self._lock = threading.Lock()
+    
+    def available(self) -> bool:
+        return MsfRpcClient is not None and bool(MSFRPC_PASSWORD)
+    
+    def _login(self):
+        return MsfRpcClient(MSFRPC_PASSWORD, server=MSFRPC_HOST, port=MSFRPC_PORT, ssl=False)
+    
+    def _connect(self):
+        """
+        Connect to msfrpcd, spawning it once if nothing is listening yet
+        
+        Only a daemon this server just started is waited for; an unreachable msfrpcd that
+        cannot be spawned fails at once, and any failure is remembered for
+        MSFRPC_RETRY_INTERVAL so callers fall back to msfconsole without retrying.
+        """
+        with self._lock:
+            if self.client is not None:
+                return self.client
+            if time.time() < self.failed_until:
+                raise ConnectionError("msfrpcd was unreachable recently")
+            try:
+                self.client = self._login()
+                return self.client
+            except Exception as e:
+                error = e
+            
+            if (self.daemon is None or self.daemon.poll() is not None) and shutil.which("msfrpcd"):
+                logger.info("🚀 Starting msfrpcd on %s:%s", MSFRPC_HOST, MSFRPC_PORT)
+                self.daemon = subprocess.Popen(
+                    ["msfrpcd", "-P", MSFRPC_PASSWORD, "-S", "-a", MSFRPC_HOST, "-p", str(MSFRPC_PORT)],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True
+                )
+                deadline = time.time() + MSFRPC_STARTUP_TIMEOUT
+                while time.time() < deadline and self.daemon.poll() is None:
+                    time.sleep(1)
+                    try:
+                        self.client = self._login()
+                        return self.client
+                    except Exception as e:
+                        error = e
+            
+            self.failed_until = time.time() + MSFRPC_RETRY_INTERVAL
+            raise ConnectionError(f"msfrpcd unreachable: {error}")
+    
+    def run_module(self, module: str, options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a module on a fresh console and return an execute_command-shaped result
+        
+        Connection failures raise so the caller can fall back to msfconsole; a module that
+        errors or prints a failure line is reported with success False.
+        """
+        start_time = time.time()
+        client = self._connect()
+        
+        module_type, _, module_name = module.partition("/")
+        options = dict(options)
+        payload = options.pop("PAYLOAD", None) or options.pop("payload", None)
+        
+        output = ""
+        error = ""
+        try:
+            msf_module = client.modules.use(module_type, module_name)
+            for key, value in options.items():
+                msf_module[key] = value
+            
+            console = client.consoles.console()
+            try:
+                output = console.run_module_with_output(msf_module, payload=payload)
+            finally:
+                console.destroy()
+        except Exception as e:
+            error = str(e)
+            # The daemon may have gone away; log in again on the next request
+            with self._lock:
+                self.client = None
+        
+        success = not error and not MSF_FAILURE_PATTERN.search(output)
+        execution_time = time.time() - start_time
+        telemetry.record_execution(success, execution_time)
+        return {
+            "stdout": output,
+            "stderr": error,
+            "return_code": 0 if success else 1,
+            "success": success,
+            "timed_out": False,
+            "partial_results": False,
+            "execution_time": execution_time,
+            "timestamp": datetime.now().isoformat(),
+            "backend": "msfrpcd"
+        }
+
+    def shutdown(self):
+        """Stop the msfrpcd this server spawned (an externally started daemon is left running)"""
+        if self.daemon is not None and self.daemon.poll() is None:
+            self.daemon.terminate()
+
+# Global msfrpcd client
+metasploit_rpc = MetasploitRPC()
+
+# Resource scripts live for the duration of one msfconsole run; keep them off disk when possible
+MSF_RESOURCE_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
 @app.route("/api/tools/metasploit", methods=["POST"])
 def metasploit():
     """Execute metasploit module with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         module = params.get("module", "")
         options = params.get("options", {})
         
@@ -8801,32 +11266,43 @@ def metasploit():
                 "error": "Module parameter is required"
             }), 400
         
-        # Create an MSF resource script
-        resource_content = f"use {module}\n"
-        for key, value in options.items():
-            resource_content += f"set {key} {value}\n"
-        resource_content += "exploit\n"
-        
-        # Save resource script to a temporary file
-        resource_file = "/tmp/mcp_msf_resource.rc"
-        with open(resource_file, "w") as f:
-            f.write(resource_content)
-        
-        command = f"msfconsole -q -r {resource_file}"
+        if metasploit_rpc.available():
+            try:
+                logger.info("🚀 Starting Metasploit module via msfrpcd: %s", module)
+                result = metasploit_rpc.run_module(module, options)
+                logger.info("📊 Metasploit module completed: %s", module)
+                return jsonify(result)
+            except Exception as e:
+                logger.warning("⚠️  msfrpcd unavailable (%s), falling back to msfconsole", e)
         
-        logger.info(f"🚀 Starting Metasploit module: {module}")
-        result = execute_command(command)
+        # Create an MSF resource script
+        resource_content = "".join([
+            f"use {module}\n",
+            *(f"set {key} {value}\n" for key, value in options.items()),
+            "exploit\n"
+        ])
         
-        # Clean up the temporary file
+        # Save resource script to a per-request temporary file (tmpfs when available)
+        fd, resource_file = tempfile.mkstemp(suffix=".rc", prefix="mcp_msf_", dir=MSF_RESOURCE_DIR)
         try:
-            os.remove(resource_file)
-        except Exception as e:
-            logger.warning(f"Error removing temporary resource file: {str(e)}")
+            with os.fdopen(fd, "w") as f:
+                f.write(resource_content)
+            
+            command = ["msfconsole", "-q", "-r", resource_file]
+            
+            logger.info("🚀 Starting Metasploit module: %s", module)
+            # The script path is unique per request, so a cached result could never be hit
+            result = execute_command(command, use_cache=False, use_async=True)
+        finally:
+            try:
+                os.unlink(resource_file)
+            except OSError as e:
+                logger.warning("Error removing temporary resource file: %s", e)
         
-        logger.info(f"📊 Metasploit module completed: {module}")
+        logger.info("📊 Metasploit module completed: %s", module)
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in metasploit endpoint: {str(e)}")
+        logger.error("💥 Error in metasploit endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8835,14 +11311,14 @@ def metasploit():
 def hydra():
     """Execute hydra with enhanced logging"""
     try:
-        params = request.json
-        target = params.get("target", "")
-        service = params.get("service", "")
-        username = params.get("username", "")
-        username_file = params.get("username_file", "")
-        password = params.get("password", "")
-        password_file = params.get("password_file", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(HydraParams)
+        target = params.target
+        service = params.service
+        username = params.username
+        username_file = params.username_file
+        password = params.password
+        password_file = params.password_file
+        additional_args = params.additional_args
         
         if not target or not service:
             logger.warning("🎯 Hydra called without target or service parameter")
@@ -8856,29 +11332,17 @@ def hydra():
                 "error": "Username/username_file and password/password_file are required"
             }), 400
         
-        command = f"hydra -t 4"
-        
-        if username:
-            command += f" -l {username}"
-        elif username_file:
-            command += f" -L {username_file}"
-        
-        if password:
-            command += f" -p {password}"
-        elif password_file:
-            command += f" -P {password_file}"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_tool_argv("hydra", username=username, username_file=username_file, password=password,
+                                  password_file=password_file, additional_args=additional_args,
+                                  target=target, service=service)
         
-        command += f" {target} {service}"
-        
-        logger.info(f"🔑 Starting Hydra attack: {target}:{service}")
-        result = execute_command(command)
-        logger.info(f"📊 Hydra attack completed for {target}")
+        logger.info("🔑 Starting Hydra attack: %s:%s", target, service)
+        result = execute_command(command, use_async=True)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in hydra endpoint: {str(e)}")
+        logger.error("💥 Error in hydra endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8887,11 +11351,12 @@ def hydra():
 def john():
     """Execute john with enhanced logging"""
     try:
-        params = request.json
-        hash_file = params.get("hash_file", "")
-        wordlist = params.get("wordlist", "/usr/share/wordlists/rockyou.txt")
-        format_type = params.get("format", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(JohnParams)
+        hash_file = params.hash_file
+        wordlist = params.wordlist
+        format_type = params.format
+        additional_args = params.additional_args
+        force = params.force
         
         if not hash_file:
             logger.warning("🔐 John called without hash_file parameter")
@@ -8899,25 +11364,23 @@ def john():
                 "error": "Hash file parameter is required"
             }), 400
         
-        command = f"john"
-        
-        if format_type:
-            command += f" --format={format_type}"
-        
+        wordlist_fp = None
         if wordlist:
-            command += f" --wordlist={wordlist}"
-        
-        if additional_args:
-            command += f" {additional_args}"
+            wordlist_fp = wordlist_fingerprint(wordlist)
+            if wordlist_fp is None:
+                logger.warning("🔐 John wordlist not found: %s", wordlist)
+                return jsonify({"error": f"Wordlist not found: {wordlist}"}), 400
         
-        command += f" {hash_file}"
+        command = build_tool_argv("john", format_type=format_type, wordlist=wordlist,
+                                  additional_args=additional_args, hash_file=hash_file)
         
-        logger.info(f"🔐 Starting John the Ripper: {hash_file}")
-        result = execute_command(command)
-        logger.info(f"📊 John the Ripper completed")
+        logger.info("🔐 Starting John the Ripper: %s", hash_file)
+        result = execute_command(command, use_async=True, cache_deps=(wordlist_fp, hash_file), force=force)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in john endpoint: {str(e)}")
+        logger.error("💥 Error in john endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8926,27 +11389,26 @@ def john():
 def wpscan():
     """Execute wpscan with enhanced logging"""
     try:
-        params = request.json
-        url = params.get("url", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(WpscanParams)
+        url = params.url
+        additional_args = params.additional_args
         
         if not url:
             logger.warning("🌐 WPScan called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"wpscan --url {url}"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_tool_argv("wpscan", url=url, additional_args=additional_args)
         
-        logger.info(f"🔍 Starting WPScan: {url}")
-        result = execute_command(command)
-        logger.info(f"📊 WPScan completed for {url}")
+        logger.info("🔍 Starting WPScan: %s", url)
+        result = execute_command(command, use_async=True)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in wpscan endpoint: {str(e)}")
+        logger.error("💥 Error in wpscan endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8955,24 +11417,23 @@ def wpscan():
 def enum4linux():
     """Execute enum4linux with enhanced logging"""
     try:
-        params = request.json
-        target = params.get("target", "")
-        additional_args = params.get("additional_args", "-a")
+        params = parse_params(Enum4linuxParams)
+        target = params.target
+        additional_args = params.additional_args
         
         if not target:
             logger.warning("🎯 Enum4linux called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
+            return error_response(ERR_NO_TARGET)
         
-        command = f"enum4linux {additional_args} {target}"
+        command = build_tool_argv("enum4linux", additional_args=additional_args, target=target)
         
-        logger.info(f"🔍 Starting Enum4linux: {target}")
-        result = execute_command(command)
-        logger.info(f"📊 Enum4linux completed for {target}")
+        logger.info("🔍 Starting Enum4linux: %s", target)
+        result = execute_command(command, use_async=True)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in enum4linux endpoint: {str(e)}")
+        logger.error("💥 Error in enum4linux endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -8981,41 +11442,44 @@ def enum4linux():
 def ffuf():
     """Execute FFuf web fuzzer with enhanced logging"""
     try:
-        params = request.json
-        url = params.get("url", "")
-        wordlist = params.get("wordlist", "/usr/share/wordlists/dirb/common.txt")
-        mode = params.get("mode", "directory")
-        match_codes = params.get("match_codes", "200,204,301,302,307,401,403")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(FfufParams)
+        url = params.url
+        wordlist = params.wordlist
+        mode = params.mode
+        match_codes = params.match_codes
+        additional_args = params.additional_args
+        force = params.force
         
         if not url:
             logger.warning("🌐 FFuf called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"ffuf"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
+        
+        wordlist_fp = wordlist_fingerprint(wordlist)
+        if wordlist_fp is None:
+            logger.warning("🔍 FFuf wordlist not found: %s", wordlist)
+            return jsonify({"error": f"Wordlist not found: {wordlist}"}), 400
         
         if mode == "directory":
-            command += f" -u {url}/FUZZ -w {wordlist}"
+            base = ["ffuf", "-u", f"{url}/FUZZ"]
         elif mode == "vhost":
-            command += f" -u {url} -H 'Host: FUZZ' -w {wordlist}"
+            base = ["ffuf", "-u", url, "-H", "Host: FUZZ"]
         elif mode == "parameter":
-            command += f" -u {url}?FUZZ=value -w {wordlist}"
+            base = ["ffuf", "-u", f"{url}?FUZZ=value"]
         else:
-            command += f" -u {url} -w {wordlist}"
-            
-        command += f" -mc {match_codes}"
+            base = ["ffuf", "-u", url]
         
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_argv(base + ["-w", wordlist, "-mc", match_codes], extra=additional_args)
         
-        logger.info(f"🔍 Starting FFuf {mode} fuzzing: {url}")
-        result = execute_command(command)
-        logger.info(f"📊 FFuf fuzzing completed for {url}")
+        logger.info("🔍 Starting FFuf %s fuzzing: %s", mode, url)
+        result = execute_command(command, use_async=True, cache_deps=(wordlist_fp,), force=force)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in ffuf endpoint: {str(e)}")
+        logger.error("💥 Error in ffuf endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -9024,79 +11488,296 @@ def ffuf():
 def netexec():
     """Execute NetExec (formerly CrackMapExec) with enhanced logging"""
     try:
-        params = request.json
-        target = params.get("target", "")
-        protocol = params.get("protocol", "smb")
-        username = params.get("username", "")
-        password = params.get("password", "")
-        hash_value = params.get("hash", "")
-        module = params.get("module", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(NetexecParams)
+        target = params.target
+        protocol = params.protocol
+        username = params.username
+        password = params.password
+        hash_value = params.hash
+        module = params.module
+        additional_args = params.additional_args
         
         if not target:
             logger.warning("🎯 NetExec called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
+            return error_response(ERR_NO_TARGET)
         
-        command = f"nxc {protocol} {target}"
+        command = build_tool_argv("netexec", protocol=protocol, target=target, username=username, password=password,
+                                  hash_value=hash_value, module=module, additional_args=additional_args)
         
-        if username:
-            command += f" -u {username}"
-            
-        if password:
-            command += f" -p {password}"
-            
-        if hash_value:
-            command += f" -H {hash_value}"
-            
-        if module:
-            command += f" -M {module}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting NetExec {protocol} scan: {target}")
-        result = execute_command(command)
-        logger.info(f"📊 NetExec scan completed for {target}")
+        logger.info("🔍 Starting NetExec %s scan: %s", protocol, target)
+        result = execute_command(command, use_async=True)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in netexec endpoint: {str(e)}")
+        logger.error("💥 Error in netexec endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
 
+def split_targets(value: Any) -> List[str]:
+    """Expand a comma-separated target list, or a path to a file with one target per line (de-duplicated)"""
+    value = str(value)
+    if os.path.isfile(value):
+        with open(value) as f:
+            targets = [line.strip() for line in f]
+    else:
+        targets = (target.strip() for target in value.split(","))
+    return list(dict.fromkeys(target for target in targets if target))
+
+def execute_sharded(tool: str, targets: List[str], shards: int, build_shard: Callable[[str], List[str]]) -> Dict[str, Any]:
+    """
+    Split targets across up to `shards` concurrent runs of a list-accepting tool
+    
+    Each shard's targets are written to a temp file handed to build_shard(path); stdout
+    lines are merged sorted and de-duplicated. Shards still queue on the tool's family limit.
+    """
+    start_time = time.time()
+    shards = max(1, min(shards, len(targets)))
+    chunks = [chunk for chunk in (targets[i::shards] for i in range(shards)) if chunk]
+    paths = []
+    try:
+        for chunk in chunks:
+            fd, path = tempfile.mkstemp(prefix=f"{tool}_shard_", suffix=".txt")
+            with os.fdopen(fd, "w") as f:
+                f.write("\n".join(chunk) + "\n")
+            paths.append(path)
+        
+        logger.info("🧩 Sharding %s targets across %s %s runs", len(targets), len(paths), tool)
+        results = async_runner.run_many([build_shard(path) for path in paths])
+    finally:
+        for path in paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    
+    lines = set()
+    for result in results:
+        # Spooled shards only carry a tail inline; merge from the full output file
+        stdout = Path(result["stdout_file"]).read_text(errors="replace") if result.get("stdout_file") else result["stdout"]
+        lines.update(line.strip() for line in stdout.splitlines() if line.strip())
+    
+    return {
+        "stdout": "\n".join(sorted(lines)) + ("\n" if lines else ""),
+        "stderr": "".join(result["stderr"] for result in results),
+        "return_code": max((result["return_code"] for result in results), key=abs),
+        "success": all(result["success"] for result in results),
+        "timed_out": any(result["timed_out"] for result in results),
+        "partial_results": any(result["partial_results"] for result in results),
+        "execution_time": time.time() - start_time,
+        "timestamp": datetime.now().isoformat(),
+        "shards": [
+            {"targets": len(chunk), "return_code": result["return_code"], "execution_time": result["execution_time"]}
+            for chunk, result in zip(chunks, results)
+        ]
+    }
+
+# Most per-target runs in flight for single-target tools given several targets; requests may ask for fewer
+FANOUT_MAX_CONCURRENT = 8
+
+# DNS recon answers go stale faster than scan output, so fierce/dnsenum results expire sooner
+DNS_CACHE_TTL = int(os.environ.get("HEXSTRIKE_DNS_CACHE_TTL", 900))
+
+# Most lookups in flight at once when DNS enumeration runs in-process on dnspython; requests may ask for fewer
+DNS_RESOLVER_CONCURRENCY = int(os.environ.get("HEXSTRIKE_DNS_RESOLVER_CONCURRENCY", 50))
+# Enumerations /api/tools/dns offers: record lookups, zone transfer and wordlist brute force
+DNS_ENUM_RECORD_TYPES = {"a": ("A", "AAAA"), "ns": ("NS",), "mx": ("MX",)}
+DNS_ENUMS = (*DNS_ENUM_RECORD_TYPES, "axfr", "brt")
+DNS_DEFAULT_WORDLIST = "/usr/share/dnsenum/dns.txt"
+
+def valid_dns_servers(dns_server: str) -> bool:
+    """True when dns_server is empty or a comma-separated list of nameserver IP addresses"""
+    if not isinstance(dns_server, str):
+        return False
+    try:
+        for server in dns_server.split(","):
+            if server.strip():
+                ipaddress.ip_address(server.strip())
+    except ValueError:
+        return False
+    return True
+
+@functools.lru_cache(maxsize=16)
+def dns_resolver(dns_server: str = "") -> "dns.resolver.Resolver":
+    """Shared dnspython Resolver per nameserver list (system resolv.conf when empty)"""
+    resolver = dns.resolver.Resolver()
+    resolver.lifetime = 5.0
+    if dns_server:
+        resolver.nameservers = [server.strip() for server in dns_server.split(",") if server.strip()]
+    return resolver
+
+def _dns_lookup(resolver, name: str, record_type: str, deadline: Optional[float] = None) -> List[Dict[str, str]]:
+    lifetime = resolver.lifetime
+    if deadline is not None:
+        lifetime = min(lifetime, deadline - time.time())
+        if lifetime <= 0:
+            return []
+    try:
+        answer = resolver.resolve(name, record_type, lifetime=lifetime)
+    except dns.exception.DNSException:
+        return []
+    return [{"name": name, "type": record_type, "value": rdata.to_text()} for rdata in answer]
+
+def _dns_zone_transfer(resolver, domain: str, deadline: Optional[float] = None) -> List[Dict[str, str]]:
+    """Records from the first of the domain's nameservers that allows AXFR, else []"""
+    for ns in _dns_lookup(resolver, domain, "NS", deadline):
+        for address in _dns_lookup(resolver, ns["value"], "A", deadline):
+            lifetime = 10 if deadline is None else min(10, deadline - time.time())
+            if lifetime <= 0:
+                return []
+            try:
+                zone = dns.zone.from_xfr(dns.query.xfr(address["value"], domain, lifetime=lifetime))
+            except (dns.exception.DNSException, OSError, EOFError):
+                continue
+            return [{"name": name.derelativize(zone.origin).to_text(omit_final_dot=True),
+                     "type": dns.rdatatype.to_text(rdataset.rdtype), "value": rdata.to_text()}
+                    for name, node in zone.nodes.items() for rdataset in node.rdatasets for rdata in rdataset]
+    return []
+
+def dns_enum_scan(domain: str, enum: str, wordlist: str = "", dns_server: str = "",
+                  concurrency: int = DNS_RESOLVER_CONCURRENCY, timeout: float = COMMAND_TIMEOUT) -> Dict[str, Any]:
+    """
+    Run one DNS enumeration (see DNS_ENUMS) for a domain with dnspython
+    
+    Every lookup goes through the shared Resolver for dns_server, so thousands of
+    wordlist names cost one setup instead of a dnsenum process re-reading resolv.conf.
+    Records come back structured; stdout lists them as "name TYPE value" lines. Lookups
+    still queued after `timeout` seconds are skipped and the records found so far are
+    returned as a timed-out partial result.
+    """
+    start_time = time.time()
+    deadline = start_time + timeout
+    stderr, return_code = "", 0
+    try:
+        resolver = dns_resolver(dns_server)
+        if enum == "axfr":
+            records = _dns_zone_transfer(resolver, domain, deadline)
+        else:
+            if enum == "brt":
+                with open(wordlist or DNS_DEFAULT_WORDLIST, errors="replace") as f:
+                    words = dict.fromkeys(line.strip().strip(".") for line in f)
+                queries = [(f"{word}.{domain}", "A") for word in words if word and not word.startswith("#")]
+            else:
+                queries = [(domain, record_type) for record_type in DNS_ENUM_RECORD_TYPES[enum]]
+            workers = max(1, min(int(concurrency), DNS_RESOLVER_CONCURRENCY, len(queries)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hexstrike-dns") as pool:
+                found = pool.map(lambda query: _dns_lookup(resolver, *query, deadline), queries)
+                records = [record for batch in found for record in batch]
+    except (OSError, ValueError) as e:
+        records, stderr, return_code = [], f"dns: {e}\n", 1
+    
+    timed_out = time.time() >= deadline
+    if timed_out:
+        stderr += f"dns: timed out after {timeout}s\n"
+        return_code = -1
+    execution_time = time.time() - start_time
+    telemetry.record_execution(return_code == 0, execution_time)
+    return {
+        "stdout": "".join(f"{r['name']} {r['type']} {r['value']}\n" for r in records),
+        "stderr": stderr,
+        "return_code": return_code,
+        "success": return_code == 0,
+        "timed_out": timed_out,
+        "partial_results": timed_out and bool(records),
+        "execution_time": execution_time,
+        "timestamp": datetime.now().isoformat(),
+        "records": records,
+        "backend": "dnspython"
+    }
+
+def dns_enumerate(domain: str, enums: Tuple[str, ...], wordlist: str = "", dns_server: str = "",
+                  concurrency: int = DNS_RESOLVER_CONCURRENCY, force: bool = False,
+                  timeout: float = COMMAND_TIMEOUT) -> Dict[str, Any]:
+    """
+    Run several DNS enumerations for a domain and merge them into one result
+    
+    Each enumeration is cached on its own (domain, enum, dns_server[, wordlist]) key, so
+    /api/tools/dns and dnsenum's native mode reuse each other's lookups. All of them
+    share one `timeout`; timed-out enumerations are returned but not cached.
+    """
+    deadline = time.time() + timeout
+    results = {}
+    for enum in enums:
+        key_argv = build_argv(["dns", enum, domain], {"--dnsserver": dns_server,
+                                                      "--file": (wordlist or DNS_DEFAULT_WORDLIST) if enum == "brt" else None})
+        results[enum] = execute_inprocess(
+            key_argv, lambda enum=enum: dns_enum_scan(domain, enum, wordlist, dns_server, concurrency,
+                                                      max(0.0, deadline - time.time())),
+            cache_deps=(wordlist or DNS_DEFAULT_WORDLIST,) if enum == "brt" else (), force=force,
+            cache_ttl=DNS_CACHE_TTL)
+    return {
+        "stdout": "".join(result["stdout"] for result in results.values()),
+        "stderr": "".join(result["stderr"] for result in results.values()),
+        "return_code": max((result["return_code"] for result in results.values()), default=0),
+        "success": all(result["success"] for result in results.values()),
+        "timed_out": any(result["timed_out"] for result in results.values()),
+        "partial_results": any(result["partial_results"] for result in results.values()),
+        "execution_time": sum(result["execution_time"] for result in results.values()),
+        "timestamp": datetime.now().isoformat(),
+        "records": [record for result in results.values() for record in result["records"]],
+        "enums": {enum: {"success": result["success"], "records": len(result["records"])}
+                  for enum, result in results.items()},
+        "backend": "dnspython"
+    }
+
+def request_targets(params: Dict[str, Any], key: str) -> List[str]:
+    """Targets from a "targets" list, else from params[key] (comma-separated or a file, see split_targets)"""
+    targets = params.get("targets")
+    if isinstance(targets, list):
+        return list(dict.fromkeys(str(target).strip() for target in targets if str(target).strip()))
+    return split_targets(params.get(key, ""))
+
+def execute_per_target(targets: List[str], run: Callable[[str], Dict[str, Any]],
+                       max_concurrent: int = FANOUT_MAX_CONCURRENT) -> Dict[str, Any]:
+    """
+    Call run(target) for each target of a single-target tool, at most max_concurrent at a time
+    
+    Each run keeps its own result under results_by_target; success means every run succeeded.
+    The requested concurrency is capped at FANOUT_MAX_CONCURRENT.
+    """
+    start_time = time.time()
+    workers = max(1, min(int(max_concurrent), FANOUT_MAX_CONCURRENT, len(targets)))
+    logger.info("🧩 Running %s targets with concurrency %s", len(targets), workers)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hexstrike-fanout") as pool:
+        results = dict(zip(targets, pool.map(run, targets)))
+    return {
+        "success": all(result["success"] for result in results.values()),
+        "targets": len(targets),
+        "results_by_target": results,
+        "execution_time": time.time() - start_time,
+        "timestamp": datetime.now().isoformat()
+    }
+
 @app.route("/api/tools/amass", methods=["POST"])
 def amass():
     """Execute Amass for subdomain enumeration with enhanced logging"""
     try:
-        params = request.json
-        domain = params.get("domain", "")
-        mode = params.get("mode", "enum")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(AmassParams)
+        domain = params.domain
+        mode = params.mode
+        additional_args = params.additional_args
         
         if not domain:
             logger.warning("🌐 Amass called without domain parameter")
-            return jsonify({
-                "error": "Domain parameter is required"
-            }), 400
-        
-        command = f"amass {mode}"
-        
-        if mode == "enum":
-            command += f" -d {domain}"
+            return error_response(ERR_NO_DOMAIN)
+        
+        targets = split_targets(domain)
+        if not all(DOMAIN_PATTERN.fullmatch(target) for target in targets):
+            return error_response(ERR_MALFORMED_DOMAIN)
+        logger.info("🔍 Starting Amass %s: %s", mode, domain)
+        if len(targets) > 1:
+            result = execute_sharded("amass", targets, params.shards, lambda path: build_tool_argv(
+                "amass_shard", mode=mode, domain_file=path, additional_args=additional_args))
         else:
-            command += f" -d {domain}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting Amass {mode}: {domain}")
-        result = execute_command(command)
-        logger.info(f"📊 Amass completed for {domain}")
+            command = build_tool_argv("amass", mode=mode, domain=targets[0] if targets else domain,
+                                      additional_args=additional_args)
+            result = execute_command(command, use_async=True)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in amass endpoint: {str(e)}")
+        logger.error("💥 Error in amass endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -9105,13 +11786,14 @@ def amass():
 def hashcat():
     """Execute Hashcat for password cracking with enhanced logging"""
     try:
-        params = request.json
-        hash_file = params.get("hash_file", "")
-        hash_type = params.get("hash_type", "")
-        attack_mode = params.get("attack_mode", "0")
-        wordlist = params.get("wordlist", "/usr/share/wordlists/rockyou.txt")
-        mask = params.get("mask", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(HashcatParams)
+        hash_file = params.hash_file
+        hash_type = params.hash_type
+        attack_mode = params.attack_mode
+        wordlist = params.wordlist
+        mask = params.mask
+        additional_args = params.additional_args
+        force = params.force
         
         if not hash_file:
             logger.warning("🔐 Hashcat called without hash_file parameter")
@@ -9125,22 +11807,28 @@ def hashcat():
                 "error": "Hash type parameter is required"
             }), 400
         
-        command = f"hashcat -m {hash_type} -a {attack_mode} {hash_file}"
+        wordlist_fp = None
+        if attack_mode == "0":
+            wordlist_fp = wordlist_fingerprint(wordlist)
+            if wordlist_fp is None:
+                logger.warning("🔐 Hashcat wordlist not found: %s", wordlist)
+                return jsonify({"error": f"Wordlist not found: {wordlist}"}), 400
+            attack_input = wordlist
+        elif attack_mode == "3":
+            attack_input = mask
+        else:
+            attack_input = ""
         
-        if attack_mode == "0" and wordlist:
-            command += f" {wordlist}"
-        elif attack_mode == "3" and mask:
-            command += f" {mask}"
-            
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_argv(["hashcat", "-m", hash_type, "-a", attack_mode, hash_file],
+                             positional=(attack_input,), extra=additional_args)
         
-        logger.info(f"🔐 Starting Hashcat attack: mode {attack_mode}")
-        result = execute_command(command)
-        logger.info(f"📊 Hashcat attack completed")
+        logger.info("🔐 Starting Hashcat attack: mode %s", attack_mode)
+        result = execute_command(command, use_async=True, cache_deps=(hash_file, wordlist_fp), force=force)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in hashcat endpoint: {str(e)}")
+        logger.error("💥 Error in hashcat endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -9149,35 +11837,32 @@ def hashcat():
 def subfinder():
     """Execute Subfinder for passive subdomain enumeration with enhanced logging"""
     try:
-        params = request.json
-        domain = params.get("domain", "")
-        silent = params.get("silent", True)
-        all_sources = params.get("all_sources", False)
-        additional_args = params.get("additional_args", "")
+        params = parse_params(SubfinderParams)
+        domain = params.domain
+        silent = params.silent
+        all_sources = params.all_sources
+        additional_args = params.additional_args
         
         if not domain:
             logger.warning("🌐 Subfinder called without domain parameter")
-            return jsonify({
-                "error": "Domain parameter is required"
-            }), 400
-        
-        command = f"subfinder -d {domain}"
-        
-        if silent:
-            command += " -silent"
-            
-        if all_sources:
-            command += " -all"
-            
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting Subfinder: {domain}")
-        result = execute_command(command)
-        logger.info(f"📊 Subfinder completed for {domain}")
+            return error_response(ERR_NO_DOMAIN)
+        
+        targets = split_targets(domain)
+        if not all(DOMAIN_PATTERN.fullmatch(target) for target in targets):
+            return error_response(ERR_MALFORMED_DOMAIN)
+        logger.info("🔍 Starting Subfinder: %s", domain)
+        if len(targets) > 1:
+            result = execute_sharded("subfinder", targets, params.shards, lambda path: build_tool_argv(
+                "subfinder_shard", domain_file=path, silent=silent, all_sources=all_sources, additional_args=additional_args))
+        else:
+            command = build_tool_argv("subfinder", domain=targets[0] if targets else domain, silent=silent,
+                                      all_sources=all_sources, additional_args=additional_args)
+            result = execute_command(command, use_async=True)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in subfinder endpoint: {str(e)}")
+        logger.error("💥 Error in subfinder endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -9186,39 +11871,27 @@ def subfinder():
 def smbmap():
     """Execute SMBMap for SMB share enumeration with enhanced logging"""
     try:
-        params = request.json
-        target = params.get("target", "")
-        username = params.get("username", "")
-        password = params.get("password", "")
-        domain = params.get("domain", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(SmbmapParams)
+        target = params.target
+        username = params.username
+        password = params.password
+        domain = params.domain
+        additional_args = params.additional_args
         
         if not target:
-            logger.warning("🎯 SMBMap called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
-        
-        command = f"smbmap -H {target}"
+            logger.warning("🎯 SMBMap called without target parameter")
+            return error_response(ERR_NO_TARGET)
         
-        if username:
-            command += f" -u {username}"
-            
-        if password:
-            command += f" -p {password}"
-            
-        if domain:
-            command += f" -d {domain}"
-            
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_tool_argv("smbmap", target=target, username=username, password=password, domain=domain,
+                                  additional_args=additional_args)
         
-        logger.info(f"🔍 Starting SMBMap: {target}")
-        result = execute_command(command)
-        logger.info(f"📊 SMBMap completed for {target}")
+        logger.info("🔍 Starting SMBMap: %s", target)
+        result = execute_command(command, use_async=True)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in smbmap endpoint: {str(e)}")
+        logger.error("💥 Error in smbmap endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -9231,7 +11904,7 @@ def smbmap():
 def rustscan():
     """Execute Rustscan for ultra-fast port scanning with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         ports = params.get("ports", "")
         ulimit = params.get("ulimit", 5000)
@@ -9242,32 +11915,26 @@ def rustscan():
         
         if not target:
             logger.warning("🎯 Rustscan called without target parameter")
-            return jsonify({"error": "Target parameter is required"}), 400
+            return error_response(ERR_NO_TARGET)
         
-        command = f"rustscan -a {target} --ulimit {ulimit} -b {batch_size} -t {timeout}"
+        command = build_argv(["rustscan", "-a", target, "--ulimit", ulimit, "-b", batch_size, "-t", timeout],
+                             {"-p": ports}, positional=("--", "-sC", "-sV") if scripts else (), extra=additional_args)
         
-        if ports:
-            command += f" -p {ports}"
-        
-        if scripts:
-            command += f" -- -sC -sV"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("⚡ Starting Rustscan: %s", target)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"⚡ Starting Rustscan: {target}")
         result = execute_command(command)
-        logger.info(f"📊 Rustscan completed for {target}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in rustscan endpoint: {str(e)}")
+        logger.error("💥 Error in rustscan endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/masscan", methods=["POST"])
 def masscan():
     """Execute Masscan for high-speed Internet-scale port scanning with intelligent rate limiting"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         ports = params.get("ports", "1-65535")
         rate = params.get("rate", 1000)
@@ -9279,38 +11946,27 @@ def masscan():
         
         if not target:
             logger.warning("🎯 Masscan called without target parameter")
-            return jsonify({"error": "Target parameter is required"}), 400
-        
-        command = f"masscan {target} -p{ports} --rate={rate}"
-        
-        if interface:
-            command += f" -e {interface}"
-        
-        if router_mac:
-            command += f" --router-mac {router_mac}"
+            return error_response(ERR_NO_TARGET)
         
-        if source_ip:
-            command += f" --source-ip {source_ip}"
+        command = build_argv(["masscan", target, f"-p{ports}", f"--rate={rate}"],
+                             {"-e": interface, "--router-mac": router_mac, "--source-ip": source_ip, "--banners": bool(banners)},
+                             extra=additional_args)
         
-        if banners:
-            command += " --banners"
+        logger.info("🚀 Starting Masscan: %s at rate %s", target, rate)
+        if wants_stream():
+            return stream_command_response(command)
         
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🚀 Starting Masscan: {target} at rate {rate}")
         result = execute_command(command)
-        logger.info(f"📊 Masscan completed for {target}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in masscan endpoint: {str(e)}")
+        logger.error("💥 Error in masscan endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/nmap-advanced", methods=["POST"])
 def nmap_advanced():
     """Execute advanced Nmap scans with custom NSE scripts and optimized timing"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         scan_type = params.get("scan_type", "-sS")
         ports = params.get("ports", "")
@@ -9324,84 +11980,56 @@ def nmap_advanced():
         
         if not target:
             logger.warning("🎯 Advanced Nmap called without target parameter")
-            return jsonify({"error": "Target parameter is required"}), 400
-        
-        command = f"nmap {scan_type} {target}"
-        
-        if ports:
-            command += f" -p {ports}"
-        
-        if stealth:
-            command += " -T2 -f --mtu 24"
-        else:
-            command += f" -{timing}"
+            return error_response(ERR_NO_TARGET)
         
-        if os_detection:
-            command += " -O"
+        command = build_argv(
+            ["nmap", *shlex.split(scan_type), target],
+            {"-p": ports, "-O": bool(os_detection), "-sV": bool(version_detection), "-A": bool(aggressive),
+             "--script=": nse_scripts or (None if aggressive else "default,discovery,safe")},
+            positional=("-T2", "-f", "--mtu", "24") if stealth else (f"-{timing}",), extra=additional_args)
         
-        if version_detection:
-            command += " -sV"
+        logger.info("🔍 Starting Advanced Nmap: %s", target)
+        if wants_stream():
+            return stream_command_response(command)
         
-        if aggressive:
-            command += " -A"
-        
-        if nse_scripts:
-            command += f" --script={nse_scripts}"
-        elif not aggressive:  # Default useful scripts if not aggressive
-            command += " --script=default,discovery,safe"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting Advanced Nmap: {target}")
         result = execute_command(command)
-        logger.info(f"📊 Advanced Nmap completed for {target}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in advanced nmap endpoint: {str(e)}")
+        logger.error("💥 Error in advanced nmap endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/autorecon", methods=["POST"])
-def autorecon():
+@tool_endpoint(AutoReconParams, required={"target": ERR_NO_TARGET})
+def autorecon(params: AutoReconParams):
     """Execute AutoRecon for comprehensive automated reconnaissance"""
-    try:
-        params = request.json
-        target = params.get("target", "")
-        output_dir = params.get("output_dir", "/tmp/autorecon")
-        port_scans = params.get("port_scans", "top-100-ports")
-        service_scans = params.get("service_scans", "default")
-        heartbeat = params.get("heartbeat", 60)
-        timeout = params.get("timeout", 300)
-        additional_args = params.get("additional_args", "")
-        
-        if not target:
-            logger.warning("🎯 AutoRecon called without target parameter")
-            return jsonify({"error": "Target parameter is required"}), 400
-        
-        command = f"autorecon {target} -o {output_dir} --heartbeat {heartbeat} --timeout {timeout}"
-        
-        if port_scans != "default":
-            command += f" --port-scans {port_scans}"
-        
-        if service_scans != "default":
-            command += f" --service-scans {service_scans}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔄 Starting AutoRecon: {target}")
-        result = execute_command(command)
-        logger.info(f"📊 AutoRecon completed for {target}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in autorecon endpoint: {str(e)}")
-        return jsonify({"error": f"Server error: {str(e)}"}), 500
+    targets = split_targets(params.target)
+    
+    # Every option maps straight onto the precompiled TOOL_SPECS layout, so the fields go over as-is.
+    # AutoRecon schedules several targets itself; --concurrent-targets bounds that fan-out
+    values = vars(params)
+    command = build_tool_argv(
+        "autorecon", **{**values, "targets": targets,
+                        "port_scans": params.port_scans if params.port_scans != "default" else "",
+                        "service_scans": params.service_scans if params.service_scans != "default" else "",
+                        "max_concurrent": params.max_concurrent if len(targets) > 1 else 0})
+    
+    # A full run takes tens of minutes; ?stream=1 hands back its progress output as it is written
+    if wants_stream():
+        return stream_command_response(command)
+    
+    cached = cached_command_response(command)
+    if cached is not None:
+        return cached
+    
+    # A client that gives up on a buffered run gets its scan terminated rather than left running for hours
+    result = execute_command(command, cancelled=client_disconnect_probe())
+    return jsonify(result)
 
 @app.route("/api/tools/enum4linux-ng", methods=["POST"])
 def enum4linux_ng():
     """Execute Enum4linux-ng for advanced SMB enumeration with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         username = params.get("username", "")
         password = params.get("password", "")
@@ -9414,49 +12042,29 @@ def enum4linux_ng():
         
         if not target:
             logger.warning("🎯 Enum4linux-ng called without target parameter")
-            return jsonify({"error": "Target parameter is required"}), 400
-        
-        command = f"enum4linux-ng {target}"
-        
-        if username:
-            command += f" -u {username}"
-        
-        if password:
-            command += f" -p {password}"
+            return error_response(ERR_NO_TARGET)
         
-        if domain:
-            command += f" -d {domain}"
-        
-        # Add specific enumeration options
-        enum_options = []
-        if shares:
-            enum_options.append("S")
-        if users:
-            enum_options.append("U")
-        if groups:
-            enum_options.append("G")
-        if policy:
-            enum_options.append("P")
-        
-        if enum_options:
-            command += f" -A {','.join(enum_options)}"
+        # Specific enumeration options
+        enum_options = [letter for letter, wanted in (("S", shares), ("U", users), ("G", groups), ("P", policy)) if wanted]
+        command = build_argv(["enum4linux-ng", target],
+                             {"-u": username, "-p": password, "-d": domain, "-A": ",".join(enum_options)},
+                             extra=additional_args)
         
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🔍 Starting Enum4linux-ng: %s", target)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🔍 Starting Enum4linux-ng: {target}")
         result = execute_command(command)
-        logger.info(f"📊 Enum4linux-ng completed for {target}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in enum4linux-ng endpoint: {str(e)}")
+        logger.error("💥 Error in enum4linux-ng endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/rpcclient", methods=["POST"])
 def rpcclient():
     """Execute rpcclient for RPC enumeration with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         username = params.get("username", "")
         password = params.get("password", "")
@@ -9466,7 +12074,7 @@ def rpcclient():
         
         if not target:
             logger.warning("🎯 rpcclient called without target parameter")
-            return jsonify({"error": "Target parameter is required"}), 400
+            return error_response(ERR_NO_TARGET)
         
         # Build authentication string
         auth_string = ""
@@ -9488,19 +12096,18 @@ def rpcclient():
         if additional_args:
             command += f" {additional_args}"
         
-        logger.info(f"🔍 Starting rpcclient: {target}")
+        logger.info("🔍 Starting rpcclient: %s", target)
         result = execute_command(command)
-        logger.info(f"📊 rpcclient completed for {target}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in rpcclient endpoint: {str(e)}")
+        logger.error("💥 Error in rpcclient endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/nbtscan", methods=["POST"])
 def nbtscan():
     """Execute nbtscan for NetBIOS name scanning with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         verbose = params.get("verbose", False)
         timeout = params.get("timeout", 2)
@@ -9508,31 +12115,25 @@ def nbtscan():
         
         if not target:
             logger.warning("🎯 nbtscan called without target parameter")
-            return jsonify({"error": "Target parameter is required"}), 400
-        
-        command = f"nbtscan -t {timeout}"
+            return error_response(ERR_NO_TARGET)
         
-        if verbose:
-            command += " -v"
+        command = build_argv(["nbtscan", "-t", timeout], {"-v": bool(verbose)}, positional=(target,), extra=additional_args)
         
-        command += f" {target}"
+        logger.info("🔍 Starting nbtscan: %s", target)
+        if wants_stream():
+            return stream_command_response(command)
         
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting nbtscan: {target}")
         result = execute_command(command)
-        logger.info(f"📊 nbtscan completed for {target}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in nbtscan endpoint: {str(e)}")
+        logger.error("💥 Error in nbtscan endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/arp-scan", methods=["POST"])
 def arp_scan():
     """Execute arp-scan for network discovery with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         interface = params.get("interface", "")
         local_network = params.get("local_network", False)
@@ -9544,32 +12145,24 @@ def arp_scan():
             logger.warning("🎯 arp-scan called without target parameter")
             return jsonify({"error": "Target parameter or local_network flag is required"}), 400
         
-        command = f"arp-scan -t {timeout} -r {retry}"
-        
-        if interface:
-            command += f" -I {interface}"
+        command = build_argv(["arp-scan", "-t", timeout, "-r", retry], {"-I": interface, "-l": bool(local_network)},
+                             positional=(None if local_network else target,), extra=additional_args)
         
-        if local_network:
-            command += " -l"
-        else:
-            command += f" {target}"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🔍 Starting arp-scan: %s", target if target else 'local network')
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🔍 Starting arp-scan: {target if target else 'local network'}")
         result = execute_command(command)
-        logger.info(f"📊 arp-scan completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in arp-scan endpoint: {str(e)}")
+        logger.error("💥 Error in arp-scan endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/responder", methods=["POST"])
 def responder():
     """Execute Responder for credential harvesting with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         interface = params.get("interface", "eth0")
         analyze = params.get("analyze", False)
         wpad = params.get("wpad", True)
@@ -9582,40 +12175,27 @@ def responder():
             logger.warning("🎯 Responder called without interface parameter")
             return jsonify({"error": "Interface parameter is required"}), 400
         
-        command = f"timeout {duration} responder -I {interface}"
+        command = build_argv(["timeout", duration, "responder", "-I", interface],
+                             {"-A": bool(analyze), "-w": bool(wpad), "-F": bool(force_wpad_auth), "-f": bool(fingerprint)},
+                             extra=additional_args)
         
-        if analyze:
-            command += " -A"
-        
-        if wpad:
-            command += " -w"
-        
-        if force_wpad_auth:
-            command += " -F"
-        
-        if fingerprint:
-            command += " -f"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting Responder on interface: {interface}")
+        logger.info("🔍 Starting Responder on interface: %s", interface)
         result = execute_command(command)
-        logger.info(f"📊 Responder completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in responder endpoint: {str(e)}")
+        logger.error("💥 Error in responder endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/volatility", methods=["POST"])
 def volatility():
     """Execute Volatility for memory forensics with enhanced logging"""
     try:
-        params = request.json
-        memory_file = params.get("memory_file", "")
-        plugin = params.get("plugin", "")
-        profile = params.get("profile", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(VolatilityParams)
+        memory_file = params.memory_file
+        plugin = params.plugin
+        profile = params.profile
+        additional_args = params.additional_args
+        force = params.force
         
         if not memory_file:
             logger.warning("🧠 Volatility called without memory_file parameter")
@@ -9629,22 +12209,16 @@ def volatility():
                 "error": "Plugin parameter is required"
             }), 400
         
-        command = f"volatility -f {memory_file}"
-        
-        if profile:
-            command += f" --profile={profile}"
-            
-        command += f" {plugin}"
-            
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_tool_argv("volatility", memory_file=memory_file, profile=profile, plugin=plugin,
+                                  additional_args=additional_args)
         
-        logger.info(f"🧠 Starting Volatility analysis: {plugin}")
-        result = execute_command(command)
-        logger.info(f"📊 Volatility analysis completed")
+        logger.info("🧠 Starting Volatility analysis: %s", plugin)
+        result = execute_command(command, use_async=True, cache_deps=(memory_file,), force=force)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in volatility endpoint: {str(e)}")
+        logger.error("💥 Error in volatility endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -9653,13 +12227,13 @@ def volatility():
 def msfvenom():
     """Execute MSFVenom to generate payloads with enhanced logging"""
     try:
-        params = request.json
-        payload = params.get("payload", "")
-        format_type = params.get("format", "")
-        output_file = params.get("output_file", "")
-        encoder = params.get("encoder", "")
-        iterations = params.get("iterations", "")
-        additional_args = params.get("additional_args", "")
+        params = parse_params(MsfvenomParams)
+        payload = params.payload
+        format_type = params.format
+        output_file = params.output_file
+        encoder = params.encoder
+        iterations = params.iterations
+        additional_args = params.additional_args
         
         if not payload:
             logger.warning("🚀 MSFVenom called without payload parameter")
@@ -9667,29 +12241,17 @@ def msfvenom():
                 "error": "Payload parameter is required"
             }), 400
         
-        command = f"msfvenom -p {payload}"
-        
-        if format_type:
-            command += f" -f {format_type}"
-            
-        if output_file:
-            command += f" -o {output_file}"
-            
-        if encoder:
-            command += f" -e {encoder}"
-            
-        if iterations:
-            command += f" -i {iterations}"
-            
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_tool_argv("msfvenom", payload=payload, format_type=format_type, output_file=output_file,
+                                  encoder=encoder, iterations=iterations, additional_args=additional_args)
         
-        logger.info(f"🚀 Starting MSFVenom payload generation: {payload}")
-        result = execute_command(command)
-        logger.info(f"📊 MSFVenom payload generated")
+        logger.info("🚀 Starting MSFVenom payload generation: %s", payload)
+        result = execute_command(command, use_async=True)
+        logger.info("📊 MSFVenom payload generated")
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in msfvenom endpoint: {str(e)}")
+        logger.error("💥 Error in msfvenom endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -9698,295 +12260,760 @@ def msfvenom():
 # BINARY ANALYSIS & REVERSE ENGINEERING TOOLS
 # ============================================================================
 
-@app.route("/api/tools/gdb", methods=["POST"])
-def gdb():
-    """Execute GDB for binary analysis and debugging with enhanced logging"""
-    try:
-        params = request.json
-        binary = params.get("binary", "")
-        commands = params.get("commands", "")
-        script_file = params.get("script_file", "")
-        additional_args = params.get("additional_args", "")
-        
-        if not binary:
-            logger.warning("🔧 GDB called without binary parameter")
-            return jsonify({
-                "error": "Binary parameter is required"
-            }), 400
-        
-        command = f"gdb {binary}"
-        
-        if script_file:
-            command += f" -x {script_file}"
-        
-        if commands:
-            temp_script = "/tmp/gdb_commands.txt"
-            with open(temp_script, "w") as f:
-                f.write(commands)
-            command += f" -x {temp_script}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-            
-        command += " -batch"
-        
-        logger.info(f"🔧 Starting GDB analysis: {binary}")
-        result = execute_command(command)
+@dataclass
+class ToolSession:
+    """One long-lived tool handle; the lock serialises commands because neither backend is thread-safe"""
+    path: str
+    handle: Any = None
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    closed: bool = False
+
+class ToolSessionPool(ABC):
+    """
+    LRU pool of per-binary tool sessions keyed by (realpath, mtime_ns)
+    
+    Subclasses open the handle lazily under session.lock and implement _quit().
+    """
+    
+    def __init__(self, max_sessions: int):
+        self.max_sessions = max_sessions
+        self.sessions: "OrderedDict[Tuple[str, int], ToolSession]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _key(self, binary: str) -> Tuple[str, int]:
+        path = os.path.realpath(binary)
+        return path, os.stat(path).st_mtime_ns
+    
+    def _checkout(self, binary: str) -> Tuple[ToolSession, bool]:
+        """Return the session for the binary's current contents and whether it was already open"""
+        key = self._key(binary)
+        path = key[0]
+        evicted = []
+        with self._lock:
+            session = self.sessions.get(key)
+            reused = session is not None
+            if reused:
+                self.sessions.move_to_end(key)
+            else:
+                # A rebuilt binary gets a new key; drop sessions loaded from its old contents
+                evicted = [self.sessions.pop(k) for k in [k for k in self.sessions if k[0] == path]]
+                session = self.sessions[key] = ToolSession(path)
+                while len(self.sessions) > self.max_sessions:
+                    evicted.append(self.sessions.popitem(last=False)[1])
+        for old in evicted:
+            self._close(old)
+        return session, reused
+    
+    @abstractmethod
+    def _quit(self, handle):
+        """Shut down one session handle"""
+    
+    def _close(self, session: ToolSession):
+        with session.lock:
+            self._discard(session)
+    
+    def _discard(self, session: ToolSession):
+        """Quit a session's handle; the caller holds session.lock"""
+        session.closed = True
+        if session.handle is not None:
+            try:
+                self._quit(session.handle)
+            except Exception:
+                pass
+            session.handle = None
+    
+    def _drop(self, session: ToolSession):
+        """Quit a broken session and forget it, so the next request opens a new one; the caller holds session.lock"""
+        self._discard(session)
+        with self._lock:
+            for key in [k for k, v in self.sessions.items() if v is session]:
+                del self.sessions[key]
+    
+    def shutdown(self):
+        """Quit every open session"""
+        with self._lock:
+            sessions = list(self.sessions.values())
+            self.sessions.clear()
+        for session in sessions:
+            self._close(session)
+
+# gdb processes kept open at once (each holds the binary's parsed debug info in memory)
+GDB_MAX_SESSIONS = int(os.environ.get("HEXSTRIKE_GDB_MAX_SESSIONS", 4))
+
+GDB_MI_ERROR_PATTERN = re.compile(r'msg="((?:[^"\\]|\\.)*)"')
+
+# Commands whose effects GdbMiProcess.reset() undoes (breakpoints, the inferior) or that only read
+# state. Any other command (set, file, display, define, source, ...) may change what the next
+# client sees, so a session that ran one is closed instead of being returned to the pool.
+GDB_SESSION_SAFE_COMMANDS = frozenset({
+    "info", "i", "disassemble", "disas", "x", "print", "p", "output", "list", "l", "ptype", "whatis", "bt", "backtrace",
+    "where", "frame", "f", "up", "down", "break", "b", "tbreak", "hbreak", "watch", "rwatch", "awatch",
+    "delete", "d", "clear", "run", "r", "start", "starti", "continue", "c", "next", "n", "step", "s",
+    "stepi", "si", "nexti", "ni", "finish", "until", "advance", "kill", "checksec", "vmmap", "telescope",
+})
+
+# A convenience variable assignment ($name = value) outlives the request
+GDB_CONVENIENCE_ASSIGNMENT = re.compile(r"\$\w+\s*(?:[-+*/%&|^]|<<|>>)?=(?!=)")
+
+def gdb_command_keeps_session(command: str) -> bool:
+    """True when a CLI command leaves nothing behind that GdbMiProcess.reset() does not clear"""
+    words = command.split()
+    name = words[0].split("/", 1)[0] if words else ""  # x/10i, p/x, ...
+    if name not in GDB_SESSION_SAFE_COMMANDS:
+        return False
+    if name in ("run", "r", "start", "starti") and len(words) > 1:
+        return False  # Arguments given to run become the default for every later run
+    return not GDB_CONVENIENCE_ASSIGNMENT.search(command)
+
+def mi_quote(text: str) -> str:
+    """Quote a CLI command as a GDB/MI c-string argument"""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+def mi_unquote(text: str) -> str:
+    """Decode the body of a GDB/MI c-string (C escapes, octal bytes)"""
+    return codecs.escape_decode(text.encode())[0].decode("utf-8", "replace")
+
+class GdbMiProcess:
+    """
+    A gdb --interpreter=mi2 child for one binary
+    
+    A reader thread queues stdout lines so every read can honour the request deadline.
+    """
+    
+    def __init__(self, path: str, deadline: float):
+        self.process = subprocess.Popen(
+            [resolve_tool("gdb") or "gdb", "--interpreter=mi2", "--quiet", path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1, start_new_session=True
+        )
+        self.lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(target=self._read, daemon=True).start()
+        while self._next(deadline).strip() != "(gdb)":
+            pass  # Startup banner and symbol loading
+    
+    def _read(self):
+        for line in self.process.stdout:
+            self.lines.put(line.rstrip("\n"))
+        self.lines.put(None)
+    
+    def _next(self, deadline: float) -> str:
+        remaining = deadline - time.monotonic()
+        try:
+            line = self.lines.get(timeout=max(remaining, 0))
+        except queue.Empty:
+            raise TimeoutError("gdb did not answer before the deadline") from None
+        if line is None:
+            raise EOFError("gdb exited")
+        return line
+    
+    def send(self, mi_command: str, deadline: float, output: List[str], errors: List[str]):
+        """
+        Send one MI command and collect its console/inferior output until gdb is idle again
         
-        if commands and os.path.exists("/tmp/gdb_commands.txt"):
+        Execution commands answer ^running first, so those wait for *stopped as well.
+        """
+        self.process.stdin.write(mi_command + "\n")
+        self.process.stdin.flush()
+        answered = running = False
+        while True:
+            line = self._next(deadline)
+            if line.startswith(("~", "@")):
+                output.append(mi_unquote(line[2:-1]))
+            elif line.startswith("^error"):
+                match = GDB_MI_ERROR_PATTERN.search(line)
+                errors.append((mi_unquote(match.group(1)) if match else line) + "\n")
+                answered = True
+            elif line.startswith("^running"):
+                answered = running = True
+            elif line.startswith("^"):
+                answered = True
+            elif line.startswith("*stopped"):
+                running = False
+            elif line.strip() == "(gdb)":
+                if answered and not running:
+                    return
+            elif not line.startswith(("&", "*", "=", "+")):
+                output.append(line + "\n")  # Raw inferior output shares gdb's stdout
+    
+    def reset(self, deadline: float):
+        """Kill the inferior and drop breakpoints so the next request starts like a fresh -batch run"""
+        self.send('-interpreter-exec console "kill"', deadline, [], [])
+        self.send("-break-delete", deadline, [], [])
+    
+    def quit(self):
+        try:
+            self.process.stdin.write("-gdb-exit\n")
+            self.process.stdin.flush()
+            self.process.wait(timeout=2)
+        except Exception:
             try:
-                os.remove("/tmp/gdb_commands.txt")
-            except:
+                os.killpg(self.process.pid, signal.SIGKILL)
+            except OSError:
                 pass
-                
-        logger.info(f"📊 GDB analysis completed for {binary}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in gdb endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
 
-@app.route("/api/tools/radare2", methods=["POST"])
-def radare2():
-    """Execute Radare2 for binary analysis and reverse engineering with enhanced logging"""
+class GdbSessions(ToolSessionPool):
+    """
+    LRU pool of gdb MI processes, so repeat queries skip re-reading the binary's symbols
+    
+    Only requests made entirely of GDB_SESSION_SAFE_COMMANDS hand their session back; one that
+    ran anything else (settings, file, displays, ...) is closed so that state never leaks.
+    """
+    
+    def __init__(self, max_sessions: int = GDB_MAX_SESSIONS):
+        super().__init__(max_sessions)
+    
+    def available(self) -> bool:
+        return resolve_tool("gdb") is not None
+    
+    def run(self, binary: str, commands: List[str], timeout: int = COMMAND_TIMEOUT) -> Dict[str, Any]:
+        """Run CLI command lines in the binary's gdb (starting it on first use)"""
+        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        output, errors = [], []
+        timed_out = False
+        session, reused = self._checkout(binary)
+        with session.lock:
+            if session.closed:
+                # Evicted while waiting for the lock; start over with a fresh session
+                return self.run(binary, commands, timeout)
+            try:
+                if session.handle is None:
+                    logger.info("🔧 Opening gdb session: %s", session.path)
+                    session.handle = GdbMiProcess(session.path, deadline)
+                for command in commands:
+                    session.handle.send(f"-interpreter-exec console {mi_quote(command)}", deadline, output, errors)
+                if all(gdb_command_keeps_session(command) for command in commands):
+                    session.handle.reset(deadline)
+                else:
+                    logger.info("🔧 Closing gdb session for %s after state-changing commands", session.path)
+                    self._drop(session)
+            except (TimeoutError, EOFError, OSError) as e:
+                # The process state is unknown after a stalled or crashed command; never reuse it
+                logger.warning("⚠️  gdb session for %s dropped: %s", session.path, e)
+                timed_out = isinstance(e, TimeoutError)
+                errors.append(f"{e}\n")
+                self._drop(session)
+        
+        execution_time = time.time() - start_time
+        success = not errors
+        telemetry.record_execution(success, execution_time)
+        return {
+            "stdout": "".join(output),
+            "stderr": "".join(errors),
+            "return_code": 0 if success else 1,
+            "success": success,
+            "timed_out": timed_out,
+            "partial_results": timed_out and bool(output),
+            "execution_time": execution_time,
+            "timestamp": datetime.now().isoformat(),
+            "backend": "gdb-mi",
+            "session_reused": reused
+        }
+    
+    def _quit(self, handle: GdbMiProcess):
+        handle.quit()
+
+# Global gdb session pool
+gdb_sessions = GdbSessions()
+
+@app.route("/api/tools/gdb", methods=["POST"])
+@tool_endpoint(GdbParams, required={"binary": ERR_NO_BINARY})
+def gdb(params: GdbParams):
+    """Execute GDB for binary analysis and debugging with enhanced logging"""
+    command_lines = [line for line in params.commands.splitlines() if line.strip()]
+    
+    # Startup flags and script files change how gdb is launched, so those keep -batch
+    if command_lines and not params.additional_args and not params.script_file and gdb_sessions.available():
+        try:
+            result = gdb_sessions.run(params.binary, command_lines)
+            return jsonify(result)
+        except OSError as e:
+            logger.warning("⚠️  gdb session failed (%s), falling back to gdb -batch", e)
+    
+    # Each command line becomes its own -ex argument, so nothing is written to disk
+    inline_commands = [arg for line in params.commands.splitlines() if line.strip() for arg in ("-ex", line)]
+    command = build_argv(["gdb", params.binary], {"-x": params.script_file}, positional=inline_commands,
+                         extra=params.additional_args) + ["-batch"]
+    
+    result = execute_command(command)
+    return jsonify(result)
+
+# Analysed radare2 sessions kept open at once; the least recently used one is closed first
+R2_MAX_SESSIONS = int(os.environ.get("HEXSTRIKE_R2_MAX_SESSIONS", 8))
+
+# r2 commands that only read state (print, info, search, help, hexdump, function and xref listings)
+# or only move the seek, which is restored before every request. Anything else (e config, o files,
+# f flags, renames, comments, ...) closes the session afterwards so it never reaches another client.
+R2_SESSION_SAFE_PREFIXES = ("p", "i", "x", "/", "?", "s", "afl", "afi", "afv", "axt", "axf", "ag")
+
+def r2_command_keeps_session(command: str) -> bool:
+    """True when every ;-separated part of an r2 command line only reads state or seeks"""
+    for part in command.split(";"):
+        words = part.split()
+        if words and not words[0].startswith(R2_SESSION_SAFE_PREFIXES):
+            return False
+    return True
+
+class Radare2Process:
+    """
+    An "r2 -q0" child for one binary: each command's output on stdout ends with a NUL byte
+    
+    Reads poll stdout and stderr together so every command honours the request deadline.
+    """
+    
+    def __init__(self, path: str, deadline: float):
+        self.process = subprocess.Popen(
+            [resolve_tool("r2") or "r2", "-q0", "-e", "scr.interactive=false", "-e", "scr.color=0", path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, start_new_session=True
+        )
+        try:
+            self._read_reply(deadline, [])  # r2 -q0 answers startup with a lone NUL
+            self.origin = self.cmd("s", deadline, []).strip()
+        except BaseException:
+            self.kill()
+            raise
+    
+    def _read_reply(self, deadline: float, errors: List[str]) -> str:
+        out_fd, err_fd = self.process.stdout.fileno(), self.process.stderr.fileno()
+        poller = select.poll()
+        poller.register(out_fd, select.POLLIN)
+        poller.register(err_fd, select.POLLIN)
+        output = bytearray()
+        while True:
+            remaining = deadline - time.monotonic()
+            events = poller.poll(max(remaining, 0) * 1000) if remaining > 0 else []
+            if not events:
+                raise TimeoutError("radare2 did not answer before the deadline")
+            for fd, _ in events:
+                chunk = os.read(fd, OUTPUT_READ_CHUNK)
+                if fd == err_fd:
+                    if chunk:
+                        errors.append(chunk.decode("utf-8", "replace"))
+                    else:
+                        poller.unregister(err_fd)
+                    continue
+                if not chunk:
+                    raise EOFError("radare2 exited")
+                output += chunk
+                end = output.find(b"\0")
+                if end != -1:
+                    return output[:end].decode("utf-8", "replace")
+    
+    def cmd(self, command: str, deadline: float, errors: List[str]) -> str:
+        """Run one command line and return its output"""
+        self.process.stdin.write(command.replace("\n", ";").encode() + b"\n")
+        self.process.stdin.flush()
+        return self._read_reply(deadline, errors)
+    
+    def kill(self):
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        self.process.wait()
+    
+    def quit(self):
+        try:
+            self.process.stdin.write(b"q!\n")
+            self.process.stdin.flush()
+            self.process.wait(timeout=2)
+        except Exception:
+            self.kill()
+
+class Radare2Sessions(ToolSessionPool):
+    """
+    LRU pool of analysed r2 processes, so repeat queries skip re-analysis
+    
+    Opening, analysis and the request's commands share one deadline; a session that times out
+    or dies is killed and forgotten. Only requests made of R2_SESSION_SAFE_PREFIXES commands
+    hand their session back, with the seek put back where analysis left it.
+    """
+    
+    def __init__(self, max_sessions: int = R2_MAX_SESSIONS):
+        super().__init__(max_sessions)
+    
+    def available(self) -> bool:
+        return resolve_tool("r2") is not None
+    
+    def run(self, binary: str, commands: List[str], timeout: int = COMMAND_TIMEOUT) -> Dict[str, Any]:
+        """Run commands in the binary's session (opening and analysing it on first use)"""
+        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        output, errors = [], []
+        timed_out = failed = False
+        session, reused = self._checkout(binary)
+        with session.lock:
+            if session.closed:
+                # Evicted while waiting for the lock; start over with a fresh session
+                return self.run(binary, commands, timeout)
+            try:
+                if session.handle is None:
+                    logger.info("🔧 Opening radare2 session: %s", session.path)
+                    session.handle = Radare2Process(session.path, deadline)
+                    session.handle.cmd("aaa", deadline, [])
+                else:
+                    session.handle.cmd(f"s {session.handle.origin}", deadline, [])
+                for command in commands:
+                    output.append(session.handle.cmd(command, deadline, errors))
+                if not all(r2_command_keeps_session(command) for command in commands):
+                    logger.info("🔧 Closing radare2 session for %s after state-changing commands", session.path)
+                    self._drop(session)
+            except (TimeoutError, EOFError, OSError) as e:
+                # A stalled or crashed r2 is in an unknown state; kill it and never reuse it
+                logger.warning("⚠️  radare2 session for %s dropped: %s", session.path, e)
+                timed_out = isinstance(e, TimeoutError)
+                failed = True
+                errors.append(f"{e}\n")
+                if session.handle is not None:
+                    session.handle.kill()
+                self._drop(session)
+        
+        execution_time = time.time() - start_time
+        success = not failed
+        telemetry.record_execution(success, execution_time)
+        return {
+            "stdout": "".join(output),
+            "stderr": "".join(errors),
+            "return_code": 0 if success else -1,
+            "success": success,
+            "timed_out": timed_out,
+            "partial_results": timed_out and any(output),
+            "execution_time": execution_time,
+            "timestamp": datetime.now().isoformat(),
+            "backend": "r2-session",
+            "session_reused": reused
+        }
+    
+    def _quit(self, handle: Radare2Process):
+        handle.quit()
+
+# Global radare2 session pool
+radare2_sessions = Radare2Sessions()
+
+# Persistent interpreters kept for /api/python/execute, one per virtual environment
+PYTHON_MAX_WORKERS = int(os.environ.get("HEXSTRIKE_PYTHON_MAX_WORKERS", 4))
+
+# Worker loop run with "python -c": read a length-prefixed script from stdin, exec it in fresh
+# globals with stdout/stderr captured, and answer with a length-prefixed JSON result. The real
+# fds 0/1 are moved aside so scripts and their children can never write into the protocol.
+PYTHON_WORKER_SOURCE = r'''
+import json, os, select, struct, sys, threading, traceback
+requests_in = os.fdopen(os.dup(0), "rb", buffering=0)
+replies_out = os.fdopen(os.dup(1), "wb")
+devnull = os.open(os.devnull, os.O_RDWR)
+os.dup2(devnull, 0)
+os.dup2(devnull, 1)
+
+# Zygote: pay the import cost once, then fork a pristine child per script
+for name in ("base64", "collections", "hashlib", "itertools", "re", "socket", "ssl", "subprocess", "urllib.request",
+             "requests"):
     try:
-        params = request.json
-        binary = params.get("binary", "")
-        commands = params.get("commands", "")
-        additional_args = params.get("additional_args", "")
-        
-        if not binary:
-            logger.warning("🔧 Radare2 called without binary parameter")
-            return jsonify({
-                "error": "Binary parameter is required"
-            }), 400
-        
-        if commands:
-            temp_script = "/tmp/r2_commands.txt"
-            with open(temp_script, "w") as f:
-                f.write(commands)
-            command = f"r2 -i {temp_script} -q {binary}"
+        __import__(name)
+    except Exception:
+        pass
+
+def read_exact(size):
+    data = b""
+    while len(data) < size:
+        chunk = requests_in.read(size - len(data))
+        if not chunk:
+            sys.exit(0)
+        data += chunk
+    return data
+
+def run_child(source, out_w, err_w):
+    requests_in.close()
+    replies_out.close()
+    os.dup2(out_w, 1)
+    os.dup2(err_w, 2)
+    os.close(out_w)
+    os.close(err_w)
+    code = 0
+    try:
+        exec(compile(source, "<script>", "exec"), {"__name__": "__main__"})
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            code = e.code or 0
         else:
-            command = f"r2 -q {binary}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔧 Starting Radare2 analysis: {binary}")
-        result = execute_command(command)
-        
-        if commands and os.path.exists("/tmp/r2_commands.txt"):
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        # Drop this frame so the traceback starts at the script, as under "python -"
+        error_type, error, tb = sys.exc_info()
+        traceback.print_exception(error_type, error, tb.tb_next)
+        code = 1
+    # Finish like an interpreter exiting: wait for the script's non-daemon threads, then flush
+    for thread in threading.enumerate():
+        if thread is not threading.main_thread() and not thread.daemon:
+            thread.join()
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            pass
+    os._exit(code & 0xFF)
+
+def collect(pid, out_r, err_r):
+    chunks = {out_r: [], err_r: []}
+    open_fds = [out_r, err_r]
+    while open_fds:
+        for fd in select.select(open_fds, [], [])[0]:
+            data = os.read(fd, 65536)
+            if data:
+                chunks[fd].append(data)
+            else:
+                open_fds.remove(fd)
+                os.close(fd)
+    status = os.waitpid(pid, 0)[1]
+    code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+    return (b"".join(chunks[out_r]).decode("utf-8", "replace"), b"".join(chunks[err_r]).decode("utf-8", "replace"), code)
+
+while True:
+    source = read_exact(struct.unpack("!I", read_exact(4))[0]).decode("utf-8", "replace")
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(out_r)
+        os.close(err_r)
+        run_child(source, out_w, err_w)
+    os.close(out_w)
+    os.close(err_w)
+    stdout, stderr, code = collect(pid, out_r, err_r)
+    reply = json.dumps({"stdout": stdout, "stderr": stderr, "return_code": code}).encode()
+    replies_out.write(struct.pack("!I", len(reply)) + reply)
+    replies_out.flush()
+'''
+
+class PythonWorker:
+    """
+    A long-lived zygote interpreter that runs scripts framed over its stdin (see PYTHON_WORKER_SOURCE)
+    
+    Each script runs in a child forked from the zygote with stdout/stderr on fresh pipes, so output
+    from os.system() and C extensions is captured, and nothing a script changes (cwd, threads,
+    monkeypatched modules) survives into the next one.
+    """
+    
+    def __init__(self, python_path: str):
+        self.process = subprocess.Popen(
+            [python_path, "-c", PYTHON_WORKER_SOURCE],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, start_new_session=True
+        )
+    
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        fd = self.process.stdout.fileno()
+        data = bytearray()
+        while len(data) < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError("script did not finish before the deadline")
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                raise EOFError("python worker exited")
+            data += chunk
+        return bytes(data)
+    
+    def run(self, script: str, deadline: float) -> Dict[str, Any]:
+        payload = script.encode("utf-8", "surrogateescape")
+        self.process.stdin.write(struct.pack("!I", len(payload)) + payload)
+        self.process.stdin.flush()
+        size = struct.unpack("!I", self._read_exact(4, deadline))[0]
+        return json.loads(self._read_exact(size, deadline))
+    
+    def kill(self):
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+    
+    def quit(self):
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=2)
+        except Exception:
+            self.kill()
+
+class PythonWorkers(ToolSessionPool):
+    """
+    Pool of persistent zygote interpreters per virtual environment, so scripts skip interpreter startup
+    
+    Common modules are imported once by the zygote and every script runs in its own forked child,
+    isolated from the scripts before it. A worker busy with another script is not waited for.
+    """
+    
+    def __init__(self, max_sessions: int = PYTHON_MAX_WORKERS):
+        super().__init__(max_sessions)
+    
+    def available(self) -> bool:
+        # The zygote forks a child per script
+        return hasattr(os, "fork")
+    
+    def _key(self, python_path: str) -> Tuple[str, int]:
+        # Venv interpreters symlink to one binary, so key on the venv's own path
+        return python_path, 0
+    
+    def run(self, python_path: str, script: str, timeout: int = COMMAND_TIMEOUT) -> Optional[Dict[str, Any]]:
+        """Run a script in the environment's worker, or return None if that worker is busy"""
+        start_time = time.time()
+        deadline = time.monotonic() + timeout
+        session, reused = self._checkout(python_path)
+        if not session.lock.acquire(blocking=False):
+            return None
+        try:
+            if session.closed:
+                return None
             try:
-                os.remove("/tmp/r2_commands.txt")
-            except:
-                pass
-                
-        logger.info(f"📊 Radare2 analysis completed for {binary}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in radare2 endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+                if session.handle is None:
+                    logger.info("🐍 Starting python worker: %s", python_path)
+                    session.handle = PythonWorker(python_path)
+                reply = session.handle.run(script, deadline)
+                timed_out = False
+            except (TimeoutError, EOFError, OSError, ValueError) as e:
+                # A stalled or crashed script leaves the interpreter in an unknown state; never reuse it
+                logger.warning("⚠️  python worker for %s dropped: %s", python_path, e)
+                timed_out = isinstance(e, TimeoutError)
+                reply = {"stdout": "", "stderr": f"{e}\n", "return_code": -1}
+                if session.handle is not None:
+                    session.handle.kill()
+                self._drop(session)
+        finally:
+            session.lock.release()
+        
+        execution_time = time.time() - start_time
+        success = reply["return_code"] == 0
+        telemetry.record_execution(success, execution_time)
+        return {
+            **reply,
+            "success": success,
+            "timed_out": timed_out,
+            "partial_results": False,
+            "execution_time": execution_time,
+            "timestamp": datetime.now().isoformat(),
+            "backend": "python-worker",
+            "session_reused": reused
+        }
+    
+    def _quit(self, handle: PythonWorker):
+        handle.quit()
+
+# Global python worker pool
+python_workers = PythonWorkers()
+
+@app.route("/api/tools/radare2", methods=["POST"])
+@tool_endpoint(Radare2Params, required={"binary": ERR_NO_BINARY})
+def radare2(params: Radare2Params):
+    """Execute Radare2 for binary analysis and reverse engineering with enhanced logging"""
+    binary = params.binary
+    command_lines = [line for line in params.commands.splitlines() if line.strip()]
+    
+    # additional_args are r2 startup flags, which an already-open session cannot honour
+    if command_lines and not params.additional_args and radare2_sessions.available():
+        try:
+            result = radare2_sessions.run(binary, command_lines)
+            return jsonify(result)
+        except OSError as e:
+            logger.warning("⚠️  radare2 session failed (%s), falling back to r2", e)
+    
+    # Each command line becomes its own -c argument, so nothing is written to disk
+    inline_commands = [arg for line in command_lines for arg in ("-c", line)]
+    command = build_argv(["r2", "-q"], positional=(*inline_commands, binary), extra=params.additional_args)
+    
+    result = execute_command(command)
+    return jsonify(result)
 
 @app.route("/api/tools/binwalk", methods=["POST"])
-def binwalk():
+@tool_endpoint(BinwalkParams, required={"file_path": ERR_NO_FILE_PATH})
+def binwalk(params: BinwalkParams):
     """Execute Binwalk for firmware and file analysis with enhanced logging"""
-    try:
-        params = request.json
-        file_path = params.get("file_path", "")
-        extract = params.get("extract", False)
-        additional_args = params.get("additional_args", "")
-        
-        if not file_path:
-            logger.warning("🔧 Binwalk called without file_path parameter")
-            return jsonify({
-                "error": "File path parameter is required"
-            }), 400
-        
-        command = f"binwalk"
-        
-        if extract:
-            command += " -e"
-            
-        if additional_args:
-            command += f" {additional_args}"
-            
-        command += f" {file_path}"
-        
-        logger.info(f"🔧 Starting Binwalk analysis: {file_path}")
-        result = execute_command(command)
-        logger.info(f"📊 Binwalk analysis completed for {file_path}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in binwalk endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+    file_path = params.file_path
+    command = build_tool_argv("binwalk", extract=params.extract, additional_args=params.additional_args,
+                              file_path=file_path)
+    
+    if wants_stream():
+        return stream_command_response(command)
+    
+    # The API's extractor chdir()s the whole process, so extraction always goes through the CLI
+    if binwalk_api is not None and not params.extract and not params.additional_args and os.path.isfile(file_path):
+        result = execute_inprocess(command, lambda: binwalk_signature_scan(file_path),
+                                   cache_deps=(file_path,), force=params.force)
+    else:
+        # Extraction writes files next to the input, so only the scan-only mode is cached
+        result = execute_command(command, use_cache=not params.extract, cache_deps=(file_path,), force=params.force)
+    return jsonify(result)
 
 @app.route("/api/tools/ropgadget", methods=["POST"])
-def ropgadget():
+@tool_endpoint(RopgadgetParams, required={"binary": ERR_NO_BINARY})
+def ropgadget(params: RopgadgetParams):
     """Search for ROP gadgets in a binary using ROPgadget with enhanced logging"""
-    try:
-        params = request.json
-        binary = params.get("binary", "")
-        gadget_type = params.get("gadget_type", "")
-        additional_args = params.get("additional_args", "")
-        
-        if not binary:
-            logger.warning("🔧 ROPgadget called without binary parameter")
-            return jsonify({
-                "error": "Binary parameter is required"
-            }), 400
-        
-        command = f"ROPgadget --binary {binary}"
-        
-        if gadget_type:
-            command += f" --only '{gadget_type}'"
-            
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔧 Starting ROPgadget search: {binary}")
-        result = execute_command(command)
-        logger.info(f"📊 ROPgadget search completed for {binary}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in ropgadget endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+    command = build_tool_argv("ropgadget", binary=params.binary, gadget_type=params.gadget_type,
+                              additional_args=params.additional_args)
+    
+    result = execute_command(command)
+    return jsonify(result)
 
 @app.route("/api/tools/checksec", methods=["POST"])
-def checksec():
+@tool_endpoint(ChecksecParams, required={"binary": ERR_NO_BINARY})
+def checksec(params: ChecksecParams):
     """Check security features of a binary with enhanced logging"""
-    try:
-        params = request.json
-        binary = params.get("binary", "")
-        
-        if not binary:
-            logger.warning("🔧 Checksec called without binary parameter")
-            return jsonify({
-                "error": "Binary parameter is required"
-            }), 400
-        
-        command = f"checksec --file={binary}"
-        
-        logger.info(f"🔧 Starting Checksec analysis: {binary}")
-        result = execute_command(command)
-        logger.info(f"📊 Checksec analysis completed for {binary}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in checksec endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+    command = build_tool_argv("checksec", binary=params.binary)
+    
+    result = execute_command(command, cache_deps=(params.binary,), force=params.force)
+    return jsonify(result)
 
 @app.route("/api/tools/xxd", methods=["POST"])
-def xxd():
+@tool_endpoint(XxdParams, required={"file_path": ERR_NO_FILE_PATH})
+def xxd(params: XxdParams):
     """Create a hex dump of a file using xxd with enhanced logging"""
-    try:
-        params = request.json
-        file_path = params.get("file_path", "")
-        offset = params.get("offset", "0")
-        length = params.get("length", "")
-        additional_args = params.get("additional_args", "")
-        
-        if not file_path:
-            logger.warning("🔧 XXD called without file_path parameter")
-            return jsonify({
-                "error": "File path parameter is required"
-            }), 400
-        
-        command = f"xxd -s {offset}"
-        
-        if length:
-            command += f" -l {length}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-            
-        command += f" {file_path}"
-        
-        logger.info(f"🔧 Starting XXD hex dump: {file_path}")
-        result = execute_command(command)
-        logger.info(f"📊 XXD hex dump completed for {file_path}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in xxd endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+    file_path = params.file_path
+    command = build_tool_argv("xxd", offset=params.offset, length=params.length,
+                              additional_args=params.additional_args, file_path=file_path)
+    
+    if wants_stream():
+        return stream_command_response(command)
+    
+    offset = parse_dump_bound(params.offset or "0")
+    length = parse_dump_bound(params.length) if params.length else None
+    # Plain dumps of small files are formatted in-process; anything else (octal/negative
+    # seeks, extra flags, large inputs) keeps xxd's own handling
+    if (not params.additional_args and offset is not None and (length is not None or not params.length)
+            and is_small_file(file_path)):
+        result = hex_dump(file_path, offset, length)
+    else:
+        result = execute_command(command, short=is_small_file(file_path))
+    return jsonify(result)
 
 @app.route("/api/tools/strings", methods=["POST"])
-def strings():
+@tool_endpoint(StringsParams, required={"file_path": ERR_NO_FILE_PATH})
+def strings(params: StringsParams):
     """Extract strings from a binary file with enhanced logging"""
-    try:
-        params = request.json
-        file_path = params.get("file_path", "")
-        min_len = params.get("min_len", 4)
-        additional_args = params.get("additional_args", "")
-        
-        if not file_path:
-            logger.warning("🔧 Strings called without file_path parameter")
-            return jsonify({
-                "error": "File path parameter is required"
-            }), 400
-        
-        command = f"strings -n {min_len}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-            
-        command += f" {file_path}"
-        
-        logger.info(f"🔧 Starting Strings extraction: {file_path}")
-        result = execute_command(command)
-        logger.info(f"📊 Strings extraction completed for {file_path}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in strings endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+    file_path = params.file_path
+    command = build_tool_argv("strings", min_len=params.min_len, additional_args=params.additional_args,
+                              file_path=file_path)
+    
+    if wants_stream():
+        return stream_command_response(command)
+    
+    # Past SHORT_INPUT_SIZE the regex scan falls behind strings(1), so large files still spawn it
+    if not params.additional_args and is_small_file(file_path):
+        result = execute_inprocess(command, lambda: scan_strings(file_path, params.min_len),
+                                   cache_deps=(file_path,), force=params.force)
+    else:
+        result = execute_command(command, short=is_small_file(file_path), cache_deps=(file_path,), force=params.force)
+    return jsonify(result)
 
 @app.route("/api/tools/objdump", methods=["POST"])
-def objdump():
+@tool_endpoint(ObjdumpParams, required={"binary": ERR_NO_BINARY})
+def objdump(params: ObjdumpParams):
     """Analyze a binary using objdump with enhanced logging"""
-    try:
-        params = request.json
-        binary = params.get("binary", "")
-        disassemble = params.get("disassemble", True)
-        additional_args = params.get("additional_args", "")
-        
-        if not binary:
-            logger.warning("🔧 Objdump called without binary parameter")
-            return jsonify({
-                "error": "Binary parameter is required"
-            }), 400
-        
-        command = f"objdump"
-        
-        if disassemble:
-            command += " -d"
-        else:
-            command += " -x"
-            
-        if additional_args:
-            command += f" {additional_args}"
-            
-        command += f" {binary}"
-        
-        logger.info(f"🔧 Starting Objdump analysis: {binary}")
-        result = execute_command(command)
-        logger.info(f"📊 Objdump analysis completed for {binary}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in objdump endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+    binary = params.binary
+    command = build_tool_argv("objdump", mode="-d" if params.disassemble else "-x",
+                              additional_args=params.additional_args, binary=binary)
+    
+    if wants_stream():
+        return stream_command_response(command)
+    
+    result = execute_command(command, cache_deps=(binary,), force=params.force)
+    return jsonify(result)
 
 # ============================================================================
 # ENHANCED BINARY ANALYSIS AND EXPLOITATION FRAMEWORK (v6.0)
@@ -9996,7 +13023,7 @@ def objdump():
 def ghidra():
     """Execute Ghidra for advanced binary analysis and reverse engineering"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         binary = params.get("binary", "")
         project_name = params.get("project_name", "hexstrike_analysis")
         script_file = params.get("script_file", "")
@@ -10006,37 +13033,29 @@ def ghidra():
         
         if not binary:
             logger.warning("🔧 Ghidra called without binary parameter")
-            return jsonify({"error": "Binary parameter is required"}), 400
+            return error_response(ERR_NO_BINARY)
         
         # Create Ghidra project directory
         project_dir = f"/tmp/ghidra_projects/{project_name}"
         os.makedirs(project_dir, exist_ok=True)
         
         # Base Ghidra command for headless analysis
-        command = f"analyzeHeadless {project_dir} {project_name} -import {binary} -deleteProject"
-        
-        if script_file:
-            command += f" -postScript {script_file}"
-        
-        if output_format == "xml":
-            command += f" -postScript ExportXml.java {project_dir}/analysis.xml"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        xml_export = ("-postScript", "ExportXml.java", f"{project_dir}/analysis.xml") if output_format == "xml" else ()
+        command = build_argv(["analyzeHeadless", project_dir, project_name, "-import", binary, "-deleteProject"],
+                             {"-postScript": script_file}, positional=xml_export, extra=additional_args)
         
-        logger.info(f"🔧 Starting Ghidra analysis: {binary}")
+        logger.info("🔧 Starting Ghidra analysis: %s", binary)
         result = execute_command(command, timeout=analysis_timeout)
-        logger.info(f"📊 Ghidra analysis completed for {binary}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in ghidra endpoint: {str(e)}")
+        logger.error("💥 Error in ghidra endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/pwntools", methods=["POST"])
 def pwntools():
     """Execute Pwntools for exploit development and automation"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         script_content = params.get("script_content", "")
         target_binary = params.get("target_binary", "")
         target_host = params.get("target_host", "")
@@ -10092,7 +13111,7 @@ p.interactive()
         if additional_args:
             command += f" {additional_args}"
         
-        logger.info(f"🔧 Starting Pwntools exploit: {exploit_type}")
+        logger.info("🔧 Starting Pwntools exploit: %s", exploit_type)
         result = execute_command(command)
         
         # Cleanup
@@ -10101,17 +13120,17 @@ p.interactive()
         except:
             pass
         
-        logger.info(f"📊 Pwntools exploit completed")
+        logger.info("📊 Pwntools exploit completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in pwntools endpoint: {str(e)}")
+        logger.error("💥 Error in pwntools endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/one-gadget", methods=["POST"])
 def one_gadget():
     """Execute one_gadget to find one-shot RCE gadgets in libc"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         libc_path = params.get("libc_path", "")
         level = params.get("level", 1)  # 0, 1, 2 for different constraint levels
         additional_args = params.get("additional_args", "")
@@ -10120,24 +13139,20 @@ def one_gadget():
             logger.warning("🔧 one_gadget called without libc_path parameter")
             return jsonify({"error": "libc_path parameter is required"}), 400
         
-        command = f"one_gadget {libc_path} --level {level}"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_argv(["one_gadget", libc_path, "--level", level], extra=additional_args)
         
-        logger.info(f"🔧 Starting one_gadget analysis: {libc_path}")
+        logger.info("🔧 Starting one_gadget analysis: %s", libc_path)
         result = execute_command(command)
-        logger.info(f"📊 one_gadget analysis completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in one_gadget endpoint: {str(e)}")
+        logger.error("💥 Error in one_gadget endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/libc-database", methods=["POST"])
 def libc_database():
     """Execute libc-database for libc identification and offset lookup"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         action = params.get("action", "find")  # find, dump, download
         symbols = params.get("symbols", "")  # format: "symbol1:offset1 symbol2:offset2"
         libc_id = params.get("libc_id", "")
@@ -10166,19 +13181,18 @@ def libc_database():
         if additional_args:
             command += f" {additional_args}"
         
-        logger.info(f"🔧 Starting libc-database {action}: {symbols or libc_id}")
+        logger.info("🔧 Starting libc-database %s: %s", action, symbols or libc_id)
         result = execute_command(command)
-        logger.info(f"📊 libc-database {action} completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in libc-database endpoint: {str(e)}")
+        logger.error("💥 Error in libc-database endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/gdb-peda", methods=["POST"])
 def gdb_peda():
     """Execute GDB with PEDA for enhanced debugging and exploitation"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         binary = params.get("binary", "")
         commands = params.get("commands", "")
         attach_pid = params.get("attach_pid", 0)
@@ -10189,58 +13203,27 @@ def gdb_peda():
             logger.warning("🔧 GDB-PEDA called without binary, PID, or core file")
             return jsonify({"error": "Binary, PID, or core file parameter is required"}), 400
         
-        # Base GDB command with PEDA
-        command = "gdb -q"
-        
-        if binary:
-            command += f" {binary}"
-        
-        if core_file:
-            command += f" {core_file}"
-        
-        if attach_pid:
-            command += f" -p {attach_pid}"
-        
-        # Create command script
-        if commands:
-            temp_script = "/tmp/gdb_peda_commands.txt"
-            peda_commands = f"""
-source ~/peda/peda.py
-{commands}
-quit
-"""
-            with open(temp_script, "w") as f:
-                f.write(peda_commands)
-            command += f" -x {temp_script}"
-        else:
-            # Default PEDA initialization
-            command += " -ex 'source ~/peda/peda.py' -ex 'quit'"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        # Load PEDA, run each command line as its own -ex argument, then quit (nothing is written to disk)
+        inline_commands = [arg for line in commands.splitlines() if line.strip() for arg in ("-ex", line)]
+        peda_commands = ["-ex", "source ~/peda/peda.py", *inline_commands, "-ex", "quit"]
+        command = build_argv(["gdb", "-q"], {"-p": attach_pid}, positional=(binary, core_file, *peda_commands),
+                             extra=additional_args)
         
         target_info = binary or f'PID {attach_pid}' or core_file
-        logger.info(f"🔧 Starting GDB-PEDA analysis: {target_info}")
+        logger.info("🔧 Starting GDB-PEDA analysis: %s", target_info)
         result = execute_command(command)
         
-        # Cleanup
-        if commands and os.path.exists("/tmp/gdb_peda_commands.txt"):
-            try:
-                os.remove("/tmp/gdb_peda_commands.txt")
-            except:
-                pass
-        
-        logger.info(f"📊 GDB-PEDA analysis completed")
+        logger.info("📊 GDB-PEDA analysis completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in gdb-peda endpoint: {str(e)}")
+        logger.error("💥 Error in gdb-peda endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/angr", methods=["POST"])
 def angr():
     """Execute angr for symbolic execution and binary analysis"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         binary = params.get("binary", "")
         script_content = params.get("script_content", "")
         find_address = params.get("find_address", "")
@@ -10250,7 +13233,7 @@ def angr():
         
         if not binary:
             logger.warning("🔧 angr called without binary parameter")
-            return jsonify({"error": "Binary parameter is required"}), 400
+            return error_response(ERR_NO_BINARY)
         
         # Create angr script
         script_file = "/tmp/angr_analysis.py"
@@ -10312,7 +13295,7 @@ for func_addr, func in cfg.functions.items():
         if additional_args:
             command += f" {additional_args}"
         
-        logger.info(f"🔧 Starting angr analysis: {binary}")
+        logger.info("🔧 Starting angr analysis: %s", binary)
         result = execute_command(command, timeout=600)  # Longer timeout for symbolic execution
         
         # Cleanup
@@ -10321,17 +13304,17 @@ for func_addr, func in cfg.functions.items():
         except:
             pass
         
-        logger.info(f"📊 angr analysis completed")
+        logger.info("📊 angr analysis completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in angr endpoint: {str(e)}")
+        logger.error("💥 Error in angr endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/ropper", methods=["POST"])
 def ropper():
     """Execute ropper for advanced ROP/JOP gadget searching"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         binary = params.get("binary", "")
         gadget_type = params.get("gadget_type", "rop")  # rop, jop, sys, all
         quality = params.get("quality", 1)  # 1-5, higher = better quality
@@ -10341,205 +13324,110 @@ def ropper():
         
         if not binary:
             logger.warning("🔧 ropper called without binary parameter")
-            return jsonify({"error": "Binary parameter is required"}), 400
-        
-        command = f"ropper --file {binary}"
-        
-        if gadget_type == "rop":
-            command += " --rop"
-        elif gadget_type == "jop":
-            command += " --jop"
-        elif gadget_type == "sys":
-            command += " --sys"
-        elif gadget_type == "all":
-            command += " --all"
-        
-        if quality > 1:
-            command += f" --quality {quality}"
-        
-        if arch:
-            command += f" --arch {arch}"
-        
-        if search_string:
-            command += f" --search '{search_string}'"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔧 Starting ropper analysis: {binary}")
-        result = execute_command(command)
-        logger.info(f"📊 ropper analysis completed")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in ropper endpoint: {str(e)}")
-        return jsonify({"error": f"Server error: {str(e)}"}), 500
-
-@app.route("/api/tools/pwninit", methods=["POST"])
-def pwninit():
-    """Execute pwninit for CTF binary exploitation setup"""
-    try:
-        params = request.json
-        binary = params.get("binary", "")
-        libc = params.get("libc", "")
-        ld = params.get("ld", "")
-        template_type = params.get("template_type", "python")  # python, c
-        additional_args = params.get("additional_args", "")
-        
-        if not binary:
-            logger.warning("🔧 pwninit called without binary parameter")
-            return jsonify({"error": "Binary parameter is required"}), 400
-        
-        command = f"pwninit --bin {binary}"
-        
-        if libc:
-            command += f" --libc {libc}"
-        
-        if ld:
-            command += f" --ld {ld}"
-        
-        if template_type:
-            command += f" --template {template_type}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔧 Starting pwninit setup: {binary}")
-        result = execute_command(command)
-        logger.info(f"📊 pwninit setup completed")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in pwninit endpoint: {str(e)}")
-        return jsonify({"error": f"Server error: {str(e)}"}), 500
-
-# ============================================================================
-# ADDITIONAL WEB SECURITY TOOLS
-# ============================================================================
-
-@app.route("/api/tools/feroxbuster", methods=["POST"])
-def feroxbuster():
-    """Execute Feroxbuster for recursive content discovery with enhanced logging"""
-    try:
-        params = request.json
-        url = params.get("url", "")
-        wordlist = params.get("wordlist", "/usr/share/wordlists/dirb/common.txt")
-        threads = params.get("threads", 10)
-        additional_args = params.get("additional_args", "")
-        
-        if not url:
-            logger.warning("🌐 Feroxbuster called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
-        
-        command = f"feroxbuster -u {url} -w {wordlist} -t {threads}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting Feroxbuster scan: {url}")
-        result = execute_command(command)
-        logger.info(f"📊 Feroxbuster scan completed for {url}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in feroxbuster endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
-
-@app.route("/api/tools/dotdotpwn", methods=["POST"])
-def dotdotpwn():
-    """Execute DotDotPwn for directory traversal testing with enhanced logging"""
-    try:
-        params = request.json
-        target = params.get("target", "")
-        module = params.get("module", "http")
-        additional_args = params.get("additional_args", "")
-        
-        if not target:
-            logger.warning("🎯 DotDotPwn called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
-        
-        command = f"dotdotpwn -m {module} -h {target}"
-        
-        if additional_args:
-            command += f" {additional_args}"
-        
-        command += " -b"
-        
-        logger.info(f"🔍 Starting DotDotPwn scan: {target}")
-        result = execute_command(command)
-        logger.info(f"📊 DotDotPwn scan completed for {target}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in dotdotpwn endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
-
-@app.route("/api/tools/xsser", methods=["POST"])
-def xsser():
-    """Execute XSSer for XSS vulnerability testing with enhanced logging"""
-    try:
-        params = request.json
-        url = params.get("url", "")
-        params_str = params.get("params", "")
-        additional_args = params.get("additional_args", "")
-        
-        if not url:
-            logger.warning("🌐 XSSer called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
-        
-        command = f"xsser --url '{url}'"
+            return error_response(ERR_NO_BINARY)
         
-        if params_str:
-            command += f" --param='{params_str}'"
-            
-        if additional_args:
-            command += f" {additional_args}"
+        gadget_flag = {"rop": "--rop", "jop": "--jop", "sys": "--sys", "all": "--all"}.get(gadget_type)
+        command = build_argv(["ropper", "--file", binary],
+                             {"--quality": quality if quality > 1 else None, "--arch": arch, "--search": search_string},
+                             positional=(gadget_flag,), extra=additional_args)
         
-        logger.info(f"🔍 Starting XSSer scan: {url}")
+        logger.info("🔧 Starting ropper analysis: %s", binary)
         result = execute_command(command)
-        logger.info(f"📊 XSSer scan completed for {url}")
-        return jsonify(result)
-    except Exception as e:
-        logger.error(f"💥 Error in xsser endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+        return jsonify(result)
+    except Exception as e:
+        logger.error("💥 Error in ropper endpoint: %s", e)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
 
-@app.route("/api/tools/wfuzz", methods=["POST"])
-def wfuzz():
-    """Execute Wfuzz for web application fuzzing with enhanced logging"""
+@app.route("/api/tools/pwninit", methods=["POST"])
+def pwninit():
+    """Execute pwninit for CTF binary exploitation setup"""
     try:
-        params = request.json
-        url = params.get("url", "")
-        wordlist = params.get("wordlist", "/usr/share/wordlists/dirb/common.txt")
+        params = request.get_json(cache=False, silent=True) or {}
+        binary = params.get("binary", "")
+        libc = params.get("libc", "")
+        ld = params.get("ld", "")
+        template_type = params.get("template_type", "python")  # python, c
         additional_args = params.get("additional_args", "")
         
-        if not url:
-            logger.warning("🌐 Wfuzz called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
-        
-        command = f"wfuzz -w {wordlist} '{url}'"
+        if not binary:
+            logger.warning("🔧 pwninit called without binary parameter")
+            return error_response(ERR_NO_BINARY)
         
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_argv(["pwninit", "--bin", binary], {"--libc": libc, "--ld": ld, "--template": template_type},
+                             extra=additional_args)
         
-        logger.info(f"🔍 Starting Wfuzz scan: {url}")
+        logger.info("🔧 Starting pwninit setup: %s", binary)
         result = execute_command(command)
-        logger.info(f"📊 Wfuzz scan completed for {url}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in wfuzz endpoint: {str(e)}")
-        return jsonify({
-            "error": f"Server error: {str(e)}"
-        }), 500
+        logger.error("💥 Error in pwninit endpoint: %s", e)
+        return jsonify({"error": f"Server error: {str(e)}"}), 500
+
+# ============================================================================
+# ADDITIONAL WEB SECURITY TOOLS
+# ============================================================================
+
+@app.route("/api/tools/feroxbuster", methods=["POST"])
+@tool_endpoint(FeroxbusterParams, required={"url": ERR_NO_URL})
+def feroxbuster(params: FeroxbusterParams):
+    """Execute Feroxbuster for recursive content discovery with enhanced logging"""
+    url = params.url
+    if not URL_PATTERN.fullmatch(url):
+        return error_response(ERR_MALFORMED_URL)
+    
+    command = build_tool_argv("feroxbuster", url=url, wordlist=params.wordlist, threads=params.threads,
+                              additional_args=params.additional_args)
+    
+    if wants_stream():
+        return stream_command_response(command)
+    
+    result = execute_command(command)
+    return jsonify(result)
+
+@app.route("/api/tools/dotdotpwn", methods=["POST"])
+@tool_endpoint(DotdotpwnParams, required={"target": ERR_NO_TARGET})
+def dotdotpwn(params: DotdotpwnParams):
+    """Execute DotDotPwn for directory traversal testing with enhanced logging"""
+    command = build_tool_argv("dotdotpwn", module=params.module, target=params.target,
+                              additional_args=params.additional_args)
+    
+    if wants_stream():
+        return stream_command_response(command)
+    
+    result = execute_command(command)
+    return jsonify(result)
+
+@app.route("/api/tools/xsser", methods=["POST"])
+@tool_endpoint(XsserParams, required={"url": ERR_NO_URL})
+def xsser(params: XsserParams):
+    """Execute XSSer for XSS vulnerability testing with enhanced logging"""
+    url = params.url
+    if not URL_PATTERN.fullmatch(url):
+        return error_response(ERR_MALFORMED_URL)
+    
+    command = build_tool_argv("xsser", url=url, params=params.params, additional_args=params.additional_args)
+    
+    if wants_stream():
+        return stream_command_response(command)
+    
+    result = execute_command(command)
+    return jsonify(result)
+
+@app.route("/api/tools/wfuzz", methods=["POST"])
+@tool_endpoint(WfuzzParams, required={"url": ERR_NO_URL})
+def wfuzz(params: WfuzzParams):
+    """Execute Wfuzz for web application fuzzing with enhanced logging"""
+    url = params.url
+    if not URL_PATTERN.fullmatch(url):
+        return error_response(ERR_MALFORMED_URL)
+    
+    command = build_tool_argv("wfuzz", wordlist=params.wordlist, url=url, additional_args=params.additional_args)
+    
+    if wants_stream():
+        return stream_command_response(command)
+    
+    result = execute_command(command)
+    return jsonify(result)
 
 # ============================================================================
 # ENHANCED WEB APPLICATION SECURITY TOOLS (v6.0)
@@ -10549,7 +13437,7 @@ def wfuzz():
 def dirsearch():
     """Execute Dirsearch for advanced directory and file discovery with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         url = params.get("url", "")
         extensions = params.get("extensions", "php,html,js,txt,xml,json")
         wordlist = params.get("wordlist", "/usr/share/wordlists/dirsearch/common.txt")
@@ -10559,29 +13447,29 @@ def dirsearch():
         
         if not url:
             logger.warning("🌐 Dirsearch called without URL parameter")
-            return jsonify({"error": "URL parameter is required"}), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"dirsearch -u {url} -e {extensions} -w {wordlist} -t {threads}"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if recursive:
-            command += " -r"
+        command = build_argv(["dirsearch", "-u", url, "-e", extensions, "-w", wordlist, "-t", threads],
+                             {"-r": bool(recursive)}, extra=additional_args)
         
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("📁 Starting Dirsearch scan: %s", url)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"📁 Starting Dirsearch scan: {url}")
         result = execute_command(command)
-        logger.info(f"📊 Dirsearch scan completed for {url}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in dirsearch endpoint: {str(e)}")
+        logger.error("💥 Error in dirsearch endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/katana", methods=["POST"])
 def katana():
     """Execute Katana for next-generation crawling and spidering with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         url = params.get("url", "")
         depth = params.get("depth", 3)
         js_crawl = params.get("js_crawl", True)
@@ -10591,35 +13479,30 @@ def katana():
         
         if not url:
             logger.warning("🌐 Katana called without URL parameter")
-            return jsonify({"error": "URL parameter is required"}), 400
-        
-        command = f"katana -u {url} -d {depth}"
+            return error_response(ERR_NO_URL)
         
-        if js_crawl:
-            command += " -jc"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if form_extraction:
-            command += " -fx"
+        command = build_argv(["katana", "-u", url, "-d", depth],
+                             {"-jc": bool(js_crawl), "-fx": bool(form_extraction), "-jsonl": output_format == "json"},
+                             extra=additional_args)
         
-        if output_format == "json":
-            command += " -jsonl"
+        logger.info("⚔️  Starting Katana crawl: %s", url)
+        if wants_stream():
+            return stream_command_response(command)
         
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"⚔️  Starting Katana crawl: {url}")
         result = execute_command(command)
-        logger.info(f"📊 Katana crawl completed for {url}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in katana endpoint: {str(e)}")
+        logger.error("💥 Error in katana endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/gau", methods=["POST"])
 def gau():
     """Execute Gau (Get All URLs) for URL discovery from multiple sources with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         domain = params.get("domain", "")
         providers = params.get("providers", "wayback,commoncrawl,otx,urlscan")
         include_subs = params.get("include_subs", True)
@@ -10628,35 +13511,30 @@ def gau():
         
         if not domain:
             logger.warning("🌐 Gau called without domain parameter")
-            return jsonify({"error": "Domain parameter is required"}), 400
-        
-        command = f"gau {domain}"
+            return error_response(ERR_NO_DOMAIN)
         
-        if providers != "wayback,commoncrawl,otx,urlscan":
-            command += f" --providers {providers}"
+        if not DOMAIN_PATTERN.fullmatch(domain):
+            return error_response(ERR_MALFORMED_DOMAIN)
         
-        if include_subs:
-            command += " --subs"
+        command = build_argv(["gau", domain],
+                             {"--providers": providers if providers != "wayback,commoncrawl,otx,urlscan" else None,
+                              "--subs": bool(include_subs), "--blacklist": blacklist}, extra=additional_args)
         
-        if blacklist:
-            command += f" --blacklist {blacklist}"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("📡 Starting Gau URL discovery: %s", domain)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"📡 Starting Gau URL discovery: {domain}")
         result = execute_command(command)
-        logger.info(f"📊 Gau URL discovery completed for {domain}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in gau endpoint: {str(e)}")
+        logger.error("💥 Error in gau endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/waybackurls", methods=["POST"])
 def waybackurls():
     """Execute Waybackurls for historical URL discovery with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         domain = params.get("domain", "")
         get_versions = params.get("get_versions", False)
         no_subs = params.get("no_subs", False)
@@ -10664,32 +13542,31 @@ def waybackurls():
         
         if not domain:
             logger.warning("🌐 Waybackurls called without domain parameter")
-            return jsonify({"error": "Domain parameter is required"}), 400
-        
-        command = f"waybackurls {domain}"
+            return error_response(ERR_NO_DOMAIN)
         
-        if get_versions:
-            command += " --get-versions"
+        if not DOMAIN_PATTERN.fullmatch(domain):
+            return error_response(ERR_MALFORMED_DOMAIN)
         
-        if no_subs:
-            command += " --no-subs"
+        command = build_argv(["waybackurls", domain], {"--get-versions": bool(get_versions), "--no-subs": bool(no_subs)},
+                             extra=additional_args)
         
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🕰️  Starting Waybackurls discovery: %s", domain)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🕰️  Starting Waybackurls discovery: {domain}")
         result = execute_command(command)
-        logger.info(f"📊 Waybackurls discovery completed for {domain}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in waybackurls endpoint: {str(e)}")
+        logger.error("💥 Error in waybackurls endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/arjun", methods=["POST"])
 def arjun():
     """Execute Arjun for HTTP parameter discovery with enhanced logging"""
     try:
-        params = request.json
+        params, error = read_json_body(ERR_NO_URL)
+        if error:
+            return error
         url = params.get("url", "")
         method = params.get("method", "GET")
         wordlist = params.get("wordlist", "")
@@ -10700,35 +13577,30 @@ def arjun():
         
         if not url:
             logger.warning("🌐 Arjun called without URL parameter")
-            return jsonify({"error": "URL parameter is required"}), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"arjun -u {url} -m {method} -t {threads}"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if wordlist:
-            command += f" -w {wordlist}"
-        
-        if delay > 0:
-            command += f" -d {delay}"
+        command = build_argv(["arjun", "-u", url, "-m", method, "-t", threads],
+                             {"-w": wordlist, "-d": delay if delay > 0 else None, "--stable": bool(stable)},
+                             extra=additional_args)
         
-        if stable:
-            command += " --stable"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🎯 Starting Arjun parameter discovery: %s", url)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🎯 Starting Arjun parameter discovery: {url}")
         result = execute_command(command)
-        logger.info(f"📊 Arjun parameter discovery completed for {url}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in arjun endpoint: {str(e)}")
+        logger.error("💥 Error in arjun endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/paramspider", methods=["POST"])
 def paramspider():
     """Execute ParamSpider for parameter mining from web archives with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         domain = params.get("domain", "")
         level = params.get("level", 2)
         exclude = params.get("exclude", "png,jpg,gif,jpeg,swf,woff,svg,pdf,css,ico")
@@ -10737,32 +13609,29 @@ def paramspider():
         
         if not domain:
             logger.warning("🌐 ParamSpider called without domain parameter")
-            return jsonify({"error": "Domain parameter is required"}), 400
-        
-        command = f"paramspider -d {domain} -l {level}"
+            return error_response(ERR_NO_DOMAIN)
         
-        if exclude:
-            command += f" --exclude {exclude}"
+        if not DOMAIN_PATTERN.fullmatch(domain):
+            return error_response(ERR_MALFORMED_DOMAIN)
         
-        if output:
-            command += f" -o {output}"
+        command = build_argv(["paramspider", "-d", domain, "-l", level], {"--exclude": exclude, "-o": output},
+                             extra=additional_args)
         
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🕷️  Starting ParamSpider mining: %s", domain)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🕷️  Starting ParamSpider mining: {domain}")
         result = execute_command(command)
-        logger.info(f"📊 ParamSpider mining completed for {domain}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in paramspider endpoint: {str(e)}")
+        logger.error("💥 Error in paramspider endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/x8", methods=["POST"])
 def x8():
     """Execute x8 for hidden parameter discovery with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         url = params.get("url", "")
         wordlist = params.get("wordlist", "/usr/share/wordlists/x8/params.txt")
         method = params.get("method", "GET")
@@ -10772,32 +13641,29 @@ def x8():
         
         if not url:
             logger.warning("🌐 x8 called without URL parameter")
-            return jsonify({"error": "URL parameter is required"}), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"x8 -u {url} -w {wordlist} -X {method}"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if body:
-            command += f" -b '{body}'"
+        command = build_tool_argv("x8", url=url, wordlist=wordlist, method=method, body=body,
+                                  headers=headers, additional_args=additional_args)
         
-        if headers:
-            command += f" -H '{headers}'"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🔍 Starting x8 parameter discovery: %s", url)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🔍 Starting x8 parameter discovery: {url}")
         result = execute_command(command)
-        logger.info(f"📊 x8 parameter discovery completed for {url}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in x8 endpoint: {str(e)}")
+        logger.error("💥 Error in x8 endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/jaeles", methods=["POST"])
 def jaeles():
     """Execute Jaeles for advanced vulnerability scanning with custom signatures"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         url = params.get("url", "")
         signatures = params.get("signatures", "")
         config = params.get("config", "")
@@ -10807,32 +13673,29 @@ def jaeles():
         
         if not url:
             logger.warning("🌐 Jaeles called without URL parameter")
-            return jsonify({"error": "URL parameter is required"}), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"jaeles scan -u {url} -c {threads} --timeout {timeout}"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if signatures:
-            command += f" -s {signatures}"
+        command = build_argv(["jaeles", "scan", "-u", url, "-c", threads, "--timeout", timeout],
+                             {"-s": signatures, "--config": config}, extra=additional_args)
         
-        if config:
-            command += f" --config {config}"
+        logger.info("🔬 Starting Jaeles vulnerability scan: %s", url)
+        if wants_stream():
+            return stream_command_response(command)
         
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔬 Starting Jaeles vulnerability scan: {url}")
         result = execute_command(command)
-        logger.info(f"📊 Jaeles vulnerability scan completed for {url}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in jaeles endpoint: {str(e)}")
+        logger.error("💥 Error in jaeles endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/dalfox", methods=["POST"])
 def dalfox():
     """Execute Dalfox for advanced XSS vulnerability scanning with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         url = params.get("url", "")
         pipe_mode = params.get("pipe_mode", False)
         blind = params.get("blind", False)
@@ -10843,41 +13706,31 @@ def dalfox():
         
         if not url and not pipe_mode:
             logger.warning("🌐 Dalfox called without URL parameter")
-            return jsonify({"error": "URL parameter is required"}), 400
-        
-        if pipe_mode:
-            command = "dalfox pipe"
-        else:
-            command = f"dalfox url {url}"
-        
-        if blind:
-            command += " --blind"
+            return error_response(ERR_NO_URL)
         
-        if mining_dom:
-            command += " --mining-dom"
+        if url and not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if mining_dict:
-            command += " --mining-dict"
+        command = build_argv(["dalfox", "pipe"] if pipe_mode else ["dalfox", "url", url],
+                             {"--blind": bool(blind), "--mining-dom": bool(mining_dom),
+                              "--mining-dict": bool(mining_dict), "--custom-payload": custom_payload},
+                             extra=additional_args)
         
-        if custom_payload:
-            command += f" --custom-payload '{custom_payload}'"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🎯 Starting Dalfox XSS scan: %s", url if url else 'pipe mode')
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🎯 Starting Dalfox XSS scan: {url if url else 'pipe mode'}")
         result = execute_command(command)
-        logger.info(f"📊 Dalfox XSS scan completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in dalfox endpoint: {str(e)}")
+        logger.error("💥 Error in dalfox endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/httpx", methods=["POST"])
 def httpx():
     """Execute httpx for fast HTTP probing and technology detection"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         probe = params.get("probe", True)
         tech_detect = params.get("tech_detect", False)
@@ -10890,44 +13743,28 @@ def httpx():
         
         if not target:
             logger.warning("🌐 httpx called without target parameter")
-            return jsonify({"error": "Target parameter is required"}), 400
-        
-        command = f"httpx -l {target} -t {threads}"
-        
-        if probe:
-            command += " -probe"
-        
-        if tech_detect:
-            command += " -tech-detect"
+            return error_response(ERR_NO_TARGET)
         
-        if status_code:
-            command += " -sc"
+        command = build_argv(["httpx", "-l", target, "-t", threads],
+                             {"-probe": bool(probe), "-tech-detect": bool(tech_detect), "-sc": bool(status_code),
+                              "-cl": bool(content_length), "-title": bool(title), "-server": bool(web_server)},
+                             extra=additional_args)
         
-        if content_length:
-            command += " -cl"
-        
-        if title:
-            command += " -title"
-        
-        if web_server:
-            command += " -server"
-        
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🌍 Starting httpx probe: %s", target)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🌍 Starting httpx probe: {target}")
         result = execute_command(command)
-        logger.info(f"📊 httpx probe completed for {target}")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in httpx endpoint: {str(e)}")
+        logger.error("💥 Error in httpx endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/anew", methods=["POST"])
 def anew():
     """Execute anew for appending new lines to files (useful for data processing)"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         input_data = params.get("input_data", "")
         output_file = params.get("output_file", "")
         additional_args = params.get("additional_args", "")
@@ -10946,17 +13783,16 @@ def anew():
         
         logger.info("📝 Starting anew data processing")
         result = execute_command(command)
-        logger.info("📊 anew data processing completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in anew endpoint: {str(e)}")
+        logger.error("💥 Error in anew endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/qsreplace", methods=["POST"])
 def qsreplace():
     """Execute qsreplace for query string parameter replacement"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         urls = params.get("urls", "")
         replacement = params.get("replacement", "FUZZ")
         additional_args = params.get("additional_args", "")
@@ -10972,17 +13808,16 @@ def qsreplace():
         
         logger.info("🔄 Starting qsreplace parameter replacement")
         result = execute_command(command)
-        logger.info("📊 qsreplace parameter replacement completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in qsreplace endpoint: {str(e)}")
+        logger.error("💥 Error in qsreplace endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/uro", methods=["POST"])
 def uro():
     """Execute uro for filtering out similar URLs"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         urls = params.get("urls", "")
         whitelist = params.get("whitelist", "")
         blacklist = params.get("blacklist", "")
@@ -11005,10 +13840,9 @@ def uro():
         
         logger.info("🔍 Starting uro URL filtering")
         result = execute_command(command)
-        logger.info("📊 uro URL filtering completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in uro endpoint: {str(e)}")
+        logger.error("💥 Error in uro endpoint: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # ============================================================================
@@ -11100,7 +13934,7 @@ class HTTPTestingFramework:
             }
             
         except Exception as e:
-            logger.error(f"{ModernVisualEngine.format_error_card('ERROR', 'HTTP-Framework', str(e))}")
+            logger.error("%s", ModernVisualEngine.format_error_card('ERROR', 'HTTP-Framework', str(e)))
             return {'success': False, 'error': str(e)}
 
     # ----------------- Match & Replace and Scope -----------------
@@ -11129,8 +13963,6 @@ class HTTPTestingFramework:
         return False
 
     def _apply_match_replace(self, url: str, data, headers: dict):
-        import re
-        from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
         original_url = url
         out_headers = dict(headers)
         out_data = data
@@ -11161,7 +13993,7 @@ class HTTPTestingFramework:
                 continue
         # Ensure scope restriction
         if not self._in_scope(url):
-            logger.warning(f"{ModernVisualEngine.format_tool_status('HTTP-Framework', 'SKIPPED', f'Out of scope: {url}')}" )
+            logger.warning("%s", ModernVisualEngine.format_tool_status('HTTP-Framework', 'SKIPPED', f'Out of scope: {url}') )
             return original_url, data, headers
         return url, out_data, out_headers
 
@@ -11346,7 +14178,7 @@ class HTTPTestingFramework:
                             forms.append(form_data)
                             
                 except Exception as e:
-                    logger.warning(f"Error spidering {current_url}: {str(e)}")
+                    logger.warning("Error spidering %s: %s", current_url, e)
                     continue
             
             return {
@@ -11358,7 +14190,7 @@ class HTTPTestingFramework:
             }
             
         except Exception as e:
-            logger.error(f"{ModernVisualEngine.format_error_card('ERROR', 'Spider', str(e))}")
+            logger.error("%s", ModernVisualEngine.format_error_card('ERROR', 'Spider', str(e)))
             return {'success': False, 'error': str(e)}
 
 class BrowserAgent:
@@ -11403,11 +14235,11 @@ class BrowserAgent:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.set_page_load_timeout(30)
             
-            logger.info(f"{ModernVisualEngine.format_tool_status('BrowserAgent', 'RUNNING', 'Chrome Browser Initialized')}")
+            logger.info("%s", ModernVisualEngine.format_tool_status('BrowserAgent', 'RUNNING', 'Chrome Browser Initialized'))
             return True
             
         except Exception as e:
-            logger.error(f"{ModernVisualEngine.format_error_card('ERROR', 'BrowserAgent', str(e))}")
+            logger.error("%s", ModernVisualEngine.format_error_card('ERROR', 'BrowserAgent', str(e)))
             return False
     
     def navigate_and_inspect(self, url: str, wait_time: int = 5) -> dict:
@@ -11418,7 +14250,7 @@ class BrowserAgent:
                     return {'success': False, 'error': 'Failed to setup browser'}
             
             nav_command = f'Navigate to {url}'
-            logger.info(f"{ModernVisualEngine.format_command_execution(nav_command, 'STARTING')}")
+            logger.info("%s", ModernVisualEngine.format_command_execution(nav_command, 'STARTING'))
             
             # Navigate to URL
             self.driver.get(url)
@@ -11462,7 +14294,7 @@ class BrowserAgent:
             security_analysis['security_score'] = max(0, 100 - (security_analysis['total_issues'] * 5))
             security_analysis['passive_modules'] = extended_passive.get('modules', [])
             
-            logger.info(f"{ModernVisualEngine.format_tool_status('BrowserAgent', 'SUCCESS', url)}")
+            logger.info("%s", ModernVisualEngine.format_tool_status('BrowserAgent', 'SUCCESS', url))
             
             return {
                 'success': True,
@@ -11473,7 +14305,7 @@ class BrowserAgent:
             }
             
         except Exception as e:
-            logger.error(f"{ModernVisualEngine.format_error_card('ERROR', 'BrowserAgent', str(e))}")
+            logger.error("%s", ModernVisualEngine.format_error_card('ERROR', 'BrowserAgent', str(e)))
             return {'success': False, 'error': str(e)}
     
     # ---------------------- Browser Deep Introspection Helpers ----------------------
@@ -11771,7 +14603,7 @@ class BrowserAgent:
         if self.driver:
             self.driver.quit()
             self.driver = None
-            logger.info(f"{ModernVisualEngine.format_tool_status('BrowserAgent', 'SUCCESS', 'Browser Closed')}")
+            logger.info("%s", ModernVisualEngine.format_tool_status('BrowserAgent', 'SUCCESS', 'Browser Closed'))
 
 # Global instances
 http_framework = HTTPTestingFramework()
@@ -11781,7 +14613,7 @@ browser_agent = BrowserAgent()
 def http_framework_endpoint():
     """Enhanced HTTP testing framework (Burp Suite alternative)"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         action = params.get("action", "request")  # request, spider, proxy_history, set_rules, set_scope, repeater, intruder
         url = params.get("url", "")
         method = params.get("method", "GET")
@@ -11789,20 +14621,20 @@ def http_framework_endpoint():
         headers = params.get("headers", {})
         cookies = params.get("cookies", {})
 
-        logger.info(f"{ModernVisualEngine.create_section_header('HTTP FRAMEWORK', '🔥', 'FIRE_RED')}")
+        logger.info("%s", ModernVisualEngine.create_section_header('HTTP FRAMEWORK', '🔥', 'FIRE_RED'))
 
         if action == "request":
             if not url:
                 return jsonify({"error": "URL parameter is required for request action"}), 400
 
             request_command = f"{method} {url}"
-            logger.info(f"{ModernVisualEngine.format_command_execution(request_command, 'STARTING')}")
+            logger.info("%s", ModernVisualEngine.format_command_execution(request_command, 'STARTING'))
             result = http_framework.intercept_request(url, method, data, headers, cookies)
 
             if result.get("success"):
-                logger.info(f"{ModernVisualEngine.format_tool_status('HTTP-Framework', 'SUCCESS', url)}")
+                logger.info("%s", ModernVisualEngine.format_tool_status('HTTP-Framework', 'SUCCESS', url))
             else:
-                logger.error(f"{ModernVisualEngine.format_tool_status('HTTP-Framework', 'FAILED', url)}")
+                logger.error("%s", ModernVisualEngine.format_tool_status('HTTP-Framework', 'FAILED', url))
 
             return jsonify(result)
 
@@ -11814,15 +14646,15 @@ def http_framework_endpoint():
             max_pages = params.get("max_pages", 100)
 
             spider_command = f"Spider {url}"
-            logger.info(f"{ModernVisualEngine.format_command_execution(spider_command, 'STARTING')}")
+            logger.info("%s", ModernVisualEngine.format_command_execution(spider_command, 'STARTING'))
             result = http_framework.spider_website(url, max_depth, max_pages)
 
             if result.get("success"):
                 total_pages = result.get("total_pages", 0)
                 pages_info = f"{total_pages} pages"
-                logger.info(f"{ModernVisualEngine.format_tool_status('HTTP-Spider', 'SUCCESS', pages_info)}")
+                logger.info("%s", ModernVisualEngine.format_tool_status('HTTP-Spider', 'SUCCESS', pages_info))
             else:
-                logger.error(f"{ModernVisualEngine.format_tool_status('HTTP-Spider', 'FAILED', url)}")
+                logger.error("%s", ModernVisualEngine.format_tool_status('HTTP-Spider', 'FAILED', url))
 
             return jsonify(result)
 
@@ -11870,14 +14702,14 @@ def http_framework_endpoint():
             return jsonify({"error": f"Unknown action: {action}"}), 400
 
     except Exception as e:
-        logger.error(f"{ModernVisualEngine.format_error_card('ERROR', 'HTTP-Framework', str(e))}")
+        logger.error("%s", ModernVisualEngine.format_error_card('ERROR', 'HTTP-Framework', str(e)))
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/tools/browser-agent", methods=["POST"])
 def browser_agent_endpoint():
     """AI-powered browser agent for web application inspection"""
     try:
-        params = request.json or {}
+        params = request.get_json(cache=False, silent=True) or {}
         action = params.get("action", "navigate")  # navigate, screenshot, close
         url = params.get("url", "")
         headless = params.get("headless", True)
@@ -11886,7 +14718,7 @@ def browser_agent_endpoint():
         active_tests = params.get("active_tests", False)
 
         logger.info(
-            f"{ModernVisualEngine.create_section_header('BROWSER AGENT', '🌐', 'CRIMSON')}"
+            "%s", ModernVisualEngine.create_section_header('BROWSER AGENT', '🌐', 'CRIMSON')
         )
 
         if action == "navigate":
@@ -11958,7 +14790,7 @@ def browser_agent_endpoint():
 
     except Exception as e:
         logger.error(
-            f"{ModernVisualEngine.format_error_card('ERROR', 'BrowserAgent', str(e))}"
+            "%s", ModernVisualEngine.format_error_card('ERROR', 'BrowserAgent', str(e))
         )
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
@@ -11966,7 +14798,7 @@ def browser_agent_endpoint():
 def burpsuite_alternative():
     """Comprehensive Burp Suite alternative combining HTTP framework and browser agent"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         scan_type = params.get("scan_type", "comprehensive")  # comprehensive, spider, passive, active
         headless = params.get("headless", True)
@@ -11974,11 +14806,11 @@ def burpsuite_alternative():
         max_pages = params.get("max_pages", 50)
         
         if not target:
-            return jsonify({"error": "Target parameter is required"}), 400
+            return error_response(ERR_NO_TARGET)
         
-        logger.info(f"{ModernVisualEngine.create_section_header('BURP SUITE ALTERNATIVE', '🔥', 'BLOOD_RED')}")
+        logger.info("%s", ModernVisualEngine.create_section_header('BURP SUITE ALTERNATIVE', '🔥', 'BLOOD_RED'))
         scan_message = f'Starting {scan_type} scan of {target}'
-        logger.info(f"{ModernVisualEngine.format_highlighted_text(scan_message, 'RED')}")
+        logger.info("%s", ModernVisualEngine.format_highlighted_text(scan_message, 'RED'))
         
         results = {
             'target': target,
@@ -11989,7 +14821,7 @@ def burpsuite_alternative():
         
         # Phase 1: Browser-based reconnaissance
         if scan_type in ['comprehensive', 'spider']:
-            logger.info(f"{ModernVisualEngine.format_tool_status('BrowserAgent', 'RUNNING', 'Reconnaissance Phase')}")
+            logger.info("%s", ModernVisualEngine.format_tool_status('BrowserAgent', 'RUNNING', 'Reconnaissance Phase'))
             
             if not browser_agent.driver:
                 browser_agent.setup_browser(headless)
@@ -11999,14 +14831,14 @@ def burpsuite_alternative():
         
         # Phase 2: HTTP spidering
         if scan_type in ['comprehensive', 'spider']:
-            logger.info(f"{ModernVisualEngine.format_tool_status('HTTP-Spider', 'RUNNING', 'Discovery Phase')}")
+            logger.info("%s", ModernVisualEngine.format_tool_status('HTTP-Spider', 'RUNNING', 'Discovery Phase'))
             
             spider_result = http_framework.spider_website(target, max_depth, max_pages)
             results['spider_analysis'] = spider_result
         
         # Phase 3: Vulnerability analysis
         if scan_type in ['comprehensive', 'active']:
-            logger.info(f"{ModernVisualEngine.format_tool_status('VulnScanner', 'RUNNING', 'Analysis Phase')}")
+            logger.info("%s", ModernVisualEngine.format_tool_status('VulnScanner', 'RUNNING', 'Analysis Phase'))
             
             # Test discovered endpoints
             discovered_urls = results.get('spider_analysis', {}).get('discovered_urls', [target])
@@ -12038,20 +14870,20 @@ def burpsuite_alternative():
         }
         
         # Display summary with enhanced colors
-        logger.info(f"{ModernVisualEngine.create_section_header('SCAN COMPLETE', '✅', 'SUCCESS')}")
+        logger.info("%s", ModernVisualEngine.create_section_header('SCAN COMPLETE', '✅', 'SUCCESS'))
         vuln_message = f'Found {total_vulns} vulnerabilities'
         color_choice = 'YELLOW' if total_vulns > 0 else 'GREEN'
-        logger.info(f"{ModernVisualEngine.format_highlighted_text(vuln_message, color_choice)}")
+        logger.info("%s", ModernVisualEngine.format_highlighted_text(vuln_message, color_choice))
         
         for severity, count in vuln_summary.items():
-            logger.info(f"  {ModernVisualEngine.format_vulnerability_severity(severity, count)}")
+            logger.info("  %s", ModernVisualEngine.format_vulnerability_severity(severity, count))
         
         return jsonify(results)
         
     except Exception as e:
-        logger.error(f"{ModernVisualEngine.format_error_card('CRITICAL', 'BurpAlternative', str(e))}")
+        logger.error("%s", ModernVisualEngine.format_error_card('CRITICAL', 'BurpAlternative', str(e)))
         return jsonify({"error": f"Server error: {str(e)}"}), 500
-        logger.error(f"💥 Error in burpsuite endpoint: {str(e)}")
+        logger.error("💥 Error in burpsuite endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -12060,7 +14892,7 @@ def burpsuite_alternative():
 def zap():
     """Execute OWASP ZAP with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target = params.get("target", "")
         scan_type = params.get("scan_type", "baseline")
         api_key = params.get("api_key", "")
@@ -12070,6 +14902,8 @@ def zap():
         format_type = params.get("format", "xml")
         output_file = params.get("output_file", "")
         additional_args = params.get("additional_args", "")
+        use_cache = param_flag(params, "use_cache", True)
+        force = param_flag(params, "force") or request.args.get("force") == "1"
         
         if not target and scan_type != "daemon":
             logger.warning("🎯 ZAP called without target parameter")
@@ -12077,31 +14911,31 @@ def zap():
                 "error": "Target parameter is required for scans"
             }), 400
         
+        api_key_config = ("-config", f"api.key={api_key}") if api_key else ()
         if daemon:
-            command = f"zaproxy -daemon -host {host} -port {port}"
-            if api_key:
-                command += f" -config api.key={api_key}"
+            command = build_argv(["zaproxy", "-daemon", "-host", host, "-port", port, *api_key_config],
+                                 extra=additional_args)
         else:
-            command = f"zaproxy -cmd -quickurl {target}"
-                
-            if format_type:
-                command += f" -quickout {format_type}"
-                
-            if output_file:
-                command += f" -quickprogress -dir \"{output_file}\""
-                
-            if api_key:
-                command += f" -config api.key={api_key}"
+            output_args = ("-quickprogress", "-dir", output_file) if output_file else ()
+            command = build_argv(["zaproxy", "-cmd", "-quickurl", target], {"-quickout": format_type},
+                                 positional=(*output_args, *api_key_config), extra=additional_args)
         
-        if additional_args:
-            command += f" {additional_args}"
+        logger.info("🔍 Starting ZAP scan: %s", target)
+        if wants_stream() and not daemon:
+            return stream_command_response(command)
         
-        logger.info(f"🔍 Starting ZAP scan: {target}")
-        result = execute_command(command)
-        logger.info(f"📊 ZAP scan completed for {target}")
+        if use_cache and not daemon and not force:
+            cached = cached_command_response(command)
+            if cached is not None:
+                return cached
+        
+        # A daemon start is a side effect, never a result worth replaying
+        result = execute_command(command, use_cache=use_cache and not daemon, force=force)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in zap endpoint: {str(e)}")
+        logger.error("💥 Error in zap endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -12110,27 +14944,27 @@ def zap():
 def wafw00f():
     """Execute wafw00f to identify and fingerprint WAF products with enhanced logging"""
     try:
-        params = request.json
+        params, error = read_json_body(ERR_NO_TARGET)
+        if error:
+            return error
         target = params.get("target", "")
         additional_args = params.get("additional_args", "")
+        use_cache = param_flag(params, "use_cache", True)
+        force = param_flag(params, "force") or request.args.get("force") == "1"
         
         if not target:
             logger.warning("🛡️ Wafw00f called without target parameter")
-            return jsonify({
-                "error": "Target parameter is required"
-            }), 400
-        
-        command = f"wafw00f {target}"
+            return error_response(ERR_NO_TARGET)
         
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_argv(["wafw00f", target], extra=additional_args)
         
-        logger.info(f"🛡️ Starting Wafw00f WAF detection: {target}")
-        result = execute_command(command)
-        logger.info(f"📊 Wafw00f completed for {target}")
+        logger.info("🛡️ Starting Wafw00f WAF detection: %s", target)
+        result = execute_command(command, use_cache=use_cache, force=force)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in wafw00f endpoint: {str(e)}")
+        logger.error("💥 Error in wafw00f endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -12139,31 +14973,38 @@ def wafw00f():
 def fierce():
     """Execute fierce for DNS reconnaissance with enhanced logging"""
     try:
-        params = request.json
-        domain = params.get("domain", "")
+        params, error = read_json_body(ERR_NO_DOMAIN)
+        if error:
+            return error
+        targets = request_targets(params, "domain")
         dns_server = params.get("dns_server", "")
         additional_args = params.get("additional_args", "")
+        use_cache = param_flag(params, "use_cache", True)
+        force = param_flag(params, "force") or request.args.get("force") == "1"
         
-        if not domain:
+        if not targets:
             logger.warning("🌐 Fierce called without domain parameter")
-            return jsonify({
-                "error": "Domain parameter is required"
-            }), 400
+            return error_response(ERR_NO_DOMAIN)
         
-        command = f"fierce --domain {domain}"
+        if not all(DOMAIN_PATTERN.fullmatch(target) for target in targets):
+            return error_response(ERR_MALFORMED_DOMAIN)
         
-        if dns_server:
-            command += f" --dns-servers {dns_server}"
-            
-        if additional_args:
-            command += f" {additional_args}"
+        def run(domain):
+            command = build_argv(["fierce", "--domain", domain], {"--dns-servers": dns_server}, extra=additional_args)
+            return execute_command(command, use_cache=use_cache, force=force, cache_ttl=DNS_CACHE_TTL)
         
-        logger.info(f"🔍 Starting Fierce DNS recon: {domain}")
-        result = execute_command(command)
-        logger.info(f"📊 Fierce completed for {domain}")
+        domain = ", ".join(targets)
+        logger.info("🔍 Starting Fierce DNS recon: %s", domain)
+        if len(targets) > 1:
+            result = execute_per_target(targets, run, params.get("max_concurrent", FANOUT_MAX_CONCURRENT))
+        else:
+            result = run(targets[0])
+        logger.info("📊 Fierce completed for %s", domain)
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in fierce endpoint: {str(e)}")
+        logger.error("💥 Error in fierce endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -12172,35 +15013,103 @@ def fierce():
 def dnsenum():
     """Execute dnsenum for DNS enumeration with enhanced logging"""
     try:
-        params = request.json
-        domain = params.get("domain", "")
+        params, error = read_json_body(ERR_NO_DOMAIN)
+        if error:
+            return error
+        targets = request_targets(params, "domain")
         dns_server = params.get("dns_server", "")
         wordlist = params.get("wordlist", "")
         additional_args = params.get("additional_args", "")
+        force = param_flag(params, "force") or request.args.get("force") == "1"
+        use_native = param_flag(params, "use_native") and dns is not None and not additional_args
         
-        if not domain:
+        if not targets:
             logger.warning("🌐 DNSenum called without domain parameter")
-            return jsonify({
-                "error": "Domain parameter is required"
-            }), 400
-        
-        command = f"dnsenum {domain}"
-        
-        if dns_server:
-            command += f" --dnsserver {dns_server}"
-            
-        if wordlist:
-            command += f" --file {wordlist}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🔍 Starting DNSenum: {domain}")
-        result = execute_command(command)
-        logger.info(f"📊 DNSenum completed for {domain}")
+            return error_response(ERR_NO_DOMAIN)
+        
+        if not all(DOMAIN_PATTERN.fullmatch(target) for target in targets):
+            return error_response(ERR_MALFORMED_DOMAIN)
+        
+        if use_native and not valid_dns_servers(dns_server):
+            return error_response(ERR_MALFORMED_DNS_SERVER)
+        
+        def run(domain):
+            # Records, zone transfer and wordlist brute force; reverse sweeps and scraping need dnsenum
+            if use_native:
+                enums = ("a", "ns", "mx", "axfr", "brt") if wordlist else ("a", "ns", "mx", "axfr")
+                return dns_enumerate(domain, enums, wordlist, dns_server,
+                                     params.get("resolver_concurrency", DNS_RESOLVER_CONCURRENCY), force)
+            command = build_argv(["dnsenum", domain], {"--dnsserver": dns_server, "--file": wordlist},
+                                 extra=additional_args)
+            return execute_command(command, cache_deps=(wordlist,) if wordlist else (), force=force,
+                                   cache_ttl=DNS_CACHE_TTL)
+        
+        domain = ", ".join(targets)
+        logger.info("🔍 Starting DNSenum: %s", domain)
+        if len(targets) > 1:
+            result = execute_per_target(targets, run, params.get("max_concurrent", FANOUT_MAX_CONCURRENT))
+        else:
+            result = run(targets[0])
+        logger.info("📊 DNSenum completed for %s", domain)
+        return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error("💥 Error in dnsenum endpoint: %s", e)
+        return jsonify({
+            "error": f"Server error: {str(e)}"
+        }), 500
+
+@app.route("/api/tools/dns", methods=["POST"])
+def dns_enum():
+    """Run the requested DNS enumerations (a, ns, mx, axfr, brt) through the cheapest backend"""
+    try:
+        params, error = read_json_body(ERR_NO_DOMAIN)
+        if error:
+            return error
+        targets = request_targets(params, "domain")
+        enums = params.get("enums", ["a", "ns", "mx"])
+        dns_server = params.get("dns_server", "")
+        wordlist = params.get("wordlist", "")
+        force = param_flag(params, "force") or request.args.get("force") == "1"
+        
+        if not targets:
+            logger.warning("🌐 DNS enumeration called without domain parameter")
+            return error_response(ERR_NO_DOMAIN)
+        
+        if not all(DOMAIN_PATTERN.fullmatch(target) for target in targets):
+            return error_response(ERR_MALFORMED_DOMAIN)
+        
+        if isinstance(enums, str):
+            enums = enums.split(",")
+        enums = tuple(dict.fromkeys(str(enum).strip().lower() for enum in enums if str(enum).strip()))
+        if not enums or not set(enums) <= set(DNS_ENUMS):
+            return jsonify({"error": f"enums must be a non-empty list of: {', '.join(DNS_ENUMS)}"}), 400
+        
+        if dns is not None and not valid_dns_servers(dns_server):
+            return error_response(ERR_MALFORMED_DNS_SERVER)
+        
+        def run(domain):
+            if dns is not None:
+                return dns_enumerate(domain, enums, wordlist, dns_server,
+                                     params.get("resolver_concurrency", DNS_RESOLVER_CONCURRENCY), force)
+            # Without dnspython one dnsenum run covers the record lookups, AXFR and brute force
+            command = build_argv(["dnsenum", "--noreverse", domain],
+                                 {"--dnsserver": dns_server, "--file": wordlist if "brt" in enums else None})
+            return execute_command(command, cache_deps=(wordlist,) if wordlist and "brt" in enums else (),
+                                   force=force, cache_ttl=DNS_CACHE_TTL)
+        
+        domain = ", ".join(targets)
+        logger.info("🔍 Starting DNS enumeration (%s): %s", ",".join(enums), domain)
+        if len(targets) > 1:
+            result = execute_per_target(targets, run, params.get("max_concurrent", FANOUT_MAX_CONCURRENT))
+        else:
+            result = run(targets[0])
         return jsonify(result)
+    except ParamsValidationError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
-        logger.error(f"💥 Error in dnsenum endpoint: {str(e)}")
+        logger.error("💥 Error in dns endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -12210,14 +15119,14 @@ def dnsenum():
 def install_python_package():
     """Install a Python package in a virtual environment"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         package = params.get("package", "")
         env_name = params.get("env_name", "default")
         
         if not package:
             return jsonify({"error": "Package name is required"}), 400
         
-        logger.info(f"📦 Installing Python package: {package} in env {env_name}")
+        logger.info("📦 Installing Python package: %s in env %s", package, env_name)
         success = env_manager.install_package(env_name, package)
         
         if success:
@@ -12233,14 +15142,14 @@ def install_python_package():
             }), 500
             
     except Exception as e:
-        logger.error(f"💥 Error installing Python package: {str(e)}")
+        logger.error("💥 Error installing Python package: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/python/execute", methods=["POST"])
 def execute_python_script():
     """Execute a Python script in a virtual environment"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         script = params.get("script", "")
         env_name = params.get("env_name", "default")
         filename = params.get("filename", f"script_{int(time.time())}.py")
@@ -12248,36 +15157,36 @@ def execute_python_script():
         if not script:
             return jsonify({"error": "Script content is required"}), 400
         
-        # Create script file
-        script_result = file_manager.create_file(filename, script)
-        if not script_result["success"]:
-            return jsonify(script_result), 500
-        
         # Get Python path for environment
         python_path = env_manager.get_python_path(env_name)
-        script_path = script_result["path"]
-        
-        # Execute script
-        command = f"{python_path} {script_path}"
-        logger.info(f"🐍 Executing Python script in env {env_name}: {filename}")
-        result = execute_command(command, use_cache=False)
         
-        # Clean up script file
-        file_manager.delete_file(filename)
+        # Scripts run in the environment's persistent worker; when it is busy the script is
+        # piped to a one-off "python -". Nothing touches disk; filename only labels the run
+        logger.info("🐍 Executing Python script in env %s: %s", env_name, filename)
+        result = python_workers.run(python_path, script) if python_workers.available() else None
+        if result is None:
+            result = execute_command([python_path, "-"], use_cache=False, input_data=script.encode())
         
         result["env_name"] = env_name
         result["script_filename"] = filename
-        logger.info(f"📊 Python script execution completed")
+        logger.info("📊 Python script execution completed")
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"💥 Error executing Python script: {str(e)}")
+        logger.error("💥 Error executing Python script: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # ============================================================================
 # AI-POWERED PAYLOAD GENERATION (v5.0 ENHANCEMENT) UNDER DEVELOPMENT
 # ============================================================================
 
+# Characters _enhance_with_context percent-encodes for the url_encoded payload variant, in one pass
+PAYLOAD_URL_ENCODING = str.maketrans({" ": "%20", "<": "%3C", ">": "%3E"})
+
+# Risk indicators _assess_risk_level looks for, each set matched case-insensitively in a single scan
+PAYLOAD_HIGH_RISK_PATTERN = re.compile(r"system|exec|eval|cmd|shell|passwd|etc", re.IGNORECASE)
+PAYLOAD_MEDIUM_RISK_PATTERN = re.compile(r"script|alert|union|select", re.IGNORECASE)
+
 class AIPayloadGenerator:
     """AI-powered payload generation system with contextual intelligence"""
     
@@ -12354,6 +15263,16 @@ class AIPayloadGenerator:
                 ]
             }
         }
+        
+        # Flattened once: (attack type, complexity) -> payloads, and attack type -> its basic set
+        self._payloads_by_level = {
+            (attack_type, complexity): tuple(payloads)
+            for attack_type, levels in self.payload_templates.items()
+            for complexity, payloads in levels.items()
+        }
+        self._basic_payloads = {
+            attack_type: tuple(levels.get("basic", ())) for attack_type, levels in self.payload_templates.items()
+        }
     
     def generate_contextual_payload(self, target_info: Dict[str, Any]) -> Dict[str, Any]:
         """Generate contextual payloads based on target information"""
@@ -12380,37 +15299,38 @@ class AIPayloadGenerator:
             "recommendations": self._get_recommendations(attack_type)
         }
     
-    def _get_payloads(self, attack_type: str, complexity: str) -> list:
+    NO_PAYLOADS = ("<!-- No payloads available for this attack type -->",)
+    
+    def _get_payloads(self, attack_type: str, complexity: str) -> Tuple[str, ...]:
         """Get payloads for specific attack type and complexity"""
-        if attack_type in self.payload_templates:
-            if complexity in self.payload_templates[attack_type]:
-                return self.payload_templates[attack_type][complexity]
-            else:
-                # Return basic payloads if complexity not found
-                return self.payload_templates[attack_type].get("basic", [])
-        
-        return ["<!-- No payloads available for this attack type -->"]
+        payloads = self._payloads_by_level.get((attack_type, complexity))
+        if payloads is not None:
+            return payloads
+        # Fall back to the basic payloads if the complexity is not found
+        return self._basic_payloads.get(attack_type, self.NO_PAYLOADS)
     
     def _enhance_with_context(self, payloads: list, tech_context: str) -> list:
         """Enhance payloads with contextual information"""
         enhanced = []
         
         for payload in payloads:
+            # Both variants share the original payload's risk level
+            risk_level = self._assess_risk_level(payload)
+            
             # Basic payload
             enhanced.append({
                 "payload": payload,
                 "context": "basic",
                 "encoding": "none",
-                "risk_level": self._assess_risk_level(payload)
+                "risk_level": risk_level
             })
             
             # URL encoded version
-            url_encoded = payload.replace(" ", "%20").replace("<", "%3C").replace(">", "%3E")
             enhanced.append({
-                "payload": url_encoded,
+                "payload": payload.translate(PAYLOAD_URL_ENCODING),
                 "context": "url_encoded",
                 "encoding": "url",
-                "risk_level": self._assess_risk_level(payload)
+                "risk_level": risk_level
             })
         
         return enhanced
@@ -12419,70 +15339,70 @@ class AIPayloadGenerator:
         """Generate test cases for the payloads"""
         test_cases = []
         
+        expected_behavior = self._get_expected_behavior(attack_type)
+        
         for i, payload_info in enumerate(payloads[:5]):  # Limit to 5 test cases
             test_case = {
                 "id": f"test_{i+1}",
                 "payload": payload_info["payload"],
                 "method": "GET" if len(payload_info["payload"]) < 100 else "POST",
-                "expected_behavior": self._get_expected_behavior(attack_type),
+                "expected_behavior": expected_behavior,
                 "risk_level": payload_info["risk_level"]
             }
             test_cases.append(test_case)
         
         return test_cases
     
+    EXPECTED_BEHAVIORS = {
+        "xss": "JavaScript execution or popup alert",
+        "sqli": "Database error or data extraction",
+        "lfi": "File content disclosure",
+        "cmd_injection": "Command execution on server",
+        "ssti": "Template expression evaluation",
+        "xxe": "XML external entity processing"
+    }
+    
     def _get_expected_behavior(self, attack_type: str) -> str:
         """Get expected behavior for attack type"""
-        behaviors = {
-            "xss": "JavaScript execution or popup alert",
-            "sqli": "Database error or data extraction",
-            "lfi": "File content disclosure",
-            "cmd_injection": "Command execution on server",
-            "ssti": "Template expression evaluation",
-            "xxe": "XML external entity processing"
-        }
-        return behaviors.get(attack_type, "Unexpected application behavior")
+        return self.EXPECTED_BEHAVIORS.get(attack_type, "Unexpected application behavior")
     
     def _assess_risk_level(self, payload: str) -> str:
         """Assess risk level of payload"""
-        high_risk_indicators = ["system", "exec", "eval", "cmd", "shell", "passwd", "etc"]
-        medium_risk_indicators = ["script", "alert", "union", "select"]
-        
-        payload_lower = payload.lower()
-        
-        if any(indicator in payload_lower for indicator in high_risk_indicators):
+        if PAYLOAD_HIGH_RISK_PATTERN.search(payload):
             return "HIGH"
-        elif any(indicator in payload_lower for indicator in medium_risk_indicators):
+        elif PAYLOAD_MEDIUM_RISK_PATTERN.search(payload):
             return "MEDIUM"
         else:
             return "LOW"
     
+    RECOMMENDATIONS = {
+        "xss": (
+            "Test in different input fields and parameters",
+            "Try both reflected and stored XSS scenarios",
+            "Test with different browsers for compatibility"
+        ),
+        "sqli": (
+            "Test different SQL injection techniques",
+            "Try both error-based and blind injection",
+            "Test various database-specific payloads"
+        ),
+        "lfi": (
+            "Test various directory traversal depths",
+            "Try different encoding techniques",
+            "Test for log file inclusion"
+        ),
+        "cmd_injection": (
+            "Test different command separators",
+            "Try both direct and blind injection",
+            "Test with various payloads for different OS"
+        )
+    }
+    DEFAULT_RECOMMENDATIONS = ("Test thoroughly", "Monitor responses")
+    
     def _get_recommendations(self, attack_type: str) -> list:
         """Get testing recommendations"""
-        recommendations = {
-            "xss": [
-                "Test in different input fields and parameters",
-                "Try both reflected and stored XSS scenarios",
-                "Test with different browsers for compatibility"
-            ],
-            "sqli": [
-                "Test different SQL injection techniques",
-                "Try both error-based and blind injection",
-                "Test various database-specific payloads"
-            ],
-            "lfi": [
-                "Test various directory traversal depths",
-                "Try different encoding techniques",
-                "Test for log file inclusion"
-            ],
-            "cmd_injection": [
-                "Test different command separators",
-                "Try both direct and blind injection",
-                "Test with various payloads for different OS"
-            ]
-        }
-        
-        return recommendations.get(attack_type, ["Test thoroughly", "Monitor responses"])
+        # A fresh list per result, so callers can extend it without touching the shared tuples
+        return list(self.RECOMMENDATIONS.get(attack_type, self.DEFAULT_RECOMMENDATIONS))
 
 # Global AI payload generator
 ai_payload_generator = AIPayloadGenerator()
@@ -12491,7 +15411,7 @@ ai_payload_generator = AIPayloadGenerator()
 def ai_generate_payload():
     """Generate AI-powered contextual payloads for security testing"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target_info = {
             "attack_type": params.get("attack_type", "xss"),
             "complexity": params.get("complexity", "basic"),
@@ -12499,10 +15419,10 @@ def ai_generate_payload():
             "url": params.get("url", "")
         }
         
-        logger.info(f"🤖 Generating AI payloads for {target_info['attack_type']} attack")
+        logger.info("🤖 Generating AI payloads for %s attack", target_info['attack_type'])
         result = ai_payload_generator.generate_contextual_payload(target_info)
         
-        logger.info(f"✅ Generated {result['payload_count']} contextual payloads")
+        logger.info("✅ Generated %s contextual payloads", result['payload_count'])
         
         return jsonify({
             "success": True,
@@ -12511,7 +15431,7 @@ def ai_generate_payload():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in AI payload generation: {str(e)}")
+        logger.error("💥 Error in AI payload generation: %s", e)
         return jsonify({
             "success": False,
             "error": f"Server error: {str(e)}"
@@ -12521,7 +15441,7 @@ def ai_generate_payload():
 def ai_test_payload():
     """Test generated payload against target with AI analysis"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         payload = params.get("payload", "")
         target_url = params.get("target_url", "")
         method = params.get("method", "GET")
@@ -12532,7 +15452,7 @@ def ai_test_payload():
                 "error": "Payload and target_url are required"
             }), 400
         
-        logger.info(f"🧪 Testing AI-generated payload against {target_url}")
+        logger.info("🧪 Testing AI-generated payload against %s", target_url)
         
         # Create test command based on method and payload
         if method.upper() == "GET":
@@ -12559,7 +15479,7 @@ def ai_test_payload():
             ]
         }
         
-        logger.info(f"🔍 Payload test completed | Potential vuln: {analysis['potential_vulnerability']}")
+        logger.info("🔍 Payload test completed | Potential vuln: %s", analysis['potential_vulnerability'])
         
         return jsonify({
             "success": True,
@@ -12569,7 +15489,7 @@ def ai_test_payload():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in AI payload testing: {str(e)}")
+        logger.error("💥 Error in AI payload testing: %s", e)
         return jsonify({
             "success": False,
             "error": f"Server error: {str(e)}"
@@ -12579,11 +15499,45 @@ def ai_test_payload():
 # ADVANCED API TESTING TOOLS (v5.0 ENHANCEMENT)
 # ============================================================================
 
+# Shared keep-alive session for the API probes below (fuzzer, GraphQL, JWT, schema fetch), so repeated
+# requests to one host reuse a pooled connection instead of forking curl for a fresh TCP/TLS handshake.
+# Only the connection pools are shared: the cookie jar accepts nothing, so a Set-Cookie seen by one
+# scan is never replayed by another client's probes
+PROBE_TIMEOUT = 10
+probe_session = requests.Session()
+probe_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+probe_session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64))
+probe_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=64))
+
+# Endpoint x method probes api_fuzzer keeps in flight at once
+API_FUZZ_MAX_CONCURRENT = int(os.environ.get("HEXSTRIKE_API_FUZZ_CONCURRENCY", 32))
+
+def http_probe(method: str, url: str, **kwargs: Any) -> Optional[requests.Response]:
+    """Send one probe request through probe_session; None when the request itself fails"""
+    try:
+        return probe_session.request(method, url, timeout=PROBE_TIMEOUT, **kwargs)
+    except requests.RequestException as e:
+        logger.warning("⚠️  Probe %s %s failed: %s", method, url, e)
+        return None
+
+class Finding(NamedTuple):
+    """One vulnerability reported by graphql_scanner or jwt_analyzer, serialized with _asdict()"""
+    type: str
+    severity: str
+    description: str
+
+class SchemaIssue(NamedTuple):
+    """One security issue reported by api_schema_analyzer, serialized with _asdict()"""
+    endpoint: str
+    issue: str
+    severity: str
+    description: str
+
 @app.route("/api/tools/api_fuzzer", methods=["POST"])
 def api_fuzzer():
     """Advanced API endpoint fuzzing with intelligent parameter discovery"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         base_url = params.get("base_url", "")
         endpoints = params.get("endpoints", [])
         methods = params.get("methods", ["GET", "POST", "PUT", "DELETE"])
@@ -12591,26 +15545,32 @@ def api_fuzzer():
         
         if not base_url:
             logger.warning("🌐 API Fuzzer called without base_url parameter")
-            return jsonify({
-                "error": "Base URL parameter is required"
-            }), 400
+            return error_response(ERR_NO_BASE_URL)
         
         # Create comprehensive API fuzzing command
         if endpoints:
-            # Test specific endpoints
-            results = []
-            for endpoint in endpoints:
-                for method in methods:
-                    test_url = f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-                    command = f"curl -s -X {method} -w '%{{http_code}}|%{{size_download}}' '{test_url}'"
-                    result = execute_command(command, use_cache=False)
-                    results.append({
-                        "endpoint": endpoint,
-                        "method": method,
-                        "result": result
-                    })
+            # Test specific endpoints; the probes only wait on the network, so they run side by side
+            tasks = [(endpoint, method) for endpoint in endpoints for method in methods]
+            
+            def probe(task):
+                endpoint, method = task
+                response = http_probe(method, f"{base_url.rstrip('/')}/{endpoint.lstrip('/')}")
+                return {
+                    "endpoint": endpoint,
+                    "method": method,
+                    "result": {
+                        "success": response is not None,
+                        "status_code": response.status_code if response is not None else None,
+                        "size_download": len(response.content) if response is not None else 0,
+                        "stdout": response.text if response is not None else ""
+                    }
+                }
             
-            logger.info(f"🔍 API endpoint testing completed for {len(endpoints)} endpoints")
+            workers = max(1, min(API_FUZZ_MAX_CONCURRENT, len(tasks)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hexstrike-apifuzz") as pool:
+                results = list(pool.map(probe, tasks))
+            
+            logger.info("🔍 API endpoint testing completed for %s endpoints", len(endpoints))
             return jsonify({
                 "success": True,
                 "fuzzing_type": "endpoint_testing",
@@ -12620,9 +15580,9 @@ def api_fuzzer():
             # Discover endpoints using wordlist
             command = f"ffuf -u {base_url}/FUZZ -w {wordlist} -mc 200,201,202,204,301,302,307,401,403,405 -t 50"
             
-            logger.info(f"🔍 Starting API endpoint discovery: {base_url}")
+            logger.info("🔍 Starting API endpoint discovery: %s", base_url)
             result = execute_command(command)
-            logger.info(f"📊 API endpoint discovery completed")
+            logger.info("📊 API endpoint discovery completed")
             
             return jsonify({
                 "success": True,
@@ -12631,7 +15591,7 @@ def api_fuzzer():
             })
         
     except Exception as e:
-        logger.error(f"💥 Error in API fuzzer: {str(e)}")
+        logger.error("💥 Error in API fuzzer: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -12640,7 +15600,7 @@ def api_fuzzer():
 def graphql_scanner():
     """Advanced GraphQL security scanning and introspection"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         endpoint = params.get("endpoint", "")
         introspection = params.get("introspection", True)
         query_depth = params.get("query_depth", 10)
@@ -12648,11 +15608,9 @@ def graphql_scanner():
         
         if not endpoint:
             logger.warning("🌐 GraphQL Scanner called without endpoint parameter")
-            return jsonify({
-                "error": "GraphQL endpoint parameter is required"
-            }), 400
+            return error_response(ERR_NO_GRAPHQL_ENDPOINT)
         
-        logger.info(f"🔍 Starting GraphQL security scan: {endpoint}")
+        logger.info("🔍 Starting GraphQL security scan: %s", endpoint)
         
         results = {
             "endpoint": endpoint,
@@ -12680,45 +15638,32 @@ def graphql_scanner():
             '''
             
             clean_query = introspection_query.replace('\n', ' ').replace('  ', ' ').strip()
-            command = f"curl -s -X POST -H 'Content-Type: application/json' -d '{{\"query\":\"{clean_query}\"}}' '{endpoint}'"
-            result = execute_command(command, use_cache=False)
+            response = http_probe("POST", endpoint, json={"query": clean_query})
             
             results["tests_performed"].append("introspection_query")
             
-            if "data" in result.get("stdout", ""):
-                results["vulnerabilities"].append({
-                    "type": "introspection_enabled",
-                    "severity": "MEDIUM",
-                    "description": "GraphQL introspection is enabled"
-                })
+            if response is not None and "data" in response.text:
+                results["vulnerabilities"].append(Finding(
+                    "introspection_enabled", "MEDIUM", "GraphQL introspection is enabled"))
         
         # Test 2: Query depth analysis
         deep_query = "{ " * query_depth + "field" + " }" * query_depth
-        command = f"curl -s -X POST -H 'Content-Type: application/json' -d '{{\"query\":\"{deep_query}\"}}' {endpoint}"
-        depth_result = execute_command(command, use_cache=False)
+        depth_response = http_probe("POST", endpoint, json={"query": deep_query})
         
         results["tests_performed"].append("query_depth_analysis")
         
-        if "error" not in depth_result.get("stdout", "").lower():
-            results["vulnerabilities"].append({
-                "type": "no_query_depth_limit",
-                "severity": "HIGH",
-                "description": f"No query depth limiting detected (tested depth: {query_depth})"
-            })
+        if depth_response is not None and "error" not in depth_response.text.lower():
+            results["vulnerabilities"].append(Finding(
+                "no_query_depth_limit", "HIGH", f"No query depth limiting detected (tested depth: {query_depth})"))
         
         # Test 3: Batch query testing
-        batch_query = '[' + ','.join(['{\"query\":\"{field}\"}' for _ in range(10)]) + ']'
-        command = f"curl -s -X POST -H 'Content-Type: application/json' -d '{batch_query}' {endpoint}"
-        batch_result = execute_command(command, use_cache=False)
+        batch_response = http_probe("POST", endpoint, json=[{"query": "{field}"}] * 10)
         
         results["tests_performed"].append("batch_query_testing")
         
-        if "data" in batch_result.get("stdout", "") and batch_result.get("success"):
-            results["vulnerabilities"].append({
-                "type": "batch_queries_allowed",
-                "severity": "MEDIUM",
-                "description": "Batch queries are allowed without rate limiting"
-            })
+        if batch_response is not None and "data" in batch_response.text:
+            results["vulnerabilities"].append(Finding(
+                "batch_queries_allowed", "MEDIUM", "Batch queries are allowed without rate limiting"))
         
         # Generate recommendations
         if results["vulnerabilities"]:
@@ -12730,7 +15675,8 @@ def graphql_scanner():
                 "Add authentication for sensitive operations"
             ]
         
-        logger.info(f"📊 GraphQL scan completed | Vulnerabilities found: {len(results['vulnerabilities'])}")
+        logger.info("📊 GraphQL scan completed | Vulnerabilities found: %s", len(results['vulnerabilities']))
+        results["vulnerabilities"] = [finding._asdict() for finding in results["vulnerabilities"]]
         
         return jsonify({
             "success": True,
@@ -12738,26 +15684,32 @@ def graphql_scanner():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in GraphQL scanner: {str(e)}")
+        logger.error("💥 Error in GraphQL scanner: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
 
+# Unpadded base64url header of an alg=none token, as the JWT spec encodes it
+JWT_NONE_HEADER = base64.urlsafe_b64encode(b'{"alg":"none","typ":"JWT"}').rstrip(b"=").decode()
+
+def decode_jwt_segment(segment: str) -> Any:
+    """Decode one base64url JWT segment (header or payload), restoring the padding JWTs strip"""
+    raw = segment.encode()
+    return app.json.loads(base64.urlsafe_b64decode(raw + b"=" * (-len(raw) % 4)))
+
 @app.route("/api/tools/jwt_analyzer", methods=["POST"])
 def jwt_analyzer():
     """Advanced JWT token analysis and vulnerability testing"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         jwt_token = params.get("jwt_token", "")
         target_url = params.get("target_url", "")
         
         if not jwt_token:
             logger.warning("🔐 JWT Analyzer called without jwt_token parameter")
-            return jsonify({
-                "error": "JWT token parameter is required"
-            }), 400
+            return error_response(ERR_NO_JWT_TOKEN)
         
-        logger.info(f"🔍 Starting JWT security analysis")
+        logger.info("🔍 Starting JWT security analysis")
         
         results = {
             "token": jwt_token[:50] + "..." if len(jwt_token) > 50 else jwt_token,
@@ -12770,17 +15722,9 @@ def jwt_analyzer():
         try:
             parts = jwt_token.split('.')
             if len(parts) >= 2:
-                # Decode header
-                import base64
-                import json
-                
-                # Add padding if needed
-                header_b64 = parts[0] + '=' * (4 - len(parts[0]) % 4)
-                payload_b64 = parts[1] + '=' * (4 - len(parts[1]) % 4)
-                
                 try:
-                    header = json.loads(base64.b64decode(header_b64))
-                    payload = json.loads(base64.b64decode(payload_b64))
+                    header = decode_jwt_segment(parts[0])
+                    payload = decode_jwt_segment(parts[1])
                     
                     results["token_info"] = {
                         "header": header,
@@ -12792,42 +15736,26 @@ def jwt_analyzer():
                     algorithm = header.get("alg", "").lower()
                     
                     if algorithm == "none":
-                        results["vulnerabilities"].append({
-                            "type": "none_algorithm",
-                            "severity": "CRITICAL",
-                            "description": "JWT uses 'none' algorithm - no signature verification"
-                        })
+                        results["vulnerabilities"].append(Finding(
+                            "none_algorithm", "CRITICAL", "JWT uses 'none' algorithm - no signature verification"))
                     
                     if algorithm in ["hs256", "hs384", "hs512"]:
                         results["attack_vectors"].append("hmac_key_confusion")
-                        results["vulnerabilities"].append({
-                            "type": "hmac_algorithm",
-                            "severity": "MEDIUM",
-                            "description": "HMAC algorithm detected - vulnerable to key confusion attacks"
-                        })
+                        results["vulnerabilities"].append(Finding(
+                            "hmac_algorithm", "MEDIUM", "HMAC algorithm detected - vulnerable to key confusion attacks"))
                     
                     # Check token expiration
                     exp = payload.get("exp")
                     if not exp:
-                        results["vulnerabilities"].append({
-                            "type": "no_expiration",
-                            "severity": "HIGH",
-                            "description": "JWT token has no expiration time"
-                        })
+                        results["vulnerabilities"].append(Finding(
+                            "no_expiration", "HIGH", "JWT token has no expiration time"))
                     
                 except Exception as decode_error:
-                    results["vulnerabilities"].append({
-                        "type": "malformed_token",
-                        "severity": "HIGH",
-                        "description": f"Token decoding failed: {str(decode_error)}"
-                    })
+                    results["vulnerabilities"].append(Finding(
+                        "malformed_token", "HIGH", f"Token decoding failed: {str(decode_error)}"))
         
         except Exception as e:
-            results["vulnerabilities"].append({
-                "type": "invalid_format",
-                "severity": "HIGH",
-                "description": "Invalid JWT token format"
-            })
+            results["vulnerabilities"].append(Finding("invalid_format", "HIGH", "Invalid JWT token format"))
         
         # Test token manipulation if target URL provided
         if target_url:
@@ -12835,20 +15763,19 @@ def jwt_analyzer():
             none_token_parts = jwt_token.split('.')
             if len(none_token_parts) >= 2:
                 # Create none algorithm token
-                none_header = base64.b64encode('{"alg":"none","typ":"JWT"}'.encode()).decode().rstrip('=')
-                none_token = f"{none_header}.{none_token_parts[1]}."
+                none_token = f"{JWT_NONE_HEADER}.{none_token_parts[1]}."
                 
-                command = f"curl -s -H 'Authorization: Bearer {none_token}' '{target_url}'"
-                none_result = execute_command(command, use_cache=False)
+                # Only a 200 the unauthenticated baseline does not get shows the forged token was accepted
+                baseline_response = http_probe("GET", target_url)
+                none_response = http_probe("GET", target_url, headers={"Authorization": f"Bearer {none_token}"})
                 
-                if "200" in none_result.get("stdout", "") or "success" in none_result.get("stdout", "").lower():
-                    results["vulnerabilities"].append({
-                        "type": "none_algorithm_accepted",
-                        "severity": "CRITICAL",
-                        "description": "Server accepts tokens with 'none' algorithm"
-                    })
+                if (baseline_response is not None and none_response is not None
+                        and none_response.status_code == 200 and baseline_response.status_code != 200):
+                    results["vulnerabilities"].append(Finding(
+                        "none_algorithm_accepted", "CRITICAL", "Server accepts tokens with 'none' algorithm"))
         
-        logger.info(f"📊 JWT analysis completed | Vulnerabilities found: {len(results['vulnerabilities'])}")
+        logger.info("📊 JWT analysis completed | Vulnerabilities found: %s", len(results['vulnerabilities']))
+        results["vulnerabilities"] = [finding._asdict() for finding in results["vulnerabilities"]]
         
         return jsonify({
             "success": True,
@@ -12856,37 +15783,35 @@ def jwt_analyzer():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in JWT analyzer: {str(e)}")
+        logger.error("💥 Error in JWT analyzer: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
 
+# Parameter names api_schema_analyzer reports as sensitive, matched case-insensitively in one scan
+SENSITIVE_PARAMETER_PATTERN = re.compile(r"password|token|key|secret", re.IGNORECASE)
+
+SCHEMA_PARSE_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson is not None else (json.JSONDecodeError,)
+
 @app.route("/api/tools/api_schema_analyzer", methods=["POST"])
 def api_schema_analyzer():
     """Analyze API schemas and identify potential security issues"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         schema_url = params.get("schema_url", "")
         schema_type = params.get("schema_type", "openapi")  # openapi, swagger, graphql
         
         if not schema_url:
             logger.warning("📋 API Schema Analyzer called without schema_url parameter")
-            return jsonify({
-                "error": "Schema URL parameter is required"
-            }), 400
+            return error_response(ERR_NO_SCHEMA_URL)
         
-        logger.info(f"🔍 Starting API schema analysis: {schema_url}")
+        logger.info("🔍 Starting API schema analysis: %s", schema_url)
         
-        # Fetch schema
-        command = f"curl -s '{schema_url}'"
-        result = execute_command(command, use_cache=True)
+        # Fetch schema; the body is read as it is parsed
+        response = http_probe("GET", schema_url, stream=True)
         
-        if not result.get("success"):
-            return jsonify({
-                "error": "Failed to fetch API schema"
-            }), 400
-        
-        schema_content = result.get("stdout", "")
+        if response is None:
+            return error_response(ERR_SCHEMA_FETCH_FAILED)
         
         analysis_results = {
             "schema_url": schema_url,
@@ -12898,44 +15823,43 @@ def api_schema_analyzer():
         
         # Parse schema based on type
         try:
-            import json
-            schema_data = json.loads(schema_content)
-            
             if schema_type.lower() in ["openapi", "swagger"]:
-                # OpenAPI/Swagger analysis
-                paths = schema_data.get("paths", {})
-                
-                for path, methods in paths.items():
-                    for method, details in methods.items():
-                        if isinstance(details, dict):
-                            endpoint_info = {
-                                "path": path,
-                                "method": method.upper(),
-                                "summary": details.get("summary", ""),
-                                "parameters": details.get("parameters", []),
-                                "security": details.get("security", [])
-                            }
-                            analysis_results["endpoints_found"].append(endpoint_info)
-                            
-                            # Check for security issues
-                            if not endpoint_info["security"]:
-                                analysis_results["security_issues"].append({
-                                    "endpoint": f"{method.upper()} {path}",
-                                    "issue": "no_authentication",
-                                    "severity": "MEDIUM",
-                                    "description": "Endpoint has no authentication requirements"
-                                })
-                            
-                            # Check for sensitive data in parameters
-                            for param in endpoint_info["parameters"]:
-                                param_name = param.get("name", "").lower()
-                                if any(sensitive in param_name for sensitive in ["password", "token", "key", "secret"]):
-                                    analysis_results["security_issues"].append({
-                                        "endpoint": f"{method.upper()} {path}",
-                                        "issue": "sensitive_parameter",
-                                        "severity": "HIGH",
-                                        "description": f"Sensitive parameter detected: {param_name}"
-                                    })
+                # OpenAPI/Swagger analysis. With ijson the path items are decoded one at a time,
+                # so multi-megabyte specs never hold their components/definitions in memory
+                if ijson is not None:
+                    response.raw.decode_content = True
+                    paths = ijson.kvitems(response.raw, "paths", use_float=True)
+                else:
+                    paths = json.loads(response.text).get("paths", {}).items()
+            else:
+                json.loads(response.text)
+                paths = ()
+            
+            for path, methods in paths:
+                for method, details in methods.items():
+                    if isinstance(details, dict):
+                        endpoint_info = {
+                            "path": path,
+                            "method": method.upper(),
+                            "summary": details.get("summary", ""),
+                            "parameters": details.get("parameters", []),
+                            "security": details.get("security", [])
+                        }
+                        analysis_results["endpoints_found"].append(endpoint_info)
+                        
+                        # Check for security issues
+                        if not endpoint_info["security"]:
+                            analysis_results["security_issues"].append(SchemaIssue(
+                                f"{method.upper()} {path}", "no_authentication", "MEDIUM",
+                                "Endpoint has no authentication requirements"))
+                        
+                        # Check for sensitive data in parameters
+                        for param in endpoint_info["parameters"]:
+                            param_name = param.get("name", "")
+                            if SENSITIVE_PARAMETER_PATTERN.search(param_name):
+                                analysis_results["security_issues"].append(SchemaIssue(
+                                    f"{method.upper()} {path}", "sensitive_parameter", "HIGH",
+                                    f"Sensitive parameter detected: {param_name.lower()}"))
             
             # Generate recommendations
             if analysis_results["security_issues"]:
@@ -12948,15 +15872,14 @@ def api_schema_analyzer():
                     "Use secure headers (CORS, CSP, etc.)"
                 ]
             
-        except json.JSONDecodeError:
-            analysis_results["security_issues"].append({
-                "endpoint": "schema",
-                "issue": "invalid_json",
-                "severity": "HIGH",
-                "description": "Schema is not valid JSON"
-            })
+        except SCHEMA_PARSE_ERRORS:
+            analysis_results["security_issues"].append(SchemaIssue(
+                "schema", "invalid_json", "HIGH", "Schema is not valid JSON"))
+        finally:
+            response.close()
         
-        logger.info(f"📊 Schema analysis completed | Issues found: {len(analysis_results['security_issues'])}")
+        logger.info("📊 Schema analysis completed | Issues found: %s", len(analysis_results['security_issues']))
+        analysis_results["security_issues"] = [issue._asdict() for issue in analysis_results["security_issues"]]
         
         return jsonify({
             "success": True,
@@ -12964,7 +15887,7 @@ def api_schema_analyzer():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in API schema analyzer: {str(e)}")
+        logger.error("💥 Error in API schema analyzer: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -12977,7 +15900,7 @@ def api_schema_analyzer():
 def volatility3():
     """Execute Volatility3 for advanced memory forensics with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         memory_file = params.get("memory_file", "")
         plugin = params.get("plugin", "")
         output_file = params.get("output_file", "")
@@ -12995,20 +15918,13 @@ def volatility3():
                 "error": "Plugin parameter is required"
             }), 400
         
-        command = f"vol.py -f {memory_file} {plugin}"
+        command = build_argv(["vol.py", "-f", memory_file, plugin], {"-o": output_file}, extra=additional_args)
         
-        if output_file:
-            command += f" -o {output_file}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-        
-        logger.info(f"🧠 Starting Volatility3 analysis: {plugin}")
+        logger.info("🧠 Starting Volatility3 analysis: %s", plugin)
         result = execute_command(command)
-        logger.info(f"📊 Volatility3 analysis completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in volatility3 endpoint: {str(e)}")
+        logger.error("💥 Error in volatility3 endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -13017,7 +15933,7 @@ def volatility3():
 def foremost():
     """Execute Foremost for file carving with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         input_file = params.get("input_file", "")
         output_dir = params.get("output_dir", "/tmp/foremost_output")
         file_types = params.get("file_types", "")
@@ -13032,23 +15948,15 @@ def foremost():
         # Ensure output directory exists
         Path(output_dir).mkdir(parents=True, exist_ok=True)
         
-        command = f"foremost -o {output_dir}"
-        
-        if file_types:
-            command += f" -t {file_types}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-            
-        command += f" {input_file}"
+        command = build_argv(["foremost", "-o", output_dir], {"-t": file_types}, extra=additional_args) + [input_file]
         
-        logger.info(f"📁 Starting Foremost file carving: {input_file}")
+        logger.info("📁 Starting Foremost file carving: %s", input_file)
         result = execute_command(command)
         result["output_directory"] = output_dir
-        logger.info(f"📊 Foremost carving completed")
+        logger.info("📊 Foremost carving completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in foremost endpoint: {str(e)}")
+        logger.error("💥 Error in foremost endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -13057,7 +15965,7 @@ def foremost():
 def steghide():
     """Execute Steghide for steganography analysis with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         action = params.get("action", "extract")  # extract, embed, info
         cover_file = params.get("cover_file", "")
         embed_file = params.get("embed_file", "")
@@ -13072,32 +15980,24 @@ def steghide():
             }), 400
         
         if action == "extract":
-            command = f"steghide extract -sf {cover_file}"
-            if output_file:
-                command += f" -xf {output_file}"
+            action_argv = build_argv(["steghide", "extract", "-sf", cover_file], {"-xf": output_file})
         elif action == "embed":
             if not embed_file:
                 return jsonify({"error": "Embed file required for embed action"}), 400
-            command = f"steghide embed -cf {cover_file} -ef {embed_file}"
+            action_argv = ["steghide", "embed", "-cf", cover_file, "-ef", embed_file]
         elif action == "info":
-            command = f"steghide info {cover_file}"
+            action_argv = ["steghide", "info", cover_file]
         else:
             return jsonify({"error": "Invalid action. Use: extract, embed, info"}), 400
-            
-        if passphrase:
-            command += f" -p {passphrase}"
-        else:
-            command += " -p ''"  # Empty passphrase
-            
-        if additional_args:
-            command += f" {additional_args}"
         
-        logger.info(f"🖼️ Starting Steghide {action}: {cover_file}")
+        # An empty passphrase is passed explicitly so steghide never prompts for one
+        command = build_argv([*action_argv, "-p", passphrase], extra=additional_args)
+        
+        logger.info("🖼️ Starting Steghide %s: %s", action, cover_file)
         result = execute_command(command)
-        logger.info(f"📊 Steghide {action} completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in steghide endpoint: {str(e)}")
+        logger.error("💥 Error in steghide endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -13106,7 +16006,7 @@ def steghide():
 def exiftool():
     """Execute ExifTool for metadata extraction with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         file_path = params.get("file_path", "")
         output_format = params.get("output_format", "")  # json, xml, csv
         tags = params.get("tags", "")
@@ -13118,25 +16018,14 @@ def exiftool():
                 "error": "File path parameter is required"
             }), 400
         
-        command = f"exiftool"
+        command = build_argv(["exiftool"], positional=(output_format and f"-{output_format}", tags and f"-{tags}"),
+                             extra=additional_args) + [file_path]
         
-        if output_format:
-            command += f" -{output_format}"
-            
-        if tags:
-            command += f" -{tags}"
-            
-        if additional_args:
-            command += f" {additional_args}"
-            
-        command += f" {file_path}"
-        
-        logger.info(f"📷 Starting ExifTool analysis: {file_path}")
+        logger.info("📷 Starting ExifTool analysis: %s", file_path)
         result = execute_command(command)
-        logger.info(f"📊 ExifTool analysis completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in exiftool endpoint: {str(e)}")
+        logger.error("💥 Error in exiftool endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -13145,7 +16034,7 @@ def exiftool():
 def hashpump():
     """Execute HashPump for hash length extension attacks with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         signature = params.get("signature", "")
         data = params.get("data", "")
         key_length = params.get("key_length", "")
@@ -13163,12 +16052,11 @@ def hashpump():
         if additional_args:
             command += f" {additional_args}"
         
-        logger.info(f"🔐 Starting HashPump attack")
+        logger.info("🔐 Starting HashPump attack")
         result = execute_command(command)
-        logger.info(f"📊 HashPump attack completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in hashpump endpoint: {str(e)}")
+        logger.error("💥 Error in hashpump endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -13181,7 +16069,7 @@ def hashpump():
 def hakrawler():
     """Execute Hakrawler for web endpoint discovery with enhanced logging"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         url = params.get("url", "")
         depth = params.get("depth", 2)
         forms = params.get("forms", True)
@@ -13192,30 +16080,23 @@ def hakrawler():
         
         if not url:
             logger.warning("🕷️ Hakrawler called without URL parameter")
-            return jsonify({
-                "error": "URL parameter is required"
-            }), 400
+            return error_response(ERR_NO_URL)
         
-        command = f"hakrawler -url {url} -depth {depth}"
+        if not URL_PATTERN.fullmatch(url):
+            return error_response(ERR_MALFORMED_URL)
         
-        if forms:
-            command += " -forms"
-        if robots:
-            command += " -robots"
-        if sitemap:
-            command += " -sitemap"
-        if wayback:
-            command += " -wayback"
-            
-        if additional_args:
-            command += f" {additional_args}"
+        command = build_argv(["hakrawler", "-url", url, "-depth", depth],
+                             {"-forms": bool(forms), "-robots": bool(robots), "-sitemap": bool(sitemap), "-wayback": bool(wayback)},
+                             extra=additional_args)
+        
+        logger.info("🕷️ Starting Hakrawler crawling: %s", url)
+        if wants_stream():
+            return stream_command_response(command)
         
-        logger.info(f"🕷️ Starting Hakrawler crawling: {url}")
         result = execute_command(command)
-        logger.info(f"📊 Hakrawler crawling completed")
         return jsonify(result)
     except Exception as e:
-        logger.error(f"💥 Error in hakrawler endpoint: {str(e)}")
+        logger.error("💥 Error in hakrawler endpoint: %s", e)
         return jsonify({
             "error": f"Server error: {str(e)}"
         }), 500
@@ -13228,12 +16109,12 @@ def hakrawler():
 def cve_monitor():
     """Monitor CVE databases for new vulnerabilities with AI analysis"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         hours = params.get("hours", 24)
         severity_filter = params.get("severity_filter", "HIGH,CRITICAL")
         keywords = params.get("keywords", "")
         
-        logger.info(f"🔍 Monitoring CVE feeds for last {hours} hours with severity filter: {severity_filter}")
+        logger.info("🔍 Monitoring CVE feeds for last %s hours with severity filter: %s", hours, severity_filter)
         
         # Fetch latest CVEs
         cve_results = cve_intelligence.fetch_latest_cves(hours, severity_filter)
@@ -13268,11 +16149,11 @@ def cve_monitor():
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"📊 CVE monitoring completed | Found: {len(cve_results.get('cves', []))} CVEs")
+        logger.info("📊 CVE monitoring completed | Found: %s CVEs", len(cve_results.get('cves', [])))
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"💥 Error in CVE monitoring: {str(e)}")
+        logger.error("💥 Error in CVE monitoring: %s", e)
         return jsonify({
             "success": False,
             "error": f"Server error: {str(e)}"
@@ -13282,7 +16163,7 @@ def cve_monitor():
 def exploit_generate():
     """Generate exploits from vulnerability data using AI"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         cve_id = params.get("cve_id", "")
         target_os = params.get("target_os", "")
         target_arch = params.get("target_arch", "x64")
@@ -13307,7 +16188,7 @@ def exploit_generate():
                 "error": "CVE ID parameter is required"
             }), 400
         
-        logger.info(f"🤖 Generating exploit for {cve_id} | Target: {target_os} {target_arch}")
+        logger.info("🤖 Generating exploit for %s | Target: %s %s", cve_id, target_os, target_arch)
         
         # First analyze the CVE for context
         cve_analysis = cve_intelligence.analyze_cve_exploitability(cve_id)
@@ -13341,11 +16222,11 @@ def exploit_generate():
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"🎯 Exploit generation completed for {cve_id}")
+        logger.info("🎯 Exploit generation completed for %s", cve_id)
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"💥 Error in exploit generation: {str(e)}")
+        logger.error("💥 Error in exploit generation: %s", e)
         return jsonify({
             "success": False,
             "error": f"Server error: {str(e)}"
@@ -13355,7 +16236,7 @@ def exploit_generate():
 def discover_attack_chains():
     """Discover multi-stage attack possibilities"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target_software = params.get("target_software", "")
         attack_depth = params.get("attack_depth", 3)
         include_zero_days = params.get("include_zero_days", False)
@@ -13367,7 +16248,7 @@ def discover_attack_chains():
                 "error": "Target software parameter is required"
             }), 400
         
-        logger.info(f"🔗 Discovering attack chains for {target_software} | Depth: {attack_depth}")
+        logger.info("🔗 Discovering attack chains for %s | Depth: %s", target_software, attack_depth)
         
         # Discover attack chains
         chain_results = vulnerability_correlator.find_attack_chains(target_software, attack_depth)
@@ -13418,11 +16299,11 @@ def discover_attack_chains():
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"🎯 Attack chain discovery completed | Found: {len(chain_results.get('attack_chains', []))} chains")
+        logger.info("🎯 Attack chain discovery completed | Found: %s chains", len(chain_results.get('attack_chains', [])))
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"💥 Error in attack chain discovery: {str(e)}")
+        logger.error("💥 Error in attack chain discovery: %s", e)
         return jsonify({
             "success": False,
             "error": f"Server error: {str(e)}"
@@ -13432,7 +16313,7 @@ def discover_attack_chains():
 def threat_intelligence_feeds():
     """Aggregate and correlate threat intelligence from multiple sources"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         indicators = params.get("indicators", [])
         timeframe = params.get("timeframe", "30d")
         sources = params.get("sources", "all")
@@ -13447,7 +16328,7 @@ def threat_intelligence_feeds():
                 "error": "Indicators parameter is required"
             }), 400
         
-        logger.info(f"🧠 Correlating threat intelligence for {len(indicators)} indicators")
+        logger.info("🧠 Correlating threat intelligence for %s indicators", len(indicators))
         
         correlation_results = {
             "indicators_analyzed": indicators,
@@ -13491,7 +16372,7 @@ def threat_intelligence_feeds():
                     correlation_results["threat_score"] += 25
                     
             except Exception as e:
-                logger.warning(f"Error analyzing CVE {cve_id}: {str(e)}")
+                logger.warning("Error analyzing CVE %s: %s", cve_id, e)
         
         # Process IP indicators (basic reputation check simulation)
         for ip in ip_indicators:
@@ -13553,11 +16434,11 @@ def threat_intelligence_feeds():
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"🎯 Threat intelligence correlation completed | Threat Score: {correlation_results['threat_score']:.1f}")
+        logger.info("🎯 Threat intelligence correlation completed | Threat Score: %.1f", correlation_results['threat_score'])
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"💥 Error in threat intelligence: {str(e)}")
+        logger.error("💥 Error in threat intelligence: %s", e)
         return jsonify({
             "success": False,
             "error": f"Server error: {str(e)}"
@@ -13567,7 +16448,7 @@ def threat_intelligence_feeds():
 def zero_day_research():
     """Automated zero-day vulnerability research using AI analysis"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         target_software = params.get("target_software", "")
         analysis_depth = params.get("analysis_depth", "standard")
         source_code_url = params.get("source_code_url", "")
@@ -13579,7 +16460,7 @@ def zero_day_research():
                 "error": "Target software parameter is required"
             }), 400
         
-        logger.info(f"🔬 Starting zero-day research for {target_software} | Depth: {analysis_depth}")
+        logger.info("🔬 Starting zero-day research for %s | Depth: %s", target_software, analysis_depth)
         
         research_results = {
             "target_software": target_software,
@@ -13692,11 +16573,11 @@ def zero_day_research():
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"🎯 Zero-day research completed | Risk Score: {research_results['risk_assessment']['risk_score']}")
+        logger.info("🎯 Zero-day research completed | Risk Score: %s", research_results['risk_assessment']['risk_score'])
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"💥 Error in zero-day research: {str(e)}")
+        logger.error("💥 Error in zero-day research: %s", e)
         return jsonify({
             "success": False,
             "error": f"Server error: {str(e)}"
@@ -13706,7 +16587,7 @@ def zero_day_research():
 def advanced_payload_generation():
     """Generate advanced payloads with AI-powered evasion techniques"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         attack_type = params.get("attack_type", "rce")
         target_context = params.get("target_context", "")
         evasion_level = params.get("evasion_level", "standard")
@@ -13719,7 +16600,7 @@ def advanced_payload_generation():
                 "error": "Attack type parameter is required"
             }), 400
         
-        logger.info(f"🎯 Generating advanced {attack_type} payload with {evasion_level} evasion")
+        logger.info("🎯 Generating advanced %s payload with %s evasion", attack_type, evasion_level)
         
         # Enhanced payload generation with contextual AI
         target_info = {
@@ -13830,11 +16711,11 @@ def advanced_payload_generation():
             "timestamp": datetime.now().isoformat()
         }
         
-        logger.info(f"🎯 Advanced payload generation completed | Generated: {len(advanced_payloads)} payloads")
+        logger.info("🎯 Advanced payload generation completed | Generated: %s payloads", len(advanced_payloads))
         return jsonify(result)
         
     except Exception as e:
-        logger.error(f"💥 Error in advanced payload generation: {str(e)}")
+        logger.error("💥 Error in advanced payload generation: %s", e)
         return jsonify({
             "success": False,
             "error": f"Server error: {str(e)}"
@@ -13848,7 +16729,7 @@ def advanced_payload_generation():
 def create_ctf_challenge_workflow():
     """Create specialized workflow for CTF challenge"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         challenge_name = params.get("name", "")
         category = params.get("category", "misc")
         difficulty = params.get("difficulty", "unknown")
@@ -13872,7 +16753,7 @@ def create_ctf_challenge_workflow():
         # Generate workflow
         workflow = ctf_manager.create_ctf_challenge_workflow(challenge)
         
-        logger.info(f"🎯 CTF workflow created for {challenge_name} | Category: {category} | Difficulty: {difficulty}")
+        logger.info("🎯 CTF workflow created for %s | Category: %s | Difficulty: %s", challenge_name, category, difficulty)
         return jsonify({
             "success": True,
             "workflow": workflow,
@@ -13881,14 +16762,14 @@ def create_ctf_challenge_workflow():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating CTF workflow: {str(e)}")
+        logger.error("💥 Error creating CTF workflow: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/ctf/auto-solve-challenge", methods=["POST"])
 def auto_solve_ctf_challenge():
     """Attempt to automatically solve a CTF challenge"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         challenge_name = params.get("name", "")
         category = params.get("category", "misc")
         difficulty = params.get("difficulty", "unknown")
@@ -13912,7 +16793,7 @@ def auto_solve_ctf_challenge():
         # Attempt automated solving
         result = ctf_automator.auto_solve_challenge(challenge)
         
-        logger.info(f"🤖 CTF auto-solve attempted for {challenge_name} | Status: {result['status']}")
+        logger.info("🤖 CTF auto-solve attempted for %s | Status: %s", challenge_name, result['status'])
         return jsonify({
             "success": True,
             "solve_result": result,
@@ -13921,14 +16802,14 @@ def auto_solve_ctf_challenge():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in CTF auto-solve: {str(e)}")
+        logger.error("💥 Error in CTF auto-solve: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/ctf/team-strategy", methods=["POST"])
 def create_ctf_team_strategy():
     """Create optimal team strategy for CTF competition"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         challenges_data = params.get("challenges", [])
         team_skills = params.get("team_skills", {})
         
@@ -13951,7 +16832,7 @@ def create_ctf_team_strategy():
         # Generate team strategy
         strategy = ctf_coordinator.optimize_team_strategy(challenges, team_skills)
         
-        logger.info(f"👥 CTF team strategy created | Challenges: {len(challenges)} | Team members: {len(team_skills)}")
+        logger.info("👥 CTF team strategy created | Challenges: %s | Team members: %s", len(challenges), len(team_skills))
         return jsonify({
             "success": True,
             "strategy": strategy,
@@ -13961,14 +16842,14 @@ def create_ctf_team_strategy():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error creating CTF team strategy: {str(e)}")
+        logger.error("💥 Error creating CTF team strategy: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/ctf/suggest-tools", methods=["POST"])
 def suggest_ctf_tools():
     """Suggest optimal tools for CTF challenge based on description and category"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         description = params.get("description", "")
         category = params.get("category", "misc")
         
@@ -13987,7 +16868,7 @@ def suggest_ctf_tools():
             except:
                 tool_commands[tool] = f"{tool} TARGET"
         
-        logger.info(f"🔧 CTF tools suggested | Category: {category} | Tools: {len(suggested_tools)}")
+        logger.info("🔧 CTF tools suggested | Category: %s | Tools: %s", category, len(suggested_tools))
         return jsonify({
             "success": True,
             "suggested_tools": suggested_tools,
@@ -13998,14 +16879,14 @@ def suggest_ctf_tools():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error suggesting CTF tools: {str(e)}")
+        logger.error("💥 Error suggesting CTF tools: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/ctf/cryptography-solver", methods=["POST"])
 def ctf_cryptography_solver():
     """Advanced cryptography challenge solver with multiple attack methods"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         cipher_text = params.get("cipher_text", "")
         cipher_type = params.get("cipher_type", "unknown")
         key_hint = params.get("key_hint", "")
@@ -14088,7 +16969,7 @@ def ctf_cryptography_solver():
                 "Try common key words"
             ])
         
-        logger.info(f"🔐 CTF crypto analysis completed | Type: {cipher_type} | Tools: {len(results['recommended_tools'])}")
+        logger.info("🔐 CTF crypto analysis completed | Type: %s | Tools: %s", cipher_type, len(results['recommended_tools']))
         return jsonify({
             "success": True,
             "analysis": results,
@@ -14096,14 +16977,14 @@ def ctf_cryptography_solver():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in CTF crypto solver: {str(e)}")
+        logger.error("💥 Error in CTF crypto solver: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/ctf/forensics-analyzer", methods=["POST"])
 def ctf_forensics_analyzer():
     """Advanced forensics challenge analyzer with multiple investigation techniques"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         file_path = params.get("file_path", "")
         analysis_type = params.get("analysis_type", "comprehensive")
         extract_hidden = params.get("extract_hidden", True)
@@ -14231,7 +17112,7 @@ def ctf_forensics_analyzer():
                 "error": str(e)
             })
         
-        logger.info(f"🔍 CTF forensics analysis completed | File: {file_path} | Tools used: {len(results['recommended_tools'])}")
+        logger.info("🔍 CTF forensics analysis completed | File: %s | Tools used: %s", file_path, len(results['recommended_tools']))
         return jsonify({
             "success": True,
             "analysis": results,
@@ -14239,14 +17120,14 @@ def ctf_forensics_analyzer():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in CTF forensics analyzer: {str(e)}")
+        logger.error("💥 Error in CTF forensics analyzer: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/ctf/binary-analyzer", methods=["POST"])
 def ctf_binary_analyzer():
     """Advanced binary analysis for reverse engineering and pwn challenges"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         binary_path = params.get("binary_path", "")
         analysis_depth = params.get("analysis_depth", "comprehensive")  # basic, comprehensive, deep
         check_protections = params.get("check_protections", True)
@@ -14407,7 +17288,7 @@ def ctf_binary_analyzer():
         if "format string" in str(results["exploitation_hints"]).lower():
             results["recommended_tools"].append("format-string-exploiter")
         
-        logger.info(f"🔬 CTF binary analysis completed | Binary: {binary_path} | Hints: {len(results['exploitation_hints'])}")
+        logger.info("🔬 CTF binary analysis completed | Binary: %s | Hints: %s", binary_path, len(results['exploitation_hints']))
         return jsonify({
             "success": True,
             "analysis": results,
@@ -14415,7 +17296,7 @@ def ctf_binary_analyzer():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in CTF binary analyzer: {str(e)}")
+        logger.error("💥 Error in CTF binary analyzer: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # ============================================================================
@@ -14426,17 +17307,17 @@ def ctf_binary_analyzer():
 def execute_command_async():
     """Execute command asynchronously using enhanced process management"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         command = params.get("command", "")
         context = params.get("context", {})
         
         if not command:
-            return jsonify({"error": "Command parameter is required"}), 400
+            return error_response(ERR_NO_COMMAND)
         
         # Execute command asynchronously
         task_id = enhanced_process_manager.execute_command_async(command, context)
         
-        logger.info(f"🚀 Async command execution started | Task ID: {task_id}")
+        logger.info("🚀 Async command execution started | Task ID: %s", task_id)
         return jsonify({
             "success": True,
             "task_id": task_id,
@@ -14446,7 +17327,7 @@ def execute_command_async():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in async command execution: {str(e)}")
+        logger.error("💥 Error in async command execution: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/get-task-result/<task_id>", methods=["GET"])
@@ -14458,7 +17339,7 @@ def get_async_task_result(task_id):
         if result["status"] == "not_found":
             return jsonify({"error": "Task not found"}), 404
         
-        logger.info(f"📋 Task result retrieved | Task ID: {task_id} | Status: {result['status']}")
+        logger.info("📋 Task result retrieved | Task ID: %s | Status: %s", task_id, result['status'])
         return jsonify({
             "success": True,
             "task_id": task_id,
@@ -14467,7 +17348,7 @@ def get_async_task_result(task_id):
         })
         
     except Exception as e:
-        logger.error(f"💥 Error getting task result: {str(e)}")
+        logger.error("💥 Error getting task result: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/pool-stats", methods=["GET"])
@@ -14476,7 +17357,7 @@ def get_process_pool_stats():
     try:
         stats = enhanced_process_manager.get_comprehensive_stats()
         
-        logger.info(f"📊 Process pool stats retrieved | Active workers: {stats['process_pool']['active_workers']}")
+        logger.info("📊 Process pool stats retrieved | Active workers: %s", stats['process_pool']['active_workers'])
         return jsonify({
             "success": True,
             "stats": stats,
@@ -14484,7 +17365,7 @@ def get_process_pool_stats():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error getting pool stats: {str(e)}")
+        logger.error("💥 Error getting pool stats: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/cache-stats", methods=["GET"])
@@ -14493,7 +17374,7 @@ def get_cache_stats():
     try:
         cache_stats = enhanced_process_manager.cache.get_stats()
         
-        logger.info(f"💾 Cache stats retrieved | Hit rate: {cache_stats['hit_rate']:.1f}%")
+        logger.info("💾 Cache stats retrieved | Hit rate: %.1f%%", cache_stats['hit_rate'])
         return jsonify({
             "success": True,
             "cache_stats": cache_stats,
@@ -14501,7 +17382,7 @@ def get_cache_stats():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error getting cache stats: {str(e)}")
+        logger.error("💥 Error getting cache stats: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/clear-cache", methods=["POST"])
@@ -14518,7 +17399,7 @@ def clear_process_cache():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error clearing cache: {str(e)}")
+        logger.error("💥 Error clearing cache: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/resource-usage", methods=["GET"])
@@ -14528,7 +17409,7 @@ def get_resource_usage():
         current_usage = enhanced_process_manager.resource_monitor.get_current_usage()
         usage_trends = enhanced_process_manager.resource_monitor.get_usage_trends()
         
-        logger.info(f"📈 Resource usage retrieved | CPU: {current_usage['cpu_percent']:.1f}% | Memory: {current_usage['memory_percent']:.1f}%")
+        logger.info("📈 Resource usage retrieved | CPU: %.1f%% | Memory: %.1f%%", current_usage['cpu_percent'], current_usage['memory_percent'])
         return jsonify({
             "success": True,
             "current_usage": current_usage,
@@ -14537,7 +17418,7 @@ def get_resource_usage():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error getting resource usage: {str(e)}")
+        logger.error("💥 Error getting resource usage: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/performance-dashboard", methods=["GET"])
@@ -14562,7 +17443,7 @@ def get_performance_dashboard():
             }
         }
         
-        logger.info(f"📊 Performance dashboard retrieved | Success rate: {dashboard_data.get('success_rate', 0):.1f}%")
+        logger.info("📊 Performance dashboard retrieved | Success rate: %.1f%%", dashboard_data.get('success_rate', 0))
         return jsonify({
             "success": True,
             "dashboard": dashboard,
@@ -14570,20 +17451,20 @@ def get_performance_dashboard():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error getting performance dashboard: {str(e)}")
+        logger.error("💥 Error getting performance dashboard: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/terminate-gracefully/<int:pid>", methods=["POST"])
 def terminate_process_gracefully(pid):
     """Terminate process with graceful degradation"""
     try:
-        params = request.json or {}
+        params = request.get_json(cache=False, silent=True) or {}
         timeout = params.get("timeout", 30)
         
         success = enhanced_process_manager.terminate_process_gracefully(pid, timeout)
         
         if success:
-            logger.info(f"✅ Process {pid} terminated gracefully")
+            logger.info("✅ Process %s terminated gracefully", pid)
             return jsonify({
                 "success": True,
                 "message": f"Process {pid} terminated successfully",
@@ -14599,14 +17480,14 @@ def terminate_process_gracefully(pid):
             }), 400
         
     except Exception as e:
-        logger.error(f"💥 Error terminating process {pid}: {str(e)}")
+        logger.error("💥 Error terminating process %s: %s", pid, e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/auto-scaling", methods=["POST"])
 def configure_auto_scaling():
     """Configure auto-scaling settings"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         enabled = params.get("enabled", True)
         thresholds = params.get("thresholds", {})
         
@@ -14616,7 +17497,7 @@ def configure_auto_scaling():
         if thresholds:
             enhanced_process_manager.resource_thresholds.update(thresholds)
         
-        logger.info(f"⚙️ Auto-scaling configured | Enabled: {enabled}")
+        logger.info("⚙️ Auto-scaling configured | Enabled: %s", enabled)
         return jsonify({
             "success": True,
             "auto_scaling_enabled": enabled,
@@ -14625,14 +17506,14 @@ def configure_auto_scaling():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error configuring auto-scaling: {str(e)}")
+        logger.error("💥 Error configuring auto-scaling: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/scale-pool", methods=["POST"])
 def manual_scale_pool():
     """Manually scale the process pool"""
     try:
-        params = request.json
+        params = request.get_json(cache=False, silent=True) or {}
         action = params.get("action", "")  # "up" or "down"
         count = params.get("count", 1)
         
@@ -14659,7 +17540,7 @@ def manual_scale_pool():
             else:
                 return jsonify({"error": f"Cannot scale down: would go below min workers ({min_workers})"}), 400
         
-        logger.info(f"📏 Manual scaling | {message} | Workers: {current_workers} → {new_workers}")
+        logger.info("📏 Manual scaling | %s | Workers: %s → %s", message, current_workers, new_workers)
         return jsonify({
             "success": True,
             "message": message,
@@ -14669,7 +17550,7 @@ def manual_scale_pool():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error scaling pool: {str(e)}")
+        logger.error("💥 Error scaling pool: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/process/health-check", methods=["GET"])
@@ -14753,7 +17634,7 @@ def process_health_check():
         if "Low cache hit rate" in issues:
             health_report["recommendations"].append("Review cache TTL settings or increase cache size")
         
-        logger.info(f"🏥 Health check completed | Status: {status} | Score: {health_score}/100")
+        logger.info("🏥 Health check completed | Status: %s | Score: %s/100", status, health_score)
         return jsonify({
             "success": True,
             "health_report": health_report,
@@ -14761,7 +17642,7 @@ def process_health_check():
         })
         
     except Exception as e:
-        logger.error(f"💥 Error in health check: {str(e)}")
+        logger.error("💥 Error in health check: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # ============================================================================
@@ -14783,14 +17664,14 @@ def get_error_statistics():
             "timestamp": datetime.now().isoformat()
         })
     except Exception as e:
-        logger.error(f"Error getting error statistics: {str(e)}")
+        logger.error("Error getting error statistics: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/error-handling/test-recovery", methods=["POST"])
 def test_error_recovery():
     """Test error recovery system with simulated failures"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         tool_name = data.get("tool_name", "nmap")
         error_type = data.get("error_type", "timeout")
         target = data.get("target", "example.com")
@@ -14829,7 +17710,7 @@ def test_error_recovery():
         })
         
     except Exception as e:
-        logger.error(f"Error testing recovery system: {str(e)}")
+        logger.error("Error testing recovery system: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/error-handling/fallback-chains", methods=["GET"])
@@ -14857,14 +17738,14 @@ def get_fallback_chains():
             })
             
     except Exception as e:
-        logger.error(f"Error getting fallback chains: {str(e)}")
+        logger.error("Error getting fallback chains: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/error-handling/execute-with-recovery", methods=["POST"])
 def execute_with_recovery_endpoint():
     """Execute a command with intelligent error handling and recovery"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         tool_name = data.get("tool_name", "")
         command = data.get("command", "")
         parameters = data.get("parameters", {})
@@ -14890,14 +17771,14 @@ def execute_with_recovery_endpoint():
         })
         
     except Exception as e:
-        logger.error(f"Error executing command with recovery: {str(e)}")
+        logger.error("Error executing command with recovery: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/error-handling/classify-error", methods=["POST"])
 def classify_error_endpoint():
     """Classify an error message"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         error_message = data.get("error_message", "")
         
         if not error_message:
@@ -14922,14 +17803,14 @@ def classify_error_endpoint():
         })
         
     except Exception as e:
-        logger.error(f"Error classifying error: {str(e)}")
+        logger.error("Error classifying error: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/error-handling/parameter-adjustments", methods=["POST"])
 def get_parameter_adjustments():
     """Get parameter adjustments for a tool and error type"""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         tool_name = data.get("tool_name", "")
         error_type_str = data.get("error_type", "")
         original_params = data.get("original_params", {})
@@ -14955,7 +17836,7 @@ def get_parameter_adjustments():
         })
         
     except Exception as e:
-        logger.error(f"Error getting parameter adjustments: {str(e)}")
+        logger.error("Error getting parameter adjustments: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 @app.route("/api/error-handling/alternative-tools", methods=["GET"])
@@ -14978,7 +17859,7 @@ def get_alternative_tools():
         })
         
     except Exception as e:
-        logger.error(f"Error getting alternative tools: {str(e)}")
+        logger.error("Error getting alternative tools: %s", e)
         return jsonify({"error": f"Server error: {str(e)}"}), 500
 
 # Create the banner after all classes are defined
@@ -15017,4 +17898,22 @@ if __name__ == "__main__":
         if line.strip():
             logger.info(line)
     
-    app.run(host="0.0.0.0", port=API_PORT, debug=DEBUG_MODE)
\ No newline at end of file
+    missing_tools = [binary for binary, path in TOOL_PATHS.items() if path is None]
+    if missing_tools:
+        logger.warning("⚠️  Tools not found on PATH: %s", ", ".join(missing_tools))
+    
+    system_load_cache.start_warmer()
+    
+    try:
+        app.run(host="0.0.0.0", port=API_PORT, debug=DEBUG_MODE)
+    finally:
+        # Commands run in their own session, so stop them explicitly; this also lets
+        # the shared command pool's reader threads finish before interpreter exit
+        ProcessManager.terminate_all()
+        metasploit_rpc.shutdown()
+        gdb_sessions.shutdown()
+        radare2_sessions.shutdown()
+        python_workers.shutdown()
+        batch_pool.shutdown(wait=False)
+        scan_jobs.shutdown()
+        command_pool.shutdown(wait=False)
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Shared fixtures for the hexstrike_server tests
+
+The server module is imported once; tests talk to it through Flask's test client or by
+calling its helpers directly, and run real (small) subprocesses where a tool is needed.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import hexstrike_server as server  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    return server.app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Every test starts and ends with an empty command cache"""
+    server.cache.clear()
+    yield
+    server.cache.clear()
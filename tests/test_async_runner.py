@@ -0,0 +1,21 @@
+"""Async subprocess runner: exit codes, captured output and timeouts"""
+
+import time
+
+import hexstrike_server as server
+
+
+def test_async_runner_reports_exit_code_and_output():
+    result = server.async_runner.run("sh -c 'echo out; echo err >&2; exit 4'",
+                                     argv=["sh", "-c", "echo out; echo err >&2; exit 4"])
+    assert result["stdout"] == "out\n"
+    assert result["stderr"] == "err\n"
+    assert result["return_code"] == 4
+    assert not result["success"]
+
+
+def test_async_runner_times_out():
+    start = time.time()
+    result = server.async_runner.run("sleep 10", timeout=1, argv=["sleep", "10"])
+    assert result["timed_out"]
+    assert time.time() - start < 8
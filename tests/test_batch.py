@@ -0,0 +1,65 @@
+"""/api/tools/batch: entry validation, bounded concurrency and per-entry results"""
+
+import threading
+import time
+
+import pytest
+
+import hexstrike_server as server
+
+
+class InFlight:
+    """Counts concurrent calls and remembers the peak"""
+
+    def __init__(self):
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.active -= 1
+
+
+@pytest.mark.parametrize("body", [
+    {},
+    {"requests": []},
+    {"requests": ["nmap"]},
+    {"requests": [{"tool": "nmap"}], "max_concurrent": "lots"},
+    {"requests": [{"tool": "nmap"}], "timeout": "soon"},
+    {"requests": [{"tool": "nmap"}], "timeout": 0},
+])
+def test_batch_rejects_malformed_requests(client, body):
+    assert client.post("/api/tools/batch", json=body).status_code == 400
+
+
+def test_batch_runs_entries_with_bounded_concurrency(client, monkeypatch):
+    in_flight = InFlight()
+
+    def dispatch(tool, params):
+        with in_flight:
+            time.sleep(0.05)
+        return 200, {"success": params.get("ok", True), "tool": tool}
+
+    monkeypatch.setattr(server, "dispatch_tool", dispatch)
+    entries = [{"tool": "echo", "id": index, "params": {"ok": index != 3}} for index in range(8)]
+    response = client.post("/api/tools/batch", json={"requests": entries, "max_concurrent": 2})
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert [result["id"] for result in body["results"]] == list(range(8))
+    assert [result["success"] for result in body["results"]] == [index != 3 for index in range(8)]
+    assert not body["success"]
+    assert body["results_by_id"]["3"]["status_code"] == 200
+    assert in_flight.peak == 2
+
+
+def test_batch_reports_unknown_tools_per_entry(client):
+    response = client.post("/api/tools/batch", json={"requests": [{"tool": "no-such-tool"}], "max_concurrent": 10**6})
+    assert response.status_code == 200
+    result = response.get_json()["results"][0]
+    assert result["status_code"] == 404 and not result["success"]
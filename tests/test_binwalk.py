@@ -0,0 +1,55 @@
+"""In-process binwalk signature scans and the cache entries execute_inprocess shares with the CLI path"""
+
+from types import SimpleNamespace
+
+import hexstrike_server as server
+
+
+class FakeBinwalk:
+    """Stands in for the binwalk v2 module: one signature module with fixed results"""
+
+    def __init__(self, results=(), error=None):
+        self.results = [SimpleNamespace(offset=offset, description=text) for offset, text in results]
+        self.error = error
+
+    def scan(self, path, signature=False, quiet=False):
+        assert signature and quiet
+        if self.error:
+            raise self.error
+        return [SimpleNamespace(results=self.results)]
+
+
+def test_binwalk_signature_scan_renders_cli_table(monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "binwalk_api", FakeBinwalk([(0, "ELF, 64-bit"), (4096, "gzip compressed data")]))
+    result = server.binwalk_signature_scan(str(tmp_path / "firmware.bin"))
+
+    assert result["success"] and result["backend"] == "binwalk-api"
+    assert result["signatures"] == [{"offset": 0, "description": "ELF, 64-bit"},
+                                    {"offset": 4096, "description": "gzip compressed data"}]
+    assert result["stdout"].splitlines()[3:] == [
+        "0             0x0             ELF, 64-bit",
+        "4096          0x1000          gzip compressed data",
+    ]
+
+
+def test_binwalk_signature_scan_reports_errors(monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "binwalk_api", FakeBinwalk(error=OSError("cannot open")))
+    result = server.binwalk_signature_scan(str(tmp_path / "missing.bin"))
+    assert not result["success"] and result["return_code"] == 1
+    assert result["stderr"] == "binwalk: cannot open\n" and result["stdout"] == ""
+
+
+def test_execute_inprocess_caches_successful_scans(tmp_path):
+    sample = tmp_path / "sample.bin"
+    sample.write_bytes(b"\x00hello world\x00")
+    calls = []
+
+    def scan():
+        calls.append(1)
+        return server.scan_strings(str(sample))
+
+    argv = ["strings", "-a", str(sample)]
+    first = server.execute_inprocess(argv, scan, cache_deps=(str(sample),))
+    assert server.execute_inprocess(argv, scan, cache_deps=(str(sample),)) is first
+    assert server.execute_inprocess(argv, scan, cache_deps=(str(sample),), force=True) is not first
+    assert len(calls) == 2
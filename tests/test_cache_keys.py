@@ -0,0 +1,10 @@
+"""Cache keys: parameters hash to the same entry regardless of key order"""
+
+import hexstrike_server as server
+
+
+def test_cache_key_ignores_param_order():
+    result = {"success": True}
+    server.cache.set("scan", {"a": 1, "b": [1, {"c": 2}]}, result)
+    assert server.cache.get("scan", {"b": [1, {"c": 2}], "a": 1}) is result
+    assert server.cache.get("scan", {"a": 2, "b": [1, {"c": 2}]}) is None
@@ -0,0 +1,66 @@
+"""Shared dnspython resolver: record lookups, brute force deadlines and dns_server validation"""
+
+import time
+
+import pytest
+
+import hexstrike_server as server
+
+
+@pytest.fixture
+def fake_resolver(monkeypatch):
+    if server.dns is None:
+        pytest.skip("dnspython not installed")
+
+    class Rdata:
+        def __init__(self, text):
+            self.text = text
+
+        def to_text(self):
+            return self.text
+
+    class Resolver:
+        lifetime = 5.0
+        delay = 0.0
+        names = {("www.example.com", "A"): ["192.0.2.1"], ("example.com", "MX"): ["10 mail.example.com."]}
+
+        def resolve(self, name, record_type, lifetime=None):
+            time.sleep(self.delay)
+            if (name, record_type) not in self.names:
+                raise server.dns.resolver.NXDOMAIN()
+            return [Rdata(text) for text in self.names[name, record_type]]
+
+    resolver = Resolver()
+    monkeypatch.setattr(server, "dns_resolver", lambda dns_server="": resolver)
+    return resolver
+
+
+def test_dns_enum_scan_records_and_brute_force(fake_resolver, tmp_path):
+    result = server.dns_enum_scan("example.com", "mx")
+    assert result["records"] == [{"name": "example.com", "type": "MX", "value": "10 mail.example.com."}]
+    assert result["stdout"] == "example.com MX 10 mail.example.com.\n"
+
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("# comment\nwww\nftp\nwww\n")
+    result = server.dns_enum_scan("example.com", "brt", str(wordlist))
+    assert result["success"]
+    assert result["stdout"] == "www.example.com A 192.0.2.1\n"
+
+
+def test_dns_enum_scan_stops_at_deadline(fake_resolver, tmp_path):
+    fake_resolver.delay = 0.05
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("\n".join(f"host{index}" for index in range(5000)))
+    start = time.time()
+    result = server.dns_enum_scan("example.com", "brt", str(wordlist), concurrency=10**6, timeout=0.5)
+    assert time.time() - start < 5
+    assert result["timed_out"] and not result["success"]
+
+
+def test_dns_endpoints_reject_malformed_servers(client):
+    if server.dns is None:
+        pytest.skip("dnspython not installed")
+    response = client.post("/api/tools/dns", json={"domain": "example.com", "dns_server": "8.8.8.8,not-an-ip"})
+    assert response.status_code == 400
+    assert server.valid_dns_servers("8.8.8.8, 2001:4860:4860::8888")
+    assert server.valid_dns_servers("")
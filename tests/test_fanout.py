@@ -0,0 +1,38 @@
+"""Per-target fan-out: every target gets a result and concurrency stays capped"""
+
+import threading
+import time
+
+import hexstrike_server as server
+
+
+class InFlight:
+    """Counts concurrent calls and remembers the peak"""
+
+    def __init__(self):
+        self.active = self.peak = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.active -= 1
+
+
+def test_execute_per_target_caps_concurrency():
+    in_flight = InFlight()
+
+    def run(target):
+        with in_flight:
+            time.sleep(0.02)
+        return {"success": target != "t5"}
+
+    targets = [f"t{index}" for index in range(30)]
+    result = server.execute_per_target(targets, run, 10**6)
+    assert in_flight.peak == server.FANOUT_MAX_CONCURRENT
+    assert set(result["results_by_target"]) == set(targets)
+    assert not result["success"]
@@ -0,0 +1,59 @@
+"""Persistent gdb sessions: the shared LRU pool and which commands keep a session reusable"""
+
+import os
+
+import pytest
+
+import hexstrike_server as server
+
+
+class RecordingPool(server.ToolSessionPool):
+    def __init__(self, max_sessions):
+        super().__init__(max_sessions)
+        self.quit = []
+
+    def _quit(self, handle):
+        self.quit.append(handle)
+
+
+def test_tool_session_pool_requires_quit():
+    with pytest.raises(TypeError):
+        server.ToolSessionPool(1)
+
+
+def test_tool_session_pool_evicts_least_recently_used(tmp_path):
+    pool = RecordingPool(2)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        path.write_bytes(b"\0")
+        paths.append(str(path))
+
+    for path in paths[:2]:
+        session, reused = pool._checkout(path)
+        session.handle = path
+        assert not reused
+    assert pool._checkout(paths[0])[1]
+
+    pool._checkout(paths[2])
+    assert pool.quit == [paths[1]]
+
+    os.utime(paths[0], ns=(0, 0))  # Rebuilt binary: new key, the old session is closed
+    session, reused = pool._checkout(paths[0])
+    assert not reused and pool.quit == [paths[1], paths[0]]
+
+
+@pytest.mark.parametrize("command, keeps", [
+    ("info functions", True),
+    ("x/10i $pc", True),
+    ("break main", True),
+    ("run", True),
+    ("run --flag", False),
+    ("set var x = 1", False),
+    ("p $counter = 5", False),
+    ("p $counter == 5", True),
+    ("file /bin/ls", False),
+    ("display/i $pc", False),
+])
+def test_gdb_command_keeps_session(command, keeps):
+    assert server.gdb_command_keeps_session(command) is keeps
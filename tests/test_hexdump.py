@@ -0,0 +1,27 @@
+"""In-process hex dumps in xxd's layout"""
+
+import shutil
+import subprocess
+
+import pytest
+
+import hexstrike_server as server
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / "sample.bin"
+    path.write_bytes(b"\x00\x01hello world\x00ab\x7fprintable run here\xff" + bytes(range(256)))
+    return str(path)
+
+
+def test_hex_dump_uses_xxd_layout(sample):
+    first_row = server.hex_dump(sample, 0, 16)["stdout"]
+    assert first_row == "00000000: 0001 6865 6c6c 6f20 776f 726c 6400 6162  ..hello world.ab\n"
+    assert server.hex_dump(sample, 2, 5)["stdout"] == "00000002: 6865 6c6c 6f                             hello\n"
+
+
+@pytest.mark.skipif(shutil.which("xxd") is None, reason="xxd not installed")
+def test_hex_dump_matches_xxd_cli(sample):
+    expected = subprocess.run(["xxd", "-s", "3", "-l", "100", sample], capture_output=True, text=True).stdout
+    assert server.hex_dump(sample, 3, 100)["stdout"] == expected
@@ -0,0 +1,34 @@
+"""OutputPump: pooled read buffers split into whole lines for the log and the spool"""
+
+import hexstrike_server as server
+
+
+class Lines(list):
+    """Collects the lines a pump logs"""
+
+    def log(self, line):
+        self.append(line)
+
+    def flush(self):
+        pass
+
+
+def test_output_pump_splits_lines_across_chunks():
+    log = Lines()
+    spool = server.OutputSpool("stdout")
+    pump = server.OutputPump(spool, log)
+    for chunk in (b"ab", b"c\nd\xc3", b"\xa9\n\n  f", b"g"):
+        pump.feed(chunk)
+    pump.close()
+    assert log == ["abc", "dé", "fg"]
+    assert spool.getvalue() == "abc\ndé\n\n  fg"
+
+
+def test_output_pump_caps_logged_line_length():
+    log = Lines()
+    pump = server.OutputPump(server.OutputSpool("stdout"), log)
+    for _ in range(10):
+        pump.feed(b"x" * server.OUTPUT_LOG_LINE_MAX)
+    pump.feed(b"\n")
+    pump.close()
+    assert [len(line) for line in log] == [server.OUTPUT_LOG_LINE_MAX]
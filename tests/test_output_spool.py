@@ -0,0 +1,35 @@
+"""Spooled command output: large streams spill to disk and old spool files are pruned"""
+
+import os
+import time
+
+import hexstrike_server as server
+
+
+def test_large_output_spills_to_spool_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "OUTPUT_SPOOL_DIR", tmp_path)
+    monkeypatch.setattr(server, "OUTPUT_INLINE_LIMIT", 1000)
+    result = server.async_runner.run("seq 1 20000", argv=["seq", "1", "20000"])
+
+    assert result["success"] and result["stdout_truncated"]
+    assert len(result["stdout"]) == server.OUTPUT_TAIL_SIZE
+    full = open(result["stdout_file"]).read()
+    assert full.splitlines() == [str(number) for number in range(1, 20001)]
+    assert full.endswith(result["stdout"])
+
+
+def test_prune_output_spool_by_age_and_size(monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "OUTPUT_SPOOL_DIR", tmp_path)
+    now = time.time()
+    for name, age, size in (("old", 2 * server.OUTPUT_SPOOL_MAX_AGE, 10), ("mid", 600, 100),
+                            ("new", 300, 100), ("active", 0, 100)):
+        path = tmp_path / f"stdout_{name}.log"
+        path.write_bytes(b"x" * size)
+        os.utime(path, (now - age, now - age))
+
+    assert server.prune_output_spool(force=True) == 1
+    assert not (tmp_path / "stdout_old.log").exists()
+
+    monkeypatch.setattr(server, "OUTPUT_SPOOL_MAX_BYTES", 150)
+    assert server.prune_output_spool(force=True) == 2
+    assert sorted(os.listdir(tmp_path)) == ["stdout_active.log"]
@@ -0,0 +1,40 @@
+"""Request parsing: parse_params fills dataclass defaults and rejects wrong types"""
+
+from dataclasses import dataclass, field
+
+import pytest
+
+import hexstrike_server as server
+
+
+@dataclass
+class SampleParams:
+    name: str = ""
+    count: int = 3
+    verbose: bool = False
+    targets: list = field(default_factory=list)
+
+
+def parse(body):
+    with server.app.test_request_context("/", method="POST", json=body):
+        return server.parse_params(SampleParams)
+
+
+def test_parse_params_fills_defaults_and_coerces():
+    params = parse({"name": 5, "count": "7", "verbose": True, "targets": ["a", 2, None]})
+    assert params == SampleParams(name="5", count=7, verbose=True, targets=["a", "2"])
+    assert parse({}) == SampleParams()
+    assert parse({"count": "", "name": None}) == SampleParams()
+
+
+@pytest.mark.parametrize("body, message", [
+    ({"count": "many"}, "count must be an integer"),
+    ({"count": True}, "count must be an integer"),
+    ({"verbose": "false"}, "verbose must be a boolean"),
+    ({"name": ["x"]}, "name must be a string"),
+    ({"targets": "a,b"}, "targets must be a list of strings"),
+    ([1, 2], "Request body must be a JSON object"),
+])
+def test_parse_params_rejects_wrong_types(body, message):
+    with pytest.raises(server.ParamsValidationError, match=message):
+        parse(body)
@@ -0,0 +1,62 @@
+"""Payload generation: chunked pattern output, size and pattern validation, streamed file writes"""
+
+import os
+
+import pytest
+
+import hexstrike_server as server
+
+
+@pytest.fixture
+def payload_dir(monkeypatch, tmp_path):
+    monkeypatch.setattr(server, "file_manager", server.FileOperationsManager(str(tmp_path)))
+    return tmp_path
+
+
+def test_repeat_chunks_produces_exact_size():
+    assert b"".join(server._cyclic_payload(30)) == b"ABCDEFGHIJKLMNOPQRSTUVWXYZABCD"
+    assert b"".join(server._buffer_payload("AB", 5)) == b"ABABA"
+    size = server.PAYLOAD_CHUNK_SIZE + 7
+    payload = b"".join(server._buffer_payload("xyz", size))
+    assert len(payload) == size and payload == (b"xyz" * size)[:size]
+
+
+def test_repeat_chunks_negative_size_is_empty():
+    assert b"".join(server._cyclic_payload(-5)) == b""
+    assert b"".join(server._buffer_payload("AB", -3)) == b""
+
+
+def test_generate_payload_writes_file(client, payload_dir):
+    response = client.post("/api/payloads/generate", json={"type": "cyclic", "size": 28, "filename": "p.bin"})
+    assert response.status_code == 200
+    assert (payload_dir / "p.bin").read_bytes() == b"ABCDEFGHIJKLMNOPQRSTUVWXYZAB"
+
+
+@pytest.mark.parametrize("body", [
+    {"size": -1},
+    {"size": 10.5},
+    {"size": True},
+    {"size": "1024"},
+    {"size": server.PAYLOAD_MAX_SIZE + 1},
+    {"type": "buffer", "pattern": ""},
+    {"type": "buffer", "pattern": 7},
+    {"type": "shellcode"},
+])
+def test_generate_payload_rejects_bad_input(client, payload_dir, body):
+    response = client.post("/api/payloads/generate", json={"filename": "p.bin", **body})
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+    assert not (payload_dir / "p.bin").exists()
+
+
+def test_create_file_streamed_replaces_only_on_success(monkeypatch, tmp_path):
+    manager = server.FileOperationsManager(str(tmp_path))
+    monkeypatch.setattr(manager, "max_file_size", 10)
+
+    result = manager.create_file_streamed("dir/out.bin", [b"12345", b"678"])
+    assert result["success"] and result["size"] == 8
+
+    result = manager.create_file_streamed("dir/out.bin", [b"abcde", b"fghijk"])
+    assert not result["success"]
+    assert (tmp_path / "dir" / "out.bin").read_bytes() == b"12345678"
+    assert os.listdir(tmp_path / "dir") == ["out.bin"]
@@ -0,0 +1,53 @@
+"""Reused python interpreters: per-script isolation, exit codes, tracebacks and timeouts"""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+import hexstrike_server as server
+
+
+@pytest.fixture
+def python_workers():
+    if not hasattr(os, "fork"):
+        pytest.skip("python workers fork a child per script")
+    pool = server.PythonWorkers()
+    yield pool
+    pool.shutdown()
+
+
+def test_python_worker_runs_scripts_in_isolation(python_workers, tmp_path):
+    script = textwrap.dedent(f"""\
+        import os, sys, threading
+        print("seen", "leak" in globals(), hasattr(sys, "leaked_attr"), os.getcwd())
+        leak = 1
+        sys.leaked_attr = True
+        os.chdir({str(tmp_path)!r})
+        threading.Thread(target=lambda: print("thread done")).start()
+    """)
+    first = python_workers.run(sys.executable, script)
+    assert first["success"]
+    assert first["stdout"].startswith(f"seen False False {os.getcwd()}\n")
+    assert "thread done" in first["stdout"]
+
+    second = python_workers.run(sys.executable, script)
+    assert second["session_reused"]
+    assert second["stdout"] == first["stdout"]
+
+
+def test_python_worker_reports_exit_codes_and_tracebacks(python_workers):
+    result = python_workers.run(sys.executable, "import sys\nprint('bye')\nsys.exit(3)\n")
+    assert result["return_code"] == 3 and result["stdout"] == "bye\n"
+
+    result = python_workers.run(sys.executable, "raise ValueError('bad input')\n")
+    assert not result["success"]
+    assert "ValueError: bad input" in result["stderr"]
+    assert "run_child" not in result["stderr"]
+
+
+def test_python_worker_timeout_drops_worker(python_workers):
+    result = python_workers.run(sys.executable, "import time\ntime.sleep(30)\n", timeout=1)
+    assert result["timed_out"] and not result["success"]
+    assert not python_workers.run(sys.executable, "print(1)\n")["session_reused"]
@@ -0,0 +1,99 @@
+"""Persistent radare2 sessions: reuse with a seek reset, state changes, deadlines and crashes"""
+
+import os
+import sys
+import textwrap
+import time
+
+import pytest
+
+import hexstrike_server as server
+
+# Speaks the "r2 -q0" protocol: a NUL after startup and after every command's output
+FAKE_R2 = textwrap.dedent("""\
+    #!{python}
+    import os, sys, time
+    out = sys.stdout.buffer
+    out.write(b"\\0"); out.flush()
+    seek, config = "0x1000", 0
+    for line in sys.stdin:
+        command = line.strip()
+        if command == "q!":
+            break
+        reply = ""
+        if command == "aaa":
+            sys.stderr.write("INFO: analyzing\\n"); sys.stderr.flush()
+        elif command == "s":
+            reply = seek + "\\n"
+        elif command.startswith("s "):
+            seek = command[2:]
+        elif command.startswith("e "):
+            config += 1
+        elif command == "hang":
+            time.sleep(60)
+        elif command == "die":
+            sys.exit(1)
+        else:
+            reply = f"{{command}} @ {{seek}} pid={{os.getpid()}} config={{config}}\\n"
+        out.write(reply.encode() + b"\\0"); out.flush()
+""")
+
+
+@pytest.mark.parametrize("command, keeps", [
+    ("pdf", True),
+    ("s main;pdf", True),
+    ("afl; axt main", True),
+    ("e asm.bits=32", False),
+    ("pdf; wx 90", False),
+    ("o /bin/ls", False),
+])
+def test_r2_command_keeps_session(command, keeps):
+    assert server.r2_command_keeps_session(command) is keeps
+
+
+@pytest.fixture
+def fake_r2(tmp_path, monkeypatch):
+    r2 = tmp_path / "bin" / "r2"
+    r2.parent.mkdir()
+    r2.write_text(FAKE_R2.format(python=sys.executable))
+    r2.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{r2.parent}{os.pathsep}{os.environ['PATH']}")
+    binary = tmp_path / "target.bin"
+    binary.write_bytes(b"\x7fELF")
+    pool = server.Radare2Sessions()
+    yield pool, str(binary)
+    pool.shutdown()
+
+
+def test_r2_session_reused_with_seek_reset(fake_r2):
+    pool, binary = fake_r2
+    first = pool.run(binary, ["s 0x2000", "pdf"])
+    assert first["success"] and not first["session_reused"]
+    assert "@ 0x2000" in first["stdout"]
+
+    second = pool.run(binary, ["pdf"])
+    assert second["session_reused"]
+    assert "@ 0x1000" in second["stdout"]
+    assert second["stdout"].split("pid=")[1] == first["stdout"].split("pid=")[1]
+
+
+def test_r2_session_dropped_after_state_change(fake_r2):
+    pool, binary = fake_r2
+    assert "config=1" in pool.run(binary, ["e asm.bits=32", "pdf"])["stdout"]
+    result = pool.run(binary, ["pdf"])
+    assert not result["session_reused"]
+    assert "config=0" in result["stdout"]
+
+
+def test_r2_session_killed_on_deadline_and_death(fake_r2):
+    pool, binary = fake_r2
+    pool.run(binary, ["pdf"])
+
+    start = time.time()
+    result = pool.run(binary, ["hang"], timeout=1)
+    assert time.time() - start < 5
+    assert result["timed_out"] and not result["success"] and result["return_code"] == -1
+
+    result = pool.run(binary, ["die"])
+    assert not result["success"] and not result["timed_out"]
+    assert pool.run(binary, ["pdf"])["success"]
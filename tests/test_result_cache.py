@@ -0,0 +1,61 @@
+"""Per-tool result cache: argv keys, forced reruns, input fingerprints and force flag parsing"""
+
+import pytest
+
+import hexstrike_server as server
+
+
+def test_execute_command_caches_by_argv():
+    first = server.execute_command(["echo", "one"])
+    assert first["success"] and first["stdout"] == "one\n"
+    assert server.execute_command(["echo", "one"]) is first
+    assert server.execute_command(["echo", "two"])["stdout"] == "two\n"
+
+
+def test_force_reruns_and_refreshes_cache():
+    first = server.execute_command(["date", "+%N"])
+    forced = server.execute_command(["date", "+%N"], force=True)
+    assert forced is not first
+    assert server.execute_command(["date", "+%N"]) is forced
+
+
+def test_failed_results_are_not_cached():
+    first = server.execute_command(["sh", "-c", "exit 3"])
+    assert first["return_code"] == 3 and not first["success"]
+    assert server.execute_command(["sh", "-c", "exit 3"]) is not first
+
+
+def test_cache_deps_expire_when_input_changes(tmp_path):
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("alpha\n")
+    assert server.execute_command(["cat", str(wordlist)], cache_deps=(str(wordlist),))["stdout"] == "alpha\n"
+    wordlist.write_text("alpha\nbeta\n")
+    assert server.execute_command(["cat", str(wordlist)], cache_deps=(str(wordlist),))["stdout"] == "alpha\nbeta\n"
+
+
+@pytest.mark.parametrize("value, expected", [
+    (None, False), (True, True), (False, False), (1, True), (0, False),
+    ("true", True), ("YES", True), ("1", True), ("false", False), ("no", False), ("", False),
+])
+def test_param_flag_parses_booleans(value, expected):
+    assert server.param_flag({"force": value}, "force") is expected
+
+
+def test_param_flag_default_and_rejects_other_values():
+    assert server.param_flag({}, "use_cache", True) is True
+    with pytest.raises(server.ParamsValidationError):
+        server.param_flag({"force": "maybe"}, "force")
+    with pytest.raises(server.ParamsValidationError):
+        server.param_flag({"force": 2}, "force")
+
+
+def test_raw_body_views_parse_force_strictly(client, monkeypatch):
+    seen = []
+    monkeypatch.setattr(server, "execute_command", lambda command, **kwargs: seen.append(kwargs) or {"success": True})
+
+    response = client.post("/api/tools/wafw00f", json={"target": "http://example.com", "force": "false"})
+    assert response.status_code == 200
+    assert seen[-1]["force"] is False
+
+    response = client.post("/api/tools/wafw00f", json={"target": "http://example.com", "force": "maybe"})
+    assert response.status_code == 400
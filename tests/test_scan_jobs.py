@@ -0,0 +1,71 @@
+"""Background tool runs: ?async=1 submission, polling, the pending cap and result pruning"""
+
+import threading
+import time
+
+import hexstrike_server as server
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_background_job_lifecycle(client, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(server, "scan_jobs", server.ScanJobs(max_parallel=1))
+    monkeypatch.setattr(server, "dispatch_tool", lambda tool, params: (release.wait(5), (200, {"echo": params}))[1])
+
+    response = client.post("/api/tools/nmap?async=1", json={"target": "127.0.0.1"})
+    assert response.status_code == 202
+    token = response.get_json()["token"]
+
+    polled = client.get(f"/api/tools/result/{token}")
+    assert polled.status_code == 202
+    assert polled.get_json()["status"] in ("queued", "running")
+
+    release.set()
+    assert wait_for(lambda: client.get(f"/api/tools/result/{token}").status_code == 200)
+    state = client.get(f"/api/tools/result/{token}").get_json()
+    assert state["status"] == "done"
+    assert state["result"] == {"echo": {"target": "127.0.0.1"}}
+
+    assert client.get("/api/tools/result/unknown").status_code == 404
+    server.scan_jobs.shutdown()
+
+
+def test_pending_jobs_are_capped(client, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(server, "SCAN_MAX_PENDING", 2)
+    monkeypatch.setattr(server, "scan_jobs", server.ScanJobs(max_parallel=1))
+    monkeypatch.setattr(server, "dispatch_tool", lambda tool, params: (release.wait(5), (200, {}))[1])
+
+    codes = [client.post("/api/tools/nmap?async=1", json={"target": "x"}).status_code for _ in range(3)]
+    assert codes == [202, 202, 429]
+
+    release.set()
+    assert wait_for(lambda: server.scan_jobs.pending == 0)
+    assert client.post("/api/tools/nmap?async=1", json={"target": "x"}).status_code == 202
+    server.scan_jobs.shutdown()
+
+
+def test_finished_jobs_pruned_by_age_and_count(monkeypatch):
+    monkeypatch.setattr(server, "dispatch_tool", lambda tool, params: (200, {}))
+    jobs = server.ScanJobs(max_parallel=2)
+
+    tokens = [jobs.submit("nmap", {}) for _ in range(4)]
+    assert wait_for(lambda: jobs.pending == 0)
+    for index, token in enumerate(tokens):
+        jobs.jobs[token]["finished_at"] = time.time() - 10 + index
+
+    monkeypatch.setattr(server, "SCAN_MAX_FINISHED", 2)
+
+    assert jobs.status(tokens[0]) is None
+    assert jobs.status(tokens[3])["status"] == "done"
+    assert set(jobs.jobs) == set(tokens[2:])
+
+    jobs.jobs[tokens[2]]["finished_at"] = time.time() - server.SCAN_RESULT_TTL - 1
+    assert jobs.status(tokens[2]) is None
+    jobs.shutdown()
@@ -0,0 +1,31 @@
+"""Sharded list tools: target parsing, shard counts and merged output"""
+
+import pytest
+
+import hexstrike_server as server
+
+
+def test_split_targets_dedupes_and_reads_files(tmp_path):
+    assert server.split_targets("a.com, b.com,a.com") == ["a.com", "b.com"]
+    target_file = tmp_path / "targets.txt"
+    target_file.write_text("x.com\n\ny.com\nx.com\n")
+    assert server.split_targets(str(target_file)) == ["x.com", "y.com"]
+
+
+def test_execute_sharded_merges_and_clamps_shards():
+    targets = ["d.example", "a.example", "c.example", "b.example", "a.example"]
+    result = server.execute_sharded("cat", targets, 50, lambda path: ["cat", path])
+    assert result["success"]
+    assert result["stdout"] == "a.example\nb.example\nc.example\nd.example\n"
+    assert len(result["shards"]) == len(targets)
+    assert sum(shard["targets"] for shard in result["shards"]) == len(targets)
+
+    result = server.execute_sharded("cat", targets, 2, lambda path: ["cat", path])
+    assert len(result["shards"]) == 2
+
+
+@pytest.mark.parametrize("shards", [0, -1])
+def test_sharded_tools_reject_shards_below_one(client, shards):
+    response = client.post("/api/tools/amass", json={"domain": "a.example.com,b.example.com", "shards": shards})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "shards must be at least 1"}
@@ -0,0 +1,45 @@
+"""Single-flight: concurrent identical commands share one run"""
+
+import threading
+import time
+
+import pytest
+
+import hexstrike_server as server
+
+
+def test_single_flight_runs_once_for_concurrent_callers():
+    key = ("single-flight-test",)
+    release = threading.Event()
+    calls = []
+
+    def run():
+        calls.append(1)
+        release.wait(5)
+        return {"value": 42}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(server.run_single_flight(key, "test", run)))
+               for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    deadline = time.time() + 5
+    while server.flight_waiters(key) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert server.flight_waiters(key) == 2
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert results == [{"value": 42}] * 3
+    assert server.flight_waiters(key) == 0
+
+
+def test_single_flight_leader_exception_reaches_caller():
+    def run():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        server.run_single_flight(("single-flight-error",), "test", run)
+    assert ("single-flight-error",) not in server.inflight_commands
@@ -0,0 +1,38 @@
+"""In-process strings: printable runs match binutils strings -a"""
+
+import shutil
+import subprocess
+
+import pytest
+
+import hexstrike_server as server
+
+SAMPLE = b"\x00\x01hello world\x00ab\x7fprintable run here\xffxyz1\n" + bytes(range(256))
+
+
+@pytest.fixture
+def sample(tmp_path):
+    path = tmp_path / "sample.bin"
+    path.write_bytes(SAMPLE)
+    return str(path)
+
+
+def test_scan_strings_extracts_printable_runs(sample):
+    result = server.scan_strings(sample, 4)
+    assert result["success"]
+    assert result["stdout"].splitlines()[:3] == ["hello world", "printable run here", "xyz1"]
+    assert "ab" not in result["stdout"].splitlines()
+    assert server.scan_strings(sample, 12)["stdout"].splitlines() == [
+        "printable run here", bytes(range(0x20, 0x7f)).decode()]
+
+
+@pytest.mark.skipif(shutil.which("strings") is None, reason="binutils strings not installed")
+def test_scan_strings_matches_strings_cli(sample):
+    expected = subprocess.run(["strings", "-a", "-n", "4", sample], capture_output=True, text=True).stdout
+    assert server.scan_strings(sample, 4)["stdout"] == expected
+
+
+def test_scan_strings_missing_file(tmp_path):
+    result = server.scan_strings(str(tmp_path / "missing"))
+    assert result["return_code"] == 1 and not result["success"]
+    assert "No such file" in result["stderr"]
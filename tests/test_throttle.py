@@ -0,0 +1,41 @@
+"""Per-family throttling: runs beyond a family's limit queue instead of starting"""
+
+import threading
+import time
+
+import pytest
+
+import hexstrike_server as server
+
+
+def test_family_limit_queues_runs(monkeypatch):
+    limit = server.TOOL_CONCURRENCY_LIMITS["gpu_cracking"][0]
+    if limit != 1:
+        pytest.skip("gpu_cracking limit overridden by the environment")
+    monkeypatch.setitem(server.TOOL_FAMILIES, "sleep", "gpu_cracking")
+
+    queued = []
+
+    def watch():
+        for _ in range(50):
+            queued.append(server.async_runner.throttle_status()["gpu_cracking"]["queued"])
+            time.sleep(0.02)
+
+    watcher = threading.Thread(target=watch)
+    watcher.start()
+    start = time.time()
+    results = server.async_runner.run_many([["sleep", "0.4"], ["sleep", "0.4"]])
+    elapsed = time.time() - start
+    watcher.join()
+
+    assert all(result["success"] for result in results)
+    assert elapsed >= 0.75
+    assert max(queued) == 1
+    status = server.async_runner.throttle_status()["gpu_cracking"]
+    assert status["running"] == 0 and status["queued"] == 0
+
+
+def test_throttle_status_endpoint(client):
+    body = client.get("/api/throttle/status").get_json()
+    assert body["success"]
+    assert "gpu_cracking" in body["families"]
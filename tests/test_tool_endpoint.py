@@ -0,0 +1,21 @@
+"""tool_endpoint views: required fields and typed parameters answer 400 before a tool runs"""
+
+import hexstrike_server as server
+
+
+def test_tool_endpoint_required_field_and_type_errors(client):
+    response = client.post("/api/tools/checksec", json={})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Binary parameter is required"}
+
+    response = client.post("/api/tools/checksec", json={"binary": "/bin/true", "force": "yes"})
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "force must be a boolean"}
+
+
+def test_tool_endpoint_passes_parsed_params(client, monkeypatch):
+    seen = []
+    monkeypatch.setattr(server, "execute_command", lambda command, **kwargs: seen.append(command) or {"success": True})
+    response = client.post("/api/tools/checksec", json={"binary": "/bin/true"})
+    assert response.status_code == 200
+    assert "/bin/true" in str(seen[-1])